@@ -0,0 +1,246 @@
+"""
+Microbenchmarks of SearchIndexDao, SearchClientDao and SearchIndexerDao against a local fake of the
+Azure AI Search REST API (see fake_search_service.py).
+
+Unlike the unit tests, which mock the SDK clients, every operation goes through the SDK, the HTTP
+stack and JSON (de)serialization. The query result cache and the schema cache are disabled so that
+each call reaches the service. For each operation the script reports the throughput and the p50 and
+p99 latency, and compares them with the stored baselines.
+
+Usage:
+    python benchmarks/dao_benchmark.py                      # run and compare with dao_baselines.json
+    python benchmarks/dao_benchmark.py --update-baselines   # run and store the results as baselines
+    python benchmarks/dao_benchmark.py --latency-ms 5 --throttle-ratio 0.05
+
+The script exits with status 1 when an operation regressed past the tolerances. Baselines depend on
+the machine, so record them on the machine that runs the comparison.
+"""
+import json
+import os
+import statistics
+import sys
+import time
+from argparse import ArgumentParser
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fake_search_service import FakeSearchService, sample_documents, sample_index  # noqa: E402
+
+DEFAULT_BASELINES_PATH = Path(__file__).resolve().parent / "dao_baselines.json"
+INDEX_NAME = "benchmark-products"
+DOCUMENT_COUNT = 2000
+VECTOR_DIMENSIONS = 16
+PAGE_SIZE = 50
+BATCH_SIZE = 100
+
+Operation = Callable[[], Any]
+
+
+def configure_environment(service: FakeSearchService) -> None:
+    """Points the DAOs at the fake service and turns off the caches in front of it."""
+    os.environ.update({
+        "AZURE_AI_SEARCH_ENDPOINT": service.endpoint,
+        "AZURE_AUTHENTICATION_METHOD": "api-search-key",
+        "AZURE_AI_SEARCH_API_KEY": "benchmark",
+        "AZURE_AI_SEARCH_QUERY_CACHE_SIZE": "0",
+        "AZURE_AI_SEARCH_SCHEMA_CACHE_MAX_AGE": "0",
+        "REQUESTS_CA_BUNDLE": str(service.certificate_path),
+        "SSL_CERT_FILE": str(service.certificate_path),
+    })
+
+
+def seed_service(service: FakeSearchService) -> None:
+    service.add_index(sample_index(INDEX_NAME, VECTOR_DIMENSIONS))
+    service.add_documents(INDEX_NAME, sample_documents(DOCUMENT_COUNT, VECTOR_DIMENSIONS))
+    for number in range(5):
+        service.add_index(sample_index(f"benchmark-other-{number}"))
+
+    service.add_resource("datasources", {"name": "benchmark-blobs", "type": "azureblob",
+                                         "credentials": {"connectionString": None},
+                                         "container": {"name": "documents"}})
+    service.add_resource("skillsets", {"name": "benchmark-skills", "skills": []})
+    service.add_resource("indexers", {"name": "benchmark-indexer", "dataSourceName": "benchmark-blobs",
+                                      "targetIndexName": INDEX_NAME, "skillsetName": "benchmark-skills"})
+
+
+def build_operations() -> dict[str, Operation]:
+    """Builds the benchmarked operations, each one DAO call."""
+    # Imported after configure_environment, since the caches read their settings on import
+    from azure.search.documents.indexes.models import SearchIndex, SimpleField
+    from mcp_server_azure_ai_search_preview.data_access_objects import SearchIndexDao, SearchClientDao, \
+        SearchIndexerDao
+
+    index_dao = SearchIndexDao()
+    client_dao = SearchClientDao(INDEX_NAME)
+    indexer_dao = SearchIndexerDao()
+
+    upload_batch = sample_documents(BATCH_SIZE, VECTOR_DIMENSIONS)
+    for document in upload_batch:
+        document["id"] = f"upload-{document['id']}"
+    upload_keys = [document["id"] for document in upload_batch]
+
+    scratch_index = SearchIndex(name="benchmark-scratch",
+                                fields=[SimpleField(name="id", type="Edm.String", key=True)])
+    cursor: dict[str, Optional[str]] = {"next": None}
+
+    def query_index_page_by_key() -> Any:
+        page = client_dao.query_index_page(page_size=PAGE_SIZE, key_field_name="id", cursor=cursor["next"])
+        cursor["next"] = page.next_cursor
+        return page
+
+    def create_and_delete_index() -> None:
+        index_dao.create_index(scratch_index)
+        index_dao.delete_index(scratch_index.name)
+
+    return {
+        "index.retrieve_index_names": index_dao.retrieve_index_names,
+        "index.retrieve_index_schemas": index_dao.retrieve_index_schemas,
+        "index.retrieve_index_schema": lambda: index_dao.retrieve_index_schema(INDEX_NAME),
+        "index.create_and_delete_index": create_and_delete_index,
+        "search.get_document_count": client_dao.get_document_count,
+        "search.count_documents": lambda: client_dao.count_documents("rating ge 3"),
+        "search.query_index": lambda: client_dao.query_index("lorem", top=PAGE_SIZE),
+        "search.query_index_page": lambda: client_dao.query_index_page("lorem", page_size=PAGE_SIZE,
+                                                                       include_total_count=True),
+        "search.query_index_page_by_key": query_index_page_by_key,
+        "search.add_documents": lambda: client_dao.add_documents(upload_batch),
+        "search.delete_documents": lambda: client_dao.delete_documents("id", upload_keys),
+        "indexer.list_indexers": indexer_dao.list_indexers,
+        "indexer.get_indexer": lambda: indexer_dao.get_indexer("benchmark-indexer"),
+        "indexer.list_data_sources": indexer_dao.list_data_sources,
+        "indexer.get_data_source": lambda: indexer_dao.get_data_source("benchmark-blobs"),
+        "indexer.list_skill_sets": indexer_dao.list_skill_sets,
+        "indexer.get_skill_set": lambda: indexer_dao.get_skill_set("benchmark-skills"),
+    }
+
+
+def measure(operation: Operation, iterations: int, warmup: int, rounds: int) -> dict[str, float]:
+    """
+    Calls an operation repeatedly and summarizes its latencies.
+
+    The calls are repeated for several rounds and the round with the lowest p50 is kept, which filters
+    out most of the noise from other processes on the machine.
+
+    Returns:
+        dict[str, float]: The throughput in operations per second and the p50 and p99 latency in ms.
+    """
+    for _ in range(warmup):
+        operation()
+
+    best: Optional[dict[str, float]] = None
+    for _ in range(rounds):
+        latencies = []
+        started = time.perf_counter()
+        for _ in range(iterations):
+            call_started = time.perf_counter()
+            operation()
+            latencies.append(time.perf_counter() - call_started)
+        elapsed = time.perf_counter() - started
+
+        percentiles = statistics.quantiles(latencies, n=100, method="inclusive")
+        result = {
+            "ops_per_second": round(iterations / elapsed, 1),
+            "p50_ms": round(statistics.median(latencies) * 1000, 3),
+            "p99_ms": round(percentiles[98] * 1000, 3),
+        }
+        if best is None or result["p50_ms"] < best["p50_ms"]:
+            best = result
+
+    return best
+
+
+def find_regressions(results: dict[str, dict[str, float]],
+                     baselines: dict[str, dict[str, float]],
+                     tolerance: float,
+                     p99_tolerance: float) -> list[str]:
+    """
+    Compares results with the baselines.
+
+    Args:
+        results (dict): The measurements per operation.
+        baselines (dict): The stored measurements per operation.
+        tolerance (float): The allowed relative increase of p50 and decrease of throughput.
+        p99_tolerance (float): The allowed relative increase of p99, which is noisier.
+
+    Returns:
+        list[str]: A description of every regression.
+    """
+    regressions = []
+
+    for name, result in results.items():
+        baseline = baselines.get(name)
+        if baseline is None:
+            continue
+
+        if result["p50_ms"] > baseline["p50_ms"] * (1 + tolerance):
+            regressions.append(f"{name}: p50 {result['p50_ms']} ms > baseline {baseline['p50_ms']} ms")
+        if result["p99_ms"] > baseline["p99_ms"] * (1 + p99_tolerance):
+            regressions.append(f"{name}: p99 {result['p99_ms']} ms > baseline {baseline['p99_ms']} ms")
+        if result["ops_per_second"] < baseline["ops_per_second"] * (1 - tolerance):
+            regressions.append(f"{name}: {result['ops_per_second']} ops/s < baseline "
+                               f"{baseline['ops_per_second']} ops/s")
+
+    return regressions
+
+
+def main() -> int:
+    parser = ArgumentParser(description="Benchmark the DAOs against a local fake Azure AI Search service.")
+    parser.add_argument("--iterations", type=int, default=200, help="Measured calls per operation (default: 200)")
+    parser.add_argument("--warmup", type=int, default=20, help="Unmeasured calls per operation (default: 20)")
+    parser.add_argument("--rounds", type=int, default=3, help="Rounds per operation; the best is kept (default: 3)")
+    parser.add_argument("--operations", default="", help="Comma-separated prefixes of the operations to run")
+    parser.add_argument("--latency-ms", type=float, default=0.0, help="Latency added to every response")
+    parser.add_argument("--throttle-ratio", type=float, default=0.0, help="Share of requests answered with 429")
+    parser.add_argument("--retry-after", type=float, default=0.0, help="Retry-After seconds of throttled responses")
+    parser.add_argument("--baselines", type=Path, default=DEFAULT_BASELINES_PATH, help="Baseline file")
+    parser.add_argument("--update-baselines", action="store_true", help="Store the results as the baselines")
+    parser.add_argument("--tolerance", type=float, default=0.5,
+                        help="Allowed relative p50 and throughput regression (default: 0.5)")
+    parser.add_argument("--p99-tolerance", type=float, default=1.0,
+                        help="Allowed relative p99 regression (default: 1.0)")
+    args = parser.parse_args()
+
+    settings = {"latency_ms": args.latency_ms, "throttle_ratio": args.throttle_ratio,
+                "retry_after": args.retry_after, "iterations": args.iterations, "rounds": args.rounds}
+    prefixes = [prefix.strip() for prefix in args.operations.split(",") if prefix.strip()]
+
+    with FakeSearchService(latency_seconds=args.latency_ms / 1000, throttle_ratio=args.throttle_ratio,
+                           retry_after_seconds=args.retry_after) as service:
+        configure_environment(service)
+        seed_service(service)
+
+        results: dict[str, dict[str, float]] = {}
+        for name, operation in build_operations().items():
+            if prefixes and not any(name.startswith(prefix) for prefix in prefixes):
+                continue
+            results[name] = measure(operation, args.iterations, args.warmup, args.rounds)
+            print(f"{name:<34} {results[name]['ops_per_second']:>9.1f} ops/s   "
+                  f"p50 {results[name]['p50_ms']:>8.3f} ms   p99 {results[name]['p99_ms']:>8.3f} ms")
+
+        print(f"{service.requests} requests, {service.throttled_requests} throttled")
+
+    if args.update_baselines:
+        args.baselines.write_text(json.dumps({"settings": settings, "operations": results}, indent=2) + "\n",
+                                  encoding="utf-8")
+        print(f"Baselines written to {args.baselines}")
+        return 0
+
+    if not args.baselines.is_file():
+        print(f"No baselines at {args.baselines}; run with --update-baselines to record them")
+        return 0
+
+    stored = json.loads(args.baselines.read_text(encoding="utf-8"))
+    if stored.get("settings") != settings:
+        print(f"Baselines were recorded with {stored.get('settings')}, not {settings}; skipping the comparison")
+        return 0
+
+    regressions = find_regressions(results, stored["operations"], args.tolerance, args.p99_tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,442 @@
+"""
+A local stand-in for the Azure AI Search REST API, for benchmarks.
+
+It implements the subset of the API used by the DAOs: listing, reading, creating, updating and
+deleting indexes (with ETags and conditional GETs), searching (with server-side paging past 1000
+results), counting and indexing documents, and reading indexers, data sources and skillsets. Documents are kept in memory. Every request can be
+delayed by a fixed latency, and a share of the requests, or the requests above a capacity, can be
+throttled with 429 responses carrying a Retry-After header, so that the retry paths of the SDK and
+the client-side rate limiter are exercised as well.
+
+The SDK only sends credentials over https, so the service uses a self-signed certificate. Point
+REQUESTS_CA_BUNDLE (sync clients) and SSL_CERT_FILE (aio clients) at certificate_path to trust it.
+"""
+import datetime
+import ipaddress
+import itertools
+import json
+import random
+import re
+import ssl
+import tempfile
+import threading
+import time
+import uuid
+from collections import deque
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Optional
+from urllib.parse import parse_qs, unquote, urlsplit
+
+RESOURCE_PATH = re.compile(r"^/(?P<collection>indexes|indexers|datasources|skillsets)"
+                           r"(?:\('(?P<name>[^']*)'\))?(?P<rest>/.*)?$")
+FILTER_CLAUSE = re.compile(r"^\s*(?P<field>\w+)\s+(?P<operator>eq|ne|gt|ge|lt|le)\s+"
+                           r"(?P<value>'(?:[^']|'')*'|-?\d+(?:\.\d+)?|true|false)\s*$")
+# Like the service, a search response holds at most this many results and continues with nextPageParameters
+MAX_RESULTS_PER_RESPONSE = 1000
+FILTER_OPERATORS = {
+    "eq": lambda left, right: left == right,
+    "ne": lambda left, right: left != right,
+    "gt": lambda left, right: left > right,
+    "ge": lambda left, right: left >= right,
+    "lt": lambda left, right: left < right,
+    "le": lambda left, right: left <= right,
+}
+
+
+class FakeSearchService:
+    """
+    Serves the fake REST API on a local port from a background thread.
+
+    Usage:
+        with FakeSearchService(latency_seconds=0.002) as service:
+            os.environ["AZURE_AI_SEARCH_ENDPOINT"] = service.endpoint
+    """
+
+    def __init__(self,
+                 latency_seconds: float = 0.0,
+                 throttle_ratio: float = 0.0,
+                 retry_after_seconds: float = 0.0,
+                 max_requests_per_second: float = 0.0,
+                 seed: int = 0):
+        """
+        Initializes the service.
+
+        Args:
+            latency_seconds (float): Added to every response.
+            throttle_ratio (float): The share of requests answered with 429 Too Many Requests.
+            retry_after_seconds (float): The Retry-After value of throttled responses.
+            max_requests_per_second (float): The capacity of the service; requests above it within any
+                second are throttled with a Retry-After of the time until capacity frees up (0: unlimited).
+            seed (int): Seeds the choice of throttled requests, so that runs are repeatable.
+        """
+        self.latency_seconds = latency_seconds
+        self.throttle_ratio = throttle_ratio
+        self.retry_after_seconds = retry_after_seconds
+        self.max_requests_per_second = max_requests_per_second
+
+        self.indexes: dict[str, dict[str, Any]] = {}
+        self.documents: dict[str, dict[str, dict[str, Any]]] = {}
+        self.resources: dict[str, dict[str, dict[str, Any]]] = {"indexers": {}, "datasources": {}, "skillsets": {}}
+        self.requests = 0
+        self.throttled_requests = 0
+
+        self._random = random.Random(seed)
+        self._accepted_times: deque[float] = deque()
+        self._lock = threading.Lock()
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+        self._certificate_directory = tempfile.TemporaryDirectory(prefix="fake-search-service-")
+        self.certificate_path = Path(self._certificate_directory.name) / "certificate.pem"
+
+    @property
+    def endpoint(self) -> str:
+        """The URL to use as AZURE_AI_SEARCH_ENDPOINT."""
+        host, port = self._server.server_address[:2]
+        return f"https://{host}:{port}"
+
+    def start(self) -> "FakeSearchService":
+        service = self
+
+        class Handler(FakeSearchRequestHandler):
+            fake_service = service
+
+        key_path = write_self_signed_certificate(self.certificate_path)
+        ssl_context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        ssl_context.load_cert_chain(self.certificate_path, key_path)
+
+        self._server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        self._server.socket = ssl_context.wrap_socket(self._server.socket, server_side=True)
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, name="fake-search-service", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        self._certificate_directory.cleanup()
+
+    def __enter__(self) -> "FakeSearchService":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def add_index(self, index: dict[str, Any]) -> dict[str, Any]:
+        """Creates or replaces an index definition and assigns it a new ETag."""
+        with self._lock:
+            index = dict(index, **{"@odata.etag": f'"{uuid.uuid4().hex}"'})
+            self.indexes[index["name"]] = index
+            self.documents.setdefault(index["name"], {})
+            return index
+
+    def add_documents(self, index_name: str, documents: list[dict[str, Any]]) -> None:
+        """Uploads documents to an index, replacing those with the same key."""
+        key_field_name = self.key_field_name(index_name)
+        with self._lock:
+            for document in documents:
+                self.documents[index_name][str(document[key_field_name])] = dict(document)
+
+    def add_resource(self, collection: str, resource: dict[str, Any]) -> None:
+        """Stores an indexer, data source or skillset definition."""
+        with self._lock:
+            self.resources[collection][resource["name"]] = dict(resource, **{"@odata.etag": f'"{uuid.uuid4().hex}"'})
+
+    def key_field_name(self, index_name: str) -> str:
+        return next(field["name"] for field in self.indexes[index_name]["fields"] if field.get("key"))
+
+    def should_throttle(self) -> Optional[float]:
+        """Counts a request and decides whether to throttle it.
+
+        Returns:
+            float | None: The Retry-After seconds of a throttled request, or None to serve it.
+        """
+        with self._lock:
+            self.requests += 1
+
+            if self.throttle_ratio > 0 and self._random.random() < self.throttle_ratio:
+                self.throttled_requests += 1
+                return self.retry_after_seconds
+
+            if self.max_requests_per_second > 0:
+                now = time.monotonic()
+                while self._accepted_times and self._accepted_times[0] <= now - 1.0:
+                    self._accepted_times.popleft()
+                if len(self._accepted_times) >= self.max_requests_per_second:
+                    self.throttled_requests += 1
+                    return max(self.retry_after_seconds, round(self._accepted_times[0] + 1.0 - now, 3))
+                self._accepted_times.append(now)
+
+            return None
+
+    def search(self, index_name: str, request: dict[str, Any]) -> dict[str, Any]:
+        """Runs a search request against the stored documents."""
+        with self._lock:
+            documents = list(self.documents[index_name].values())
+
+        search_text = (request.get("search") or "*").strip()
+        if search_text != "*":
+            terms = [term.lower() for term in search_text.split()]
+            documents = [document for document in documents
+                         if any(term in str(value).lower() for value in document.values() for term in terms)]
+
+        if request.get("filter"):
+            documents = [document for document in documents if matches_filter(document, request["filter"])]
+
+        for order_by in reversed([clause.strip() for clause in (request.get("orderby") or "").split(",")
+                                  if clause.strip()]):
+            field_name, _, direction = order_by.partition(" ")
+            documents.sort(key=lambda document: (document.get(field_name) is None, document.get(field_name)),
+                           reverse=direction.strip().lower() == "desc")
+
+        count = len(documents)
+        skip = int(request.get("skip") or 0)
+        top = request.get("top")
+        next_page_parameters = None
+        if top is not None and int(top) > MAX_RESULTS_PER_RESPONSE and count > skip + MAX_RESULTS_PER_RESPONSE:
+            next_page_parameters = dict(request, skip=skip + MAX_RESULTS_PER_RESPONSE,
+                                        top=int(top) - MAX_RESULTS_PER_RESPONSE)
+        page_size = min(int(top), MAX_RESULTS_PER_RESPONSE) if top is not None else 50
+        documents = documents[skip:skip + page_size]
+
+        select = [field_name.strip() for field_name in (request.get("select") or "").split(",")
+                  if field_name.strip()]
+        if select:
+            documents = [{field_name: document.get(field_name) for field_name in select} for document in documents]
+
+        response: dict[str, Any] = {"value": [dict(document, **{"@search.score": 1.0}) for document in documents]}
+        if request.get("count"):
+            response["@odata.count"] = count
+        if next_page_parameters is not None:
+            response["@search.nextPageParameters"] = next_page_parameters
+        return response
+
+    def index_documents(self, index_name: str, actions: list[dict[str, Any]]) -> dict[str, Any]:
+        """Applies a batch of upload, merge and delete actions."""
+        key_field_name = self.key_field_name(index_name)
+        results = []
+
+        with self._lock:
+            stored_documents = self.documents[index_name]
+            for action in actions:
+                action_type = action.pop("@search.action", "upload")
+                key = str(action.get(key_field_name))
+                if action_type == "delete":
+                    stored_documents.pop(key, None)
+                elif action_type in ("merge", "mergeOrUpload") and key in stored_documents:
+                    stored_documents[key].update(action)
+                else:
+                    stored_documents[key] = action
+                results.append({"key": key, "status": True, "errorMessage": None, "statusCode": 200})
+
+        return {"value": results}
+
+
+def write_self_signed_certificate(certificate_path: Path) -> Path:
+    """
+    Writes a certificate for 127.0.0.1 and localhost and returns the path of its private key.
+
+    cryptography is installed with azure-identity, so the benchmarks need no extra dependency.
+    """
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    private_key = ec.generate_private_key(ec.SECP256R1())
+    subject = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    certificate = (
+        x509.CertificateBuilder()
+        .subject_name(subject)
+        .issuer_name(subject)
+        .public_key(private_key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(minutes=5))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(x509.SubjectAlternativeName([x509.DNSName("localhost"),
+                                                    x509.IPAddress(ipaddress.ip_address("127.0.0.1"))]),
+                       critical=False)
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(private_key, hashes.SHA256())
+    )
+
+    key_path = certificate_path.with_suffix(".key")
+    certificate_path.write_bytes(certificate.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(private_key.private_bytes(serialization.Encoding.PEM,
+                                                   serialization.PrivateFormat.PKCS8,
+                                                   serialization.NoEncryption()))
+    return key_path
+
+
+def parse_filter_value(value: str) -> Any:
+    if value.startswith("'"):
+        return value[1:-1].replace("''", "'")
+    if value in ("true", "false"):
+        return value == "true"
+    return float(value) if "." in value else int(value)
+
+
+def matches_filter(document: dict[str, Any], odata_filter: str) -> bool:
+    """Evaluates the comparisons joined by 'and' that keyset paging and simple queries use."""
+    for clause in re.split(r"\s+and\s+", odata_filter.strip().strip("()")):
+        match = FILTER_CLAUSE.match(clause.strip().strip("()"))
+        if match is None:
+            raise ValueError(f"Unsupported filter clause: {clause}")
+
+        value = document.get(match["field"])
+        expected = parse_filter_value(match["value"])
+        if value is None or not FILTER_OPERATORS[match["operator"]](value, expected):
+            return False
+
+    return True
+
+
+class FakeSearchRequestHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Headers and body are written separately; without TCP_NODELAY delayed ACKs add ~40 ms per response
+    disable_nagle_algorithm = True
+    fake_service: FakeSearchService
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        self._dispatch("GET")
+
+    def do_POST(self) -> None:
+        self._dispatch("POST")
+
+    def do_PUT(self) -> None:
+        self._dispatch("PUT")
+
+    def do_DELETE(self) -> None:
+        self._dispatch("DELETE")
+
+    def _dispatch(self, method: str) -> None:
+        content_length = int(self.headers.get("Content-Length") or 0)
+        body = json.loads(self.rfile.read(content_length)) if content_length else None
+
+        service = self.fake_service
+        if service.latency_seconds:
+            time.sleep(service.latency_seconds)
+
+        retry_after = service.should_throttle()
+        if retry_after is not None:
+            self._send(429, {"error": {"code": "Throttled", "message": "Too many requests"}},
+                       headers={"Retry-After": str(retry_after)})
+            return
+
+        url = urlsplit(self.path)
+        match = RESOURCE_PATH.match(unquote(url.path))
+        if match is None:
+            self._send(404, {"error": {"code": "NotFound", "message": f"Unknown path {url.path}"}})
+            return
+
+        try:
+            status, payload, headers = self._handle(method, match["collection"], match["name"], match["rest"] or "",
+                                                    parse_qs(url.query), body)
+        except KeyError as error:
+            status, payload, headers = 404, {"error": {"code": "NotFound", "message": f"{error} not found"}}, {}
+        except ValueError as error:
+            status, payload, headers = 400, {"error": {"code": "InvalidRequest", "message": str(error)}}, {}
+
+        self._send(status, payload, headers)
+
+    def _handle(self, method: str, collection: str, name: Optional[str], rest: str,
+                query: dict[str, list[str]], body: Any) -> tuple[int, Any, dict[str, str]]:
+        service = self.fake_service
+
+        if collection == "indexes":
+            if name is None:
+                if method == "POST":
+                    return 201, service.add_index(body), {}
+                indexes = list(service.indexes.values())
+                if query.get("$select") == ["name"]:
+                    indexes = [{"name": index["name"]} for index in indexes]
+                return 200, {"value": indexes}, {}
+
+            if rest == "/docs/$count":
+                return 200, len(service.documents[name]), {}
+            if rest in ("/docs/search.post.search", "/docs/search"):
+                return 200, service.search(name, body or {}), {}
+            if rest == "/docs/search.index":
+                return 200, service.index_documents(name, body["value"]), {}
+
+            if method == "GET":
+                index = service.indexes[name]
+                if self.headers.get("If-None-Match") == index["@odata.etag"]:
+                    return 304, None, {"ETag": index["@odata.etag"]}
+                return 200, index, {"ETag": index["@odata.etag"]}
+            if method == "PUT":
+                return 200, service.add_index(body), {}
+            if method == "DELETE":
+                service.indexes.pop(name)
+                service.documents.pop(name, None)
+                return 204, None, {}
+
+        resources = service.resources[collection]
+        if name is None:
+            items = list(resources.values())
+            if query.get("$select") == ["name"]:
+                items = [{"name": item["name"]} for item in items]
+            return 200, {"value": items}, {}
+        if method == "GET":
+            return 200, resources[name], {}
+        if method == "PUT":
+            service.add_resource(collection, body)
+            return 200, resources[name], {}
+        if method == "DELETE":
+            resources.pop(name)
+            return 204, None, {}
+
+        raise ValueError(f"Unsupported request {method} {collection}")
+
+    def _send(self, status: int, payload: Any, headers: Optional[dict[str, str]] = None) -> None:
+        content = b"" if payload is None else json.dumps(payload).encode("utf-8")
+
+        self.send_response(status)
+        for header_name, header_value in (headers or {}).items():
+            self.send_header(header_name, header_value)
+        if content:
+            self.send_header("Content-Type", "application/json; odata.metadata=minimal")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        self.wfile.write(content)
+
+
+def sample_index(name: str, vector_dimensions: int = 0) -> dict[str, Any]:
+    """Builds an index definition with a key, a few text fields and an optional vector field."""
+    fields = [
+        {"name": "id", "type": "Edm.String", "key": True, "filterable": True, "sortable": True},
+        {"name": "title", "type": "Edm.String", "searchable": True},
+        {"name": "content", "type": "Edm.String", "searchable": True},
+        {"name": "category", "type": "Edm.String", "filterable": True, "facetable": True},
+        {"name": "rating", "type": "Edm.Int32", "filterable": True, "sortable": True},
+    ]
+    if vector_dimensions:
+        fields.append({"name": "embedding", "type": "Collection(Edm.Single)", "searchable": True,
+                       "dimensions": vector_dimensions, "vectorSearchProfile": "default"})
+    return {"name": name, "fields": fields}
+
+
+def sample_documents(count: int, vector_dimensions: int = 0, content_chars: int = 400) -> list[dict[str, Any]]:
+    """Builds documents for sample_index with content of a given size."""
+    categories = itertools.cycle(["produce", "dairy", "bakery", "frozen", "pantry"])
+    documents = []
+    for number in range(count):
+        document = {
+            "id": f"{number:08d}",
+            "title": f"Document {number}",
+            "content": ("lorem ipsum dolor sit amet " * (content_chars // 27 + 1))[:content_chars],
+            "category": next(categories),
+            "rating": number % 5,
+        }
+        if vector_dimensions:
+            document["embedding"] = [round((number * 31 + dimension) % 97 / 97, 6)
+                                     for dimension in range(vector_dimensions)]
+        documents.append(document)
+    return documents
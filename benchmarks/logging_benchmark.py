@@ -0,0 +1,110 @@
+"""
+Measures what logging the payload of a bulk write costs, compared with the write itself.
+
+Every variant logs one batch of documents, as SearchClientDao.add_documents does, to a handler that
+formats the record and discards it:
+
+- "full payload": the whole batch formatted into the message, as the DAOs used to log it.
+- "policy, INFO": the payload log policy with DEBUG disabled, the production default.
+- "policy, DEBUG summary": the policy with DEBUG enabled; the record carries the batch summary.
+- "policy, DEBUG sampled": the policy including the capped payload in every record.
+
+The write is add_documents against the local fake of the Azure AI Search REST API (see
+fake_search_service.py).
+
+Usage:
+    python benchmarks/logging_benchmark.py [--batch-size 1000] [--max-overhead 0.01]
+
+The script exits with status 1 when logging a summary costs more than --max-overhead of the write.
+"""
+import io
+import logging
+import sys
+import time
+from argparse import ArgumentParser
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fake_search_service import FakeSearchService, sample_documents  # noqa: E402
+from dao_benchmark import INDEX_NAME, VECTOR_DIMENSIONS, configure_environment, seed_service  # noqa: E402
+
+
+def seconds_per_call(call: Callable[[], object], iterations: int) -> float:
+    """Returns the best of three average durations of the call."""
+    best = float("inf")
+    for _ in range(3):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            call()
+        best = min(best, (time.perf_counter() - started) / iterations)
+    return best
+
+
+def main() -> int:
+    parser = ArgumentParser(description="Benchmark payload logging against a bulk write.")
+    parser.add_argument("--batch-size", type=int, default=1000, help="Documents per write (default: 1000)")
+    parser.add_argument("--iterations", type=int, default=50, help="Calls per measurement (default: 50)")
+    parser.add_argument("--max-overhead", type=float, default=0.01,
+                        help="Allowed cost of a DEBUG summary relative to the write (default: 0.01)")
+    args = parser.parse_args()
+
+    with FakeSearchService() as service:
+        configure_environment(service)
+        seed_service(service)
+
+        # Imported after configure_environment, since the DAO modules read their settings on import
+        from mcp.server.fastmcp.server import logger
+        from mcp_server_azure_ai_search_preview.data_access_objects import SearchClientDao, PayloadLogPolicy
+
+        documents = sample_documents(args.batch_size, VECTOR_DIMENSIONS)
+        for document in documents:
+            document["id"] = f"logged-{document['id']}"
+
+        handler = logging.StreamHandler(io.StringIO())
+        logger.addHandler(handler)
+        logger.propagate = False
+        summaries = PayloadLogPolicy(sample_rate=0.0)
+        samples = PayloadLogPolicy(sample_rate=1.0)
+
+        def log_full_payload() -> None:
+            logger.debug("Adding documents to index %s: %s", INDEX_NAME, documents)
+            handler.stream.seek(0)
+            handler.stream.truncate()
+
+        def log_with(policy: PayloadLogPolicy) -> Callable[[], None]:
+            def log() -> None:
+                policy.log("Adding documents to index %s", documents, INDEX_NAME)
+                handler.stream.seek(0)
+                handler.stream.truncate()
+            return log
+
+        client_dao = SearchClientDao(INDEX_NAME)
+        logger.setLevel(logging.INFO)
+        write = seconds_per_call(lambda: client_dao.add_documents(documents), max(args.iterations // 5, 3))
+
+        results: dict[str, float] = {}
+        logger.setLevel(logging.DEBUG)
+        results["full payload"] = seconds_per_call(log_full_payload, max(args.iterations // 5, 3))
+        results["policy, DEBUG summary"] = seconds_per_call(log_with(summaries), args.iterations)
+        results["policy, DEBUG sampled"] = seconds_per_call(log_with(samples), args.iterations)
+        logger.setLevel(logging.INFO)
+        results["policy, INFO"] = seconds_per_call(log_with(summaries), args.iterations * 100)
+
+        logger.removeHandler(handler)
+        logger.propagate = True
+
+    print(f"{'add_documents':<24} {write * 1000:>10.3f} ms per batch of {args.batch_size}")
+    for name, seconds in results.items():
+        print(f"{name:<24} {seconds * 1000:>10.3f} ms   {seconds / write:>8.2%} of the write")
+
+    overhead = results["policy, DEBUG summary"] / write
+    if overhead > args.max_overhead:
+        print(f"REGRESSION logging a summary costs {overhead:.2%} of the write, more than {args.max_overhead:.2%}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
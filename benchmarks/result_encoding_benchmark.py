@@ -0,0 +1,193 @@
+"""
+Measures how tool results are produced and encoded for large index listings and query pages, and
+checks that the output is unchanged.
+
+Each stage is measured on the path the SDK and FastMCP take and on the path the server takes now:
+
+- listing: SearchIndex models deserialized and serialized again, against the raw REST JSON with the
+  definitions whose ETag did not change taken from the schema cache.
+- search: SearchClient.search, which deserializes SDK models, against the raw REST JSON of the same
+  request.
+- copy: copy.deepcopy of a cached listing against copy_result.
+- encoding: FastMCP's conversion of a tool result to text content against encode_tool_result.
+- columnar: the JSON size of a query_index page, and the time to encode and decode it, with
+  result_format="rows" against result_format="columnar".
+
+The listings, the search results and the encoded text must be byte-for-byte identical, and the
+columnar page must hold the same documents as the rows page.
+The tool calls at the end run the list_index_schemas and query_index tools end to end against the
+local fake of the Azure AI Search REST API (see fake_search_service.py).
+
+Usage:
+    python benchmarks/result_encoding_benchmark.py [--indexes 100] [--page-size 1000]
+
+The script exits with status 1 when an output differs.
+"""
+import asyncio
+import copy
+import itertools
+import json
+import sys
+import time
+from argparse import ArgumentParser
+from pathlib import Path
+from typing import Any, Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from fake_search_service import FakeSearchService, sample_documents, sample_index  # noqa: E402
+from dao_benchmark import INDEX_NAME, VECTOR_DIMENSIONS, configure_environment  # noqa: E402
+
+EXTRA_FIELDS = 20
+DOCUMENT_COUNT = 2000
+
+
+def seconds_per_call(call: Callable[[], object], iterations: int) -> float:
+    """Returns the best of three average durations of the call."""
+    best = float("inf")
+    for _ in range(3):
+        started = time.perf_counter()
+        for _ in range(iterations):
+            call()
+        best = min(best, (time.perf_counter() - started) / iterations)
+    return best
+
+
+def wide_index(name: str) -> dict[str, Any]:
+    """An index like sample_index with a few dozen more fields, as production schemas tend to have."""
+    index = sample_index(name, VECTOR_DIMENSIONS)
+    index["fields"] += [{"name": f"attribute{number}", "type": "Edm.String", "searchable": True,
+                         "filterable": True, "retrievable": True} for number in range(EXTRA_FIELDS)]
+    return index
+
+
+def wide_documents(count: int) -> list[dict[str, Any]]:
+    """Documents for wide_index with short values in the extra fields, every third one null."""
+    documents = sample_documents(count, VECTOR_DIMENSIONS, content_chars=40)
+    for number, document in enumerate(documents):
+        for attribute in range(EXTRA_FIELDS):
+            value = None if (number + attribute) % 3 == 0 else f"v{(number * attribute) % 50}"
+            document[f"attribute{attribute}"] = value
+    return documents
+
+
+def report(stage: str, before: float, after: float) -> None:
+    print(f"{stage:<34} {before * 1000:>10.2f} ms {after * 1000:>10.2f} ms {before / after:>8.1f}x")
+
+
+def main() -> int:
+    parser = ArgumentParser(description="Benchmark the production and encoding of large tool results.")
+    parser.add_argument("--indexes", type=int, default=100, help="Indexes in the listing (default: 100)")
+    parser.add_argument("--page-size", type=int, default=1000, help="Documents per query page (default: 1000)")
+    parser.add_argument("--iterations", type=int, default=10, help="Calls per measurement (default: 10)")
+    args = parser.parse_args()
+
+    with FakeSearchService() as service:
+        configure_environment(service)
+        for number in range(args.indexes - 1):
+            service.add_index(wide_index(f"index-{number:03d}"))
+        service.add_index(wide_index(INDEX_NAME))
+        service.add_documents(INDEX_NAME, wide_documents(DOCUMENT_COUNT))
+
+        # Imported after configure_environment, since the DAO modules read their settings on import
+        from mcp.server.fastmcp.server import FastMCP, _convert_to_content
+        from mcp_server_azure_ai_search_preview.__main__ import setup_mcp_service
+        from mcp_server_azure_ai_search_preview.data_access_objects import SearchIndexDao, SearchClientDao, \
+            search_client_registry
+        from mcp_server_azure_ai_search_preview.data_access_objects.paging import prepare_page_request
+        from mcp_server_azure_ai_search_preview.data_access_objects.raw_responses import list_index_definitions, \
+            search_documents
+        from mcp_server_azure_ai_search_preview.shared.serialization import copy_result, encode_tool_result
+
+        mismatches: list[str] = []
+        index_dao = SearchIndexDao()
+        client_dao = SearchClientDao(INDEX_NAME)
+
+        def sdk_listing() -> list[dict]:
+            return [index.serialize(keep_readonly=True) for index in index_dao.client.list_indexes()]
+
+        def raw_listing() -> list[dict]:
+            return list_index_definitions(index_dao.client, index_dao.api_version, index_dao.service_endpoint)
+
+        page_request = prepare_page_request(page_size=args.page_size)
+        limit = page_request.page_size + 1
+
+        def sdk_search() -> list[dict]:
+            return list(itertools.islice(client_dao.client.search(**page_request.search_kwargs), limit))
+
+        def raw_search() -> list[dict]:
+            return search_documents(client_dao.client, client_dao.api_version, page_request.search_kwargs, limit)[0]
+
+        index_dao.retrieve_index_schemas()
+        listing = sdk_listing()
+        if json.dumps(raw_listing()) != json.dumps(listing):
+            mismatches.append("index listing")
+        if json.dumps(raw_search()) != json.dumps(sdk_search()):
+            mismatches.append("search results")
+
+        mcp = setup_mcp_service("localhost", 8000, "WARNING")
+        loop = asyncio.new_event_loop()
+        query_arguments = {"index_name": INDEX_NAME, "page_size": args.page_size, "max_response_bytes": 0}
+
+        def tool_result(name: str, arguments: dict[str, Any]) -> Any:
+            return loop.run_until_complete(mcp._tool_manager.call_tool(name, arguments, context=mcp.get_context()))
+
+        listing_result = tool_result("list_index_schemas", {})
+        page_result = tool_result("query_index", query_arguments)
+        for name, result in (("list_index_schemas", listing_result), ("query_index", page_result)):
+            if encode_tool_result(result) != _convert_to_content(result):
+                mismatches.append(f"{name} content")
+
+        columnar_arguments = {**query_arguments, "result_format": "columnar"}
+        columnar_result = tool_result("query_index", columnar_arguments)
+        fields = columnar_result["fields"]
+        columnar_documents = [{name: value for name, value in zip(fields, row) if value is not None}
+                              for row in columnar_result["rows"]]
+        if columnar_documents != [{name: value for name, value in document.items() if value is not None}
+                                  for document in page_result["documents"]]:
+            mismatches.append("columnar page")
+
+        iterations = args.iterations
+        print(f"{'stage':<34} {'before':>13} {'after':>13} {'speedup':>9}")
+        report(f"listing of {args.indexes} indexes", seconds_per_call(sdk_listing, iterations),
+               seconds_per_call(raw_listing, iterations))
+        report("copy of the cached listing", seconds_per_call(lambda: copy.deepcopy(listing), iterations),
+               seconds_per_call(lambda: copy_result(listing), iterations))
+        report("list_index_schemas encoding", seconds_per_call(lambda: _convert_to_content(listing_result), iterations),
+               seconds_per_call(lambda: encode_tool_result(listing_result), iterations))
+        report(f"search page of {args.page_size}", seconds_per_call(sdk_search, iterations),
+               seconds_per_call(raw_search, iterations))
+        report("query_index encoding", seconds_per_call(lambda: _convert_to_content(page_result), iterations),
+               seconds_per_call(lambda: encode_tool_result(page_result), iterations))
+
+        rows_text, columnar_text = json.dumps(page_result), json.dumps(columnar_result)
+        print(f"{'query_index page size':<34} {len(rows_text):>10} B  {len(columnar_text):>10} B  "
+              f"{len(rows_text) / len(columnar_text):>8.1f}x")
+        report("query_index encode and decode", seconds_per_call(lambda: json.loads(json.dumps(page_result)), iterations),
+               seconds_per_call(lambda: json.loads(json.dumps(columnar_result)), iterations))
+        report("query_index rows / columnar call",
+               seconds_per_call(lambda: loop.run_until_complete(mcp.call_tool("query_index", query_arguments)),
+                                iterations),
+               seconds_per_call(lambda: loop.run_until_complete(mcp.call_tool("query_index", columnar_arguments)),
+                                iterations))
+
+        for name, arguments in (("list_index_schemas", {}), ("query_index", query_arguments)):
+            fastmcp_call = seconds_per_call(
+                lambda: loop.run_until_complete(FastMCP.call_tool(mcp, name, arguments)), iterations)
+            call = seconds_per_call(lambda: loop.run_until_complete(mcp.call_tool(name, arguments)), iterations)
+            report(f"{name} tool call", fastmcp_call, call)
+
+        loop.run_until_complete(mcp.shutdown_async())
+        loop.close()
+        search_client_registry.close()
+
+    print("The tool calls run the new DAO paths either way; 'before' only uses FastMCP's encoding.")
+    print("For the query_index page rows, 'before' is result_format=\"rows\" and 'after' is result_format=\"columnar\".")
+    if mismatches:
+        print(f"MISMATCH in {', '.join(mismatches)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
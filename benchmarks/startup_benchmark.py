@@ -0,0 +1,93 @@
+"""
+Measures the cold start of the MCP server: the time from launching
+``python -m mcp_server_azure_ai_search_preview --transport stdio`` to receiving the response to ``initialize``.
+
+Usage:
+    python benchmarks/startup_benchmark.py [--runs 10] [--max-seconds 2.0]
+
+With --max-seconds the script exits with status 1 when the median start up time exceeds the limit,
+so it can guard against import time regressions in CI.
+"""
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+from argparse import ArgumentParser
+
+INITIALIZE_REQUEST = {
+    "jsonrpc": "2.0",
+    "id": 1,
+    "method": "initialize",
+    "params": {
+        "protocolVersion": "2024-11-05",
+        "capabilities": {},
+        "clientInfo": {"name": "startup-benchmark", "version": "1.0"},
+    },
+}
+
+
+def time_to_initialize(timeout_seconds: float) -> float:
+    """
+    Starts the server once and returns the seconds until it answered initialize.
+
+    Args:
+        timeout_seconds (float): How long to wait for the response.
+
+    Returns:
+        float: The elapsed wall clock time.
+    """
+    environment = dict(os.environ)
+    environment.setdefault("AZURE_AI_SEARCH_ENDPOINT", "https://startup-benchmark.search.windows.net")
+    environment.setdefault("AZURE_AI_SEARCH_API_KEY", "startup-benchmark")
+
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "-m", "mcp_server_azure_ai_search_preview", "--transport", "stdio",
+         "--envFile", "", "--logLevel", "WARNING"],
+        stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, env=environment, text=True)
+
+    try:
+        process.stdin.write(json.dumps(INITIALIZE_REQUEST) + "\n")
+        process.stdin.flush()
+
+        # The server prints start up messages to stdout before the transport runs, so skip non JSON lines
+        for line in process.stdout:
+            if time.perf_counter() - started > timeout_seconds:
+                break
+            try:
+                message = json.loads(line)
+            except ValueError:
+                continue
+            if isinstance(message, dict) and message.get("id") == 1:
+                return time.perf_counter() - started
+    finally:
+        process.kill()
+        process.wait()
+
+    raise TimeoutError(f"The server did not answer initialize within {timeout_seconds} seconds")
+
+
+def main() -> int:
+    parser = ArgumentParser(description="Measure the time until the MCP server answers initialize.")
+    parser.add_argument("--runs", type=int, default=10, help="Number of cold starts (default: 10)")
+    parser.add_argument("--timeout", type=float, default=30.0, help="Seconds to wait for each start (default: 30)")
+    parser.add_argument("--max-seconds", type=float, default=None,
+                        help="Fail when the median start up time is above this limit")
+    args = parser.parse_args()
+
+    durations = [time_to_initialize(args.timeout) for _ in range(args.runs)]
+    median = statistics.median(durations)
+
+    print(f"time to initialize over {args.runs} runs: "
+          f"median {median * 1000:.0f} ms, min {min(durations) * 1000:.0f} ms, max {max(durations) * 1000:.0f} ms")
+
+    if args.max_seconds is not None and median > args.max_seconds:
+        print(f"median start up time is above the limit of {args.max_seconds * 1000:.0f} ms")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
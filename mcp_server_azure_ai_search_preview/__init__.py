@@ -1,37 +1,53 @@
-from mcp_server_azure_ai_search_preview.data_access_objects import (
-    SearchIndexDao,
-    SearchBaseDao,
-    SearchClientDao,
-    SearchIndexerDao,
-    SearchIndexSchema,
-    SearchFieldSchema,
-    SuggesterSchema,
-    CorsOptionsSchema,
-    ScoringProfileSchema,
-    convert_pydantic_model_to_search_index,
-    convert_to_field_mappings,
-    FieldMappingModel, OperationResult, SearchDocument,
-)
+import importlib
+from typing import Any
 
-from mcp_server_azure_ai_search_preview.shared import FoundryKnowledgeMCP, LoggingLevel
+# Exports are resolved on first access, so that starting the server only loads the modules it uses
+# and the Azure SDK is imported when the first tool needs it.
+_LAZY_IMPORTS: dict[str, str] = {
+    'FoundryKnowledgeMCP': 'shared',
+    'LoggingLevel': 'shared',
+    'ExecutionMode': 'shared',
+    'Transport': 'shared',
+    'SearchIndexDao': 'data_access_objects',
+    'SearchBaseDao': 'data_access_objects',
+    'SearchClientDao': 'data_access_objects',
+    'SearchIndexerDao': 'data_access_objects',
+    'AsyncSearchBaseDao': 'data_access_objects',
+    'AsyncSearchIndexDao': 'data_access_objects',
+    'AsyncSearchClientDao': 'data_access_objects',
+    'AsyncSearchIndexerDao': 'data_access_objects',
+    'SearchIndexSchema': 'data_access_objects',
+    'SearchFieldSchema': 'data_access_objects',
+    'SuggesterSchema': 'data_access_objects',
+    'CorsOptionsSchema': 'data_access_objects',
+    'ScoringProfileSchema': 'data_access_objects',
+    'convert_pydantic_model_to_search_index': 'data_access_objects',
+    'convert_to_field_mappings': 'data_access_objects',
+    'FieldMappingModel': 'data_access_objects',
+    'OperationResult': 'data_access_objects',
+    'SearchDocument': 'data_access_objects',
+    'BatchSummary': 'data_access_objects',
+    'BulkOperationSummary': 'data_access_objects',
+    'QueryPage': 'data_access_objects',
+    'ColumnarQueryPage': 'data_access_objects',
+    'DocumentCounts': 'data_access_objects',
+    'PayloadTrimReport': 'data_access_objects',
+    'IngestionSummary': 'data_access_objects',
+    'FileChunk': 'data_access_objects',
+    'FileMetadata': 'data_access_objects',
+}
 
-__all__ = (
-    'FoundryKnowledgeMCP',
-    'LoggingLevel',
-    'SearchIndexDao',
-    'SearchBaseDao',
-    'SearchClientDao',
-    'SearchIndexerDao',
-    'SearchIndexSchema',
-    'SearchFieldSchema',
-    'SuggesterSchema',
-    'CorsOptionsSchema',
-    'ScoringProfileSchema',
-    'FieldMappingModel',
-    'convert_pydantic_model_to_search_index',
-    'convert_to_field_mappings',
-    'OperationResult',
-    'SearchDocument'
-)
+__all__ = [*_LAZY_IMPORTS]
 
 
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f"{__name__}.{_LAZY_IMPORTS[name]}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -1,17 +1,23 @@
 import os
 import sys
 from argparse import ArgumentParser
-from pathlib import Path
-from typing import Optional, List, Literal, cast
+from typing import Optional, List, cast
 
-import httpx
-from azure.search.documents.indexes._generated.models import FieldMapping
+from mcp.server.fastmcp import Context
 from dotenv import load_dotenv
 
-from mcp_server_azure_ai_search_preview import SearchIndexDao, SearchClientDao, SearchIndexerDao, SearchIndexSchema, \
-    convert_pydantic_model_to_search_index, FieldMappingModel, convert_to_field_mappings, FoundryKnowledgeMCP, \
-    OperationResult, \
-    SearchDocument, LoggingLevel
+from mcp_server_azure_ai_search_preview import SearchIndexSchema, convert_pydantic_model_to_search_index, \
+    FieldMappingModel, convert_to_field_mappings, FoundryKnowledgeMCP, OperationResult, SearchDocument, LoggingLevel, \
+    QueryPage, Transport
+from mcp_server_azure_ai_search_preview.data_access_objects import DocumentBatcher, document_deletion, \
+    delete_matching_documents, supports_keyset_paging, sortable_key_field_name, query_result_cache, \
+    count_documents_per_index, PayloadBudget, default_projection, find_json_files, RecordMapper, ingest_json_files, \
+    PageFormat, to_columnar
+from mcp_server_azure_ai_search_preview.shared import url_fetcher, read_byte_range, read_line_range, \
+    describe_local_file, resolve_local_file, max_read_bytes, metrics_registry
+
+TRANSPORTS = ("stdio", "sse", "streamable-http")
+WORKER_APP_FACTORY = "mcp_server_azure_ai_search_preview.__main__:create_worker_app"
 
 
 def setup_mcp_service(host_name: str, port: int, log_level: LoggingLevel = "INFO"):
@@ -20,28 +26,86 @@ def setup_mcp_service(host_name: str, port: int, log_level: LoggingLevel = "INFO
 
     mcp = FoundryKnowledgeMCP("AI Search MCP Service", **settings)
 
-    @mcp.tool(description="Reads the content of a local file and returns it as a string")
-    def fk_fetch_local_file_contents(file_path: str, encoding: str = "utf-8") -> str:
+    @mcp.tool(description="Reads the content of a local file, or a byte or line range of it, and returns it as a string")
+    def fk_fetch_local_file_contents(file_path: str,
+                                     encoding: str = "utf-8",
+                                     offset: Optional[int] = None,
+                                     length: Optional[int] = None,
+                                     start_line: Optional[int] = None,
+                                     line_count: Optional[int] = None) -> str:
         """
         Reads the content of a local file and returns it as a string.
 
+        Ranges are read through a memory map, so only the requested part of the file is loaded. Ranges and
+        whole-file reads are capped at AZURE_AI_SEARCH_MCP_FILE_READ_MAX_BYTES; larger files must be read in
+        ranges or with fk_read_local_file_chunk.
+
         Args:
             file_path (str): The path to the local file.
             encoding (str): The character encoding to use (default is 'utf-8').
+            offset (int): The byte offset to start reading at.
+            length (int): The number of bytes to read.
+            start_line (int): The first line to read, counting from 1.
+            line_count (int): The number of lines to read.
 
         Returns:
-            str: The contents of the file as a string.
+            str: The contents of the file, or of the requested range, as a string.
 
         Raises:
             FileNotFoundError: If the file does not exist.
             IOError: If the file cannot be read.
+            ValueError: If a range is invalid, or the whole file is requested but it is larger than
+                AZURE_AI_SEARCH_MCP_FILE_READ_MAX_BYTES.
         """
-        path = Path(file_path)
-        if not path.is_file():
-            raise FileNotFoundError(f"No such file: '{file_path}'")
+        if start_line is not None or line_count is not None:
+            return read_line_range(file_path, start_line or 1, line_count, encoding).content
+
+        if offset is not None or length is not None:
+            return read_byte_range(file_path, offset or 0, length, encoding).content
+
+        path = resolve_local_file(file_path)
+        file_size = path.stat().st_size
+        if file_size > max_read_bytes():
+            raise ValueError(f"'{file_path}' is {file_size} bytes, more than the limit of {max_read_bytes()} bytes. "
+                             "Read it in ranges with offset and length or start_line and line_count, "
+                             "or with fk_read_local_file_chunk.")
 
         return path.read_text(encoding=encoding)
 
+    @mcp.tool(description="Returns the size, line count and likely encoding of a local file without returning its content")
+    def fk_get_local_file_metadata(file_path: str, count_lines: bool = True) -> OperationResult:
+        """
+        Describes a local file without loading its content into memory.
+
+        Args:
+            file_path (str): The path to the local file.
+            count_lines (bool): Whether to count the lines, which scans the whole file.
+
+        Returns:
+            OperationResult: The size in bytes, the line count, the guessed encoding and the modification time.
+        """
+        return cast(OperationResult, describe_local_file(file_path, count_lines).model_dump(exclude_none=True))
+
+    @mcp.tool(description="Reads one chunk of a local file; pass next_offset back to read the next chunk")
+    def fk_read_local_file_chunk(file_path: str,
+                                 offset: int = 0,
+                                 length: Optional[int] = None,
+                                 encoding: str = "utf-8") -> OperationResult:
+        """
+        Reads one chunk of a local file so that large files can be walked piece by piece with constant memory.
+
+        Args:
+            file_path (str): The path to the local file.
+            offset (int): The byte offset of the chunk; use the next_offset of the previous chunk.
+            length (int): The number of bytes in the chunk (default 1 MiB).
+            encoding (str): The character encoding to use (default is 'utf-8').
+
+        Returns:
+            OperationResult: The content of the chunk, its byte range, the file size and the next_offset,
+                which is absent at the end of the file.
+        """
+        return cast(OperationResult, read_byte_range(file_path, offset, length, encoding).model_dump(exclude_none=True))
+
     @mcp.tool(description="Fetches the contents of the given HTTP URL")
     async def fk_fetch_url_contents(url: str) -> str:
         """
@@ -56,11 +120,9 @@ def setup_mcp_service(host_name: str, port: int, log_level: LoggingLevel = "INFO
         Raises:
             httpx.RequestError: If the request fails due to a network problem.
             httpx.HTTPStatusError: If the response status code is not 2xx.
+            ValueError: If the content is larger than AZURE_AI_SEARCH_MCP_FETCH_MAX_BYTES.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.get(url)
-            response.raise_for_status()
-            return response.text
+        return await url_fetcher.fetch_text(url)
 
     @mcp.tool(description="Retrieves the names of all indexes ")
     async def list_index_names() -> list[str]:
@@ -70,8 +132,8 @@ def setup_mcp_service(host_name: str, port: int, log_level: LoggingLevel = "INFO
         Returns:
             list[str]: A list containing the names of all available search indexes.
         """
-        dao = SearchIndexDao()
-        return dao.retrieve_index_names()
+        dao = mcp.index_dao()
+        return await dao.retrieve_index_names()
 
     @mcp.tool(description="Retrieves the schemas for all indexes ")
     async def list_index_schemas() -> list[OperationResult]:
@@ -81,8 +143,8 @@ def setup_mcp_service(host_name: str, port: int, log_level: LoggingLevel = "INFO
         Returns:
             list[OperationResult]: A list of dictionaries, each representing the schema of an index.
         """
-        dao = SearchIndexDao()
-        return cast(list[OperationResult], dao.retrieve_index_schemas())
+        dao = mcp.index_dao()
+        return cast(list[OperationResult], await dao.retrieve_index_schemas())
 
     @mcp.tool(description="Retrieves the schema for a specific index")
     async def retrieve_index_schema(index_name: str) -> OperationResult:
@@ -95,8 +157,8 @@ def setup_mcp_service(host_name: str, port: int, log_level: LoggingLevel = "INFO
         Returns:
             OperationResult: A dictionary representing the schema of the specified index.
         """
-        dao = SearchIndexDao()
-        return cast(OperationResult, dao.retrieve_index_schema(index_name))
+        dao = mcp.index_dao()
+        return cast(OperationResult, await dao.retrieve_index_schema(index_name))
 
     @mcp.tool(description="Creates an AI Search index")
     async def create_index(index_definition: SearchIndexSchema) -> OperationResult:
@@ -109,9 +171,9 @@ def setup_mcp_service(host_name: str, port: int, log_level: LoggingLevel = "INFO
         Returns:
             OperationResult: The serialized response of the created index.
         """
-        dao = SearchIndexDao()
+        dao = mcp.index_dao()
         compatible_index_definition = convert_pydantic_model_to_search_index(index_definition)
-        return cast(OperationResult, dao.create_index(compatible_index_definition))
+        return cast(OperationResult, await dao.create_index(compatible_index_definition))
 
     @mcp.tool(description="Updates an AI Search index with a new index definition")
     async def modify_index(index_name: str, updated_index_definition: SearchIndexSchema) -> OperationResult:
@@ -125,9 +187,9 @@ def setup_mcp_service(host_name: str, port: int, log_level: LoggingLevel = "INFO
         Returns:
             OperationResult: The serialized response of the modified index.
         """
-        dao = SearchIndexDao()
+        dao = mcp.index_dao()
         compatible_index_definition = convert_pydantic_model_to_search_index(updated_index_definition)
-        return cast(OperationResult, dao.modify_index(index_name, compatible_index_definition))
+        return cast(OperationResult, await dao.modify_index(index_name, compatible_index_definition))
 
     @mcp.tool(description="Deletes the specified index")
     async def delete_index(index_name: str) -> str:
@@ -140,12 +202,12 @@ def setup_mcp_service(host_name: str, port: int, log_level: LoggingLevel = "INFO
         Returns:
             str: The result of the operation
         """
-        dao = SearchIndexDao()
-        dao.delete_index(index_name)
+        dao = mcp.index_dao()
+        await dao.delete_index(index_name)
         return "Successful"
 
     @mcp.tool(description="Return the total number of documents in the index")
-    def get_document_count(index_name: str) -> int:
+    async def get_document_count(index_name: str) -> int:
         """
         Returns the total number of documents in the index
 
@@ -155,12 +217,29 @@ def setup_mcp_service(host_name: str, port: int, log_level: LoggingLevel = "INFO
         Returns:
             int: The total number of documents in the index
         """
-        search_client_dao = SearchClientDao(index_name)
-        result = search_client_dao.get_document_count()
+        search_client_dao = mcp.search_client_dao(index_name)
+        result = await search_client_dao.get_document_count()
         return result
 
+    @mcp.tool(description="Returns the number of documents in many or all indexes, counted concurrently")
+    async def get_document_counts(index_names: Optional[List[str]] = None) -> OperationResult:
+        """
+        Returns the number of documents in each of the given indexes, or in every index if none are given
+
+        Args:
+            index_names (list[str]): the names of the indexes to count. All indexes are counted if omitted.
+
+        Returns:
+            OperationResult: The count per index, the total and the error of each index that could not be counted.
+        """
+        if not index_names:
+            index_names = await mcp.index_dao().retrieve_index_names()
+
+        document_counts = await count_documents_per_index(mcp.search_client_dao, index_names)
+        return cast(OperationResult, document_counts.model_dump(exclude_none=True))
+
     @mcp.tool(description="Adds a document to the index")
-    def add_document(index_name: str, document: SearchDocument) -> OperationResult:
+    async def add_document(index_name: str, document: SearchDocument) -> OperationResult:
         """
         Add a document to the specified Azure AI Search index
 
@@ -171,10 +250,79 @@ def setup_mcp_service(host_name: str, port: int, log_level: LoggingLevel = "INFO
         Returns:
             OperationResult: The serialized result of the add operation for the single document.
         """
-        search_client_dao = SearchClientDao(index_name)
-        result = search_client_dao.add_document(document.model_dump())
+        search_client_dao = mcp.search_client_dao(index_name)
+        result = await search_client_dao.add_document(document.model_dump())
         return cast(OperationResult, result)
 
+    @mcp.tool(description="Adds many documents to the index in batches and returns a summary per batch")
+    async def add_documents(index_name: str,
+                            documents: list[SearchDocument],
+                            key_field_name: Optional[str] = None,
+                            batch_size: int = 1000) -> OperationResult:
+        """
+        Adds many documents to the specified Azure AI Search index using batched, concurrent uploads
+
+        Documents rejected with a transient status are submitted again with backoff.
+
+        Args:
+            index_name (str): the name of the index we are adding the documents to
+            documents (list[SearchDocument]): The contents of the documents to be added to the index.
+            key_field_name (str): The name of the key field in the index. Looked up from the index schema if omitted.
+            batch_size (int): The maximum number of documents per batch (at most 1000).
+
+        Returns:
+            OperationResult: The number of documents that succeeded and failed, overall and per batch.
+        """
+        search_client_dao = mcp.search_client_dao(index_name)
+        if key_field_name is None:
+            key_field_name = await mcp.index_dao().retrieve_key_field_name(index_name)
+
+        batcher = DocumentBatcher(index_name, key_field_name, search_client_dao.add_documents,
+                                  max_batch_size=batch_size)
+        async with batcher:
+            await batcher.add_many(document.model_dump() for document in documents)
+
+        return cast(OperationResult, batcher.summary.model_dump(exclude_none=True))
+
+    @mcp.tool(description="Streams records from a local JSON or JSON Lines file, or a directory of them, into the index in batches")
+    async def ingest_local_file(index_name: str,
+                                path: str,
+                                ctx: Context,
+                                field_mappings: Optional[dict[str, str]] = None,
+                                key_field_name: Optional[str] = None,
+                                batch_size: int = 1000,
+                                encoding: str = "utf-8") -> OperationResult:
+        """
+        Uploads the records of local JSON files to the specified Azure AI Search index without passing them through the model
+
+        Each file may hold a JSON array of objects, a single object or one object per line (JSON Lines).
+        Directories are searched recursively for .json, .jsonl and .ndjson files.
+
+        Args:
+            index_name (str): the name of the index we are adding the documents to
+            path (str): The path to a file or a directory of files.
+            field_mappings (dict[str, str]): Source field names mapped to index field names. Fields the index
+                does not define are left out.
+            key_field_name (str): The name of the key field in the index. Looked up from the index schema if omitted.
+            batch_size (int): The maximum number of documents per batch (at most 1000).
+            encoding (str): The character encoding of the files (default is 'utf-8').
+
+        Returns:
+            OperationResult: The number of files and records read, the fields left out and the upload summary.
+        """
+        file_paths = find_json_files(path)
+        index_schema = await mcp.index_dao().retrieve_index_schema(index_name)
+        record_mapper = RecordMapper(index_schema, field_mappings, key_field_name)
+
+        async def report_progress(files_done: int, file_count: Optional[int]) -> None:
+            await ctx.report_progress(files_done, file_count)
+
+        summary = await ingest_json_files(mcp.search_client_dao(index_name), index_name, file_paths, record_mapper,
+                                          batch_size=batch_size, encoding=encoding,
+                                          progress_callback=report_progress)
+
+        return cast(OperationResult, summary.model_dump(exclude_none=True))
+
     @mcp.tool(description="Removes a document from the index")
     async def delete_document(index_name: str, key_field_name: str, key_value: str) -> OperationResult:
         """
@@ -188,10 +336,61 @@ def setup_mcp_service(host_name: str, port: int, log_level: LoggingLevel = "INFO
         Returns:
             OperationResult: A list of serialized results for each document deletion operation.
         """
-        search_client_dao = SearchClientDao(index_name)
-        return cast(OperationResult, search_client_dao.delete_document(key_field_name, key_value))
+        search_client_dao = mcp.search_client_dao(index_name)
+        return cast(OperationResult, await search_client_dao.delete_document(key_field_name, key_value))
 
-    @mcp.tool(description="Search a specific index for documents in that index")
+    @mcp.tool(description="Removes many documents from the index by key in batches")
+    async def delete_documents(index_name: str, key_field_name: str, key_values: list[str]) -> OperationResult:
+        """
+        Removes many documents from the index using batched, concurrent deletes.
+
+        Args:
+            index_name (str): the name of the index from which to delete the documents
+            key_field_name (str): The name of the key field in the index we are removing the documents from
+            key_values (list[str]): The values of the key field for the documents we are deleting
+
+        Returns:
+            OperationResult: The number of documents that succeeded and failed, overall and per batch.
+        """
+        search_client_dao = mcp.search_client_dao(index_name)
+
+        batcher = DocumentBatcher(index_name, key_field_name, document_deletion(search_client_dao, key_field_name))
+        async with batcher:
+            await batcher.add_many({key_field_name: key_value} for key_value in key_values)
+
+        return cast(OperationResult, batcher.summary.model_dump(exclude_none=True))
+
+    @mcp.tool(description="Removes all documents matching an OData filter from the index")
+    async def delete_documents_by_filter(index_name: str,
+                                         query_filter: str,
+                                         ctx: Context,
+                                         key_field_name: Optional[str] = None) -> OperationResult:
+        """
+        Removes all documents matching an OData filter from the index, reporting progress as it goes.
+
+        Running it again after an interruption continues with the documents that still match.
+
+        Args:
+            index_name (str): the name of the index from which to delete the documents
+            query_filter (str): The OData $filter expression selecting the documents to delete
+            key_field_name (str): The name of the key field in the index. Looked up from the index schema if omitted.
+
+        Returns:
+            OperationResult: The number of documents that succeeded and failed, overall and per batch.
+        """
+        search_client_dao = mcp.search_client_dao(index_name)
+        if key_field_name is None:
+            key_field_name = await mcp.index_dao().retrieve_key_field_name(index_name)
+
+        async def report_progress(deleted: int, total: Optional[int]) -> None:
+            await ctx.report_progress(deleted, total)
+
+        summary = await delete_matching_documents(search_client_dao, index_name, key_field_name, query_filter,
+                                                   progress_callback=report_progress)
+
+        return cast(OperationResult, summary.model_dump(exclude_none=True))
+
+    @mcp.tool(description="Search a specific index for one page of documents; pass next_cursor back to get the next page")
     async def query_index(
             index_name: str,
             search_text: Optional[str] = None,
@@ -202,8 +401,13 @@ def setup_mcp_service(host_name: str, port: int, log_level: LoggingLevel = "INFO
             skip: Optional[int] = None,
             top: Optional[int] = None,
             include_total_count: Optional[bool] = None,
-    ) -> list[dict]:
-        """Searches the Azure search index for documents matching the query criteria
+            page_size: Optional[int] = None,
+            cursor: Optional[str] = None,
+            max_field_chars: Optional[int] = None,
+            max_response_bytes: Optional[int] = None,
+            result_format: PageFormat = "rows",
+    ) -> OperationResult:
+        """Searches the Azure search index for one page of documents matching the query criteria
 
             :param str index_name: The name of the index to query. This parameter is required
             :param str search_text: A full-text search query expression; Use "*" or omit this parameter to
@@ -215,33 +419,63 @@ def setup_mcp_service(host_name: str, port: int, log_level: LoggingLevel = "INFO
                 desc to indicate descending. The default is ascending order. Ties will be broken by the match
                 scores of documents. If no OrderBy is specified, the default sort order is descending by
                 document match score. There can be at most 32 $orderby clauses.
-            :param list[str] select: The list of fields to retrieve. If unspecified, all fields marked as retrievable
-                in the schema are included.
-            :param int skip: The number of search results to skip. This value cannot be greater than 100,000.
-                If you need to scan documents in sequence, but cannot use $skip due to this limitation,
-                consider using $orderby on a totally-ordered key and $filter with a range query instead.
-            :param int top: The number of search results to retrieve. This can be used in conjunction with
-                $skip to implement client-side paging of search results. If results are truncated due to
-                server-side paging, the response will include a continuation token that can be used to issue
-                another Search request for the next page of results.
+            :param list[str] select: The list of fields to retrieve. If unspecified, all retrievable fields except
+                vector fields are included; use ["*"] to retrieve every retrievable field.
+            :param int skip: The number of search results to skip before the first page.
+            :param int top: The maximum number of search results to retrieve across all pages.
             :param bool include_total_count: A value that specifies whether to fetch the total count of
-                results. Default is false. Setting this value to true may have a performance impact. Note that
-                the count returned is an approximation.
-            :rtype: list[dict]
+                results with the first page. Default is false. Setting this value to true may have a performance
+                impact. Note that the count returned is an approximation.
+            :param int page_size: The number of documents to return in this page (default 50, at most 1000).
+            :param str cursor: The next_cursor returned with the previous page. The other query parameters
+                must be the same as for the previous page.
+            :param int max_field_chars: Strings longer than this are cut to a snippet (default 1000, 0 for no limit).
+            :param int max_response_bytes: The page stops before its documents exceed this JSON size; the rest
+                follow with the next page (default 256 KiB, 0 for no limit).
+            :param str result_format: "rows" returns each document as an object. "columnar" returns the field
+                names once as fields and each document as an array of values in rows; fields that are null in
+                every document are left out and a shorter row ends with nulls. Columnar pages are much smaller
+                for wide documents.
+            :rtype: OperationResult with the documents of the page, the next_cursor, if more documents match,
+                and what was trimmed to stay within the payload budget
             """
-        search_client_dao = SearchClientDao(index_name)
-
-        search_results: list[dict] = search_client_dao.query_index(
+        search_client_dao = mcp.search_client_dao(index_name)
+        payload_budget = PayloadBudget.from_environment(max_field_chars, max_response_bytes)
+
+        # Unordered queries over the whole index are paged by key so they are not bound by the $skip limit
+        key_field_name: Optional[str] = None
+        excluded_fields: list[str] = []
+        needs_keyset_key = cursor is None and supports_keyset_paging(search_text, order_by)
+        if needs_keyset_key or not select:
+            index_schema = await mcp.index_dao().retrieve_index_schema(index_name)
+            if needs_keyset_key:
+                key_field_name = sortable_key_field_name(index_schema)
+            if not select:
+                select, excluded_fields = default_projection(index_schema)
+                select = select if excluded_fields else None
+
+        search_results: QueryPage = await search_client_dao.query_index_page(
             search_text=search_text,
             include_total_count=include_total_count,
             query_filter=query_filter,
             order_by=order_by,
             select=select,
             skip=skip,
-            top=top
+            top=top,
+            page_size=page_size,
+            cursor=cursor,
+            key_field_name=key_field_name,
+            payload_budget=payload_budget
         )
 
-        return search_results
+        if result_format == "columnar":
+            query_result = to_columnar(search_results).model_dump(exclude_none=True)
+        else:
+            query_result = search_results.model_dump(exclude_none=True)
+        if excluded_fields:
+            query_result.setdefault("trimmed", {"omitted_documents": 0})["excluded_fields"] = excluded_fields
+
+        return cast(OperationResult, query_result)
 
     @mcp.tool(
         description="Retrieves the list of all the names of the indexers")
@@ -252,8 +486,8 @@ def setup_mcp_service(host_name: str, port: int, log_level: LoggingLevel = "INFO
         Returns:
             list[str]: A list of indexer names.
         """
-        search_indexer_dao = SearchIndexerDao()
-        return search_indexer_dao.list_indexers()
+        search_indexer_dao = mcp.indexer_dao()
+        return await search_indexer_dao.list_indexers()
 
     @mcp.tool(description="Retrieves the details of a specific indexer by name.")
     async def get_indexer(name: str) -> OperationResult:
@@ -266,8 +500,8 @@ def setup_mcp_service(host_name: str, port: int, log_level: LoggingLevel = "INFO
         Returns:
             OperationResult: A dictionary containing the indexer details.
         """
-        search_indexer_dao = SearchIndexerDao()
-        return cast(OperationResult, search_indexer_dao.get_indexer(name))
+        search_indexer_dao = mcp.indexer_dao()
+        return cast(OperationResult, await search_indexer_dao.get_indexer(name))
 
     @mcp.tool(description="Creates a new indexer")
     async def create_indexer(
@@ -294,12 +528,12 @@ def setup_mcp_service(host_name: str, port: int, log_level: LoggingLevel = "INFO
         Returns:
             OperationResult: A dictionary representing the created indexer.
         """
-        search_indexer_dao = SearchIndexerDao()
+        search_indexer_dao = mcp.indexer_dao()
 
         compat_field_mappings = convert_to_field_mappings(field_mappings)
         compat_output_field_mappings = convert_to_field_mappings(output_field_mappings)
 
-        result = search_indexer_dao.create_indexer(
+        result = await search_indexer_dao.create_indexer(
             name=name,
             data_source_name=data_source_name,
             target_index_name=target_index_name,
@@ -322,8 +556,8 @@ def setup_mcp_service(host_name: str, port: int, log_level: LoggingLevel = "INFO
         Returns:
             None
         """
-        search_indexer_dao = SearchIndexerDao()
-        search_indexer_dao.delete_indexer(name)
+        search_indexer_dao = mcp.indexer_dao()
+        await search_indexer_dao.delete_indexer(name)
         return "Successful"
 
     @mcp.tool(description="Retrieves the list of all data source names")
@@ -334,8 +568,8 @@ def setup_mcp_service(host_name: str, port: int, log_level: LoggingLevel = "INFO
         Returns:
             list[str]: A list of data source names.
         """
-        search_indexer_dao = SearchIndexerDao()
-        return search_indexer_dao.list_data_sources()
+        search_indexer_dao = mcp.indexer_dao()
+        return await search_indexer_dao.list_data_sources()
 
     @mcp.tool(description="Retrieves the details of a specific data source by name")
     async def get_data_source(name: str) -> OperationResult:
@@ -348,8 +582,8 @@ def setup_mcp_service(host_name: str, port: int, log_level: LoggingLevel = "INFO
         Returns:
             OperationResult: A dictionary containing the data source details.
         """
-        search_indexer_dao = SearchIndexerDao()
-        return cast(OperationResult, search_indexer_dao.get_data_source(name))
+        search_indexer_dao = mcp.indexer_dao()
+        return cast(OperationResult, await search_indexer_dao.get_data_source(name))
 
     @mcp.tool(description="Retrieves the list of the names of all skill sets")
     async def list_skill_sets() -> list[str]:
@@ -359,8 +593,8 @@ def setup_mcp_service(host_name: str, port: int, log_level: LoggingLevel = "INFO
         Returns:
             list[str]: A list of skill set names.
         """
-        search_indexer_dao = SearchIndexerDao()
-        return search_indexer_dao.list_skill_sets()
+        search_indexer_dao = mcp.indexer_dao()
+        return await search_indexer_dao.list_skill_sets()
 
     @mcp.tool(description="Retrieves the details of a specific skill set by name")
     async def get_skill_set(skill_set_name: str) -> OperationResult:
@@ -373,8 +607,8 @@ def setup_mcp_service(host_name: str, port: int, log_level: LoggingLevel = "INFO
         Returns:
             OperationResult: A dictionary containing the skill set details.
         """
-        search_indexer_dao = SearchIndexerDao()
-        return cast(OperationResult, search_indexer_dao.get_skill_set(skill_set_name))
+        search_indexer_dao = mcp.indexer_dao()
+        return cast(OperationResult, await search_indexer_dao.get_skill_set(skill_set_name))
 
     @mcp.prompt(description="A prompt to list the names of all the indices")
     async def list_all_indices_prompt() -> str:
@@ -470,25 +704,52 @@ def setup_mcp_service(host_name: str, port: int, log_level: LoggingLevel = "INFO
         https://github.com/projectAcetylcholine/ai-search-pydantic-mcp-client
         """
 
+    @mcp.resource("stats://query-cache", description="Hit and miss counters of the query result cache", mime_type="application/json")
+    async def query_cache_stats_resource() -> dict:
+        return query_result_cache.stats()
+
+    @mcp.resource("stats://thread-pool", description="Queue depth, active calls and wait times of the blocking thread pool", mime_type="application/json")
+    async def thread_pool_stats_resource() -> dict:
+        return mcp.executor_stats()
+
+    @mcp.resource("stats://metrics", description="Tool and Azure AI Search request metrics in the Prometheus text format", mime_type="text/plain")
+    async def metrics_resource() -> str:
+        return metrics_registry.render()
+
     return mcp
 
 
+def create_worker_app():
+    """
+    Builds the streamable HTTP app of one worker process.
+
+    The workers are started by run_mcp_service, which passes the host, port and log level in the
+    FASTMCP_HOST, FASTMCP_PORT and FASTMCP_LOG_LEVEL environment variables along with the variables
+    loaded from the env file.
+    """
+    mcp_service = setup_mcp_service(os.environ["FASTMCP_HOST"], int(os.environ["FASTMCP_PORT"]),
+                                    log_level=cast(LoggingLevel, os.environ["FASTMCP_LOG_LEVEL"]))
+    return mcp_service.streamable_http_app(manage_lifecycle=True)
+
+
 def run_mcp_service():
 
     parser = ArgumentParser(description="Start the MCP service with provided or default configuration.")
 
-    parser.add_argument('--transport', required=True, default='stdio', help='Transport protocol (sse | stdio) (default: stdio)')
+    parser.add_argument('--transport', required=True, default='stdio', help='Transport protocol (sse | stdio | streamable-http) (default: stdio)')
     parser.add_argument('--envFile', required=False, default='.env', help='Path to .env file (default: .env)')
-    parser.add_argument('--host', required=False, default='0.0.0.0', help='Host IP or name for SSE (default: 0.0.0.0)')
-    parser.add_argument('--port', required=False, type=int, default=8000, help='Port number for SSE (default: 8000)')
-    parser.add_argument('--logLevel', required=False, default='DEBUG', help='Logging Level (default: DEBUG) one of: ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]')
+    parser.add_argument('--host', required=False, default='0.0.0.0', help='Host IP or name for SSE and streamable HTTP (default: 0.0.0.0)')
+    parser.add_argument('--port', required=False, type=int, default=8000, help='Port number for SSE and streamable HTTP (default: 8000)')
+    parser.add_argument('--workers', required=False, type=int, default=1, help='Worker processes serving streamable HTTP on the same port (default: 1)')
+    parser.add_argument('--logLevel', required=False, default='INFO', help='Logging Level (default: INFO) one of: ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]')
 
 
     # Parse the application arguments
     args = parser.parse_args()
 
     # Retrieve the specified transport
-    transport: Literal["stdio", "sse"] = args.transport
+    transport: Transport = args.transport
+    workers: int = args.workers
     mcp_env_file = args.envFile
     log_level: LoggingLevel = args.logLevel
 
@@ -496,7 +757,7 @@ def run_mcp_service():
     mcp_host: str = args.host
     mcp_port: int = args.port
 
-    if transport in ["sse", "stdio"]:
+    if transport in TRANSPORTS:
         print("")
         print("")
         print(f"Transport is specified as {transport}")
@@ -507,6 +768,13 @@ def run_mcp_service():
         parser.print_help()
         sys.exit(1)
 
+    # SSE sessions live in the process that opened them, so only the stateless transport can be spread over workers
+    if workers < 1 or (workers > 1 and transport != "streamable-http"):
+        print(f"Invalid number of workers for the {transport} transport: workers={workers}. "
+              "Several workers are only supported with the streamable-http transport")
+        parser.print_help()
+        sys.exit(1)
+
     # Check if envFile exists and load it
     if mcp_env_file and os.path.exists(mcp_env_file):
         load_dotenv(dotenv_path=mcp_env_file)
@@ -517,7 +785,11 @@ def run_mcp_service():
     mcp_service = setup_mcp_service(mcp_host, mcp_port, log_level=log_level)
 
     # Check all params and then run or print the help message
-    mcp_service.run(transport)
+    if workers > 1:
+        os.environ.update({"FASTMCP_HOST": mcp_host, "FASTMCP_PORT": str(mcp_port), "FASTMCP_LOG_LEVEL": log_level})
+        mcp_service.run_workers(workers, WORKER_APP_FACTORY)
+    else:
+        mcp_service.run(transport)
 
 if __name__ == "__main__":
     run_mcp_service()
@@ -1,23 +1,87 @@
+import importlib
+from typing import Any
 
-from mcp_server_azure_ai_search_preview.data_access_objects.dao import SearchIndexDao, SearchBaseDao, SearchClientDao, SearchIndexerDao
-from mcp_server_azure_ai_search_preview.data_access_objects.models import SearchIndexSchema, \
-    convert_pydantic_model_to_search_index, SearchFieldSchema, SuggesterSchema, CorsOptionsSchema, ScoringProfileSchema, \
-    FieldMappingModel, convert_to_field_mappings, OperationResult, SearchDocument
+# Submodules are imported on first attribute access so that importing the package does not load
+# azure.identity and the Azure AI Search clients before they are needed.
+_LAZY_IMPORTS: dict[str, str] = {
+    'SearchClientRegistry': 'client_registry',
+    'search_client_registry': 'client_registry',
+    'RefreshingTokenCredential': 'credentials',
+    'AsyncRefreshingTokenCredential': 'credentials',
+    'get_shared_token_credential': 'credentials',
+    'get_shared_async_token_credential': 'credentials',
+    'close_shared_token_credential': 'credentials',
+    'SearchIndexDao': 'dao',
+    'SearchBaseDao': 'dao',
+    'SearchClientDao': 'dao',
+    'SearchIndexerDao': 'dao',
+    'find_key_field_name': 'dao',
+    'AsyncSearchBaseDao': 'async_dao',
+    'AsyncSearchIndexDao': 'async_dao',
+    'AsyncSearchClientDao': 'async_dao',
+    'AsyncSearchIndexerDao': 'async_dao',
+    'SearchIndexSchema': 'models',
+    'convert_pydantic_model_to_search_index': 'models',
+    'SearchFieldSchema': 'models',
+    'SuggesterSchema': 'models',
+    'CorsOptionsSchema': 'models',
+    'ScoringProfileSchema': 'models',
+    'FieldMappingModel': 'models',
+    'convert_to_field_mappings': 'models',
+    'OperationResult': 'models',
+    'SearchDocument': 'models',
+    'BatchSummary': 'models',
+    'BulkOperationSummary': 'models',
+    'QueryPage': 'models',
+    'ColumnarQueryPage': 'models',
+    'DocumentCounts': 'models',
+    'PayloadTrimReport': 'models',
+    'IngestionSummary': 'models',
+    'FileChunk': 'models',
+    'FileMetadata': 'models',
+    'QueryCursor': 'paging',
+    'PageFormat': 'paging',
+    'to_columnar': 'paging',
+    'supports_keyset_paging': 'paging',
+    'sortable_key_field_name': 'paging',
+    'QueryResultCache': 'query_cache',
+    'query_result_cache': 'query_cache',
+    'IndexSchemaCache': 'schema_cache',
+    'index_schema_cache': 'schema_cache',
+    'PayloadBudget': 'payload_budget',
+    'default_projection': 'payload_budget',
+    'count_documents_per_index': 'counting',
+    'DocumentBatcher': 'batching',
+    'document_deletion': 'batching',
+    'delete_matching_documents': 'batching',
+    'JsonRecordDecoder': 'ingestion',
+    'RecordMapper': 'ingestion',
+    'find_json_files': 'ingestion',
+    'stream_json_records': 'ingestion',
+    'ingest_json_files': 'ingestion',
+    'MemorySearchService': 'memory_backend',
+    'MemoryIndex': 'memory_backend',
+    'memory_search_service': 'memory_backend',
+    'AdaptiveRateLimiter': 'rate_limiter',
+    'RateLimiterRegistry': 'rate_limiter',
+    'rate_limiter_registry': 'rate_limiter',
+    'RequestCoalescer': 'coalescing',
+    'request_coalescer': 'coalescing',
+    'PayloadLogPolicy': 'payload_logging',
+    'payload_log_policy': 'payload_logging',
+}
 
-__all__ = (
-    'SearchBaseDao',
-    'SearchIndexDao',
-    'SearchClientDao',
-    'SearchIndexerDao',
-    'SearchIndexSchema',
-    'SearchFieldSchema',
-    'SuggesterSchema',
-    'CorsOptionsSchema',
-    'ScoringProfileSchema',
-    'FieldMappingModel',
-    'convert_pydantic_model_to_search_index',
-    'convert_to_field_mappings',
-    'OperationResult',
-    'SearchDocument'
-)
+__all__ = [*_LAZY_IMPORTS]
 
+
+def __getattr__(name: str) -> Any:
+    if name not in _LAZY_IMPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(importlib.import_module(f"{__name__}.{_LAZY_IMPORTS[name]}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,546 @@
+import asyncio
+from typing import MutableMapping, Any, Optional, List, Hashable
+
+from azure.core.async_paging import AsyncItemPaged
+from azure.core.credentials import AzureKeyCredential
+from azure.core.exceptions import ResourceNotFoundError, ResourceNotModifiedError
+from azure.search.documents.aio import SearchClient, AsyncSearchItemPaged
+from azure.search.documents.indexes.aio import SearchIndexClient, SearchIndexerClient
+from azure.search.documents.indexes._generated.models import FieldMapping
+from azure.search.documents.indexes.models import SearchIndex, SearchIndexerDataSourceConnection
+from mcp.server.fastmcp.server import logger
+
+from mcp_server_azure_ai_search_preview.data_access_objects.coalescing import coalesced
+from mcp_server_azure_ai_search_preview.data_access_objects.credentials import AsyncRefreshingTokenCredential, \
+    get_shared_async_token_credential
+from mcp_server_azure_ai_search_preview.data_access_objects.dao import SearchBaseDao, SearchIndexRequests, \
+    SearchDocumentRequests, SearchIndexerRequests, find_key_field_name
+from mcp_server_azure_ai_search_preview.data_access_objects.instrumentation import request_metrics_policy
+from mcp_server_azure_ai_search_preview.data_access_objects.models import QueryPage
+from mcp_server_azure_ai_search_preview.data_access_objects.payload_budget import PayloadBudget
+from mcp_server_azure_ai_search_preview.data_access_objects.rate_limiter import AsyncRateLimitPolicy
+from mcp_server_azure_ai_search_preview.data_access_objects.raw_responses import list_index_definitions_async, \
+    search_documents_async
+from mcp_server_azure_ai_search_preview.shared.serialization import copy_result
+
+class AsyncSearchBaseDao(SearchBaseDao):
+    """
+    Base class for asynchronous Azure AI Search data access operations.
+
+    Shares the environment configuration of SearchBaseDao and pools the azure.search.documents.aio
+    clients per event loop, since their HTTP sessions cannot be used across loops.
+    """
+
+    def _fetch_credentials(self) -> AzureKeyCredential | AsyncRefreshingTokenCredential:
+        """
+        Fetches the appropriate async credentials for Azure Search based on the configured authentication method.
+
+        Returns:
+            AzureKeyCredential | AsyncRefreshingTokenCredential: A credential object for authenticating requests.
+
+        Raises:
+            Exception: If the authentication method is missing or invalid.
+        """
+        if self.authentication_method == 'service-principal':
+            return get_shared_async_token_credential()
+
+        return super()._fetch_credentials()
+
+    def _client_key(self, client_type: str, index_name: str | None = None) -> Hashable:
+        """
+        Builds the key identifying a pooled async client for this configuration and event loop.
+
+        Args:
+            client_type (str): The kind of SDK client (index, search or indexer).
+            index_name (str | None): The index the client is bound to, if any.
+
+        Returns:
+            Hashable: The registry key for the client.
+        """
+        try:
+            event_loop_id = id(asyncio.get_running_loop())
+        except RuntimeError:
+            event_loop_id = None
+
+        return ("async", event_loop_id) + super()._client_key(client_type, index_name)
+
+    def _pipeline_policies(self) -> list[Any]:
+        """Builds the per-retry policies of the async SDK clients: the shared rate limiter and the request metrics."""
+        return [AsyncRateLimitPolicy(self.service_endpoint), request_metrics_policy]
+
+    def _create_memory_client(self, client_type: str, index_name: str | None = None) -> Any:
+        """Creates a client of the in-memory backend with the interface of the aio clients."""
+        from mcp_server_azure_ai_search_preview.data_access_objects.memory_backend import memory_client
+
+        return memory_client(client_type, index_name, asynchronous=True)
+
+
+class AsyncSearchIndexDao(AsyncSearchBaseDao, SearchIndexRequests):
+    """
+    Asynchronous Data Access Object (DAO) for interacting with Azure AI Search Indexes.
+
+    Mirrors SearchIndexDao on top of the azure.search.documents.indexes.aio client.
+    """
+
+    def __init__(self):
+        """
+        Initializes the AsyncSearchIndexDao with a pooled async SearchIndexClient instance.
+        """
+        super().__init__()
+        self.client = self._acquire_client(
+            "index",
+            lambda: SearchIndexClient(self.service_endpoint, self._fetch_credentials(), api_version=self.api_version,
+                                     per_retry_policies=self._pipeline_policies())
+        )
+
+    async def close(self):
+        """Shuts down the Data Access Object instance and associated resources
+
+        The pooled client is shared with other instances, so it stays open for reuse. It is closed
+        once the registry has evicted it and no other instance still uses it, or when the service
+        shuts down.
+
+        :rtype: None
+        """
+        self._release_client()
+        self.client = None
+
+    @coalesced
+    async def retrieve_index_names(self) -> list[str]:
+        """
+        Retrieves a list of all search index names from the Azure Search service.
+
+        Returns:
+            list[str]: A list of index names.
+        """
+        search_results: AsyncItemPaged[str] = self.client.list_index_names()
+        return [search_result async for search_result in search_results]
+
+    @coalesced
+    async def retrieve_index_schemas(self) -> list[MutableMapping[str, Any]]:
+        """
+        Retrieves the full schema definition for each search index.
+
+        The listing is served from the schema cache while it is younger than the cache's max age. Once
+        listed again, definitions whose ETag did not change are taken from the cache.
+
+        Returns:
+            list[SearchIndex]: A list of serialized index schema definitions.
+        """
+        cached_schemas = self._cached_index_schemas()
+        if cached_schemas is not None:
+            return cached_schemas
+
+        if isinstance(self.client, SearchIndexClient):
+            results = await list_index_definitions_async(self.client, self.api_version, self.service_endpoint)
+        else:
+            # The clients of the in-memory backend have no REST pipeline to send the request through
+            search_results: AsyncItemPaged[SearchIndex] = self.client.list_indexes()
+            results = [search_result.serialize(keep_readonly=True) async for search_result in search_results]
+
+        return self._store_index_schemas(results)
+
+    @coalesced
+    async def retrieve_index_schema(self, index_name: str) -> MutableMapping[str, Any]:
+        """
+        Retrieves the full schema definition for a search index.
+
+        Definitions are served from the schema cache. Once older than the cache's max age they are
+        revalidated with a conditional GET on their ETag, which returns no body if the index is unchanged.
+
+        Returns:
+            SearchIndex: A serialized index schema definition.
+        """
+        cached_schema, get_index_arguments = self._lookup_index_schema(index_name)
+        if get_index_arguments is None:
+            return copy_result(cached_schema.schema)
+
+        try:
+            search_results = await self.client.get_index(index_name, **get_index_arguments)
+        except ResourceNotModifiedError:
+            return self._index_schema_not_modified(index_name, cached_schema)
+        except ResourceNotFoundError:
+            self._index_schema_not_found(index_name)
+            raise
+
+        return self._store_index_schema(search_results)
+
+    async def retrieve_key_field_name(self, index_name: str) -> str:
+        """
+        Retrieves the name of the key field of a search index.
+
+        Args:
+            index_name (str): The name of the index.
+
+        Returns:
+            str: The name of the key field.
+        """
+        index_schema = await self.retrieve_index_schema(index_name)
+        return find_key_field_name(index_schema)
+
+    async def modify_index(self, index_name: str, updated_index_definition: SearchIndex) -> MutableMapping[str, Any]:
+        """
+        Updates an existing index in the Azure AI Search service.
+
+        Args:
+            index_name (SearchIndex): The name of the index to be updated
+            updated_index_definition (SearchIndex): The full definition of the index.
+
+        Returns:
+            MutableMapping[str, Any]: The serialized response of the created index.
+        """
+        index_definition = self._prepare_index_update(index_name, updated_index_definition)
+        operation_results = await self.client.create_or_update_index(index_definition)
+        return self._index_changed(index_name, operation_results)
+
+    async def create_index(self, index_definition: SearchIndex) -> MutableMapping[str, Any]:
+        """
+        Creates a new index in the Azure AI Search service.
+
+        Args:
+            index_definition (SearchIndex): The full definition of the index to be created.
+
+        Returns:
+            MutableMapping[str, Any]: The serialized response of the created index.
+        """
+        operation_results = await self.client.create_index(self._prepare_index_creation(index_definition))
+        return self._index_changed(index_definition.name, operation_results)
+
+    async def delete_index(self, index_name: str):
+        """
+        Deletes an existing index from the Azure AI Search service.
+
+        Args:
+            index_name (str): The name of the index to be deleted.
+
+        Returns:
+            None
+        """
+        logger.debug("Deleting index %s", index_name)
+        await self.client.delete_index(index_name)
+        self._index_changed(index_name)
+
+
+class AsyncSearchClientDao(AsyncSearchBaseDao, SearchDocumentRequests):
+    """
+    Asynchronous Data Access Object (DAO) for the documents of a single Azure AI Search index.
+
+    Mirrors SearchClientDao on top of the azure.search.documents.aio client.
+    """
+
+    def __init__(self, index_name: str):
+        """
+        Initializes the AsyncSearchClientDao with a pooled async SearchClient instance.
+        :param index_name: The name of the index to connect to
+        """
+        super().__init__()
+        self.index_name = index_name
+        self.client = self._acquire_client(
+            "search",
+            lambda: SearchClient(self.service_endpoint, index_name, self._fetch_credentials(),
+                                 api_version=self.api_version, per_retry_policies=self._pipeline_policies()),
+            index_name
+        )
+
+    async def close(self):
+        """Shuts down the Data Access Object instance and associated resources
+
+        The pooled client is shared with other instances, so it stays open for reuse. It is closed
+        once the registry has evicted it and no other instance still uses it, or when the service
+        shuts down.
+
+        :rtype: None
+        """
+        self._release_client()
+        self.client = None
+
+    @coalesced
+    async def get_document_count(self) -> int:
+        """
+        Return the total number of documents in the index
+
+        Uses the document count API ($count), which returns a single number instead of a page of results.
+
+        Returns:
+           int: The total number of documents in the index.
+        """
+        return await self.client.get_document_count()
+
+    @coalesced
+    async def count_documents(self, query_filter: Optional[str] = None) -> int:
+        """
+        Return the number of documents matching an OData filter without retrieving any of them
+
+        Args:
+            query_filter (str): The OData $filter expression the documents must match.
+
+        Returns:
+           int: The number of matching documents.
+        """
+        search_results: AsyncSearchItemPaged[dict] = await self.client.search(**self._count_arguments(query_filter))
+
+        return await search_results.get_count()
+
+    async def add_document(self, document: dict):
+        """
+        Uploads a single document to the Azure AI Search index.
+
+        Args:
+            document (dict): The document to be added to the index.
+
+        Returns:
+            MutableMapping[str, Any]: The serialized result of the add operation for the single document.
+        """
+        documents_to_add = [document]
+        operation_results = await self.add_documents(documents_to_add)
+        return operation_results[0]
+
+    async def add_documents(self, documents: list[dict]) -> list[MutableMapping[str, Any]]:
+        """
+        Uploads a batch of documents to the Azure AI Search index.
+
+        Args:
+            documents (list[dict]): A list of documents to upload.
+
+        Returns:
+            list[MutableMapping[str, Any]]: A list of serialized results for each document upload operation.
+        """
+        operation_results = await self.client.upload_documents(self._prepare_upload(documents))
+        return self._documents_changed(operation_results)
+
+    async def delete_document(self, key_field_name: str, key_value: str):
+        """
+        Deletes a single document from the Azure AI Search index.
+
+        Args:
+            key_field_name (str): The name of the key field in the index
+            key_value (str): The value of the key field
+
+        Returns:
+            list[MutableMapping[str, Any]]: A list of serialized results for each document deletion operation.
+        """
+        document_keys: list[str] = [key_value]
+
+        results = await self.delete_documents(key_field_name=key_field_name, document_keys=document_keys)
+
+        return results
+
+    async def delete_documents(self, key_field_name: str, document_keys: list[str]) -> list[MutableMapping[str, Any]]:
+        """
+        Deletes a batch of documents from the Azure AI Search index.
+
+        Args:
+            key_field_name (str): The name of the key field in the index
+            document_keys (list[str]): A list of document keys to delete.
+
+        Returns:
+            list[MutableMapping[str, Any]]: A list of serialized results for each document deletion operation.
+        """
+        operation_results = await self.client.delete_documents(self._prepare_deletion(key_field_name, document_keys))
+        return self._documents_changed(operation_results)
+
+    async def query_index(self,
+                          search_text: Optional[str] = None,
+                          *,
+                          query_filter: Optional[str] = None,
+                          order_by: Optional[List[str]] = None,
+                          select: Optional[List[str]] = None,
+                          skip: Optional[int] = None,
+                          top: Optional[int] = None,
+                          include_total_count: Optional[bool] = None,
+                          ) -> list[dict]:
+        """Search the Azure search index for documents.
+
+        Accepts the same parameters as SearchClientDao.query_index.
+
+        :rtype: list[dict]
+        """
+        search_results: AsyncSearchItemPaged[dict] = await self.client.search(
+            **self._search_arguments(search_text, query_filter, order_by, select, skip, top, include_total_count)
+        )
+
+        return [search_result_item async for search_result_item in search_results]
+
+    async def query_index_page(self,
+                               search_text: Optional[str] = None,
+                               *,
+                               query_filter: Optional[str] = None,
+                               order_by: Optional[List[str]] = None,
+                               select: Optional[List[str]] = None,
+                               skip: Optional[int] = None,
+                               top: Optional[int] = None,
+                               include_total_count: Optional[bool] = None,
+                               page_size: Optional[int] = None,
+                               cursor: Optional[str] = None,
+                               key_field_name: Optional[str] = None,
+                               payload_budget: Optional[PayloadBudget] = None,
+                               ) -> QueryPage:
+        """Search the Azure search index for one page of documents.
+
+        Accepts the same parameters as SearchClientDao.query_index_page.
+
+        :rtype: QueryPage
+        """
+        page_lookup = self._lookup_page(search_text, query_filter, order_by, select, skip, top, include_total_count,
+                                        page_size, cursor, key_field_name, payload_budget)
+        if page_lookup.page is not None:
+            return page_lookup.page
+
+        search_kwargs = page_lookup.request.search_kwargs
+        if isinstance(self.client, SearchClient):
+            results, count = await search_documents_async(self.client, self.api_version, search_kwargs,
+                                                          page_lookup.result_limit)
+        else:
+            # The clients of the in-memory backend have no REST pipeline to send the request through
+            search_results: AsyncSearchItemPaged[dict] = await self.client.search(**search_kwargs)
+            results = []
+
+            async for search_result_item in search_results:
+                results.append(search_result_item)
+                if len(results) == page_lookup.result_limit:
+                    break
+
+            count = await search_results.get_count() if page_lookup.include_total_count else None
+
+        return self._store_page(page_lookup, results, count, payload_budget)
+
+
+class AsyncSearchIndexerDao(AsyncSearchBaseDao, SearchIndexerRequests):
+    """
+    An asynchronous data access object (DAO) for managing Azure AI Search indexers, data sources, and skillsets.
+
+    Mirrors SearchIndexerDao on top of the azure.search.documents.indexes.aio client.
+    """
+
+    def __init__(self):
+        """
+        Initializes the AsyncSearchIndexerDao by acquiring a pooled async SearchIndexerClient using credentials
+        and service configuration from the base class.
+        """
+        super().__init__()
+        self.client = self._acquire_client(
+            "indexer",
+            lambda: SearchIndexerClient(self.service_endpoint, self._fetch_credentials(), api_version=self.api_version,
+                                       per_retry_policies=self._pipeline_policies())
+        )
+
+    async def close(self):
+        """Shuts down the Data Access Object instance and associated resources
+
+        The pooled client is shared with other instances, so it stays open for reuse. It is closed
+        once the registry has evicted it and no other instance still uses it, or when the service
+        shuts down.
+
+        :rtype: None
+        """
+        self._release_client()
+        self.client = None
+
+    @coalesced
+    async def list_indexers(self) -> list[str]:
+        """
+        Retrieves the names of all indexers registered in the Azure AI Search service.
+
+        Returns:
+            list[str]: A list of indexer names.
+        """
+        search_results = await self.client.get_indexer_names()
+        return list(search_results)
+
+    @coalesced
+    async def get_indexer(self, name: str) -> MutableMapping[str, Any]:
+        """
+        Retrieves the full definition of a specific indexer.
+
+        Args:
+            name (str): The name of the indexer to retrieve.
+
+        Returns:
+            MutableMapping[str, Any]: A dictionary representing the serialized indexer definition.
+        """
+        indexer_details = await self.client.get_indexer(name)
+        return indexer_details.serialize(keep_readonly=True)
+
+    async def create_indexer(self, name: str,
+                             data_source_name: str,
+                             target_index_name: str,
+                             description: str,
+                             field_mappings: list[FieldMapping],
+                             output_field_mappings: list[FieldMapping],
+                             skill_set_name: str = None,
+                             ) -> MutableMapping[str, Any]:
+        """
+        Creates a new indexer in the Azure AI Search service.
+
+        Accepts the same parameters as SearchIndexerDao.create_indexer.
+
+        Returns:
+            MutableMapping[str, Any]: A dictionary representing the created indexer.
+        """
+        parameters = self._indexing_parameters(await self.client.get_data_source_connection(name=data_source_name))
+        indexer_definition = self._indexer_definition(name, data_source_name, target_index_name, description,
+                                                      field_mappings, output_field_mappings, skill_set_name,
+                                                      parameters)
+        indexer_result = await self.client.create_indexer(indexer_definition)
+        return self._indexer_changed(indexer_result)
+
+    async def delete_indexer(self, name: str) -> None:
+        """
+        Deletes an indexer by name from the Azure AI Search service.
+
+        Args:
+            name (str): The name of the indexer to delete.
+        """
+        await self.client.delete_indexer(name)
+        self._indexer_changed()
+
+    @coalesced
+    async def list_data_sources(self) -> list[str]:
+        """
+        Lists the names of all data source connections configured in the AI Search service.
+
+        Returns:
+            list[str]: A list of data source connection names.
+        """
+        data_source_names = await self.client.get_data_source_connection_names()
+        return list(data_source_names)
+
+    @coalesced
+    async def get_data_source(self, name: str) -> MutableMapping[str, Any]:
+        """
+        Retrieves the full definition of a specific data source connection.
+
+        Args:
+            name (str): The name of the data source connection to retrieve.
+
+        Returns:
+            MutableMapping[str, Any]: A dictionary representing the serialized data source definition.
+        """
+        data_source_detail: SearchIndexerDataSourceConnection = await self.client.get_data_source_connection(
+            name=name)
+        return data_source_detail.serialize(keep_readonly=True)
+
+    @coalesced
+    async def list_skill_sets(self) -> list[str]:
+        """
+        Lists the names of all skillsets configured in the Azure AI Search service.
+
+        Returns:
+            list[str]: A list of skillset names.
+        """
+        skill_set_names = await self.client.get_skillset_names()
+        return list(skill_set_names)
+
+    @coalesced
+    async def get_skill_set(self, skill_set_name: str) -> MutableMapping[str, Any]:
+        """
+        Retrieves the full definition of a specific skillset.
+
+        Args:
+            skill_set_name (str): The name of the skillset to retrieve.
+
+        Returns:
+            MutableMapping[str, Any]: A dictionary representing the serialized skillset definition.
+        """
+        skill_set_result = await self.client.get_skillset(skill_set_name)
+        return skill_set_result.serialize(keep_readonly=True)
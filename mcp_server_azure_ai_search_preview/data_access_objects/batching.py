@@ -0,0 +1,362 @@
+import asyncio
+import json
+import random
+from typing import Any, AsyncIterable, Awaitable, Callable, Iterable, MutableMapping, Optional
+
+from mcp.server.fastmcp.server import logger
+
+from mcp_server_azure_ai_search_preview.data_access_objects.models import BatchSummary, BulkOperationSummary
+
+# Azure AI Search accepts at most 1000 actions and 16 MB per indexing request
+DEFAULT_MAX_BATCH_SIZE = 1000
+DEFAULT_MAX_BATCH_BYTES = 15 * 1024 * 1024
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_MAX_RETRIES = 3
+DEFAULT_RETRY_BACKOFF_SECONDS = 0.5
+MAX_REPORTED_KEYS = 20
+
+# Per-document status codes of a 207 response that are worth submitting again
+RETRIABLE_STATUS_CODES = frozenset({409, 422, 429, 500, 502, 503, 504})
+MISSING_RESULT_ERROR = "The service returned no result for the document"
+
+# Deleted documents keep matching queries until the index refreshes, usually within a second
+STALLED_ROUND_DELAY_SECONDS = 0.5
+MAX_STALLED_ROUNDS = 5
+
+BatchOperation = Callable[[list[dict]], Awaitable[list[MutableMapping[str, Any]]]]
+ProgressCallback = Callable[[int, Optional[int]], Awaitable[None]]
+
+
+class DocumentBatcher:
+    """
+    Buffers documents into size- and byte-bounded batches and submits them concurrently.
+
+    Documents that fail with a transient per-document status in a 207 multi-status response are
+    re-submitted with exponential backoff. The outcome of each batch is recorded in a compact
+    BulkOperationSummary instead of one result per document.
+    """
+
+    def __init__(self,
+                 index_name: str,
+                 key_field_name: str,
+                 operation: BatchOperation,
+                 *,
+                 max_batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+                 max_batch_bytes: int = DEFAULT_MAX_BATCH_BYTES,
+                 max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                 max_retries: int = DEFAULT_MAX_RETRIES,
+                 retry_backoff_seconds: float = DEFAULT_RETRY_BACKOFF_SECONDS):
+        """
+        Initializes the batcher.
+
+        Args:
+            index_name (str): The name of the index the documents are sent to.
+            key_field_name (str): The name of the key field, used to match results to documents.
+            operation (BatchOperation): Submits one batch and returns the serialized indexing results.
+            max_batch_size (int): The maximum number of documents per batch.
+            max_batch_bytes (int): The maximum JSON size of a batch in bytes.
+            max_concurrency (int): The maximum number of batches in flight.
+            max_retries (int): How many times failed documents of a batch are re-submitted.
+            retry_backoff_seconds (float): The initial delay between retries.
+        """
+        self.index_name = index_name
+        self.key_field_name = key_field_name
+        self.max_batch_size = max(1, min(max_batch_size, DEFAULT_MAX_BATCH_SIZE))
+        self.max_batch_bytes = max_batch_bytes
+        self.max_retries = max_retries
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.summary = BulkOperationSummary(index_name=index_name)
+
+        self._operation = operation
+        self._buffer: list[dict] = []
+        self._buffer_bytes = 0
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._tasks: set[asyncio.Task] = set()
+
+    async def __aenter__(self) -> "DocumentBatcher":
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+    async def add(self, document: dict) -> None:
+        """
+        Adds a document to the current batch, submitting the batch first if the document does not fit.
+
+        Args:
+            document (dict): The document to buffer.
+        """
+        document_bytes = self._document_size(document)
+
+        if self._buffer and (len(self._buffer) >= self.max_batch_size
+                             or self._buffer_bytes + document_bytes > self.max_batch_bytes):
+            await self._submit_buffer()
+
+        self._buffer.append(document)
+        self._buffer_bytes += document_bytes
+
+    async def add_many(self, documents: Iterable[dict] | AsyncIterable[dict]) -> None:
+        """
+        Adds every document of a (possibly asynchronous) iterable.
+
+        Args:
+            documents (Iterable[dict] | AsyncIterable[dict]): The documents to buffer.
+        """
+        if isinstance(documents, AsyncIterable):
+            async for document in documents:
+                await self.add(document)
+        else:
+            for document in documents:
+                await self.add(document)
+
+    async def flush(self) -> None:
+        """
+        Submits the buffered documents and waits for every batch in flight.
+        """
+        if self._buffer:
+            await self._submit_buffer()
+
+        if self._tasks:
+            await asyncio.gather(*self._tasks)
+
+    async def close(self) -> BulkOperationSummary:
+        """
+        Flushes the remaining documents and returns the summary of the whole operation.
+
+        Returns:
+            BulkOperationSummary: The per-batch and total outcome.
+        """
+        await self.flush()
+
+        self.summary.succeeded = sum(batch.succeeded for batch in self.summary.batches)
+        self.summary.failed = sum(batch.failed for batch in self.summary.batches)
+        return self.summary
+
+    async def _submit_buffer(self) -> None:
+        batch, self._buffer = self._buffer, []
+        batch_bytes, self._buffer_bytes = self._buffer_bytes, 0
+
+        batch_summary = BatchSummary(batch=len(self.summary.batches) + 1, documents=len(batch), bytes=batch_bytes)
+        self.summary.batches.append(batch_summary)
+        self.summary.total_documents += len(batch)
+
+        # Waiting for a free slot keeps at most max_concurrency batches in memory
+        await self._semaphore.acquire()
+        task = asyncio.create_task(self._run_batch(batch, batch_summary))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _run_batch(self, batch: list[dict], batch_summary: BatchSummary) -> None:
+        # Imported here so that the server can start without loading azure.core
+        from azure.core.exceptions import HttpResponseError, ServiceRequestError, ServiceResponseError
+
+        try:
+            pending = batch
+            attempt = 0
+
+            while pending:
+                retry_after: Optional[float] = None
+
+                try:
+                    results = await self._operation(pending)
+                except (HttpResponseError, ServiceRequestError, ServiceResponseError) as error:
+                    status_code = getattr(error, "status_code", None)
+                    transient = status_code is None or status_code in RETRIABLE_STATUS_CODES
+                    if not transient or attempt >= self.max_retries:
+                        self._record_failures(batch_summary, pending, str(error))
+                        return
+                    retry_after = self._retry_after(error)
+                else:
+                    pending = self._record_results(batch_summary, pending, results, attempt)
+
+                if not pending:
+                    return
+
+                attempt += 1
+                batch_summary.retries += 1
+                await asyncio.sleep(retry_after if retry_after is not None else self._backoff(attempt))
+        except Exception as error:
+            logger.warning(f"Batch {batch_summary.batch} for index {self.index_name} failed: {error}")
+            self._record_failures(batch_summary, batch, str(error))
+        finally:
+            self._semaphore.release()
+
+    def _record_results(self, batch_summary: BatchSummary, pending: list[dict],
+                        results: list[MutableMapping[str, Any]], attempt: int) -> list[dict]:
+        """
+        Tallies the indexing results and returns the documents that should be submitted again.
+
+        Results are matched to the submitted documents by key. A document without a matching result is
+        counted as failed, and a result matching no submitted document is ignored, so every document is
+        counted exactly once.
+        """
+        unmatched_documents: dict[str, int] = {}
+        for document in pending:
+            key = str(document.get(self.key_field_name))
+            unmatched_documents[key] = unmatched_documents.get(key, 0) + 1
+
+        retry_keys: set[str] = set()
+
+        for result in results:
+            key = str(result.get("key"))
+            if not unmatched_documents.get(key):
+                logger.warning(f"Ignoring the result for key {key} in batch {batch_summary.batch} for index "
+                               f"{self.index_name}, which matches no submitted document")
+                continue
+            unmatched_documents[key] -= 1
+
+            if result.get("status"):
+                batch_summary.succeeded += 1
+            elif result.get("statusCode") in RETRIABLE_STATUS_CODES and attempt < self.max_retries:
+                retry_keys.add(key)
+            else:
+                self._record_failure(batch_summary, result.get("key"), result.get("errorMessage"))
+
+        for key, count in unmatched_documents.items():
+            for _ in range(count):
+                self._record_failure(batch_summary, key, MISSING_RESULT_ERROR)
+
+        return [document for document in pending if str(document.get(self.key_field_name)) in retry_keys]
+
+    def _record_failures(self, batch_summary: BatchSummary, documents: list[dict], error_message: str) -> None:
+        for document in documents:
+            self._record_failure(batch_summary, document.get(self.key_field_name), error_message)
+
+    @staticmethod
+    def _record_failure(batch_summary: BatchSummary, key: Any, error_message: Optional[str]) -> None:
+        batch_summary.failed += 1
+
+        if batch_summary.failed_keys is None:
+            batch_summary.failed_keys = []
+        if len(batch_summary.failed_keys) < MAX_REPORTED_KEYS:
+            batch_summary.failed_keys.append(str(key))
+
+        if error_message:
+            if batch_summary.errors is None:
+                batch_summary.errors = []
+            if error_message not in batch_summary.errors and len(batch_summary.errors) < MAX_REPORTED_KEYS:
+                batch_summary.errors.append(error_message)
+
+    def _backoff(self, attempt: int) -> float:
+        delay = self.retry_backoff_seconds * (2 ** (attempt - 1))
+        return delay + random.uniform(0, delay)
+
+    @staticmethod
+    def _retry_after(error: Exception) -> Optional[float]:
+        response = getattr(error, "response", None)
+        if response is None:
+            return None
+
+        retry_after = response.headers.get("Retry-After")
+        try:
+            return float(retry_after) if retry_after is not None else None
+        except ValueError:
+            return None
+
+    @staticmethod
+    def _document_size(document: dict) -> int:
+        return len(json.dumps(document, separators=(",", ":"), default=str).encode("utf-8"))
+
+
+def document_deletion(dao: Any, key_field_name: str) -> BatchOperation:
+    """
+    Builds a batch operation that deletes the buffered documents by key.
+
+    Args:
+        dao (Any): A document DAO whose delete_documents method is awaitable.
+        key_field_name (str): The name of the key field in the index.
+
+    Returns:
+        BatchOperation: The operation to hand to a DocumentBatcher.
+    """
+
+    async def delete_batch(batch: list[dict]) -> list[MutableMapping[str, Any]]:
+        document_keys = [document[key_field_name] for document in batch]
+        return await dao.delete_documents(key_field_name=key_field_name, document_keys=document_keys)
+
+    return delete_batch
+
+
+async def delete_matching_documents(dao: Any,
+                                     index_name: str,
+                                     key_field_name: str,
+                                     query_filter: str,
+                                     *,
+                                     batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+                                     max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+                                     progress_callback: Optional[ProgressCallback] = None) -> BulkOperationSummary:
+    """
+    Deletes every document matching an OData filter in concurrent batches.
+
+    Each round fetches only the keys of the next matching documents (select=[key], no $skip) and
+    deletes them before querying again, so only the keys are kept in memory and the 100,000 $skip
+    limit does not apply. Because only documents that still match are touched, an interrupted run
+    can simply be started again and it continues where it stopped.
+
+    Deleted documents keep matching until the index refreshes, so keys that were already submitted
+    are never submitted or counted again. Rounds that only return such keys are retried after a
+    short delay, unless none of them was actually deleted: documents that failed to be deleted stop
+    the run right away, and their failures are reported in the summary.
+
+    Args:
+        dao (Any): A document DAO whose count_documents, query_index and delete_documents methods are awaitable.
+        index_name (str): The name of the index.
+        key_field_name (str): The name of the key field in the index.
+        query_filter (str): The OData $filter expression selecting the documents to delete.
+        batch_size (int): The maximum number of documents per delete batch.
+        max_concurrency (int): The maximum number of delete batches in flight.
+        progress_callback (ProgressCallback | None): Awaited with (documents submitted, documents matched) after
+            every round.
+
+    Returns:
+        BulkOperationSummary: The per-batch and total outcome.
+    """
+    total_matches = await dao.count_documents(query_filter)
+    if progress_callback is not None:
+        await progress_callback(0, total_matches)
+
+    delete_batch = document_deletion(dao, key_field_name)
+    deleted_keys: set[str] = set()
+
+    async def delete_and_track(batch: list[dict]) -> list[MutableMapping[str, Any]]:
+        results = await delete_batch(batch)
+        deleted_keys.update(str(result.get("key")) for result in results if result.get("status"))
+        return results
+
+    batcher = DocumentBatcher(index_name, key_field_name, delete_and_track,
+                              max_batch_size=batch_size, max_concurrency=max_concurrency)
+    round_size = batcher.max_batch_size * max_concurrency
+    submitted_keys: set[str] = set()
+    stalled_rounds = 0
+
+    while True:
+        matches = await dao.query_index(query_filter=query_filter, select=[key_field_name], top=round_size)
+        round_keys = [str(match[key_field_name]) for match in matches]
+        if not round_keys:
+            break
+
+        new_keys = [key for key in round_keys if key not in submitted_keys]
+
+        if not new_keys:
+            if not any(key in deleted_keys for key in round_keys):
+                logger.warning(f"{len(round_keys)} documents matching '{query_filter}' in index {index_name} "
+                               "could not be deleted; stopping")
+                break
+            stalled_rounds += 1
+            if stalled_rounds > MAX_STALLED_ROUNDS:
+                logger.warning(f"Documents matching '{query_filter}' in index {index_name} are still visible "
+                               "after being deleted; stopping")
+                break
+            await asyncio.sleep(STALLED_ROUND_DELAY_SECONDS * stalled_rounds)
+            continue
+
+        stalled_rounds = 0
+        submitted_keys.update(new_keys)
+        await batcher.add_many({key_field_name: key} for key in new_keys)
+        await batcher.flush()
+
+        logger.info(f"Deleted {batcher.summary.total_documents} of {total_matches} documents from index {index_name}")
+        if progress_callback is not None:
+            await progress_callback(batcher.summary.total_documents, total_matches)
+
+    return await batcher.close()
@@ -0,0 +1,197 @@
+import asyncio
+import inspect
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, TypeVar
+
+from mcp.server.fastmcp.server import logger
+
+ClientT = TypeVar("ClientT")
+
+DEFAULT_CLIENT_POOL_SIZE = 32
+
+
+class SearchClientRegistry:
+    """
+    Process-wide registry of Azure AI Search SDK clients.
+
+    Clients are keyed by (client type, endpoint, index name, api version, credential) so that
+    every tool call targeting the same resource reuses the same HTTP pipeline and its warm
+    connections. The registry is bounded; the least recently used client is evicted when the
+    limit is exceeded.
+
+    Each acquire leases the client until it is released. An evicted client that is still leased
+    stays open until its last lease is released, so calls in flight on it are not cut off.
+    """
+
+    def __init__(self, max_size: int | None = None):
+        """
+        Initializes the registry.
+
+        Args:
+            max_size (int | None): The maximum number of clients to keep open. Defaults to the
+                AZURE_AI_SEARCH_CLIENT_POOL_SIZE environment variable or 32.
+        """
+        if max_size is None:
+            max_size = int(os.environ.get("AZURE_AI_SEARCH_CLIENT_POOL_SIZE", DEFAULT_CLIENT_POOL_SIZE))
+
+        if max_size < 1:
+            raise ValueError("The client pool size must be at least 1")
+
+        self.max_size = max_size
+        self._clients: OrderedDict[Hashable, Any] = OrderedDict()
+        # Leases and evicted clients are keyed by id(client); the registry holds every client it tracks
+        self._leases: dict[int, int] = {}
+        self._evicted: dict[int, Any] = {}
+        self._lock = threading.Lock()
+        self._closing_tasks: set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._clients)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._clients
+
+    def acquire(self, key: Hashable, factory: Callable[[], ClientT]) -> ClientT:
+        """
+        Leases the client registered under the key, creating it with the factory on a miss.
+
+        The factory runs outside the registry lock, so building a client does not hold up the lookups
+        of other callers. When another caller registers a client for the same key first, that client is
+        leased instead and the one just built is closed.
+
+        Args:
+            key (Hashable): The identity of the client.
+            factory (Callable[[], ClientT]): Builds a new client when none is registered yet.
+
+        Returns:
+            ClientT: The shared client instance, to be passed to release once the caller is done with it.
+        """
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+                self._lease(client)
+                return client
+
+        built_client = factory()
+
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+                unused = [built_client]
+            else:
+                client = built_client
+                self._clients[key] = client
+                unused = []
+            self._lease(client)
+
+            while len(self._clients) > self.max_size:
+                evicted_key, evicted_client = self._clients.popitem(last=False)
+                logger.debug(f"Evicting pooled search client {evicted_key}")
+                unused.extend(self._retire(evicted_client))
+
+        for unused_client in unused:
+            self._close_client(unused_client)
+
+        return client
+
+    def release(self, client: Any) -> None:
+        """
+        Releases a lease taken by acquire; an evicted client is closed with its last lease.
+
+        Args:
+            client (Any): The client returned by acquire.
+        """
+        with self._lock:
+            client_id = id(client)
+            leases = self._leases.get(client_id, 0) - 1
+            if leases > 0:
+                self._leases[client_id] = leases
+                return
+
+            self._leases.pop(client_id, None)
+            evicted_client = self._evicted.pop(client_id, None)
+
+        if evicted_client is not None:
+            logger.debug("Closing evicted search client after its last lease was released")
+            self._close_client(evicted_client)
+
+    def evict(self, key: Hashable) -> None:
+        """
+        Removes the client registered under the key, if any, and closes it once it is no longer leased.
+
+        Args:
+            key (Hashable): The identity of the client.
+        """
+        with self._lock:
+            client = self._clients.pop(key, None)
+            unused = self._retire(client) if client is not None else []
+
+        for unused_client in unused:
+            self._close_client(unused_client)
+
+    def close(self) -> None:
+        """
+        Closes every pooled client, leased or not, and empties the registry.
+        """
+        for client in self._drain():
+            self._close_client(client)
+
+    async def aclose(self) -> None:
+        """
+        Closes every pooled client, leased or not, awaiting the async ones, and empties the registry.
+        """
+        for client in self._drain():
+            try:
+                result = client.close()
+                if inspect.isawaitable(result):
+                    await result
+            except Exception as error:
+                logger.warning(f"Unable to close pooled search client: {error}")
+
+    def _lease(self, client: Any) -> None:
+        client_id = id(client)
+        self._leases[client_id] = self._leases.get(client_id, 0) + 1
+
+    def _retire(self, client: Any) -> list[Any]:
+        """Returns the client if it can be closed now; a leased client is kept until its last release."""
+        client_id = id(client)
+        if self._leases.get(client_id):
+            self._evicted[client_id] = client
+            return []
+        return [client]
+
+    def _drain(self) -> list[Any]:
+        with self._lock:
+            clients = list(self._clients.values()) + list(self._evicted.values())
+            self._clients.clear()
+            self._evicted.clear()
+            self._leases.clear()
+        return clients
+
+    def _close_client(self, client: Any) -> None:
+        try:
+            result = client.close()
+        except Exception as error:
+            logger.warning(f"Unable to close pooled search client: {error}")
+            return
+
+        if not inspect.isawaitable(result):
+            return
+
+        # Async clients can only be closed from inside a running event loop
+        try:
+            task = asyncio.get_running_loop().create_task(result)
+        except RuntimeError:
+            result.close()
+            logger.warning("Unable to close pooled async search client outside of an event loop")
+            return
+
+        self._closing_tasks.add(task)
+        task.add_done_callback(self._closing_tasks.discard)
+
+
+search_client_registry = SearchClientRegistry()
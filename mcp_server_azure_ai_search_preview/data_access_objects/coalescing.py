@@ -0,0 +1,178 @@
+import asyncio
+import functools
+import inspect
+import threading
+from concurrent.futures import Future
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+from mcp_server_azure_ai_search_preview.shared.metrics import metrics_registry
+from mcp_server_azure_ai_search_preview.shared.serialization import copy_result
+
+ReadMethod = TypeVar("ReadMethod", bound=Callable[..., Any])
+
+coalesced_calls = metrics_registry.counter(
+    "azure_search_coalesced_calls_total", "Read calls served by an identical call that was already in flight",
+    ("method",))
+
+
+class _InFlightRequest:
+    """A request in flight and the number of calls waiting for it besides the one that started it."""
+
+    def __init__(self, result: Future | asyncio.Task):
+        self.result = result
+        self.followers = 0
+
+
+class RequestCoalescer:
+    """
+    Shares one in-flight request between concurrent identical read calls.
+
+    The first call for a key runs the request; calls with the same key that arrive while it is in flight
+    wait for it and receive the same result, or the same error. Once a result is shared, every caller
+    gets its own deep copy, so callers can modify it. Nothing is kept once the request completes, so
+    results are never served after the fact. A write to an endpoint detaches the requests in flight on
+    it, so that reads started after the write send a request of their own.
+    """
+
+    def __init__(self):
+        self._requests: dict[Hashable, _InFlightRequest] = {}
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def invalidate(self, endpoint: str) -> None:
+        """
+        Detaches the requests in flight on an endpoint, typically after a write to it.
+
+        Args:
+            endpoint (str): The search service endpoint.
+        """
+        with self._lock:
+            self._generations[endpoint] = self._generations.get(endpoint, 0) + 1
+
+    def _join(self, endpoint: str, key: Hashable,
+              start: Callable[[], Future | asyncio.Task]) -> tuple[Hashable, _InFlightRequest, bool]:
+        """Returns the request in flight for the key, starting it if there is none, and whether this call leads it."""
+        with self._lock:
+            key = (endpoint, self._generations.get(endpoint, 0), key)
+            in_flight = self._requests.get(key)
+            if in_flight is not None:
+                in_flight.followers += 1
+                return key, in_flight, False
+            in_flight = self._requests[key] = _InFlightRequest(start())
+            return key, in_flight, True
+
+    def _finish(self, key: Hashable, in_flight: _InFlightRequest) -> bool:
+        """Stops sharing a request and returns whether other calls received its result."""
+        with self._lock:
+            if self._requests.get(key) is in_flight:
+                del self._requests[key]
+            return in_flight.followers > 0
+
+    def call(self, endpoint: str, key: Hashable, request: Callable[[], Any]) -> Any:
+        """
+        Runs a blocking request, or waits for the identical one already in flight in another thread.
+
+        Args:
+            endpoint (str): The search service endpoint the request goes to.
+            key (Hashable): Identifies the request on the endpoint.
+            request (Callable[[], Any]): Sends the request and returns its result.
+
+        Returns:
+            Any: The result of the request.
+        """
+        key, in_flight, leader = self._join(endpoint, key, Future)
+        if not leader:
+            coalesced_calls.inc(method=key[2][0])
+            return copy_result(in_flight.result.result())
+
+        try:
+            result = request()
+        except BaseException as error:
+            self._finish(key, in_flight)
+            in_flight.result.set_exception(error)
+            raise
+
+        shared = self._finish(key, in_flight)
+        in_flight.result.set_result(result)
+        return copy_result(result) if shared else result
+
+    async def call_async(self, endpoint: str, key: Hashable, request: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Runs a request, or waits for the identical one already in flight on the event loop.
+
+        The request runs in its own task, so it completes for the other callers even if the call that
+        started it is cancelled.
+
+        Args:
+            endpoint (str): The search service endpoint the request goes to.
+            key (Hashable): Identifies the request on the endpoint; it must include the event loop.
+            request (Callable[[], Awaitable[Any]]): Sends the request and returns its result.
+
+        Returns:
+            Any: The result of the request.
+        """
+        key, in_flight, leader = self._join(endpoint, key, lambda: asyncio.ensure_future(request()))
+        if not leader:
+            coalesced_calls.inc(method=key[2][0])
+            return copy_result(await asyncio.shield(in_flight.result))
+
+        in_flight.result.add_done_callback(functools.partial(self._task_done, key, in_flight))
+        result = await asyncio.shield(in_flight.result)
+        return copy_result(result) if self._finish(key, in_flight) else result
+
+    def _task_done(self, key: Hashable, in_flight: _InFlightRequest, task: asyncio.Task) -> None:
+        self._finish(key, in_flight)
+        # Marks the error as retrieved when every caller was cancelled before the task failed
+        if not task.cancelled():
+            task.exception()
+
+    def in_flight(self) -> int:
+        """Returns the number of requests currently shared."""
+        with self._lock:
+            return len(self._requests)
+
+
+request_coalescer = RequestCoalescer()
+
+
+def _freeze(value: Any) -> Hashable:
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, dict):
+        return tuple(sorted((name, _freeze(item)) for name, item in value.items()))
+    return value
+
+
+def coalesced(method: ReadMethod) -> ReadMethod:
+    """
+    Coalesces concurrent identical calls of a read-only DAO method.
+
+    Calls are identical when they go to the same pooled client with the same arguments; the pooled
+    client stands for the endpoint, credential, API version, index and, for the async clients, the
+    event loop. Sync and async methods are both supported.
+
+    Args:
+        method: A read-only method of a DAO with a client and a service_endpoint.
+
+    Returns:
+        The wrapped method.
+    """
+    name = method.__qualname__
+
+    def call_key(dao: Any, args: tuple, kwargs: dict) -> Hashable:
+        return name, id(dao.client), _freeze(args), _freeze(kwargs)
+
+    if inspect.iscoroutinefunction(method):
+        @functools.wraps(method)
+        async def async_wrapper(self, *args, **kwargs):
+            return await request_coalescer.call_async(self.service_endpoint, call_key(self, args, kwargs),
+                                                      lambda: method(self, *args, **kwargs))
+
+        return async_wrapper  # type: ignore[return-value]
+
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        return request_coalescer.call(self.service_endpoint, call_key(self, args, kwargs),
+                                      lambda: method(self, *args, **kwargs))
+
+    return wrapper  # type: ignore[return-value]
@@ -0,0 +1,49 @@
+import asyncio
+from typing import Any, Callable, Optional
+
+from mcp.server.fastmcp.server import logger
+
+from mcp_server_azure_ai_search_preview.data_access_objects.models import DocumentCounts
+
+DEFAULT_MAX_CONCURRENCY = 8
+
+
+async def count_documents_per_index(dao_factory: Callable[[str], Any],
+                                    index_names: list[str],
+                                    *,
+                                    max_concurrency: int = DEFAULT_MAX_CONCURRENCY) -> DocumentCounts:
+    """
+    Counts the documents of several indexes concurrently.
+
+    An index that cannot be counted is reported in the errors instead of failing the whole call.
+
+    Args:
+        dao_factory (Callable[[str], Any]): Returns a document DAO for an index name whose get_document_count
+            method is awaitable.
+        index_names (list[str]): The names of the indexes to count.
+        max_concurrency (int): The maximum number of count requests in flight.
+
+    Returns:
+        DocumentCounts: The count of each index, their total and the errors of the indexes that failed.
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def count_index(index_name: str) -> int:
+        async with semaphore:
+            return await dao_factory(index_name).get_document_count()
+
+    index_names = list(dict.fromkeys(index_names))
+    results = await asyncio.gather(*(count_index(index_name) for index_name in index_names), return_exceptions=True)
+
+    counts: dict[str, int] = {}
+    errors: Optional[dict[str, str]] = None
+
+    for index_name, result in zip(index_names, results):
+        if isinstance(result, BaseException):
+            logger.warning(f"Counting the documents of index {index_name} failed: {result}")
+            errors = errors or {}
+            errors[index_name] = str(result)
+        else:
+            counts[index_name] = result
+
+    return DocumentCounts(counts=counts, total=sum(counts.values()), errors=errors)
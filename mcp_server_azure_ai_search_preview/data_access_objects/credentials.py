@@ -0,0 +1,282 @@
+import asyncio
+import os
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from azure.core.credentials import AccessToken, TokenCredential
+from azure.identity import DefaultAzureCredential
+from mcp.server.fastmcp.server import logger
+
+DEFAULT_TOKEN_REFRESH_MARGIN_SECONDS = 300
+# Refreshes are never scheduled sooner than this, even for tokens that live shorter than the margin
+MIN_REFRESH_DELAY_SECONDS = 5.0
+MAX_REFRESH_RETRY_DELAY_SECONDS = 300.0
+
+
+class RefreshingTokenCredential:
+    """
+    Process-wide token credential that resolves the Azure credential chain once.
+
+    Access tokens are cached per scope and refreshed on a background timer shortly before they
+    expire, so tool calls read the cached token instead of waiting on Azure Active Directory. A
+    failed background refresh is retried with exponential backoff.
+    """
+
+    def __init__(self,
+                 credential_factory: Callable[[], TokenCredential],
+                 refresh_margin_seconds: int | None = None):
+        """
+        Initializes the credential.
+
+        Args:
+            credential_factory (Callable[[], TokenCredential]): Builds the underlying credential on first use.
+            refresh_margin_seconds (int | None): How long before expiry a token is refreshed. Defaults to the
+                AZURE_AI_SEARCH_TOKEN_REFRESH_MARGIN environment variable or 300 seconds.
+        """
+        if refresh_margin_seconds is None:
+            refresh_margin_seconds = int(os.environ.get("AZURE_AI_SEARCH_TOKEN_REFRESH_MARGIN",
+                                                        DEFAULT_TOKEN_REFRESH_MARGIN_SECONDS))
+
+        self.refresh_margin_seconds = refresh_margin_seconds
+        self._credential_factory = credential_factory
+        self._credential: Optional[TokenCredential] = None
+        self._tokens: dict[tuple, AccessToken] = {}
+        self._timers: dict[tuple, threading.Timer] = {}
+        # Guards the cached state; tokens are acquired outside of it, one at a time per cache key
+        self._lock = threading.RLock()
+        self._refresh_locks: dict[tuple, threading.Lock] = {}
+        self._closed = False
+
+    @property
+    def credential(self) -> TokenCredential:
+        """
+        The underlying credential, resolved on first access.
+
+        Raises:
+            RuntimeError: If the credential was closed.
+        """
+        with self._lock:
+            if self._closed:
+                raise RuntimeError("The token credential is closed")
+            if self._credential is None:
+                self._credential = self._credential_factory()
+            return self._credential
+
+    def get_token(self, *scopes: str, claims: Optional[str] = None, tenant_id: Optional[str] = None,
+                  **kwargs: Any) -> AccessToken:
+        """
+        Returns a cached access token for the scopes, acquiring one only when none is usable.
+
+        Args:
+            scopes (str): The scopes requested by the client pipeline.
+            claims (str | None): Additional claims from a challenge; these always bypass the cache.
+            tenant_id (str | None): Optional tenant to request the token from.
+
+        Returns:
+            AccessToken: A valid access token.
+
+        Raises:
+            RuntimeError: If the credential was closed.
+        """
+        if claims:
+            return self.credential.get_token(*scopes, claims=claims, tenant_id=tenant_id, **kwargs)
+
+        token = self.cached_token(*scopes, tenant_id=tenant_id)
+        if token is not None:
+            return token
+
+        return self._refresh((scopes, tenant_id))
+
+    def cached_token(self, *scopes: str, tenant_id: Optional[str] = None) -> Optional[AccessToken]:
+        """
+        Returns the cached access token for the scopes if it has not expired yet.
+
+        Args:
+            scopes (str): The scopes of the token.
+            tenant_id (str | None): Optional tenant of the token.
+
+        Returns:
+            AccessToken | None: The cached token, or None when a new one must be acquired.
+        """
+        token = self._tokens.get((scopes, tenant_id))
+        if token is not None and token.expires_on > time.time():
+            return token
+        return None
+
+    def _refresh(self, cache_key: tuple, replace_valid_token: bool = False) -> AccessToken:
+        """
+        Acquires a new token for the cache key and schedules its next background refresh.
+
+        The token is acquired outside of the state lock, so cached reads of other scopes and close do not
+        wait on Azure Active Directory. Concurrent refreshes of the same key run one at a time, and the
+        later ones return the token the first one acquired.
+
+        Args:
+            cache_key (tuple): The scopes and tenant of the token.
+            replace_valid_token (bool): Whether to acquire a new token even if the cached one is still valid.
+
+        Returns:
+            AccessToken: The newly acquired token, or the one a concurrent refresh acquired.
+        """
+        scopes, tenant_id = cache_key
+        with self._lock:
+            refresh_lock = self._refresh_locks.setdefault(cache_key, threading.Lock())
+
+        with refresh_lock:
+            if not replace_valid_token:
+                token = self.cached_token(*scopes, tenant_id=tenant_id)
+                if token is not None:
+                    return token
+
+            token = self.credential.get_token(*scopes, tenant_id=tenant_id)
+            with self._lock:
+                if not self._closed:
+                    self._tokens[cache_key] = token
+                    self._schedule_refresh(cache_key, token)
+            return token
+
+    def _schedule_refresh(self, cache_key: tuple, token: AccessToken) -> None:
+        now = time.time()
+        # Tokens living shorter than the margin are refreshed halfway through their remaining lifetime
+        delay = max(token.expires_on - now - self.refresh_margin_seconds, (token.expires_on - now) / 2,
+                    MIN_REFRESH_DELAY_SECONDS)
+        self._start_timer(cache_key, delay, 0)
+
+    def _start_timer(self, cache_key: tuple, delay: float, failed_attempts: int) -> None:
+        with self._lock:
+            if self._closed:
+                return
+
+            previous_timer = self._timers.pop(cache_key, None)
+            if previous_timer is not None:
+                previous_timer.cancel()
+
+            timer = threading.Timer(delay, self._background_refresh, args=(cache_key, failed_attempts))
+            timer.daemon = True
+            self._timers[cache_key] = timer
+            timer.start()
+
+    def _background_refresh(self, cache_key: tuple, failed_attempts: int = 0) -> None:
+        try:
+            self._refresh(cache_key, replace_valid_token=True)
+        except Exception as error:
+            if self._closed:
+                return
+            # The cached token stays in use until it expires; the refresh is retried with backoff meanwhile
+            retry_delay = min(MIN_REFRESH_DELAY_SECONDS * 2 ** failed_attempts, MAX_REFRESH_RETRY_DELAY_SECONDS)
+            logger.warning(f"Background token refresh failed, retrying in {retry_delay:.0f} seconds: {error}")
+            self._start_timer(cache_key, retry_delay, failed_attempts + 1)
+
+    def close(self) -> None:
+        """
+        Cancels the pending refreshes, drops cached tokens and closes the underlying credential.
+
+        A closed credential cannot be used again.
+        """
+        with self._lock:
+            self._closed = True
+            for timer in self._timers.values():
+                timer.cancel()
+            self._timers.clear()
+            self._tokens.clear()
+            credential, self._credential = self._credential, None
+
+        if credential is not None and hasattr(credential, "close"):
+            credential.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+
+class AsyncRefreshingTokenCredential:
+    """
+    Async view over a RefreshingTokenCredential for the azure.search.documents.aio clients.
+
+    Cached tokens are returned without leaving the event loop; acquiring a new token runs the
+    blocking credential chain in a worker thread.
+    """
+
+    def __init__(self, credential: RefreshingTokenCredential):
+        """
+        Initializes the async credential.
+
+        Args:
+            credential (RefreshingTokenCredential): The shared credential holding the token cache.
+        """
+        self._credential = credential
+
+    async def get_token(self, *scopes: str, claims: Optional[str] = None, tenant_id: Optional[str] = None,
+                        **kwargs: Any) -> AccessToken:
+        """
+        Returns a cached access token for the scopes, acquiring one in a worker thread if needed.
+
+        Args:
+            scopes (str): The scopes requested by the client pipeline.
+            claims (str | None): Additional claims from a challenge; these always bypass the cache.
+            tenant_id (str | None): Optional tenant to request the token from.
+
+        Returns:
+            AccessToken: A valid access token.
+        """
+        if not claims:
+            token = self._credential.cached_token(*scopes, tenant_id=tenant_id)
+            if token is not None:
+                return token
+
+        return await asyncio.to_thread(self._credential.get_token, *scopes, claims=claims, tenant_id=tenant_id,
+                                       **kwargs)
+
+    async def close(self) -> None:
+        """The shared credential outlives the async clients, so there is nothing to release here."""
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args: Any) -> None:
+        await self.close()
+
+
+_shared_credential: Optional[RefreshingTokenCredential] = None
+_shared_credential_lock = threading.Lock()
+
+
+def get_shared_token_credential() -> RefreshingTokenCredential:
+    """
+    Returns the process-wide refreshing credential backed by DefaultAzureCredential.
+
+    Returns:
+        RefreshingTokenCredential: The shared credential instance.
+    """
+    global _shared_credential
+
+    with _shared_credential_lock:
+        if _shared_credential is None:
+            _shared_credential = RefreshingTokenCredential(DefaultAzureCredential)
+        return _shared_credential
+
+
+def get_shared_async_token_credential() -> AsyncRefreshingTokenCredential:
+    """
+    Returns an async credential sharing the token cache of the process-wide credential.
+
+    Returns:
+        AsyncRefreshingTokenCredential: An async view over the shared credential.
+    """
+    return AsyncRefreshingTokenCredential(get_shared_token_credential())
+
+
+def close_shared_token_credential() -> None:
+    """
+    Closes the process-wide credential, if it was ever created.
+    """
+    global _shared_credential
+
+    with _shared_credential_lock:
+        credential, _shared_credential = _shared_credential, None
+
+    if credential is not None:
+        credential.close()
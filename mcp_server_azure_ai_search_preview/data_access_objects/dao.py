@@ -1,16 +1,60 @@
+import hashlib
+import itertools
 import os
+import weakref
 from datetime import timedelta
-from typing import MutableMapping, Any, Optional, List, Union
+from typing import MutableMapping, Any, Optional, List, Union, Hashable, Callable, NamedTuple
 from mcp.server.fastmcp.server import logger
 from azure.core.credentials import AzureKeyCredential
+from azure.core.exceptions import ResourceNotFoundError, ResourceNotModifiedError
 from azure.core.paging import ItemPaged
-from azure.identity import DefaultAzureCredential
 from azure.search.documents import SearchClient, SearchItemPaged
 from azure.search.documents.indexes import SearchIndexClient, SearchIndexerClient
 from azure.search.documents.indexes._generated.models import FieldMapping, IndexingSchedule, IndexingParameters, \
     IndexingParametersConfiguration
 from azure.search.documents.indexes.models import SearchIndex, SearchIndexer, SearchIndexerDataSourceConnection
 
+from mcp_server_azure_ai_search_preview.data_access_objects.client_registry import search_client_registry
+from mcp_server_azure_ai_search_preview.data_access_objects.coalescing import coalesced, request_coalescer
+from mcp_server_azure_ai_search_preview.data_access_objects.credentials import RefreshingTokenCredential, \
+    get_shared_token_credential
+from mcp_server_azure_ai_search_preview.data_access_objects.instrumentation import request_metrics_policy
+from mcp_server_azure_ai_search_preview.data_access_objects.models import QueryPage
+from mcp_server_azure_ai_search_preview.data_access_objects.paging import PageRequest, prepare_page_request, \
+    build_page, resolve_page_size
+from mcp_server_azure_ai_search_preview.data_access_objects.payload_budget import PayloadBudget
+from mcp_server_azure_ai_search_preview.data_access_objects.payload_logging import payload_log_policy
+from mcp_server_azure_ai_search_preview.data_access_objects.query_cache import query_result_cache
+from mcp_server_azure_ai_search_preview.data_access_objects.rate_limiter import RateLimitPolicy
+from mcp_server_azure_ai_search_preview.data_access_objects.raw_responses import list_index_definitions, \
+    search_documents
+from mcp_server_azure_ai_search_preview.data_access_objects.schema_cache import CachedIndexSchema, \
+    index_schema_cache
+from mcp_server_azure_ai_search_preview.shared.serialization import copy_result
+
+SEARCH_BACKENDS = ("azure", "memory")
+MEMORY_SERVICE_ENDPOINT = "memory://"
+
+
+def find_key_field_name(index_schema: MutableMapping[str, Any]) -> str:
+    """
+    Finds the name of the key field in a serialized index schema.
+
+    Args:
+        index_schema (MutableMapping[str, Any]): The serialized index definition.
+
+    Returns:
+        str: The name of the key field.
+
+    Raises:
+        ValueError: If the index has no key field.
+    """
+    for field in index_schema.get("fields", []):
+        if field.get("key"):
+            return field["name"]
+
+    raise ValueError(f"Index {index_schema.get('name')} does not define a key field")
+
 
 class SearchBaseDao:
     """
@@ -23,9 +67,18 @@ class SearchBaseDao:
     def __init__(self):
         """
         Initializes the SearchBaseDao by reading configuration from environment variables.
+
+        Raises:
+            ValueError: If AZURE_AI_SEARCH_BACKEND is neither "azure" nor "memory".
         """
+        self.backend = self._get_env_variable("AZURE_AI_SEARCH_BACKEND", "azure").strip().lower()
+        if self.backend not in SEARCH_BACKENDS:
+            raise ValueError(f"AZURE_AI_SEARCH_BACKEND must be one of {', '.join(SEARCH_BACKENDS)}, "
+                             f"not '{self.backend}'")
         self.authentication_method = self._get_env_variable("AZURE_AUTHENTICATION_METHOD", "api-search-key")
         self.service_endpoint = self._get_env_variable("AZURE_AI_SEARCH_ENDPOINT")
+        if self.backend == "memory" and not self.service_endpoint:
+            self.service_endpoint = MEMORY_SERVICE_ENDPOINT
         self.api_version = self._get_env_variable('AZURE_AI_SEARCH_API_VERSION', '2025-03-01-preview')
 
     @staticmethod
@@ -42,12 +95,15 @@ class SearchBaseDao:
         """
         return os.environ.get(key, default_value)
 
-    def _fetch_credentials(self) -> AzureKeyCredential | DefaultAzureCredential:
+    def _fetch_credentials(self) -> AzureKeyCredential | RefreshingTokenCredential:
         """
         Fetches the appropriate credentials for Azure Search based on the configured authentication method.
 
+        Service principal authentication shares one process-wide credential that caches its access
+        tokens and refreshes them in the background before they expire.
+
         Returns:
-            AzureKeyCredential | DefaultAzureCredential: A credential object for authenticating requests.
+            AzureKeyCredential | RefreshingTokenCredential: A credential object for authenticating requests.
 
         Raises:
             Exception: If the authentication method is missing or invalid.
@@ -57,7 +113,7 @@ class SearchBaseDao:
             credential = AzureKeyCredential(api_key)
             return credential
         elif self.authentication_method == 'service-principal':
-            credential = DefaultAzureCredential()
+            credential = get_shared_token_credential()
             return credential
 
         error_message = (
@@ -66,8 +122,318 @@ class SearchBaseDao:
         )
         raise Exception(error_message)
 
+    def _client_key(self, client_type: str, index_name: str | None = None) -> Hashable:
+        """
+        Builds the key identifying a pooled client for this configuration.
+
+        The API key is hashed so that the secret itself is never kept in the registry keys.
+
+        Args:
+            client_type (str): The kind of SDK client (index, search or indexer).
+            index_name (str | None): The index the client is bound to, if any.
+
+        Returns:
+            Hashable: The registry key for the client.
+        """
+        if self.authentication_method == 'api-search-key':
+            api_key = self._get_env_variable('AZURE_AI_SEARCH_API_KEY') or ''
+            credential_identity = hashlib.sha256(api_key.encode('utf-8')).hexdigest()
+        else:
+            credential_identity = self.authentication_method
+
+        return client_type, self.service_endpoint, index_name, self.api_version, credential_identity
+
+    def _pipeline_policies(self) -> list[Any]:
+        """
+        Builds the policies added to the pipeline of each SDK client, after its retry policy.
+
+        Every attempt, retries included, first waits for the rate limiter shared by all clients of the
+        endpoint and is then recorded in the request metrics.
+
+        Returns:
+            list[Any]: The per-retry policies.
+        """
+        return [RateLimitPolicy(self.service_endpoint), request_metrics_policy]
+
+    def _acquire_client(self, client_type: str, factory: Callable[[], Any], index_name: str | None = None) -> Any:
+        """
+        Acquires a lease on the pooled client of the configured backend.
+
+        Args:
+            client_type (str): The kind of SDK client (index, search or indexer).
+            factory (Callable[[], Any]): Creates the Azure SDK client when none is pooled yet.
+            index_name (str | None): The index the client is bound to, if any.
+
+        Returns:
+            Any: The Azure SDK client, or the in-memory client with the same interface.
+        """
+        if self.backend == "memory":
+            factory = lambda: self._create_memory_client(client_type, index_name)  # noqa: E731
+
+        client = search_client_registry.acquire(self._client_key(client_type, index_name), factory)
+        # The lease is released by close or, for DAOs that are dropped without being closed, on collection
+        self._client_lease = weakref.finalize(self, search_client_registry.release, client)
+        self._client_lease.atexit = False
+        return client
+
+    def _release_client(self) -> None:
+        """Releases the lease on the pooled client, which the registry closes if it was evicted meanwhile."""
+        client_lease = getattr(self, "_client_lease", None)
+        if client_lease is not None:
+            client_lease()
+
+    def _create_memory_client(self, client_type: str, index_name: str | None = None) -> Any:
+        """Creates a client of the in-memory backend; imported on demand since most deployments never use it."""
+        from mcp_server_azure_ai_search_preview.data_access_objects.memory_backend import memory_client
+
+        return memory_client(client_type, index_name)
+
+    def _invalidate_caches(self, index_name: str | None = None, schema_changed: bool = False) -> None:
+        """
+        Drops what a write made stale: the coalesced reads of the endpoint and the cached results of an index.
+
+        Args:
+            index_name (str | None): The index that was written to, if any.
+            schema_changed (bool): Whether the definition of the index changed as well.
+        """
+        request_coalescer.invalidate(self.service_endpoint)
+        if index_name is not None:
+            query_result_cache.invalidate(self.service_endpoint, index_name)
+            if schema_changed:
+                index_schema_cache.invalidate(self.service_endpoint, index_name)
+
+
+class PageLookup(NamedTuple):
+    """The request for a page of documents, its query cache entry and the page if it was cached."""
+    request: Optional[PageRequest]
+    cache_key: Hashable
+    generation: int
+    page: Optional[QueryPage]
+
+    @property
+    def result_limit(self) -> int:
+        """How many results to read: one more than the page size, to tell whether another page follows."""
+        return self.request.page_size + 1
+
+    @property
+    def include_total_count(self) -> bool:
+        """Whether the page reports the total number of matching documents."""
+        return bool(self.request.search_kwargs["include_total_count"])
+
+
+class SearchIndexRequests:
+    """
+    Request building and result shaping shared by SearchIndexDao and AsyncSearchIndexDao.
+
+    The DAOs only send the requests, so that both flavors cache, log and invalidate the same way.
+    """
+    service_endpoint: str
+
+    def _cached_index_schemas(self) -> Optional[list[MutableMapping[str, Any]]]:
+        """Returns the cached definitions of all indexes, or None once the listing is too old."""
+        return index_schema_cache.get_listing(self.service_endpoint)
+
+    def _store_index_schemas(self, index_schemas: list[MutableMapping[str, Any]]) -> list[MutableMapping[str, Any]]:
+        """Caches a copy of the listed index definitions and returns them."""
+        index_schema_cache.put_listing(self.service_endpoint, copy_result(index_schemas))
+        return index_schemas
+
+    def _lookup_index_schema(self, index_name: str) -> tuple[Optional[CachedIndexSchema], Optional[dict[str, Any]]]:
+        """
+        Looks up the cached definition of an index.
+
+        Args:
+            index_name (str): The name of the index.
+
+        Returns:
+            tuple[CachedIndexSchema | None, dict[str, Any] | None]: The cached entry, and the keyword arguments of
+                the get_index call that fetches or revalidates it, or None if the entry is fresh.
+        """
+        cached_schema = index_schema_cache.get(self.service_endpoint, index_name)
+        if cached_schema is None:
+            return None, {}
+        if index_schema_cache.is_fresh(cached_schema):
+            return cached_schema, None
+        if cached_schema.etag:
+            return cached_schema, {"headers": {"If-None-Match": cached_schema.etag}}
+        return cached_schema, {}
+
+    def _index_schema_not_modified(self, index_name: str, cached_schema: CachedIndexSchema) -> MutableMapping[str, Any]:
+        """Marks a cached definition the service confirmed as unchanged and returns a copy of it."""
+        index_schema_cache.revalidated(self.service_endpoint, index_name)
+        return copy_result(cached_schema.schema)
+
+    def _index_schema_not_found(self, index_name: str) -> None:
+        """Forgets the cached definition of an index the service no longer has."""
+        index_schema_cache.invalidate(self.service_endpoint, index_name)
+
+    def _store_index_schema(self, index: SearchIndex) -> MutableMapping[str, Any]:
+        """Serializes a fetched index definition, caches a copy of it and returns it."""
+        index_schema = index.serialize(keep_readonly=True)
+        index_schema_cache.put(self.service_endpoint, copy_result(index_schema))
+        return index_schema
+
+    @staticmethod
+    def _prepare_index_update(index_name: str, updated_index_definition: SearchIndex) -> SearchIndex:
+        """Logs an index update and names the definition after the index it replaces."""
+        payload_log_policy.log("Updating index %s with a new definition", updated_index_definition, index_name)
+        updated_index_definition.name = index_name
+        return updated_index_definition
+
+    @staticmethod
+    def _prepare_index_creation(index_definition: SearchIndex) -> SearchIndex:
+        """Logs the creation of an index."""
+        payload_log_policy.log("Creating index %s", index_definition, index_definition.name)
+        return index_definition
+
+    def _index_changed(self, index_name: str,
+                       index: Optional[SearchIndex] = None) -> Optional[MutableMapping[str, Any]]:
+        """Invalidates everything cached about a written index and returns the serialized definition, if any."""
+        self._invalidate_caches(index_name, schema_changed=True)
+        if index is None:
+            return None
+        return index.serialize(keep_readonly=True)
+
+
+class SearchDocumentRequests:
+    """
+    Request building and result shaping shared by SearchClientDao and AsyncSearchClientDao.
+
+    The DAOs only send the requests, so that both flavors cache, log and invalidate the same way.
+    """
+    service_endpoint: str
+    index_name: str
+
+    @staticmethod
+    def _count_arguments(query_filter: Optional[str]) -> dict[str, Any]:
+        """The arguments of a search that only counts the documents matching a filter."""
+        return dict(search_text=None, filter=query_filter, include_total_count=True, top=0)
+
+    @staticmethod
+    def _search_arguments(search_text: Optional[str],
+                          query_filter: Optional[str],
+                          order_by: Optional[List[str]],
+                          select: Optional[List[str]],
+                          skip: Optional[int],
+                          top: Optional[int],
+                          include_total_count: Optional[bool]) -> dict[str, Any]:
+        """The arguments of the SDK search call for the parameters of query_index."""
+        return dict(search_text=search_text, include_total_count=include_total_count, filter=query_filter,
+                    order_by=order_by, select=select, skip=skip, top=top)
+
+    def _prepare_upload(self, documents: list[dict]) -> list[dict]:
+        """Logs the documents about to be uploaded."""
+        payload_log_policy.log("Adding documents to index %s", documents, self.index_name)
+        return documents
+
+    def _prepare_deletion(self, key_field_name: str, document_keys: list[str]) -> list[dict]:
+        """Builds and logs the documents that delete the given keys."""
+        documents_to_delete = [{key_field_name: document_key} for document_key in document_keys]
+        payload_log_policy.log("Removing documents from index %s", documents_to_delete, self.index_name)
+        return documents_to_delete
+
+    def _documents_changed(self, operation_results: list[Any]) -> list[MutableMapping[str, Any]]:
+        """Invalidates the cached results of the index and serializes the result of each document."""
+        self._invalidate_caches(self.index_name)
+        return [operation_result.serialize(keep_readonly=True) for operation_result in operation_results]
+
+    def _lookup_page(self,
+                     search_text: Optional[str],
+                     query_filter: Optional[str],
+                     order_by: Optional[List[str]],
+                     select: Optional[List[str]],
+                     skip: Optional[int],
+                     top: Optional[int],
+                     include_total_count: Optional[bool],
+                     page_size: Optional[int],
+                     cursor: Optional[str],
+                     key_field_name: Optional[str],
+                     payload_budget: Optional[PayloadBudget]) -> PageLookup:
+        """
+        Validates the arguments of query_index_page and looks the page up in the query cache.
+
+        Returns:
+            PageLookup: The lookup, whose page is set when no request needs to be sent.
+        """
+        page_request = prepare_page_request(search_text, query_filter=query_filter, order_by=order_by,
+                                            select=select, skip=skip, top=top,
+                                            include_total_count=include_total_count, page_size=page_size,
+                                            cursor=cursor, key_field_name=key_field_name)
+        if page_request is None:
+            return PageLookup(request=None, cache_key=None, generation=0, page=QueryPage(documents=[]))
+
+        cache_key = query_result_cache.make_key(self.service_endpoint, self.index_name, search_text=search_text,
+                                                query_filter=query_filter, order_by=order_by, select=select,
+                                                skip=skip, top=top, include_total_count=include_total_count,
+                                                page_size=resolve_page_size(page_size), cursor=cursor,
+                                                key_field_name=key_field_name, payload_budget=payload_budget)
+        cached_page: Optional[QueryPage] = query_result_cache.get(cache_key)
+        generation = query_result_cache.generation(self.service_endpoint, self.index_name)
+        return PageLookup(request=page_request, cache_key=cache_key, generation=generation, page=cached_page)
+
+    @staticmethod
+    def _store_page(page_lookup: PageLookup,
+                    results: list[dict],
+                    count: Optional[int],
+                    payload_budget: Optional[PayloadBudget]) -> QueryPage:
+        """Builds the page from the results read for it and caches it."""
+        page = build_page(page_lookup.request, results, count, payload_budget)
+        query_result_cache.put(page_lookup.cache_key, page, page_lookup.generation)
+        return page
+
+
+class SearchIndexerRequests:
+    """
+    Request building and result shaping shared by SearchIndexerDao and AsyncSearchIndexerDao.
+
+    The DAOs only send the requests, so that both flavors build and invalidate the same way.
+    """
+    service_endpoint: str
+
+    @staticmethod
+    def _indexing_parameters(data_source: SearchIndexerDataSourceConnection) -> IndexingParameters | None:
+        """The indexing parameters required by the type of the data source, if any."""
+        # Possible values include: "azuresql", "cosmosdb", "azureblob", "azuretable", "mysql", "adlsgen2".
+        if data_source.type == "azureblob":
+            indexing_configuration = IndexingParametersConfiguration(data_to_extract='contentAndMetadata',
+                                                                     parsing_mode='json', query_timeout=None)
+            return IndexingParameters(configuration=indexing_configuration)
+        return None
+
+    @staticmethod
+    def _indexer_definition(name: str,
+                            data_source_name: str,
+                            target_index_name: str,
+                            description: str,
+                            field_mappings: list[FieldMapping],
+                            output_field_mappings: list[FieldMapping],
+                            skill_set_name: Optional[str],
+                            parameters: IndexingParameters | None) -> SearchIndexer:
+        """Builds the definition of an indexer that runs every five minutes."""
+        interval: timedelta = timedelta(minutes=5)
+        schedule: IndexingSchedule = IndexingSchedule(interval=interval)
 
-class SearchIndexDao(SearchBaseDao):
+        return SearchIndexer(
+            name=name,
+            data_source_name=data_source_name,
+            target_index_name=target_index_name,
+            description=description,
+            skillset_name=skill_set_name,
+            field_mappings=field_mappings,
+            output_field_mappings=output_field_mappings,
+            schedule=schedule,
+            parameters=parameters
+        )
+
+    def _indexer_changed(self, indexer: Optional[SearchIndexer] = None) -> Optional[MutableMapping[str, Any]]:
+        """Invalidates the coalesced reads of the endpoint and returns the serialized indexer, if any."""
+        self._invalidate_caches()
+        if indexer is None:
+            return None
+        return indexer.serialize(keep_readonly=True)
+
+
+class SearchIndexDao(SearchBaseDao, SearchIndexRequests):
     """
     Data Access Object (DAO) for interacting with Azure AI Search Indexes.
 
@@ -76,19 +442,28 @@ class SearchIndexDao(SearchBaseDao):
 
     def __init__(self):
         """
-        Initializes the SearchIndexDao with a SearchIndexClient instance.
+        Initializes the SearchIndexDao with a pooled SearchIndexClient instance.
         """
         super().__init__()
-        credentials = self._fetch_credentials()
-        self.client = SearchIndexClient(self.service_endpoint, credentials, api_version=self.api_version)
+        self.client = self._acquire_client(
+            "index",
+            lambda: SearchIndexClient(self.service_endpoint, self._fetch_credentials(), api_version=self.api_version,
+                                     per_retry_policies=self._pipeline_policies())
+        )
 
     def close(self):
         """Shuts down the Data Access Object instance and associated resources
 
+        The pooled client is shared with other instances, so it stays open for reuse. It is closed
+        once the registry has evicted it and no other instance still uses it, or when the service
+        shuts down.
+
         :rtype: None
         """
-        self.client.close()
+        self._release_client()
+        self.client = None
 
+    @coalesced
     def retrieve_index_names(self) -> list[str]:
         """
         Retrieves a list of all search index names from the Azure Search service.
@@ -96,39 +471,69 @@ class SearchIndexDao(SearchBaseDao):
         Returns:
             list[str]: A list of index names.
         """
-        search_results = self.client.list_index_names()
-        results: list[str] = []
-
-        for search_result in search_results:
-            results.append(search_result)
-
-        return results
+        return list(self.client.list_index_names())
 
+    @coalesced
     def retrieve_index_schemas(self) -> list[MutableMapping[str, Any]]:
         """
         Retrieves the full schema definition for each search index.
 
+        The listing is served from the schema cache while it is younger than the cache's max age. Once
+        listed again, definitions whose ETag did not change are taken from the cache.
+
         Returns:
             list[SearchIndex]: A list of serialized index schema definitions.
         """
-        search_results: ItemPaged[SearchIndex] = self.client.list_indexes()
-        results = []
+        cached_schemas = self._cached_index_schemas()
+        if cached_schemas is not None:
+            return cached_schemas
 
-        for search_result in search_results:
-            results.append(search_result.serialize(keep_readonly=True))
+        if isinstance(self.client, SearchIndexClient):
+            results = list_index_definitions(self.client, self.api_version, self.service_endpoint)
+        else:
+            # The clients of the in-memory backend have no REST pipeline to send the request through
+            search_results: ItemPaged[SearchIndex] = self.client.list_indexes()
+            results = [search_result.serialize(keep_readonly=True) for search_result in search_results]
 
-        return results
+        return self._store_index_schemas(results)
 
+    @coalesced
     def retrieve_index_schema(self, index_name: str) -> MutableMapping[str, Any]:
         """
         Retrieves the full schema definition for a search index.
 
+        Definitions are served from the schema cache. Once older than the cache's max age they are
+        revalidated with a conditional GET on their ETag, which returns no body if the index is unchanged.
+
         Returns:
             SearchIndex: A serialized index schema definition.
         """
-        search_results = self.client.get_index(index_name)
+        cached_schema, get_index_arguments = self._lookup_index_schema(index_name)
+        if get_index_arguments is None:
+            return copy_result(cached_schema.schema)
+
+        try:
+            search_results = self.client.get_index(index_name, **get_index_arguments)
+        except ResourceNotModifiedError:
+            return self._index_schema_not_modified(index_name, cached_schema)
+        except ResourceNotFoundError:
+            self._index_schema_not_found(index_name)
+            raise
+
+        return self._store_index_schema(search_results)
+
+    def retrieve_key_field_name(self, index_name: str) -> str:
+        """
+        Retrieves the name of the key field of a search index.
 
-        return search_results.serialize(keep_readonly=True)
+        Args:
+            index_name (str): The name of the index.
+
+        Returns:
+            str: The name of the key field.
+        """
+        index_schema = self.retrieve_index_schema(index_name)
+        return find_key_field_name(index_schema)
 
     def modify_index(self, index_name: str, updated_index_definition: SearchIndex) -> MutableMapping[str, Any]:
         """
@@ -141,12 +546,9 @@ class SearchIndexDao(SearchBaseDao):
         Returns:
             MutableMapping[str, Any]: The serialized response of the created index.
         """
-
-        logger.debug(f"Updating Index {index_name} with new definition", updated_index_definition)
-
-        updated_index_definition.name = index_name
-        operation_results = self.client.create_or_update_index(updated_index_definition)
-        return operation_results.serialize(keep_readonly=True)
+        index_definition = self._prepare_index_update(index_name, updated_index_definition)
+        operation_results = self.client.create_or_update_index(index_definition)
+        return self._index_changed(index_name, operation_results)
 
     def create_index(self, index_definition: SearchIndex) -> MutableMapping[str, Any]:
         """
@@ -158,9 +560,8 @@ class SearchIndexDao(SearchBaseDao):
         Returns:
             MutableMapping[str, Any]: The serialized response of the created index.
         """
-        logger.debug("Creating Index ", index_definition)
-        operation_results = self.client.create_index(index_definition)
-        return operation_results.serialize(keep_readonly=True)
+        operation_results = self.client.create_index(self._prepare_index_creation(index_definition))
+        return self._index_changed(index_definition.name, operation_results)
 
     def delete_index(self, index_name: str):
         """
@@ -172,37 +573,62 @@ class SearchIndexDao(SearchBaseDao):
         Returns:
             None
         """
-        logger.debug(f"Deleting Index {index_name}")
+        logger.debug("Deleting index %s", index_name)
         self.client.delete_index(index_name)
+        self._index_changed(index_name)
 
-class SearchClientDao(SearchBaseDao):
+class SearchClientDao(SearchBaseDao, SearchDocumentRequests):
 
     def __init__(self, index_name: str):
         """
-        Initializes the SearchIndexDao with a SearchIndexClient instance.
+        Initializes the SearchClientDao with a pooled SearchClient instance.
         :param index_name: The name of the index to connect to
         """
         super().__init__()
-        credentials = self._fetch_credentials()
         self.index_name = index_name
-        self.client = SearchClient(self.service_endpoint, index_name, credentials, api_version=self.api_version)
+        self.client = self._acquire_client(
+            "search",
+            lambda: SearchClient(self.service_endpoint, index_name, self._fetch_credentials(),
+                                 api_version=self.api_version, per_retry_policies=self._pipeline_policies()),
+            index_name
+        )
 
     def close(self):
         """Shuts down the Data Access Object instance and associated resources
 
+        The pooled client is shared with other instances, so it stays open for reuse. It is closed
+        once the registry has evicted it and no other instance still uses it, or when the service
+        shuts down.
+
         :rtype: None
         """
-        self.client.close()
+        self._release_client()
+        self.client = None
 
+    @coalesced
     def get_document_count(self) -> int:
         """
         Return the total number of documents in the index
 
+        Uses the document count API ($count), which returns a single number instead of a page of results.
+
         Returns:
            int: The total number of documents in the index.
         """
-        search_text: str | None = None
-        search_results: SearchItemPaged[dict] = self.client.search(search_text=search_text, include_total_count=True)
+        return self.client.get_document_count()
+
+    @coalesced
+    def count_documents(self, query_filter: Optional[str] = None) -> int:
+        """
+        Return the number of documents matching an OData filter without retrieving any of them
+
+        Args:
+            query_filter (str): The OData $filter expression the documents must match.
+
+        Returns:
+           int: The number of matching documents.
+        """
+        search_results: SearchItemPaged[dict] = self.client.search(**self._count_arguments(query_filter))
 
         return search_results.get_count()
 
@@ -230,16 +656,8 @@ class SearchClientDao(SearchBaseDao):
         Returns:
             list[MutableMapping[str, Any]]: A list of serialized results for each document upload operation.
         """
-
-        logger.debug(f"Adding documents to index {self.index_name}", documents)
-        operation_results = self.client.upload_documents(documents)
-
-        results: list[MutableMapping[str, Any]] = []
-
-        for operation_result in operation_results:
-            results.append(operation_result.serialize(keep_readonly=True))
-
-        return results
+        operation_results = self.client.upload_documents(self._prepare_upload(documents))
+        return self._documents_changed(operation_results)
 
     def delete_document(self, key_field_name: str, key_value: str):
         """
@@ -252,17 +670,12 @@ class SearchClientDao(SearchBaseDao):
         Returns:
             list[MutableMapping[str, Any]]: A list of serialized results for each document deletion operation.
         """
-        document_lookup = {key_field_name: key_value}
-        documents = [document_lookup]
         document_keys: list[str] = [key_value]
 
-        logger.debug(f"Removing document from index {self.index_name}", documents)
         results = self.delete_documents(key_field_name=key_field_name, document_keys=document_keys)
 
         return results
 
-    # @TODO: expose this to the MCP clients only after thorough testing with a lot of models
-    # For now it is ok to delete just one document at a time
     def delete_documents(self, key_field_name: str, document_keys: list[str]) -> list[MutableMapping[str, Any]]:
         """
         Deletes a batch of documents from the Azure AI Search index.
@@ -274,20 +687,8 @@ class SearchClientDao(SearchBaseDao):
         Returns:
             list[MutableMapping[str, Any]]: A list of serialized results for each document deletion operation.
         """
-        documents_to_delete = []
-        for document_key in document_keys:
-            documents_to_delete.append({key_field_name: document_key})
-
-        logger.debug(f"Removing document from index {self.index_name}", documents_to_delete)
-        operation_results = self.client.delete_documents(documents_to_delete)
-
-        results: list[MutableMapping[str, Any]] = []
-
-
-        for operation_result in operation_results:
-            results.append(operation_result.serialize(keep_readonly=True))
-
-        return results
+        operation_results = self.client.delete_documents(self._prepare_deletion(key_field_name, document_keys))
+        return self._documents_changed(operation_results)
 
     def query_index(self,
                     search_text: Optional[str] = None,
@@ -325,27 +726,57 @@ class SearchClientDao(SearchBaseDao):
         :rtype: list[dict]
         """
         search_results: SearchItemPaged[dict] = self.client.search(
-            search_text=search_text,
-            include_total_count=include_total_count,
-            filter=query_filter,
-            order_by=order_by,
-            select=select,
-            skip=skip,
-            top=top
+            **self._search_arguments(search_text, query_filter, order_by, select, skip, top, include_total_count)
         )
 
-        query_results: list[dict] = []
-
-        for search_result_item in search_results:
-            query_results.append(search_result_item)
-
-        return query_results
-
-
-
-
-
-class SearchIndexerDao(SearchBaseDao):
+        return list(search_results)
+
+    def query_index_page(self,
+                         search_text: Optional[str] = None,
+                         *,
+                         query_filter: Optional[str] = None,
+                         order_by: Optional[List[str]] = None,
+                         select: Optional[List[str]] = None,
+                         skip: Optional[int] = None,
+                         top: Optional[int] = None,
+                         include_total_count: Optional[bool] = None,
+                         page_size: Optional[int] = None,
+                         cursor: Optional[str] = None,
+                         key_field_name: Optional[str] = None,
+                         payload_budget: Optional[PayloadBudget] = None,
+                         ) -> QueryPage:
+        """Search the Azure search index for one page of documents.
+
+        Only one page is read from the service, so memory and latency stay bounded however many documents
+        match. The remaining parameters are the same as for query_index, with top capping the results
+        across all pages.
+
+        :param int page_size: The number of documents in the page (default 50, at most 1000).
+        :param str cursor: The next_cursor of the previous page; the other query arguments must stay the same.
+        :param str key_field_name: A filterable, sortable key field. Unordered queries are then paged by key
+            instead of $skip, which is not limited to 100,000 results.
+        :param PayloadBudget payload_budget: Truncates long strings and caps the size of the page. Documents
+            left out to stay within the budget are returned with the next page.
+        :rtype: QueryPage
+        """
+        page_lookup = self._lookup_page(search_text, query_filter, order_by, select, skip, top, include_total_count,
+                                        page_size, cursor, key_field_name, payload_budget)
+        if page_lookup.page is not None:
+            return page_lookup.page
+
+        search_kwargs = page_lookup.request.search_kwargs
+        if isinstance(self.client, SearchClient):
+            results, count = search_documents(self.client, self.api_version, search_kwargs, page_lookup.result_limit)
+        else:
+            # The clients of the in-memory backend have no REST pipeline to send the request through
+            search_results: SearchItemPaged[dict] = self.client.search(**search_kwargs)
+            results = list(itertools.islice(search_results, page_lookup.result_limit))
+            count = search_results.get_count() if page_lookup.include_total_count else None
+
+        return self._store_page(page_lookup, results, count, payload_budget)
+
+
+class SearchIndexerDao(SearchBaseDao, SearchIndexerRequests):
     """
     A data access object (DAO) for managing Azure AI Search indexers, data sources, and skillsets.
 
@@ -355,20 +786,29 @@ class SearchIndexerDao(SearchBaseDao):
 
     def __init__(self):
         """
-        Initializes the SearchIndexerDao by creating a SearchIndexerClient using credentials
+        Initializes the SearchIndexerDao by acquiring a pooled SearchIndexerClient using credentials
         and service configuration from the base class.
         """
         super().__init__()
-        credentials = self._fetch_credentials()
-        self.client = SearchIndexerClient(self.service_endpoint, credentials, api_version=self.api_version)
+        self.client = self._acquire_client(
+            "indexer",
+            lambda: SearchIndexerClient(self.service_endpoint, self._fetch_credentials(), api_version=self.api_version,
+                                       per_retry_policies=self._pipeline_policies())
+        )
 
     def close(self):
         """Shuts down the Data Access Object instance and associated resources
 
+        The pooled client is shared with other instances, so it stays open for reuse. It is closed
+        once the registry has evicted it and no other instance still uses it, or when the service
+        shuts down.
+
         :rtype: None
         """
-        self.client.close()
+        self._release_client()
+        self.client = None
 
+    @coalesced
     def list_indexers(self) -> list[str]:
         """
         Retrieves the names of all indexers registered in the Azure AI Search service.
@@ -377,12 +817,9 @@ class SearchIndexerDao(SearchBaseDao):
             list[str]: A list of indexer names.
         """
         search_results = self.client.get_indexer_names()
-        indexer_names: list[str] = []
-
-        for search_result in search_results:
-            indexer_names.append(search_result)
-        return indexer_names
+        return list(search_results)
 
+    @coalesced
     def get_indexer(self, name: str) -> MutableMapping[str, Any]:
         """
         Retrieves the full definition of a specific indexer.
@@ -394,8 +831,7 @@ class SearchIndexerDao(SearchBaseDao):
             MutableMapping[str, Any]: A dictionary representing the serialized indexer definition.
         """
         indexer_details = self.client.get_indexer(name)
-        indexer_result = indexer_details.serialize(keep_readonly=True)
-        return indexer_result
+        return indexer_details.serialize(keep_readonly=True)
 
     def create_indexer(self, name: str,
                        data_source_name: str,
@@ -420,39 +856,12 @@ class SearchIndexerDao(SearchBaseDao):
         Returns:
             MutableMapping[str, Any]: A dictionary representing the created indexer.
         """
-
-        interval: timedelta = timedelta(minutes=5)
-        schedule: IndexingSchedule = IndexingSchedule(interval=interval)
-
-        parameters = self._prepare_indexer_parameters(data_source_name)
-
-        indexer_definition = SearchIndexer(
-            name=name,
-            data_source_name=data_source_name,
-            target_index_name=target_index_name,
-            description=description,
-            skillset_name=skill_set_name,
-            field_mappings=field_mappings,
-            output_field_mappings=output_field_mappings,
-            schedule=schedule,
-            parameters=parameters
-        )
+        parameters = self._indexing_parameters(self.client.get_data_source_connection(name=data_source_name))
+        indexer_definition = self._indexer_definition(name, data_source_name, target_index_name, description,
+                                                      field_mappings, output_field_mappings, skill_set_name,
+                                                      parameters)
         indexer_result = self.client.create_indexer(indexer_definition)
-        return indexer_result.serialize(keep_readonly=True)
-
-    def _prepare_indexer_parameters(self, data_source_name) -> IndexingParameters | None:
-
-        data_source_detail: SearchIndexerDataSourceConnection = self.client.get_data_source_connection(name=data_source_name)
-        data_source_type = data_source_detail.type
-
-        # Possible values include: "azuresql", "cosmosdb", "azureblob", "azuretable", "mysql", "adlsgen2".
-        if data_source_type == "azureblob":
-            indexing_configuration = IndexingParametersConfiguration(data_to_extract='contentAndMetadata',
-                                                                     parsing_mode='json', query_timeout=None)
-            parameters = IndexingParameters(configuration=indexing_configuration)
-            return parameters
-        return None
-
+        return self._indexer_changed(indexer_result)
 
     def delete_indexer(self, name: str) -> None:
         """
@@ -462,7 +871,9 @@ class SearchIndexerDao(SearchBaseDao):
             name (str): The name of the indexer to delete.
         """
         self.client.delete_indexer(name)
+        self._indexer_changed()
 
+    @coalesced
     def list_data_sources(self) -> list[str]:
         """
         Lists the names of all data source connections configured in the AI Search service.
@@ -471,11 +882,9 @@ class SearchIndexerDao(SearchBaseDao):
             list[str]: A list of data source connection names.
         """
         data_source_names = self.client.get_data_source_connection_names()
-        search_results: list[str] = []
-        for data_source_name in data_source_names:
-            search_results.append(data_source_name)
-        return search_results
+        return list(data_source_names)
 
+    @coalesced
     def get_data_source(self, name: str) -> MutableMapping[str, Any]:
         """
         Retrieves the full definition of a specific data source connection.
@@ -487,9 +896,9 @@ class SearchIndexerDao(SearchBaseDao):
             MutableMapping[str, Any]: A dictionary representing the serialized data source definition.
         """
         data_source_detail: SearchIndexerDataSourceConnection = self.client.get_data_source_connection(name=name)
-        data_source_result = data_source_detail.serialize(keep_readonly=True)
-        return data_source_result
+        return data_source_detail.serialize(keep_readonly=True)
 
+    @coalesced
     def list_skill_sets(self) -> list[str]:
         """
         Lists the names of all skillsets configured in the Azure AI Search service.
@@ -498,11 +907,9 @@ class SearchIndexerDao(SearchBaseDao):
             list[str]: A list of skillset names.
         """
         skill_set_names = self.client.get_skillset_names()
-        search_results: list[str] = []
-        for skill_set_name in skill_set_names:
-            search_results.append(skill_set_name)
-        return search_results
+        return list(skill_set_names)
 
+    @coalesced
     def get_skill_set(self, skill_set_name: str) -> MutableMapping[str, Any]:
         """
         Retrieves the full definition of a specific skillset.
@@ -0,0 +1,366 @@
+import asyncio
+import json
+import re
+from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable, Callable, MutableMapping, Optional
+
+from mcp.server.fastmcp.server import logger
+
+from mcp_server_azure_ai_search_preview.data_access_objects.batching import DocumentBatcher, DEFAULT_MAX_BATCH_SIZE
+from mcp_server_azure_ai_search_preview.data_access_objects.models import IngestionSummary
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+MAX_RECORD_CHARS = 16 * 1024 * 1024
+JSON_FILE_SUFFIXES = (".json", ".jsonl", ".ndjson")
+# The characters that delimit objects, arrays and strings, and escape characters in strings
+STRUCTURAL_CHARACTERS = re.compile(r'[{}\[\]"\\]')
+
+ProgressCallback = Callable[[int, Optional[int]], Awaitable[None]]
+
+
+class JsonRecordDecoder:
+    """
+    Incremental decoder for a JSON array of objects or a stream of objects (JSON Lines).
+
+    Text is fed in chunks and every complete object is returned as soon as it has been read, so
+    only the record being decoded is held in memory. A record spanning several chunks is scanned
+    chunk by chunk for its closing brace and decoded once, when it is complete, so the work per
+    record stays linear in its size whatever the chunk size.
+    """
+
+    def __init__(self, max_record_chars: int = MAX_RECORD_CHARS):
+        """
+        Initializes the decoder.
+
+        Args:
+            max_record_chars (int): The largest record accepted, which bounds the buffered text.
+        """
+        self.max_record_chars = max_record_chars
+        self._decoder = json.JSONDecoder()
+        self._in_array: Optional[bool] = None
+        self._array_closed = False
+        self._expect_separator = False
+        self._error: Optional[ValueError] = None
+        # The text of the incomplete record and the scan state at its end
+        self._record_parts: list[str] = []
+        self._record_chars = 0
+        self._depth = 0
+        self._in_string = False
+        self._escaped = False
+
+    def feed(self, text: str) -> list[dict]:
+        """
+        Adds text and returns the records it completed.
+
+        Args:
+            text (str): The next chunk of the file.
+
+        Returns:
+            list[dict]: The records decoded from the buffered text.
+
+        Raises:
+            ValueError: If the text is not a JSON array of objects or a stream of objects.
+        """
+        if self._error is not None:
+            raise self._error
+
+        records: list[dict] = []
+
+        try:
+            position = 0
+            if self._record_parts:
+                position = self._find_record_end(text, 0)
+                if position < 0:
+                    self._keep_partial_record(text)
+                    return records
+                self._record_parts.append(text[:position])
+                record_text = "".join(self._record_parts)
+                self._record_parts, self._record_chars = [], 0
+                records.append(self._decode_record(record_text, 0))
+
+            self._decode_records(text, position, records)
+        except ValueError as error:
+            if not records:
+                raise
+            # The records before the error are returned first, the error is raised with the next call
+            self._error = error
+
+        return records
+
+    def close(self) -> None:
+        """
+        Checks that the input ended on a record boundary.
+
+        Raises:
+            ValueError: If a record or the array is incomplete.
+        """
+        if self._error is not None:
+            raise self._error
+        if self._record_parts:
+            raise ValueError("The file ends in the middle of a record")
+        if self._in_array and not self._array_closed:
+            raise ValueError("The JSON array is not closed")
+
+    def _decode_records(self, text: str, position: int, records: list[dict]) -> None:
+        """Appends the complete records of the text from the position on and keeps an incomplete last record."""
+        while True:
+            position = self._skip_whitespace(text, position)
+            if position >= len(text):
+                break
+
+            if self._in_array is None:
+                self._in_array = text[position] == "["
+                if self._in_array:
+                    position += 1
+                continue
+
+            if self._array_closed:
+                raise ValueError("Unexpected content after the end of the JSON array")
+
+            if self._in_array and self._expect_separator:
+                if text[position] == ",":
+                    self._expect_separator = False
+                    position += 1
+                    continue
+                if text[position] == "]":
+                    self._array_closed = True
+                    position += 1
+                    continue
+                raise ValueError(f"Expected ',' or ']' but found '{text[position]}'")
+
+            if self._in_array and text[position] == "]":
+                self._array_closed = True
+                position += 1
+                continue
+
+            if text[position] != "{":
+                raise ValueError("Expected a JSON object for each record")
+
+            self._depth, self._in_string, self._escaped = 0, False, False
+            record_end = self._find_record_end(text, position)
+            if record_end < 0:
+                # The record continues in the next chunk
+                self._keep_partial_record(text[position:])
+                break
+
+            records.append(self._decode_record(text, position))
+            position = record_end
+
+    def _decode_record(self, text: str, position: int) -> dict:
+        try:
+            record, _ = self._decoder.raw_decode(text, position)
+        except json.JSONDecodeError as error:
+            raise ValueError(f"A record is malformed: {error}") from error
+
+        self._expect_separator = bool(self._in_array)
+        return record
+
+    def _find_record_end(self, text: str, position: int) -> int:
+        """
+        Scans the text for the closing brace of the current record, continuing from the state left by the
+        previous chunk.
+
+        Returns:
+            int: The position after the record, or -1 if the record continues past the text.
+        """
+        if self._escaped and position < len(text):
+            # The previous chunk ended with a backslash inside a string
+            self._escaped = False
+            position += 1
+
+        skip_until = position
+        for match in STRUCTURAL_CHARACTERS.finditer(text, position):
+            index = match.start()
+            if index < skip_until:
+                continue
+
+            character = text[index]
+            if self._in_string:
+                if character == "\\":
+                    if index + 1 == len(text):
+                        self._escaped = True
+                    skip_until = index + 2
+                elif character == '"':
+                    self._in_string = False
+            elif character == '"':
+                self._in_string = True
+            elif character in "{[":
+                self._depth += 1
+            elif character in "}]":
+                self._depth -= 1
+                if self._depth == 0:
+                    return index + 1
+
+        return -1
+
+    def _keep_partial_record(self, text: str) -> None:
+        self._record_parts.append(text)
+        self._record_chars += len(text)
+        if self._record_chars > self.max_record_chars:
+            raise ValueError(f"A record is larger than {self.max_record_chars} characters or is malformed")
+
+    @staticmethod
+    def _skip_whitespace(text: str, position: int) -> int:
+        while position < len(text) and text[position].isspace():
+            position += 1
+        return position
+
+
+def find_json_files(path: str | Path) -> list[Path]:
+    """
+    Lists the JSON and JSON Lines files to ingest.
+
+    Args:
+        path (str | Path): A file, or a directory that is searched recursively.
+
+    Returns:
+        list[Path]: The files in a stable order.
+
+    Raises:
+        FileNotFoundError: If the path does not exist.
+    """
+    path = Path(path)
+    if path.is_file():
+        return [path]
+    if not path.is_dir():
+        raise FileNotFoundError(f"No such file or directory: '{path}'")
+
+    return sorted(file_path for file_path in path.rglob("*")
+                  if file_path.is_file() and file_path.suffix.lower() in JSON_FILE_SUFFIXES)
+
+
+async def stream_json_records(file_path: Path,
+                              encoding: str = "utf-8",
+                              chunk_size: int = DEFAULT_CHUNK_SIZE) -> AsyncIterator[dict]:
+    """
+    Yields the records of a JSON or JSON Lines file, reading it in chunks off the event loop.
+
+    Args:
+        file_path (Path): The file to read.
+        encoding (str): The character encoding of the file.
+        chunk_size (int): The number of characters read at a time.
+
+    Yields:
+        dict: One record at a time.
+
+    Raises:
+        ValueError: If the file is not a JSON array of objects or a stream of objects.
+    """
+    decoder = JsonRecordDecoder()
+
+    with open(file_path, "r", encoding=encoding) as file:
+        while chunk := await asyncio.to_thread(file.read, chunk_size):
+            for record in decoder.feed(chunk):
+                yield record
+
+    decoder.close()
+
+
+class RecordMapper:
+    """
+    Maps source records onto the fields of an index.
+
+    Fields are renamed with the given mappings, fields the index does not define are dropped and
+    the key is converted to a string. Records without a key are skipped.
+    """
+
+    def __init__(self,
+                 index_schema: MutableMapping[str, Any],
+                 field_mappings: Optional[dict[str, str]] = None,
+                 key_field_name: Optional[str] = None):
+        """
+        Initializes the mapper.
+
+        Args:
+            index_schema (MutableMapping[str, Any]): The serialized definition of the target index.
+            field_mappings (dict[str, str] | None): Source field names mapped to index field names.
+            key_field_name (str | None): The key field of the index. Looked up from the schema if omitted.
+        """
+        # Imported here because the DAO module loads the Azure SDK
+        from mcp_server_azure_ai_search_preview.data_access_objects.dao import find_key_field_name
+
+        self.field_mappings = field_mappings or {}
+        self.key_field_name = key_field_name or find_key_field_name(index_schema)
+        self.index_field_names = {field["name"] for field in index_schema.get("fields", [])}
+        self.dropped_fields: set[str] = set()
+        self.skipped_records = 0
+
+    def map(self, record: dict) -> Optional[dict]:
+        """
+        Maps one record.
+
+        Args:
+            record (dict): The source record.
+
+        Returns:
+            dict | None: The document to upload, or None if the record has no key.
+        """
+        document = {}
+
+        for source_field_name, value in record.items():
+            field_name = self.field_mappings.get(source_field_name, source_field_name)
+            if field_name in self.index_field_names:
+                document[field_name] = value
+            else:
+                self.dropped_fields.add(source_field_name)
+
+        if document.get(self.key_field_name) is None:
+            self.skipped_records += 1
+            return None
+
+        document[self.key_field_name] = str(document[self.key_field_name])
+        return document
+
+
+async def ingest_json_files(dao: Any,
+                            index_name: str,
+                            file_paths: list[Path],
+                            record_mapper: RecordMapper,
+                            *,
+                            batch_size: int = DEFAULT_MAX_BATCH_SIZE,
+                            encoding: str = "utf-8",
+                            progress_callback: Optional[ProgressCallback] = None) -> IngestionSummary:
+    """
+    Streams the records of JSON and JSON Lines files into an index in concurrent batches.
+
+    Files are read chunk by chunk and records are handed to a DocumentBatcher as they are decoded,
+    so memory stays bounded whatever the size of the files. A file that cannot be parsed is reported
+    and the records read from it before the error are still uploaded.
+
+    Args:
+        dao (Any): A document DAO whose add_documents method is awaitable.
+        index_name (str): The name of the index.
+        file_paths (list[Path]): The files to ingest.
+        record_mapper (RecordMapper): Maps the records onto the fields of the index.
+        batch_size (int): The maximum number of documents per upload batch.
+        encoding (str): The character encoding of the files.
+        progress_callback (ProgressCallback | None): Awaited with (files done, file count) after every file.
+
+    Returns:
+        IngestionSummary: The number of files and records read and the outcome of the uploads.
+    """
+    batcher = DocumentBatcher(index_name, record_mapper.key_field_name, dao.add_documents, max_batch_size=batch_size)
+    records = 0
+    file_errors: list[str] = []
+
+    async with batcher:
+        for file_number, file_path in enumerate(file_paths, start=1):
+            try:
+                async for record in stream_json_records(file_path, encoding):
+                    records += 1
+                    document = record_mapper.map(record)
+                    if document is not None:
+                        await batcher.add(document)
+            except (OSError, ValueError) as error:
+                logger.warning(f"Ingesting {file_path} into index {index_name} failed: {error}")
+                file_errors.append(f"{file_path}: {error}")
+
+            if progress_callback is not None:
+                await progress_callback(file_number, len(file_paths))
+
+    return IngestionSummary(files=len(file_paths),
+                            records=records,
+                            skipped_records=record_mapper.skipped_records,
+                            dropped_fields=sorted(record_mapper.dropped_fields) or None,
+                            file_errors=file_errors or None,
+                            upload=batcher.summary)
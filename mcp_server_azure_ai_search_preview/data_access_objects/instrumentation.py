@@ -0,0 +1,67 @@
+import re
+import sys
+import time
+from urllib.parse import urlparse
+
+from azure.core.pipeline import PipelineRequest, PipelineResponse
+from azure.core.pipeline.policies import SansIOHTTPPolicy
+
+from mcp_server_azure_ai_search_preview.shared.metrics import azure_requests, azure_request_duration, \
+    azure_throttled_requests, azure_request_errors
+
+# Resource names in paths such as /indexes('hotels')/docs/search.post.search
+RESOURCE_NAME_PATTERN = re.compile(r"\('(?:[^']|'')*'\)")
+START_TIME_CONTEXT_KEY = "mcp_metrics_start_time"
+
+
+def operation_name(method: str, url: str) -> str:
+    """
+    Names the REST operation of a request with its resource names replaced by a placeholder, which keeps the
+    label cardinality low.
+
+    Args:
+        method (str): The HTTP method.
+        url (str): The request URL.
+
+    Returns:
+        str: The method and the path template, e.g. "POST indexes({name})/docs/search.post.search".
+    """
+    path = RESOURCE_NAME_PATTERN.sub("({name})", urlparse(url).path).strip("/")
+    return f"{method.upper()} {path}"
+
+
+class RequestMetricsPolicy(SansIOHTTPPolicy):
+    """
+    Records the count, status code and duration of every HTTP request the Azure SDK clients send.
+
+    The policy is added after the retry policy, so each attempt is recorded and throttled attempts
+    that are retried still show up in the 429 counter.
+    """
+
+    def on_request(self, request: PipelineRequest) -> None:
+        request.context[START_TIME_CONTEXT_KEY] = time.perf_counter()
+
+    def on_response(self, request: PipelineRequest, response: PipelineResponse) -> None:
+        operation = operation_name(request.http_request.method, request.http_request.url)
+        status_code = response.http_response.status_code
+
+        azure_requests.inc(operation=operation, status_code=str(status_code))
+        azure_request_duration.observe(self._elapsed(request), operation=operation)
+        if status_code == 429:
+            azure_throttled_requests.inc(operation=operation)
+
+    def on_exception(self, request: PipelineRequest) -> None:
+        # Only called for errors raised before a response was received, such as connection failures
+        operation = operation_name(request.http_request.method, request.http_request.url)
+        error = sys.exc_info()[1]
+
+        azure_request_errors.inc(operation=operation, error_type=type(error).__name__ if error else "Unknown")
+        azure_request_duration.observe(self._elapsed(request), operation=operation)
+
+    @staticmethod
+    def _elapsed(request: PipelineRequest) -> float:
+        started = request.context.get(START_TIME_CONTEXT_KEY)
+        return time.perf_counter() - started if started is not None else 0.0
+
+
+request_metrics_policy = RequestMetricsPolicy()
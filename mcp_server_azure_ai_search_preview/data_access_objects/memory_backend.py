@@ -0,0 +1,865 @@
+import bisect
+import copy
+import heapq
+import itertools
+import math
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, MutableMapping, Optional
+
+from azure.core.exceptions import ResourceExistsError, ResourceNotFoundError, ResourceNotModifiedError
+from azure.search.documents.indexes.models import SearchIndex, SearchIndexer, SearchIndexerDataSourceConnection, \
+    SearchIndexerSkillset
+from azure.search.documents.models import IndexingResult
+from mcp.server.fastmcp.server import logger
+
+from mcp_server_azure_ai_search_preview.data_access_objects.ingestion import JsonRecordDecoder, find_json_files
+from mcp_server_azure_ai_search_preview.data_access_objects.odata import compile_filter, parse_order_by, \
+    OrderByClause, CompiledFilter
+
+DEFAULT_TOP = 50
+BM25_K1 = 1.2
+BM25_B = 0.75
+TERM_PATTERN = re.compile(r"\w+")
+QUERY_CLAUSE_PATTERN = re.compile(r'([+-]?)(?:"([^"]*)"|(\S+))')
+TEXT_FIELD_TYPES = ("Edm.String", "Collection(Edm.String)")
+RESOURCE_DEFINITION_DIRECTORIES = {
+    "datasource-definitions": "data_sources",
+    "indexer-definitions": "indexers",
+    "skillset-definitions": "skillsets",
+}
+INDEX_DEFINITION_DIRECTORY = "index-definitions"
+
+
+def tokenize(text: Any) -> list[str]:
+    """Splits text into lower-cased terms, the way the emulator indexes and queries searchable fields."""
+    if isinstance(text, list):
+        return [term for value in text for term in tokenize(value)]
+    if not isinstance(text, str):
+        return []
+    return TERM_PATTERN.findall(text.lower())
+
+
+def _copy_document(document: dict) -> dict:
+    """Copies a stored document so that callers cannot change the index through the result."""
+    return {field_name: copy.deepcopy(value) if isinstance(value, (list, dict)) else value
+            for field_name, value in document.items()}
+
+
+class _QueryClause:
+    """One clause of a simple query: a term, a prefix or a phrase, optionally required (+) or excluded (-)."""
+
+    def __init__(self, operator: str, terms: list[str], prefix: bool):
+        self.required = operator == "+"
+        self.excluded = operator == "-"
+        self.terms = terms
+        self.prefix = prefix
+
+
+def parse_simple_query(search_text: str) -> list[_QueryClause]:
+    """
+    Parses the subset of the simple query syntax the emulator supports.
+
+    Terms match any searchable field; "quoted phrases" match documents containing all of their terms;
+    term* matches by prefix; +term is required and -term is excluded.
+    """
+    clauses: list[_QueryClause] = []
+
+    for operator, phrase, word in QUERY_CLAUSE_PATTERN.findall(search_text):
+        text = phrase if phrase else word
+        prefix = not phrase and text.endswith("*") and len(text) > 1
+        terms = tokenize(text)
+        if terms:
+            clauses.append(_QueryClause(operator, terms, prefix))
+
+    return clauses
+
+
+class MemoryIndex:
+    """
+    The documents of one index, with an inverted index over its searchable fields.
+
+    Full-text queries are answered from the postings and scored with BM25. Filters are compiled
+    once and applied to the candidates. Sorted orders are built once per version of the index, so
+    that ordered queries, including the keyset paging of query_index_page, read only the page
+    they return instead of sorting every match.
+    """
+
+    def __init__(self, definition: MutableMapping[str, Any]):
+        """
+        Initializes an empty index.
+
+        Args:
+            definition (MutableMapping[str, Any]): The serialized index definition.
+        """
+        self._lock = threading.RLock()
+        self._documents: dict[str, dict] = {}
+        self._postings: dict[str, dict[str, int]] = {}
+        self._lengths: dict[str, int] = {}
+        self._total_length = 0
+        self._version = 0
+        self._vocabulary: Optional[list[str]] = None
+        self._sorted_orders: dict[tuple[OrderByClause, ...], tuple[int, list[tuple], list[str]]] = {}
+        self.set_definition(definition)
+
+    def set_definition(self, definition: MutableMapping[str, Any]) -> None:
+        """Applies a new definition and re-indexes the documents for its searchable fields."""
+        with self._lock:
+            fields = definition.get("fields", [])
+            self.definition = definition
+            self.key_field_name = next((field["name"] for field in fields if field.get("key")), None)
+            self.field_names = {field["name"] for field in fields}
+            self.hidden_field_names = {field["name"] for field in fields if field.get("retrievable") is False
+                                       or field.get("hidden") is True}
+            self.searchable_field_names = [field["name"] for field in fields
+                                           if field.get("type") in TEXT_FIELD_TYPES
+                                           and field.get("searchable") is not False]
+
+            documents = list(self._documents.values())
+            self._documents.clear()
+            self._postings.clear()
+            self._lengths.clear()
+            self._total_length = 0
+            for document in documents:
+                self._store(document)
+            self._changed()
+
+    def count(self) -> int:
+        return len(self._documents)
+
+    def upload(self, documents: Iterable[dict], merge: bool = False) -> list[dict]:
+        """
+        Uploads documents, replacing the stored ones with the same key, or merging into them.
+
+        Returns:
+            list[dict]: An IndexingResult payload for every document.
+        """
+        results = []
+
+        with self._lock:
+            for document in documents:
+                key = document.get(self.key_field_name)
+                error_message = self._validate(document)
+                if error_message is not None:
+                    results.append({"key": key, "status": False, "statusCode": 400, "errorMessage": error_message})
+                    continue
+
+                existing = self._documents.get(key)
+                if existing is not None:
+                    self._remove(key)
+                    if merge:
+                        document = dict(existing, **document)
+                self._store(_copy_document(document))
+                results.append({"key": key, "status": True, "statusCode": 201 if existing is None else 200,
+                                "errorMessage": None})
+            self._changed()
+
+        return results
+
+    def delete(self, documents: Iterable[dict]) -> list[dict]:
+        """Deletes documents by key; deleting a missing document succeeds, as in the service."""
+        results = []
+
+        with self._lock:
+            for document in documents:
+                key = document.get(self.key_field_name)
+                if not isinstance(key, str):
+                    results.append({"key": key, "status": False, "statusCode": 400,
+                                    "errorMessage": f"The key field '{self.key_field_name}' must be a string"})
+                    continue
+                if key in self._documents:
+                    self._remove(key)
+                results.append({"key": key, "status": True, "statusCode": 200, "errorMessage": None})
+            self._changed()
+
+        return results
+
+    def search(self,
+               search_text: Optional[str] = None,
+               *,
+               filter: Optional[str] = None,
+               order_by: Optional[list[str]] = None,
+               select: Optional[list[str]] = None,
+               skip: Optional[int] = None,
+               top: Optional[int] = None,
+               include_total_count: Optional[bool] = None) -> tuple[list[dict], Optional[int]]:
+        """
+        Runs a query.
+
+        Args:
+            search_text (str | None): A simple query; None, "" or "*" match every document.
+            filter (str | None): An OData $filter expression in the supported subset.
+            order_by (list[str] | None): $orderby clauses; search.score() is supported.
+            select (list[str] | None): The fields to return.
+            skip (int | None): The number of results to skip.
+            top (int | None): The number of results to return (default 50).
+            include_total_count (bool | None): Whether to count every match.
+
+        Returns:
+            tuple[list[dict], int | None]: The results, with @search.score, and the count if requested.
+        """
+        compiled_filter = compile_filter(filter) if filter else None
+        clauses = parse_order_by(order_by)
+        skip = skip or 0
+        limit = skip + (DEFAULT_TOP if top is None else top)
+
+        for field_name in select or []:
+            if field_name not in self.field_names:
+                raise ValueError(f"Could not find a property named '{field_name}' on type 'search.document'")
+        for clause in clauses:
+            if clause.field_name != "@search.score" and clause.field_name.split("/")[0] not in self.field_names:
+                raise ValueError(f"Could not find a property named '{clause.field_name}' on type 'search.document'")
+
+        with self._lock:
+            scores = self._score(search_text)
+            count: Optional[int] = None
+
+            if scores is None and clauses and clauses[0].field_name != "@search.score" and not include_total_count:
+                keys = list(itertools.islice(self._ordered_matches(clauses, compiled_filter), limit))
+            else:
+                candidates: Iterable[str] = scores if scores is not None else self._documents
+                matches = self._filter(candidates, compiled_filter)
+                if include_total_count or clauses or scores is not None:
+                    matches = list(matches)
+                    count = len(matches) if include_total_count else None
+                    if clauses:
+                        keys = self._order(matches, clauses, scores)[:limit]
+                    elif scores is not None:
+                        # Only the requested page needs to be ranked
+                        keys = heapq.nlargest(limit, matches, key=scores.__getitem__)
+                    else:
+                        keys = matches[:limit]
+                else:
+                    keys = list(itertools.islice(matches, limit))
+
+            results = [self._result(key, select, scores) for key in keys[skip:]]
+
+        return results, count
+
+    def _validate(self, document: dict) -> Optional[str]:
+        key = document.get(self.key_field_name)
+        if not isinstance(key, str) or not key:
+            return f"The key field '{self.key_field_name}' must be a non-empty string"
+
+        unknown_field_names = [field_name for field_name in document
+                               if field_name not in self.field_names and not field_name.startswith("@")]
+        if unknown_field_names:
+            return f"The property '{unknown_field_names[0]}' does not exist on type 'search.documentFields'"
+        return None
+
+    def _store(self, document: dict) -> None:
+        key = document[self.key_field_name]
+        document = {field_name: value for field_name, value in document.items() if not field_name.startswith("@")}
+        self._documents[key] = document
+
+        terms = [term for field_name in self.searchable_field_names for term in tokenize(document.get(field_name))]
+        for term in terms:
+            postings = self._postings.setdefault(term, {})
+            postings[key] = postings.get(key, 0) + 1
+        self._lengths[key] = len(terms)
+        self._total_length += len(terms)
+
+    def _remove(self, key: str) -> None:
+        document = self._documents.pop(key)
+        for field_name in self.searchable_field_names:
+            for term in tokenize(document.get(field_name)):
+                postings = self._postings.get(term)
+                if postings is not None:
+                    postings.pop(key, None)
+                    if not postings:
+                        del self._postings[term]
+        self._total_length -= self._lengths.pop(key, 0)
+
+    def _changed(self) -> None:
+        self._version += 1
+        self._vocabulary = None
+
+    def _expand(self, clause: _QueryClause) -> list[list[str]]:
+        """Returns, for each term of the clause, the indexed terms it matches."""
+        if not clause.prefix:
+            return [[term] for term in clause.terms]
+
+        if self._vocabulary is None:
+            self._vocabulary = sorted(self._postings)
+        *whole_terms, prefix = clause.terms
+        start = bisect.bisect_left(self._vocabulary, prefix)
+        prefix_terms = list(itertools.takewhile(lambda term: term.startswith(prefix), self._vocabulary[start:]))
+        return [[term] for term in whole_terms] + [prefix_terms]
+
+    def _score(self, search_text: Optional[str]) -> Optional[dict[str, float]]:
+        """Scores the documents matching a query with BM25, or returns None if it matches everything."""
+        if search_text is None or search_text.strip() in ("", "*"):
+            return None
+
+        clauses = parse_simple_query(search_text)
+        if not clauses:
+            return None
+
+        document_count = max(len(self._documents), 1)
+        average_length = self._total_length / document_count or 1.0
+        scores: dict[str, float] = {}
+        required: Optional[set[str]] = None
+        excluded: set[str] = set()
+
+        for clause in clauses:
+            clause_scores: Optional[dict[str, float]] = None
+            for alternatives in self._expand(clause):
+                term_scores: dict[str, float] = {}
+                for term in alternatives:
+                    postings = self._postings.get(term, {})
+                    inverse_document_frequency = math.log(1 + (document_count - len(postings) + 0.5)
+                                                          / (len(postings) + 0.5))
+                    for key, frequency in postings.items():
+                        length_norm = 1 - BM25_B + BM25_B * self._lengths[key] / average_length
+                        term_scores[key] = term_scores.get(key, 0.0) + inverse_document_frequency * \
+                            frequency * (BM25_K1 + 1) / (frequency + BM25_K1 * length_norm)
+                # Every term of a phrase must occur in the document
+                if clause_scores is None:
+                    clause_scores = term_scores
+                else:
+                    clause_scores = {key: score + term_scores[key] for key, score in clause_scores.items()
+                                     if key in term_scores}
+
+            clause_scores = clause_scores or {}
+            if clause.excluded:
+                excluded.update(clause_scores)
+                continue
+            if clause.required:
+                required = set(clause_scores) if required is None else required & set(clause_scores)
+            for key, score in clause_scores.items():
+                scores[key] = scores.get(key, 0.0) + score
+
+        if required is not None:
+            scores = {key: score for key, score in scores.items() if key in required}
+        if excluded:
+            if not scores and all(clause.excluded for clause in clauses):
+                scores = {key: 1.0 for key in self._documents}
+            scores = {key: score for key, score in scores.items() if key not in excluded}
+        return scores
+
+    def _filter(self, keys: Iterable[str], compiled_filter: Optional[CompiledFilter]) -> Iterator[str]:
+        if compiled_filter is None:
+            return iter(keys)
+        documents = self._documents
+        predicate = compiled_filter.predicate
+        return (key for key in keys if predicate(documents[key]))
+
+    @staticmethod
+    def _sort_value(value: Any) -> tuple:
+        # Nulls sort first in ascending order; values of different types sort by type first
+        if value is None:
+            return (0, "", "")
+        if isinstance(value, bool):
+            return (1, "bool", value)
+        if isinstance(value, (int, float)):
+            return (1, "number", value)
+        return (1, type(value).__name__, value)
+
+    def _order(self, keys: list[str], clauses: list[OrderByClause], scores: Optional[dict[str, float]]) -> list[str]:
+        if not clauses:
+            if scores is not None:
+                keys.sort(key=lambda key: scores[key], reverse=True)
+            return keys
+
+        documents = self._documents
+        for clause in reversed(clauses):
+            if clause.field_name == "@search.score":
+                keys.sort(key=lambda key: scores.get(key, 1.0) if scores else 1.0, reverse=clause.descending)
+            else:
+                getter = self._getter(clause.field_name)
+                keys.sort(key=lambda key: self._sort_value(getter(documents[key])), reverse=clause.descending)
+        return keys
+
+    @staticmethod
+    def _getter(field_path: str) -> Callable[[dict], Any]:
+        names = field_path.split("/")
+
+        def get(document: dict) -> Any:
+            value: Any = document
+            for name in names:
+                value = value.get(name) if isinstance(value, dict) else None
+            return value
+
+        return get
+
+    def _ordered_matches(self, clauses: list[OrderByClause],
+                         compiled_filter: Optional[CompiledFilter]) -> Iterator[str]:
+        """Walks the documents in a cached sorted order, starting after a range the filter requires."""
+        order_key = tuple(clauses)
+        cached = self._sorted_orders.get(order_key)
+        if cached is None or cached[0] != self._version:
+            keys = self._order(list(self._documents), clauses, None)
+            getter = self._getter(clauses[0].field_name)
+            sort_values = [self._sort_value(getter(self._documents[key])) for key in keys]
+            cached = (self._version, sort_values, keys)
+            self._sorted_orders[order_key] = cached
+        _, sort_values, keys = cached
+
+        start = 0
+        if compiled_filter is not None and not clauses[0].descending:
+            for constraint in compiled_filter.ranges:
+                if constraint.field_name != clauses[0].field_name or constraint.value is None:
+                    continue
+                if constraint.operator == "gt":
+                    start = max(start, bisect.bisect_right(sort_values, self._sort_value(constraint.value)))
+                elif constraint.operator in ("ge", "eq"):
+                    start = max(start, bisect.bisect_left(sort_values, self._sort_value(constraint.value)))
+
+        return self._filter(itertools.islice(keys, start, None), compiled_filter)
+
+    def _result(self, key: str, select: Optional[list[str]], scores: Optional[dict[str, float]]) -> dict:
+        document = self._documents[key]
+        if select:
+            result = {field_name: copy.deepcopy(document.get(field_name)) for field_name in select
+                      if field_name not in self.hidden_field_names}
+        else:
+            result = {field_name: value for field_name, value in _copy_document(document).items()
+                      if field_name not in self.hidden_field_names}
+
+        result["@search.score"] = scores.get(key, 1.0) if scores is not None else 1.0
+        result["@search.reranker_score"] = None
+        result["@search.highlights"] = None
+        result["@search.captions"] = None
+        return result
+
+
+def _infer_field(name: str, values: list[Any]) -> dict[str, Any]:
+    sample = next((value for value in values if value is not None), None)
+
+    if isinstance(sample, dict):
+        nested_values: dict[str, list[Any]] = {}
+        for value in values:
+            for nested_name, nested_value in (value or {}).items():
+                nested_values.setdefault(nested_name, []).append(nested_value)
+        return {"name": name, "type": "Edm.ComplexType",
+                "fields": [_infer_field(nested_name, nested) for nested_name, nested in nested_values.items()]}
+
+    if isinstance(sample, list):
+        element = next((item for value in values for item in (value or []) if item is not None), "")
+        element_type = _infer_field(name, [element])["type"]
+        field = {"name": name, "type": f"Collection({element_type})", "filterable": True, "facetable": True}
+        if element_type == "Edm.String":
+            field["searchable"] = True
+        return field
+
+    if isinstance(sample, bool):
+        field_type = "Edm.Boolean"
+    elif isinstance(sample, int):
+        field_type = "Edm.Int64"
+    elif isinstance(sample, float):
+        field_type = "Edm.Double"
+    else:
+        field_type = "Edm.String"
+
+    return {"name": name, "type": field_type, "searchable": field_type == "Edm.String", "filterable": True,
+            "sortable": True, "facetable": True}
+
+
+def infer_index_definition(index_name: str, documents: list[dict]) -> dict[str, Any]:
+    """
+    Builds an index definition from the fields and values of sample documents.
+
+    The key is "id" if every document has one, otherwise the first field ending in "id" that every
+    document has. Without either, an "id" key is added and numbered by position.
+
+    Args:
+        index_name (str): The name of the index.
+        documents (list[dict]): The documents the index will hold.
+
+    Returns:
+        dict[str, Any]: The serialized index definition.
+    """
+    values: dict[str, list[Any]] = {}
+    for document in documents:
+        for field_name, value in document.items():
+            values.setdefault(field_name, []).append(value)
+
+    complete_field_names = [field_name for field_name, field_values in values.items()
+                            if len(field_values) == len(documents) and all(value is not None for value in field_values)]
+    key_field_name = "id" if "id" in complete_field_names else next(
+        (field_name for field_name in complete_field_names if field_name.lower().endswith("id")), None)
+
+    fields = [_infer_field(field_name, field_values) for field_name, field_values in values.items()]
+    if key_field_name is None:
+        key_field_name = "id"
+        fields.insert(0, {"name": "id", "type": "Edm.String"})
+
+    for field in fields:
+        if field["name"] == key_field_name:
+            field.update({"type": "Edm.String", "key": True, "filterable": True, "sortable": True})
+
+    return {"name": index_name, "fields": fields}
+
+
+def index_name_for_directory(directory_name: str) -> str:
+    """Turns a directory name into a valid index name: lower case letters, digits and dashes."""
+    return re.sub(r"[^a-z0-9-]+", "-", directory_name.lower()).strip("-") or "documents"
+
+
+class MemorySearchService:
+    """
+    A process-wide, in-memory stand-in for an Azure AI Search service.
+
+    Holds the index definitions and documents, and the indexer, data source and skillset
+    definitions. Indexers are stored but never run.
+    """
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._indexes: dict[str, dict[str, Any]] = {}
+        self._engines: dict[str, MemoryIndex] = {}
+        self._resources: dict[str, dict[str, dict[str, Any]]] = {"indexers": {}, "data_sources": {},
+                                                                 "skillsets": {}}
+        self._etags = itertools.count(1)
+        self._seeded = False
+
+    def reset(self) -> None:
+        """Removes everything, so that the next use seeds the service again."""
+        with self._lock:
+            self._indexes.clear()
+            self._engines.clear()
+            for resources in self._resources.values():
+                resources.clear()
+            self._seeded = False
+
+    def ensure_seeded(self) -> None:
+        """Loads the directory named by AZURE_AI_SEARCH_MEMORY_SEED_DIR the first time the service is used."""
+        with self._lock:
+            if self._seeded:
+                return
+            self._seeded = True
+            seed_directory = os.environ.get("AZURE_AI_SEARCH_MEMORY_SEED_DIR")
+            if seed_directory:
+                self.load_directory(seed_directory)
+
+    def load_directory(self, root: str | Path, encoding: str = "utf-8") -> None:
+        """
+        Loads index, data source, indexer and skillset definitions and documents from a directory.
+
+        index-definitions/, datasource-definitions/, indexer-definitions/ and skillset-definitions/
+        hold one JSON definition per file. Every other directory holding JSON or JSON Lines files
+        becomes an index named after the directory, with the definition from index-definitions/ or
+        one inferred from its documents.
+
+        Args:
+            root (str | Path): The directory, laid out like sample-dataset/.
+            encoding (str): The character encoding of the files.
+        """
+        root = Path(root)
+        definition_directories = {root / name for name in RESOURCE_DEFINITION_DIRECTORIES} | \
+            {root / INDEX_DEFINITION_DIRECTORY}
+
+        for definition_path in sorted((root / INDEX_DEFINITION_DIRECTORY).glob("*.json")):
+            self.put_index(self._read_records(definition_path, encoding)[0], replace=True)
+
+        for directory_name, kind in RESOURCE_DEFINITION_DIRECTORIES.items():
+            for definition_path in sorted((root / directory_name).glob("*.json")):
+                self.put_resource(kind, self._read_records(definition_path, encoding)[0])
+
+        documents_by_directory: dict[Path, list[dict]] = {}
+        for file_path in find_json_files(root):
+            if file_path.parent in definition_directories:
+                continue
+            documents_by_directory.setdefault(file_path.parent, []).extend(self._read_records(file_path, encoding))
+
+        for directory, documents in documents_by_directory.items():
+            index_name = index_name_for_directory(directory.name)
+            if index_name not in self._indexes:
+                self.put_index(infer_index_definition(index_name, documents))
+
+            engine = self.engine(index_name)
+            key_field_name = engine.key_field_name
+            for position, document in enumerate(documents):
+                key = document.get(key_field_name)
+                document[key_field_name] = str(key) if key is not None else str(position + 1)
+            failures = [result for result in engine.upload(documents) if not result["status"]]
+            if failures:
+                logger.warning(f"{len(failures)} documents of {directory} were not loaded: "
+                               f"{failures[0]['errorMessage']}")
+
+        logger.info(f"Loaded {len(self._indexes)} indexes into the in-memory search service from {root}")
+
+    @staticmethod
+    def _read_records(file_path: Path, encoding: str) -> list[dict]:
+        decoder = JsonRecordDecoder()
+        records = decoder.feed(file_path.read_text(encoding=encoding))
+        decoder.close()
+        return records
+
+    def index_names(self) -> list[str]:
+        self.ensure_seeded()
+        return list(self._indexes)
+
+    def get_index(self, index_name: str) -> dict[str, Any]:
+        self.ensure_seeded()
+        definition = self._indexes.get(index_name)
+        if definition is None:
+            raise ResourceNotFoundError(message=f"No index with the name '{index_name}' was found in the service")
+        return copy.deepcopy(definition)
+
+    def put_index(self, definition: MutableMapping[str, Any], replace: bool = False) -> dict[str, Any]:
+        """Creates an index, or replaces the definition of an existing one if replace is set."""
+        self.ensure_seeded()
+        with self._lock:
+            index_name = definition["name"]
+            if index_name in self._indexes and not replace:
+                raise ResourceExistsError(message=f"Cannot create index '{index_name}' because it already exists")
+            if not any(field.get("key") for field in definition.get("fields", [])):
+                raise ValueError(f"Index '{index_name}' does not define a key field")
+
+            definition = copy.deepcopy(dict(definition))
+            definition["@odata.etag"] = f'"0x{next(self._etags):X}"'
+            self._indexes[index_name] = definition
+            if index_name in self._engines:
+                self._engines[index_name].set_definition(definition)
+            else:
+                self._engines[index_name] = MemoryIndex(definition)
+            return copy.deepcopy(definition)
+
+    def delete_index(self, index_name: str) -> None:
+        self.ensure_seeded()
+        with self._lock:
+            if self._indexes.pop(index_name, None) is None:
+                raise ResourceNotFoundError(message=f"No index with the name '{index_name}' was found in the service")
+            del self._engines[index_name]
+
+    def engine(self, index_name: str) -> MemoryIndex:
+        self.ensure_seeded()
+        engine = self._engines.get(index_name)
+        if engine is None:
+            raise ResourceNotFoundError(message=f"The index '{index_name}' was not found")
+        return engine
+
+    def resource_names(self, kind: str) -> list[str]:
+        self.ensure_seeded()
+        return list(self._resources[kind])
+
+    def get_resource(self, kind: str, name: str) -> dict[str, Any]:
+        self.ensure_seeded()
+        resource = self._resources[kind].get(name)
+        if resource is None:
+            raise ResourceNotFoundError(message=f"No {kind[:-1].replace('_', ' ')} with the name '{name}' was found")
+        return copy.deepcopy(resource)
+
+    def put_resource(self, kind: str, definition: MutableMapping[str, Any]) -> dict[str, Any]:
+        self.ensure_seeded()
+        with self._lock:
+            definition = copy.deepcopy(dict(definition))
+            definition["@odata.etag"] = f'"0x{next(self._etags):X}"'
+            self._resources[kind][definition["name"]] = definition
+            return copy.deepcopy(definition)
+
+    def delete_resource(self, kind: str, name: str) -> None:
+        self.ensure_seeded()
+        with self._lock:
+            if self._resources[kind].pop(name, None) is None:
+                raise ResourceNotFoundError(message=f"No {kind[:-1].replace('_', ' ')} with the name '{name}' was found")
+
+
+class MemorySearchResults:
+    """Search results with the iteration and get_count interface of SearchItemPaged."""
+
+    def __init__(self, results: list[dict], count: Optional[int]):
+        self._results = results
+        self._count = count
+
+    def __iter__(self) -> Iterator[dict]:
+        return iter(self._results)
+
+    def get_count(self) -> Optional[int]:
+        return self._count
+
+
+class MemorySearchIndexClient:
+    """The subset of SearchIndexClient used by the DAOs, backed by a MemorySearchService."""
+
+    def __init__(self, service: MemorySearchService):
+        self._service = service
+
+    def list_index_names(self) -> Iterator[str]:
+        return iter(self._service.index_names())
+
+    def list_indexes(self) -> Iterator[SearchIndex]:
+        return iter([SearchIndex.deserialize(self._service.get_index(index_name))
+                     for index_name in self._service.index_names()])
+
+    def get_index(self, name: str, **kwargs: Any) -> SearchIndex:
+        definition = self._service.get_index(name)
+        if_none_match = (kwargs.get("headers") or {}).get("If-None-Match")
+        if if_none_match is not None and if_none_match == definition.get("@odata.etag"):
+            raise ResourceNotModifiedError(message="Not Modified")
+        return SearchIndex.deserialize(definition)
+
+    def create_index(self, index: SearchIndex, **kwargs: Any) -> SearchIndex:
+        return SearchIndex.deserialize(self._service.put_index(index.serialize(keep_readonly=True)))
+
+    def create_or_update_index(self, index: SearchIndex, **kwargs: Any) -> SearchIndex:
+        return SearchIndex.deserialize(self._service.put_index(index.serialize(keep_readonly=True), replace=True))
+
+    def delete_index(self, index: str | SearchIndex, **kwargs: Any) -> None:
+        self._service.delete_index(index if isinstance(index, str) else index.name)
+
+    def close(self) -> None:
+        pass
+
+
+class MemorySearchClient:
+    """The subset of SearchClient used by the DAOs, backed by a MemorySearchService."""
+
+    def __init__(self, service: MemorySearchService, index_name: str):
+        self._service = service
+        self._index_name = index_name
+
+    def get_document_count(self, **kwargs: Any) -> int:
+        return self._service.engine(self._index_name).count()
+
+    def search(self,
+               search_text: Optional[str] = None,
+               *,
+               include_total_count: Optional[bool] = None,
+               filter: Optional[str] = None,
+               order_by: Optional[list[str]] = None,
+               select: Optional[list[str]] = None,
+               skip: Optional[int] = None,
+               top: Optional[int] = None,
+               **kwargs: Any) -> MemorySearchResults:
+        unsupported = sorted(name for name, value in kwargs.items() if value is not None)
+        if unsupported:
+            raise ValueError(f"The in-memory search backend does not support {', '.join(unsupported)}")
+
+        results, count = self._service.engine(self._index_name).search(
+            search_text, filter=filter, order_by=order_by, select=select, skip=skip, top=top,
+            include_total_count=include_total_count)
+        return MemorySearchResults(results, count)
+
+    def upload_documents(self, documents: list[dict], **kwargs: Any) -> list[IndexingResult]:
+        return self._indexing_results(self._service.engine(self._index_name).upload(documents))
+
+    def merge_or_upload_documents(self, documents: list[dict], **kwargs: Any) -> list[IndexingResult]:
+        return self._indexing_results(self._service.engine(self._index_name).upload(documents, merge=True))
+
+    def delete_documents(self, documents: list[dict], **kwargs: Any) -> list[IndexingResult]:
+        return self._indexing_results(self._service.engine(self._index_name).delete(documents))
+
+    @staticmethod
+    def _indexing_results(results: list[dict]) -> list[IndexingResult]:
+        return [IndexingResult.deserialize(result) for result in results]
+
+    def close(self) -> None:
+        pass
+
+
+class MemorySearchIndexerClient:
+    """The subset of SearchIndexerClient used by the DAOs, backed by a MemorySearchService."""
+
+    def __init__(self, service: MemorySearchService):
+        self._service = service
+
+    def get_indexer_names(self, **kwargs: Any) -> list[str]:
+        return self._service.resource_names("indexers")
+
+    def get_indexer(self, name: str, **kwargs: Any) -> SearchIndexer:
+        return SearchIndexer.deserialize(self._service.get_resource("indexers", name))
+
+    def create_indexer(self, indexer: SearchIndexer, **kwargs: Any) -> SearchIndexer:
+        if indexer.name in self._service.resource_names("indexers"):
+            raise ResourceExistsError(message=f"Cannot create indexer '{indexer.name}' because it already exists")
+        self._service.get_resource("data_sources", indexer.data_source_name)
+        self._service.engine(indexer.target_index_name)
+        return SearchIndexer.deserialize(self._service.put_resource("indexers", indexer.serialize(keep_readonly=True)))
+
+    def delete_indexer(self, indexer: str | SearchIndexer, **kwargs: Any) -> None:
+        self._service.delete_resource("indexers", indexer if isinstance(indexer, str) else indexer.name)
+
+    def get_data_source_connection_names(self, **kwargs: Any) -> list[str]:
+        return self._service.resource_names("data_sources")
+
+    def get_data_source_connection(self, name: str, **kwargs: Any) -> SearchIndexerDataSourceConnection:
+        return SearchIndexerDataSourceConnection.deserialize(self._service.get_resource("data_sources", name))
+
+    def get_skillset_names(self, **kwargs: Any) -> list[str]:
+        return self._service.resource_names("skillsets")
+
+    def get_skillset(self, name: str, **kwargs: Any) -> SearchIndexerSkillset:
+        return SearchIndexerSkillset.deserialize(self._service.get_resource("skillsets", name))
+
+    def close(self) -> None:
+        pass
+
+
+class _AsyncIterator:
+    """Async iteration over a list, and the get_count of AsyncSearchItemPaged for search results."""
+
+    def __init__(self, items: Iterable[Any]):
+        self._items = items
+        self._iterator = iter(items)
+
+    def __aiter__(self) -> "_AsyncIterator":
+        return self
+
+    async def __anext__(self) -> Any:
+        try:
+            return next(self._iterator)
+        except StopIteration:
+            raise StopAsyncIteration
+
+    async def get_count(self) -> Optional[int]:
+        return self._items.get_count() if isinstance(self._items, MemorySearchResults) else None
+
+
+class AsyncMemoryClient:
+    """
+    Exposes a memory client with the interface of the azure.search.documents aio clients.
+
+    Listing methods return async iterables, as AsyncItemPaged does, and every other method is a
+    coroutine. The work itself is done synchronously, since it never waits on I/O.
+    """
+
+    PAGED_METHOD_NAMES = frozenset({"list_index_names", "list_indexes"})
+
+    def __init__(self, client: MemorySearchIndexClient | MemorySearchClient | MemorySearchIndexerClient):
+        self._client = client
+
+    def __getattr__(self, name: str) -> Callable[..., Any]:
+        method = getattr(self._client, name)
+
+        if name in self.PAGED_METHOD_NAMES:
+            return lambda *args, **kwargs: _AsyncIterator(method(*args, **kwargs))
+
+        async def call(*args: Any, **kwargs: Any) -> Any:
+            result = method(*args, **kwargs)
+            return _AsyncIterator(result) if isinstance(result, MemorySearchResults) else result
+
+        return call
+
+    async def close(self) -> None:
+        pass
+
+
+memory_search_service = MemorySearchService()
+
+
+def memory_client(client_type: str, index_name: Optional[str] = None, asynchronous: bool = False) -> Any:
+    """
+    Creates a client of the in-memory backend with the interface of the SDK client it replaces.
+
+    Args:
+        client_type (str): "index", "search" or "indexer".
+        index_name (str | None): The index a search client is bound to.
+        asynchronous (bool): Whether to return the aio interface.
+
+    Returns:
+        Any: The client.
+    """
+    if client_type == "index":
+        client = MemorySearchIndexClient(memory_search_service)
+    elif client_type == "search":
+        client = MemorySearchClient(memory_search_service, index_name)
+    elif client_type == "indexer":
+        client = MemorySearchIndexerClient(memory_search_service)
+    else:
+        raise ValueError(f"Unknown client type '{client_type}'")
+
+    return AsyncMemoryClient(client) if asynchronous else client
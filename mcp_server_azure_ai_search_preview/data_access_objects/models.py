@@ -1,8 +1,10 @@
-from typing import List, Optional, AnyStr, Any
+from typing import List, Optional, AnyStr, Any, TYPE_CHECKING
 
-from azure.search.documents.indexes._generated.models import FieldMapping
 from pydantic import BaseModel, ConfigDict
-from azure.search.documents.indexes.models import SearchIndex, SimpleField, SearchSuggester
+
+if TYPE_CHECKING:
+    from azure.search.documents.indexes._generated.models import FieldMapping
+    from azure.search.documents.indexes.models import SearchIndex
 
 OperationResult = dict[str, Any]
 
@@ -53,12 +55,93 @@ class SearchIndexSchema(BaseModel):
     encryption_key: Optional[dict] = None  # @TODO expand this to a model if needed
 
 
+class BatchSummary(BaseModel):
+    batch: int
+    documents: int
+    bytes: int
+    succeeded: int = 0
+    failed: int = 0
+    retries: int = 0
+    failed_keys: Optional[List[str]] = None
+    errors: Optional[List[str]] = None
+
+
+class BulkOperationSummary(BaseModel):
+    index_name: str
+    total_documents: int = 0
+    succeeded: int = 0
+    failed: int = 0
+    batches: List[BatchSummary] = []
+
+
+class PayloadTrimReport(BaseModel):
+    excluded_fields: Optional[List[str]] = None
+    truncated_fields: Optional[dict[str, int]] = None
+    max_field_chars: Optional[int] = None
+    omitted_documents: int = 0
+    bytes: Optional[int] = None
+
+
+class IngestionSummary(BaseModel):
+    files: int = 0
+    records: int = 0
+    skipped_records: int = 0
+    dropped_fields: Optional[List[str]] = None
+    file_errors: Optional[List[str]] = None
+    upload: BulkOperationSummary
+
+
+class QueryPage(BaseModel):
+    documents: List[dict]
+    next_cursor: Optional[str] = None
+    count: Optional[int] = None
+    warnings: Optional[List[str]] = None
+    trimmed: Optional[PayloadTrimReport] = None
+
+
+class ColumnarQueryPage(BaseModel):
+    fields: List[str]
+    rows: List[list]
+    next_cursor: Optional[str] = None
+    count: Optional[int] = None
+    warnings: Optional[List[str]] = None
+    trimmed: Optional[PayloadTrimReport] = None
+
+
+class DocumentCounts(BaseModel):
+    counts: dict[str, int]
+    total: int = 0
+    errors: Optional[dict[str, str]] = None
+
+
+class FileChunk(BaseModel):
+    file_path: str
+    offset: int
+    length: int
+    size: int
+    content: str
+    next_offset: Optional[int] = None
+    start_line: Optional[int] = None
+    next_line: Optional[int] = None
+
+
+class FileMetadata(BaseModel):
+    file_path: str
+    size: int
+    line_count: Optional[int] = None
+    encoding: str
+    modified: str
+
+
 class FieldMappingModel(BaseModel):
     source_field_name: str
     target_field_name: str
     mapping_function: str | None = None
 
-def convert_pydantic_model_to_search_index(schema: SearchIndexSchema) -> SearchIndex:
+def convert_pydantic_model_to_search_index(schema: SearchIndexSchema) -> "SearchIndex":
+    # The Azure SDK models are imported on first use to keep them out of the server start up
+    from azure.search.documents.indexes.models import SearchIndex, SimpleField, SearchSuggester
+
     fields = [SimpleField(**field.model_dump()) for field in schema.fields]
     suggesters = [SearchSuggester(name=s.name, source_fields=s.source_fields) for s in (schema.suggesters or [])]
 
@@ -74,7 +157,7 @@ def convert_pydantic_model_to_search_index(schema: SearchIndexSchema) -> SearchI
     )
 
 
-def convert_to_field_mappings(models: List[FieldMappingModel]) -> List[FieldMapping]:
+def convert_to_field_mappings(models: List[FieldMappingModel]) -> List["FieldMapping"]:
     """
     Converts a list of FieldMappingModel instances to Azure FieldMapping objects.
 
@@ -84,6 +167,8 @@ def convert_to_field_mappings(models: List[FieldMappingModel]) -> List[FieldMapp
     Returns:
         List[FieldMapping]: List of Azure SDK FieldMapping instances.
     """
+    from azure.search.documents.indexes._generated.models import FieldMapping
+
     return [
         FieldMapping(
             source_field_name=model.source_field_name,
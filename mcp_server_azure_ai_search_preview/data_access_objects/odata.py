@@ -0,0 +1,345 @@
+import functools
+import re
+from typing import Any, Callable, NamedTuple, Optional
+
+Predicate = Callable[[dict], bool]
+Operand = Callable[[dict], Any]
+
+TOKEN_PATTERN = re.compile(r"""
+    \s*(?:
+        (?P<string>'(?:[^']|'')*')
+      | (?P<datetime>\d{4}-\d{2}-\d{2}T\d{2}:\d{2}(?::\d{2}(?:\.\d+)?)?(?:Z|[+-]\d{2}:\d{2}))
+      | (?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)
+      | (?P<identifier>[A-Za-z_]\w*(?:[./][A-Za-z_]\w*)*)
+      | (?P<punctuation>[(),:])
+    )""", re.VERBOSE)
+
+COMPARISON_OPERATORS: dict[str, Callable[[Any, Any], bool]] = {
+    "eq": lambda left, right: left == right,
+    "ne": lambda left, right: left != right,
+    "gt": lambda left, right: left > right,
+    "ge": lambda left, right: left >= right,
+    "lt": lambda left, right: left < right,
+    "le": lambda left, right: left <= right,
+}
+
+KEYWORD_LITERALS = {"true": True, "false": False, "null": None}
+
+
+class RangeConstraint(NamedTuple):
+    """A comparison of a field with a literal that the whole filter requires (a top-level 'and' term)."""
+    field_name: str
+    operator: str
+    value: Any
+
+
+class CompiledFilter(NamedTuple):
+    predicate: Predicate
+    ranges: tuple[RangeConstraint, ...]
+
+
+class OrderByClause(NamedTuple):
+    field_name: str
+    descending: bool
+
+
+class _Token(NamedTuple):
+    kind: str
+    value: str
+
+
+def _tokenize(expression: str) -> list[_Token]:
+    tokens: list[_Token] = []
+    position = 0
+
+    while position < len(expression):
+        if expression[position:].strip() == "":
+            break
+        match = TOKEN_PATTERN.match(expression, position)
+        if match is None or match.end() == position:
+            raise ValueError(f"Invalid OData expression near '{expression[position:position + 20]}'")
+        kind = match.lastgroup
+        tokens.append(_Token(kind, match.group(kind)))
+        position = match.end()
+
+    return tokens
+
+
+def _field_getter(path: str) -> Operand:
+    """Reads a field, following '/' into complex fields."""
+    names = path.split("/")
+    if len(names) == 1:
+        return lambda document: document.get(path)
+
+    def get_nested(document: dict) -> Any:
+        value: Any = document
+        for name in names:
+            if not isinstance(value, dict):
+                return None
+            value = value.get(name)
+        return value
+
+    return get_nested
+
+
+def _compare(operator: str, left: Operand, right: Operand) -> Predicate:
+    compare = COMPARISON_OPERATORS[operator]
+
+    def predicate(document: dict) -> bool:
+        left_value = left(document)
+        right_value = right(document)
+        if left_value is None or right_value is None:
+            # Only equality is defined for null
+            return compare(left_value, right_value) if operator in ("eq", "ne") else False
+        try:
+            return compare(left_value, right_value)
+        except TypeError:
+            return False
+
+    return predicate
+
+
+class _FilterParser:
+    """
+    Recursive descent parser for the supported subset of OData $filter.
+
+    Supported: comparisons (eq, ne, gt, ge, lt, le) between fields and literals, and, or, not,
+    parentheses, boolean fields, search.in, and the any/all lambdas over collection fields. String,
+    number, boolean, null and date time literals are recognized; date times compare as ISO 8601 strings.
+
+    As in the service, a lambda body can only refer to its range variable, so the body is compiled as
+    a predicate over one element of the collection.
+    """
+
+    def __init__(self, expression: str):
+        self.tokens = _tokenize(expression)
+        self.position = 0
+        self.ranges: list[RangeConstraint] = []
+        self.range_variable: Optional[str] = None
+
+    def parse(self) -> CompiledFilter:
+        terms = self._parse_conjunction_terms(collect_ranges=True)
+        if self.position != len(self.tokens):
+            raise ValueError(f"Unexpected '{self.tokens[self.position].value}' in OData expression")
+
+        predicate = terms[0] if len(terms) == 1 else self._all_of(terms)
+        return CompiledFilter(predicate, tuple(self.ranges))
+
+    def _peek(self) -> Optional[_Token]:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def _next(self) -> _Token:
+        token = self._peek()
+        if token is None:
+            raise ValueError("Unexpected end of OData expression")
+        self.position += 1
+        return token
+
+    def _expect(self, value: str) -> None:
+        token = self._next()
+        if token.value != value:
+            raise ValueError(f"Expected '{value}' but found '{token.value}' in OData expression")
+
+    def _accept_keyword(self, keyword: str) -> bool:
+        token = self._peek()
+        if token is not None and token.kind == "identifier" and token.value.lower() == keyword:
+            self.position += 1
+            return True
+        return False
+
+    @staticmethod
+    def _all_of(predicates: list[Predicate]) -> Predicate:
+        return lambda document: all(predicate(document) for predicate in predicates)
+
+    @staticmethod
+    def _any_of(predicates: list[Predicate]) -> Predicate:
+        return lambda document: any(predicate(document) for predicate in predicates)
+
+    def _parse_conjunction_terms(self, collect_ranges: bool = False) -> list[Predicate]:
+        """Parses an 'or' expression; a single top-level 'and' chain is returned as its terms."""
+        first_range = len(self.ranges)
+        terms = self._parse_and_terms(collect_ranges)
+        if not self._accept_keyword("or"):
+            return terms
+
+        # An 'or' makes none of its terms required
+        del self.ranges[first_range:]
+        alternatives = [self._all_of(terms) if len(terms) > 1 else terms[0]]
+        while True:
+            and_terms = self._parse_and_terms(False)
+            alternatives.append(self._all_of(and_terms) if len(and_terms) > 1 else and_terms[0])
+            if not self._accept_keyword("or"):
+                break
+        return [self._any_of(alternatives)]
+
+    def _parse_or(self) -> Predicate:
+        terms = self._parse_conjunction_terms()
+        return terms[0] if len(terms) == 1 else self._all_of(terms)
+
+    def _parse_and_terms(self, collect_ranges: bool) -> list[Predicate]:
+        terms = [self._parse_unary(collect_ranges)]
+        while self._accept_keyword("and"):
+            terms.append(self._parse_unary(collect_ranges))
+        return terms
+
+    def _parse_unary(self, collect_ranges: bool = False) -> Predicate:
+        if self._accept_keyword("not"):
+            operand = self._parse_unary()
+            return lambda document: not operand(document)
+
+        token = self._peek()
+        if token is not None and token.value == "(":
+            self._next()
+            # Ranges inside a parenthesized 'and' chain are still required by the whole filter
+            terms = self._parse_conjunction_terms(collect_ranges)
+            self._expect(")")
+            return terms[0] if len(terms) == 1 else self._all_of(terms)
+
+        return self._parse_comparison(collect_ranges)
+
+    def _parse_comparison(self, collect_ranges: bool) -> Predicate:
+        left, left_field, left_literal = self._parse_operand()
+
+        token = self._peek()
+        if token is not None and token.kind == "identifier" and token.value.lower() in COMPARISON_OPERATORS:
+            operator = self._next().value.lower()
+            right, right_field, right_literal = self._parse_operand()
+            if collect_ranges and left_field is not None and right_field is None:
+                self.ranges.append(RangeConstraint(left_field, operator, right_literal))
+            return _compare(operator, left, right)
+
+        if callable(left_literal):
+            # A function call or lambda already yields a boolean
+            return left_literal
+        if left_field is not None:
+            return lambda document: left(document) is True
+        return lambda document: bool(left_literal)
+
+    def _parse_operand(self) -> tuple[Operand, Optional[str], Any]:
+        """Returns the operand, the field path if it is a plain field, and the literal or predicate value."""
+        token = self._next()
+
+        if token.kind == "string":
+            value = token.value[1:-1].replace("''", "'")
+            return (lambda document: value), None, value
+        if token.kind == "datetime":
+            value = token.value
+            return (lambda document: value), None, value
+        if token.kind == "number":
+            value = float(token.value) if any(character in token.value for character in ".eE") else int(token.value)
+            return (lambda document: value), None, value
+        if token.kind != "identifier":
+            raise ValueError(f"Unexpected '{token.value}' in OData expression")
+
+        name = token.value
+        if name.lower() in KEYWORD_LITERALS:
+            value = KEYWORD_LITERALS[name.lower()]
+            return (lambda document: value), None, value
+
+        next_token = self._peek()
+        if next_token is not None and next_token.value == "(":
+            predicate = self._parse_function(name)
+            return predicate, None, predicate
+
+        if self.range_variable is not None:
+            return self._range_variable_getter(name), None, None
+        return _field_getter(name), name, None
+
+    def _parse_function(self, name: str) -> Predicate:
+        self._expect("(")
+
+        if name.lower() == "search.in":
+            field_name = self._next().value
+            getter = self._range_variable_getter(field_name) if self.range_variable else _field_getter(field_name)
+            self._expect(",")
+            values_token = self._next()
+            delimiters = " ,"
+            if self._peek() is not None and self._peek().value == ",":
+                self._next()
+                delimiters = self._next().value[1:-1].replace("''", "'")
+            self._expect(")")
+            raw_values = values_token.value[1:-1].replace("''", "'")
+            values = frozenset(value for value in re.split("|".join(map(re.escape, delimiters)), raw_values)
+                               if value)
+            return lambda document: getter(document) in values
+
+        collection_path, _, lambda_kind = name.rpartition("/")
+        if lambda_kind.lower() not in ("any", "all") or not collection_path:
+            raise ValueError(f"Unsupported OData function '{name}'")
+
+        if self.range_variable is not None:
+            collection_getter = self._range_variable_getter(collection_path)
+        else:
+            collection_getter = _field_getter(collection_path)
+
+        if self._peek() is not None and self._peek().value == ")":
+            self._next()
+            return lambda document: bool(collection_getter(document))
+
+        outer_variable = self.range_variable
+        self.range_variable = self._next().value
+        self._expect(":")
+        body = self._parse_or()
+        self.range_variable = outer_variable
+        self._expect(")")
+
+        check = any if lambda_kind.lower() == "any" else all
+        return lambda document: check(body(element) for element in collection_getter(document) or ())
+
+    def _range_variable_getter(self, path: str) -> Operand:
+        """Reads the range variable of the enclosing lambda, or a field of it."""
+        root, _, rest = path.partition("/")
+        if root != self.range_variable:
+            raise ValueError(f"Only the range variable '{self.range_variable}' can be used inside a lambda, "
+                             f"not '{path}'")
+        if not rest:
+            return lambda element: element
+
+        nested = _field_getter(rest)
+        return lambda element: nested(element) if isinstance(element, dict) else None
+
+
+@functools.lru_cache(maxsize=256)
+def compile_filter(expression: str) -> CompiledFilter:
+    """
+    Compiles an OData $filter expression into a predicate over documents.
+
+    Compiled filters are cached, since clients repeat the same filters across pages.
+
+    Args:
+        expression (str): The $filter expression.
+
+    Returns:
+        CompiledFilter: The predicate and the field comparisons every match must satisfy, which
+            let the caller narrow the candidates with a sorted field.
+
+    Raises:
+        ValueError: If the expression is malformed or uses an unsupported construct.
+    """
+    return _FilterParser(expression).parse()
+
+
+def parse_order_by(order_by: Optional[list[str]]) -> list[OrderByClause]:
+    """
+    Parses $orderby clauses such as "rating desc" or "search.score() desc".
+
+    Args:
+        order_by (list[str] | None): The clauses; a clause may also hold several comma-separated ones.
+
+    Returns:
+        list[OrderByClause]: The field and direction of each clause. search.score() is returned as
+            the field "@search.score".
+    """
+    clauses: list[OrderByClause] = []
+
+    for clause in order_by or []:
+        for part in clause.split(","):
+            words = part.split()
+            if not words:
+                continue
+            if len(words) > 2 or (len(words) == 2 and words[1].lower() not in ("asc", "desc")):
+                raise ValueError(f"Invalid $orderby clause '{part.strip()}'")
+            field_name = "@search.score" if words[0].lower() == "search.score()" else words[0]
+            clauses.append(OrderByClause(field_name, len(words) == 2 and words[1].lower() == "desc"))
+
+    return clauses
@@ -0,0 +1,312 @@
+import base64
+import binascii
+import hashlib
+import json
+import os
+from typing import Any, List, Literal, MutableMapping, Optional
+
+from pydantic import BaseModel, ValidationError
+
+from mcp_server_azure_ai_search_preview.data_access_objects.models import QueryPage, ColumnarQueryPage
+from mcp_server_azure_ai_search_preview.data_access_objects.payload_budget import PayloadBudget
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 1000
+
+# The service rejects $skip values above this limit
+MAX_SKIP = 100_000
+
+PageFormat = Literal["rows", "columnar"]
+
+
+class QueryCursor(BaseModel):
+    """
+    State carried from one query page to the next, handed to clients as an opaque string.
+
+    In "skip" mode the next page starts at an offset. In "keyset" mode the results are ordered by
+    the key field and the next page starts after the last key seen, which is not subject to the
+    $skip limit.
+    """
+    query_hash: str
+    mode: Literal["skip", "keyset"]
+    skip: int = 0
+    returned: int = 0
+    key_field_name: Optional[str] = None
+    last_key: Optional[str] = None
+
+    def encode(self) -> str:
+        """
+        Encodes the cursor as an opaque URL-safe string.
+
+        Returns:
+            str: The encoded cursor.
+        """
+        payload = self.model_dump_json(exclude_none=True).encode("utf-8")
+        return base64.urlsafe_b64encode(payload).decode("ascii").rstrip("=")
+
+    @classmethod
+    def decode(cls, cursor: str, query_hash: str) -> "QueryCursor":
+        """
+        Decodes a cursor and checks that it was issued for the same query.
+
+        Args:
+            cursor (str): The encoded cursor.
+            query_hash (str): The fingerprint of the query being continued.
+
+        Returns:
+            QueryCursor: The decoded cursor.
+
+        Raises:
+            ValueError: If the cursor is malformed or belongs to a different query.
+        """
+        try:
+            padded_cursor = cursor + "=" * (-len(cursor) % 4)
+            decoded_cursor = cls.model_validate_json(base64.urlsafe_b64decode(padded_cursor))
+        except (binascii.Error, ValueError, ValidationError) as error:
+            raise ValueError(f"Invalid query cursor: {error}") from error
+
+        if decoded_cursor.query_hash != query_hash:
+            raise ValueError("The query cursor was issued for a different query")
+
+        return decoded_cursor
+
+
+class PageRequest(BaseModel):
+    """The search arguments for one page and the cursor state they were derived from."""
+    search_kwargs: dict[str, Any]
+    page_size: int
+    cursor: QueryCursor
+    strip_key_field: bool = False
+    top: Optional[int] = None
+
+
+def resolve_page_size(page_size: Optional[int]) -> int:
+    """
+    Returns the page size to use, defaulting to AZURE_AI_SEARCH_QUERY_PAGE_SIZE or 50.
+
+    Args:
+        page_size (int | None): The page size requested by the caller.
+
+    Returns:
+        int: A page size between 1 and 1000.
+    """
+    if page_size is None:
+        page_size = int(os.environ.get("AZURE_AI_SEARCH_QUERY_PAGE_SIZE", DEFAULT_PAGE_SIZE))
+
+    return max(1, min(page_size, MAX_PAGE_SIZE))
+
+
+def normalize_search_text(search_text: Optional[str]) -> str:
+    """An omitted or blank search text matches all documents, the same as "*"."""
+    return (search_text or "").strip() or "*"
+
+
+def normalize_select(select: Optional[List[str]]) -> Optional[tuple[str, ...]]:
+    """The order of the selected fields does not change which fields are returned."""
+    return tuple(sorted(select)) if select is not None else None
+
+
+def query_fingerprint(search_text: Optional[str],
+                      query_filter: Optional[str],
+                      order_by: Optional[List[str]],
+                      select: Optional[List[str]]) -> str:
+    """
+    Fingerprints the arguments that must stay the same across the pages of a query.
+
+    The search text and the selected fields are normalized the same way as for the query result
+    cache, so that a cached page and its cursor can be used by any query with the same fingerprint.
+
+    Returns:
+        str: A short hash of the query arguments.
+    """
+    query_arguments = json.dumps([normalize_search_text(search_text), query_filter, order_by,
+                                  normalize_select(select)], separators=(",", ":"))
+    return hashlib.sha256(query_arguments.encode("utf-8")).hexdigest()[:16]
+
+
+def sortable_key_field_name(index_schema: MutableMapping[str, Any]) -> Optional[str]:
+    """
+    Returns the key field of an index if it can drive keyset paging (filterable and sortable).
+
+    Args:
+        index_schema (MutableMapping[str, Any]): The serialized index definition.
+
+    Returns:
+        str | None: The name of the key field, or None if keyset paging is not possible.
+    """
+    for field in index_schema.get("fields", []):
+        if field.get("key"):
+            if field.get("sortable") is False or field.get("filterable") is False:
+                return None
+            return field["name"]
+
+    return None
+
+
+def supports_keyset_paging(search_text: Optional[str], order_by: Optional[List[str]]) -> bool:
+    """
+    Keyset paging replaces the result order, so it is only used for unranked, unordered queries.
+    """
+    return not order_by and normalize_search_text(search_text) == "*"
+
+
+def keyset_filter(query_filter: Optional[str], key_field_name: str, last_key: str) -> str:
+    """
+    Combines the caller's filter with the range filter that starts after the last key.
+
+    Returns:
+        str: The OData $filter expression for the next page.
+    """
+    escaped_key = last_key.replace("'", "''")
+    range_filter = f"{key_field_name} gt '{escaped_key}'"
+
+    if query_filter:
+        return f"({query_filter}) and {range_filter}"
+    return range_filter
+
+
+def prepare_page_request(search_text: Optional[str] = None,
+                         *,
+                         query_filter: Optional[str] = None,
+                         order_by: Optional[List[str]] = None,
+                         select: Optional[List[str]] = None,
+                         skip: Optional[int] = None,
+                         top: Optional[int] = None,
+                         include_total_count: Optional[bool] = None,
+                         page_size: Optional[int] = None,
+                         cursor: Optional[str] = None,
+                         key_field_name: Optional[str] = None) -> Optional[PageRequest]:
+    """
+    Plans the search call for the next page of a query.
+
+    Args:
+        key_field_name (str | None): A sortable, filterable key field. When given and the query is unordered,
+            keyset paging is used instead of $skip.
+
+    Returns:
+        PageRequest | None: The request for the page, or None if the requested top was already reached.
+    """
+    page_size = resolve_page_size(page_size)
+    query_hash = query_fingerprint(search_text, query_filter, order_by, select)
+
+    if cursor:
+        page_cursor = QueryCursor.decode(cursor, query_hash)
+    elif key_field_name and supports_keyset_paging(search_text, order_by):
+        page_cursor = QueryCursor(query_hash=query_hash, mode="keyset", skip=skip or 0,
+                                  key_field_name=key_field_name)
+    else:
+        page_cursor = QueryCursor(query_hash=query_hash, mode="skip", skip=skip or 0)
+
+    fetch_size = page_size
+    if top is not None:
+        fetch_size = min(fetch_size, top - page_cursor.returned)
+        if fetch_size <= 0:
+            return None
+
+    search_kwargs: dict[str, Any] = {
+        "search_text": search_text,
+        "include_total_count": include_total_count if not cursor else None,
+        "filter": query_filter,
+        "order_by": order_by,
+        "select": select,
+        "skip": page_cursor.skip or None,
+        # One extra result tells whether another page exists
+        "top": fetch_size + 1,
+    }
+
+    strip_key_field = False
+    if page_cursor.mode == "keyset":
+        key_field = page_cursor.key_field_name
+        search_kwargs["order_by"] = [f"{key_field} asc"]
+        if page_cursor.last_key is not None:
+            search_kwargs["filter"] = keyset_filter(query_filter, key_field, page_cursor.last_key)
+            search_kwargs["skip"] = None
+        if select and key_field not in select:
+            search_kwargs["select"] = list(select) + [key_field]
+            strip_key_field = True
+
+    return PageRequest(search_kwargs=search_kwargs, page_size=fetch_size, cursor=page_cursor,
+                       strip_key_field=strip_key_field, top=top)
+
+
+def build_page(page_request: PageRequest,
+               results: list[dict],
+               count: Optional[int] = None,
+               payload_budget: Optional[PayloadBudget] = None) -> QueryPage:
+    """
+    Builds the page returned to the caller and the cursor for the following page.
+
+    Args:
+        page_request (PageRequest): The request the results were fetched with.
+        results (list[dict]): Up to page_size + 1 search results.
+        count (int | None): The total count, if it was requested.
+        payload_budget (PayloadBudget | None): Limits the size of the page. Documents left out to stay within
+            the budget are returned with the next page.
+
+    Returns:
+        QueryPage: The documents of the page and the cursor for the next one.
+    """
+    documents = results[:page_request.page_size]
+    has_more = len(results) > page_request.page_size
+    page_cursor = page_request.cursor
+    warnings: list[str] = []
+
+    page_documents = documents
+    if page_request.strip_key_field:
+        key_field = page_cursor.key_field_name
+        page_documents = [{name: value for name, value in document.items() if name != key_field}
+                          for document in documents]
+
+    trim_report = None
+    if payload_budget is not None:
+        page_documents, trim_report = payload_budget.fit(page_documents)
+        if len(page_documents) < len(documents):
+            documents = documents[:len(page_documents)]
+            has_more = True
+
+    returned = page_cursor.returned + len(documents)
+    if page_request.top is not None and returned >= page_request.top:
+        has_more = False
+
+    next_cursor: Optional[str] = None
+    if has_more and page_cursor.mode == "keyset":
+        last_key = str(documents[-1][page_cursor.key_field_name])
+        next_cursor = page_cursor.model_copy(update={"returned": returned, "last_key": last_key, "skip": 0}).encode()
+    elif has_more:
+        next_skip = page_cursor.skip + len(documents)
+        if next_skip > MAX_SKIP:
+            warnings.append(f"More results exist but $skip cannot exceed {MAX_SKIP}. "
+                            "Narrow the filter or omit order_by and search_text to page by key.")
+        else:
+            next_cursor = page_cursor.model_copy(update={"returned": returned, "skip": next_skip}).encode()
+
+    return QueryPage(documents=page_documents, next_cursor=next_cursor, count=count, warnings=warnings or None,
+                     trimmed=trim_report)
+
+
+def to_columnar(page: QueryPage) -> ColumnarQueryPage:
+    """
+    Converts a page to the columnar format: the field names once and one array of values per document.
+
+    The fields keep the order of the documents. Fields that are missing or null in every document are
+    left out, and each row ends at its last non-null value, so the positions past the end of a shorter
+    row are null.
+
+    Args:
+        page (QueryPage): The page built by build_page.
+
+    Returns:
+        ColumnarQueryPage: The same page with its documents as rows.
+    """
+    present = {name for document in page.documents for name, value in document.items() if value is not None}
+    fields = [name for name in dict.fromkeys(name for document in page.documents for name in document)
+              if name in present]
+    rows: list[list] = []
+    for document in page.documents:
+        row = list(map(document.get, fields))
+        while row and row[-1] is None:
+            row.pop()
+        rows.append(row)
+
+    return ColumnarQueryPage(fields=fields, rows=rows, next_cursor=page.next_cursor, count=page.count,
+                             warnings=page.warnings, trimmed=page.trimmed)
@@ -0,0 +1,171 @@
+import json
+import os
+from typing import Any, MutableMapping, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from mcp_server_azure_ai_search_preview.data_access_objects.models import PayloadTrimReport
+
+DEFAULT_MAX_FIELD_CHARS = 1000
+DEFAULT_MAX_RESPONSE_BYTES = 256 * 1024
+TRUNCATION_MARKER = "…"
+# Values of these types hold no strings to truncate
+SCALAR_TYPES = frozenset({int, float, bool, type(None)})
+
+VECTOR_FIELD_TYPES = frozenset({
+    "Collection(Edm.Single)",
+    "Collection(Edm.Half)",
+    "Collection(Edm.Int16)",
+    "Collection(Edm.SByte)",
+    "Collection(Edm.Byte)",
+})
+
+
+def _json_size(document: dict) -> int:
+    """The size of a document in compact UTF-8 JSON."""
+    return len(json.dumps(document, separators=(",", ":"), default=str).encode("utf-8"))
+
+
+def is_vector_field(field: MutableMapping[str, Any]) -> bool:
+    """Whether a serialized field definition describes a vector field."""
+    return field.get("dimensions") is not None or field.get("type") in VECTOR_FIELD_TYPES
+
+
+def default_projection(index_schema: MutableMapping[str, Any]) -> tuple[list[str], list[str]]:
+    """
+    Picks the fields returned when a query does not select any.
+
+    Every retrievable field is selected except vector fields, whose embeddings are large and not
+    useful to read. The schema does not tell how long the values of a string field are, so long
+    text is returned and cut to a snippet by the payload budget instead.
+
+    Args:
+        index_schema (MutableMapping[str, Any]): The serialized index definition.
+
+    Returns:
+        tuple[list[str], list[str]]: The fields to select and the retrievable fields that were left out.
+    """
+    selected_fields: list[str] = []
+    excluded_fields: list[str] = []
+
+    for field in index_schema.get("fields", []):
+        if field.get("retrievable") is False:
+            continue
+        if is_vector_field(field):
+            excluded_fields.append(field["name"])
+        else:
+            selected_fields.append(field["name"])
+
+    return selected_fields, excluded_fields
+
+
+class PayloadBudget(BaseModel):
+    """
+    Limits the size of the documents returned by a query.
+
+    Strings longer than max_field_chars are cut to a snippet, and documents stop being added once
+    their JSON size would exceed max_bytes. The first document is always returned so that paging
+    makes progress. A limit of zero disables it.
+    """
+    model_config = ConfigDict(frozen=True)
+
+    max_field_chars: int = DEFAULT_MAX_FIELD_CHARS
+    max_bytes: int = DEFAULT_MAX_RESPONSE_BYTES
+
+    @classmethod
+    def from_environment(cls,
+                         max_field_chars: Optional[int] = None,
+                         max_bytes: Optional[int] = None) -> "PayloadBudget":
+        """
+        Builds a budget, defaulting to AZURE_AI_SEARCH_MAX_FIELD_CHARS and AZURE_AI_SEARCH_RESPONSE_BYTE_BUDGET.
+
+        Args:
+            max_field_chars (int | None): The maximum length of a string value.
+            max_bytes (int | None): The maximum JSON size of the documents of a response.
+
+        Returns:
+            PayloadBudget: The budget.
+        """
+        if max_field_chars is None:
+            max_field_chars = int(os.environ.get("AZURE_AI_SEARCH_MAX_FIELD_CHARS", DEFAULT_MAX_FIELD_CHARS))
+        if max_bytes is None:
+            max_bytes = int(os.environ.get("AZURE_AI_SEARCH_RESPONSE_BYTE_BUDGET", DEFAULT_MAX_RESPONSE_BYTES))
+
+        return cls(max_field_chars=max(0, max_field_chars), max_bytes=max(0, max_bytes))
+
+    def fit(self, documents: list[dict]) -> tuple[list[dict], Optional[PayloadTrimReport]]:
+        """
+        Trims documents to the budget without modifying them.
+
+        Documents and values that need no trimming are returned as they are rather than copied, and
+        documents are only measured when there is a byte limit or something to report.
+
+        Args:
+            documents (list[dict]): The documents of a page, in order.
+
+        Returns:
+            tuple[list[dict], PayloadTrimReport | None]: The leading documents that fit, with long strings
+                truncated, and a report of what was trimmed, or None if nothing was.
+        """
+        fitted_documents: list[dict] = []
+        truncated_fields: dict[str, int] = {}
+        total_bytes = 0
+
+        for document in documents:
+            fitted_document = document
+            for field_name, value in document.items():
+                fitted_value, truncated = self._truncate(value)
+                if truncated:
+                    truncated_fields[field_name] = truncated_fields.get(field_name, 0) + 1
+                    if fitted_document is document:
+                        fitted_document = dict(document)
+                    fitted_document[field_name] = fitted_value
+
+            if self.max_bytes:
+                document_bytes = _json_size(fitted_document)
+                if fitted_documents and total_bytes + document_bytes > self.max_bytes:
+                    break
+                total_bytes += document_bytes
+
+            fitted_documents.append(fitted_document)
+
+        omitted_documents = len(documents) - len(fitted_documents)
+        if not truncated_fields and not omitted_documents:
+            return fitted_documents, None
+
+        if not self.max_bytes:
+            total_bytes = sum(_json_size(document) for document in fitted_documents)
+
+        return fitted_documents, PayloadTrimReport(truncated_fields=truncated_fields or None,
+                                                   max_field_chars=self.max_field_chars if truncated_fields else None,
+                                                   omitted_documents=omitted_documents,
+                                                   bytes=total_bytes)
+
+    def _truncate(self, value: Any) -> tuple[Any, int]:
+        """Returns the value with long strings cut, and how many strings were cut; unchanged values are not copied."""
+        if not self.max_field_chars:
+            return value, 0
+
+        if isinstance(value, str):
+            if len(value) > self.max_field_chars:
+                return value[:self.max_field_chars] + TRUNCATION_MARKER, 1
+            return value, 0
+
+        if isinstance(value, list):
+            # Collections of numbers, such as vectors, have nothing to truncate
+            if all(map(SCALAR_TYPES.__contains__, map(type, value))):
+                return value, 0
+            truncated_items = [self._truncate(item) for item in value]
+            truncated_count = sum(truncated for _, truncated in truncated_items)
+            if not truncated_count:
+                return value, 0
+            return [item for item, _ in truncated_items], truncated_count
+
+        if isinstance(value, dict):
+            truncated_items = {name: self._truncate(item) for name, item in value.items()}
+            truncated_count = sum(truncated for _, truncated in truncated_items.values())
+            if not truncated_count:
+                return value, 0
+            return {name: item for name, (item, _) in truncated_items.items()}, truncated_count
+
+        return value, 0
@@ -0,0 +1,150 @@
+import json
+import logging
+import os
+import random
+from typing import Any, Callable
+
+from mcp.server.fastmcp.server import logger
+
+DEFAULT_PAYLOAD_LOG_MAX_BYTES = 2048
+DEFAULT_PAYLOAD_LOG_SAMPLE_RATE = 0.0
+# The size of a batch is estimated from this many of its documents, so summaries cost the same for any batch size
+SIZE_ESTIMATE_DOCUMENTS = 8
+MAX_SUMMARY_FIELD_NAMES = 20
+
+
+def _serialize(payload: Any) -> str:
+    """Serializes a payload to compact JSON; SDK models such as SearchIndex are serialized with their REST names."""
+    serialize = getattr(payload, "serialize", None)
+    if callable(serialize):
+        payload = serialize(keep_readonly=True)
+    return json.dumps(payload, default=str, ensure_ascii=False, separators=(",", ":"))
+
+
+def _serialize_capped(payload: Any, max_length: int) -> str:
+    """Serializes a payload up to max_length characters; the documents of a batch past the cap are not serialized."""
+    if not isinstance(payload, list):
+        serialized = _serialize(payload)
+    else:
+        parts: list[str] = []
+        length = 1
+        for document in payload:
+            if length > max_length:
+                break
+            parts.append(_serialize(document))
+            length += len(parts[-1]) + 1
+        serialized = f"[{','.join(parts)}]"
+
+    if len(serialized) > max_length:
+        return f"{serialized[:max_length]}... (truncated)"
+    return serialized
+
+
+def _byte_size(payload: Any) -> int:
+    return len(_serialize(payload).encode("utf-8"))
+
+
+class PayloadSummary:
+    """
+    Describes a logged payload: its document count, field names and size, and optionally a capped copy.
+
+    The description is built by __str__, so nothing is computed unless the log record is emitted.
+    """
+
+    __slots__ = ("payload", "max_bytes", "include_payload")
+
+    def __init__(self, payload: Any, max_bytes: int, include_payload: bool):
+        self.payload = payload
+        self.max_bytes = max_bytes
+        self.include_payload = include_payload
+
+    def __str__(self) -> str:
+        if isinstance(self.payload, list):
+            summary = self._describe_documents(self.payload)
+        else:
+            summary = self._describe_object(self.payload)
+
+        if self.include_payload:
+            summary = f"{summary}; payload {_serialize_capped(self.payload, self.max_bytes)}"
+
+        return summary
+
+    @staticmethod
+    def _describe_documents(documents: list[Any]) -> str:
+        sample = documents[:SIZE_ESTIMATE_DOCUMENTS]
+        if not sample:
+            return "0 documents"
+
+        field_names = list(dict.fromkeys(name for document in sample if isinstance(document, dict)
+                                         for name in document))
+        shown_field_names = ", ".join(field_names[:MAX_SUMMARY_FIELD_NAMES])
+        if len(field_names) > MAX_SUMMARY_FIELD_NAMES:
+            shown_field_names += f", ... ({len(field_names) - MAX_SUMMARY_FIELD_NAMES} more)"
+
+        estimated_bytes = sum(_byte_size(document) for document in sample) * len(documents) // len(sample)
+        estimate = "" if len(sample) == len(documents) else "~"
+        return f"{len(documents)} documents, fields [{shown_field_names}], {estimate}{estimated_bytes} bytes"
+
+    @staticmethod
+    def _describe_object(payload: Any) -> str:
+        fields = getattr(payload, "fields", None)
+        field_count = f", {len(fields)} fields" if isinstance(fields, list) else ""
+        name = getattr(payload, "name", None)
+        name_part = f" '{name}'" if isinstance(name, str) else ""
+        return f"{type(payload).__name__}{name_part}{field_count}, {_byte_size(payload)} bytes"
+
+
+class PayloadLogPolicy:
+    """
+    Logs the documents and definitions sent by the DAO write methods at DEBUG level without slowing
+    the writes down.
+
+    When DEBUG is disabled, which is the production default, a call costs one level check. Otherwise
+    the record carries a summary of the payload (document count, field names and byte size) that is
+    only computed when a handler formats the record. A sampled share of the records also includes the
+    payload itself, capped at a maximum size.
+    """
+
+    def __init__(self,
+                 max_bytes: int | None = None,
+                 sample_rate: float | None = None,
+                 random_source: Callable[[], float] = random.random):
+        """
+        Initializes the policy.
+
+        Args:
+            max_bytes (int | None): The maximum length of a logged payload, in characters. Defaults to the
+                AZURE_AI_SEARCH_LOG_PAYLOAD_MAX_BYTES environment variable or 2048.
+            sample_rate (float | None): The share of records, from 0 to 1, that include the payload. Defaults
+                to the AZURE_AI_SEARCH_LOG_PAYLOAD_SAMPLE_RATE environment variable or 0, i.e. summaries only.
+            random_source (Callable[[], float]): Returns a random number in [0, 1), replaceable in tests.
+        """
+        if max_bytes is None:
+            max_bytes = int(os.environ.get("AZURE_AI_SEARCH_LOG_PAYLOAD_MAX_BYTES", DEFAULT_PAYLOAD_LOG_MAX_BYTES))
+        if sample_rate is None:
+            sample_rate = float(os.environ.get("AZURE_AI_SEARCH_LOG_PAYLOAD_SAMPLE_RATE",
+                                               DEFAULT_PAYLOAD_LOG_SAMPLE_RATE))
+        if not 0.0 <= sample_rate <= 1.0:
+            raise ValueError(f"The payload log sample rate must be between 0 and 1, not {sample_rate}")
+
+        self.max_bytes = max_bytes
+        self.sample_rate = sample_rate
+        self._random = random_source
+
+    def log(self, message: str, payload: Any, *args: Any) -> None:
+        """
+        Logs a write and a summary of its payload at DEBUG level.
+
+        Args:
+            message (str): The %-style message, formatted with args when the record is emitted.
+            payload (Any): The documents or the SDK model sent to the service.
+            *args (Any): The arguments of the message.
+        """
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
+
+        include_payload = self.sample_rate > 0 and self._random() < self.sample_rate
+        logger.debug(f"{message}: %s", *args, PayloadSummary(payload, self.max_bytes, include_payload))
+
+
+payload_log_policy = PayloadLogPolicy()
@@ -0,0 +1,244 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+from mcp_server_azure_ai_search_preview.data_access_objects.paging import normalize_search_text, normalize_select
+
+DEFAULT_QUERY_CACHE_SIZE = 256
+DEFAULT_QUERY_CACHE_TTL_SECONDS = 30.0
+
+# Writes become visible to queries once the index refreshes, usually within a second, so results
+# fetched right after a write are not cached
+WRITE_SETTLE_SECONDS = 2.0
+
+
+def _parse_index_ttls(raw_index_ttls: str) -> dict[str, float]:
+    """
+    Parses per-index TTL overrides written as "index1=60,index2=0".
+    """
+    index_ttls: dict[str, float] = {}
+
+    for entry in raw_index_ttls.split(","):
+        if not entry.strip():
+            continue
+        index_name, separator, ttl_seconds = entry.partition("=")
+        if not separator:
+            raise ValueError(f"Invalid query cache TTL entry '{entry}'. Expected index_name=seconds")
+        index_ttls[index_name.strip()] = float(ttl_seconds)
+
+    return index_ttls
+
+
+class QueryResultCache:
+    """
+    In-process LRU cache for query results with a time-to-live per index.
+
+    Entries are keyed by the normalized query arguments. Writes to an index invalidate all of its
+    entries, and a per-index generation counter keeps queries that were already in flight during a
+    write from storing stale results.
+    """
+
+    def __init__(self,
+                 max_size: int | None = None,
+                 default_ttl_seconds: float | None = None,
+                 index_ttl_seconds: dict[str, float] | None = None):
+        """
+        Initializes the cache.
+
+        Args:
+            max_size (int | None): The maximum number of cached results. Defaults to the
+                AZURE_AI_SEARCH_QUERY_CACHE_SIZE environment variable or 256.
+            default_ttl_seconds (float | None): How long results stay fresh. Defaults to the
+                AZURE_AI_SEARCH_QUERY_CACHE_TTL environment variable or 30 seconds. Zero disables the cache.
+            index_ttl_seconds (dict[str, float] | None): Per-index overrides of the TTL. Defaults to the
+                AZURE_AI_SEARCH_QUERY_CACHE_INDEX_TTLS environment variable, e.g. "products=300,orders=0".
+        """
+        if max_size is None:
+            max_size = int(os.environ.get("AZURE_AI_SEARCH_QUERY_CACHE_SIZE", DEFAULT_QUERY_CACHE_SIZE))
+        if default_ttl_seconds is None:
+            default_ttl_seconds = float(os.environ.get("AZURE_AI_SEARCH_QUERY_CACHE_TTL",
+                                                       DEFAULT_QUERY_CACHE_TTL_SECONDS))
+        if index_ttl_seconds is None:
+            index_ttl_seconds = _parse_index_ttls(os.environ.get("AZURE_AI_SEARCH_QUERY_CACHE_INDEX_TTLS", ""))
+
+        self.max_size = max_size
+        self.default_ttl_seconds = default_ttl_seconds
+        self.index_ttl_seconds = index_ttl_seconds
+
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._index_keys: dict[tuple[str, str], set[Hashable]] = {}
+        self._generations: dict[tuple[str, str], int] = {}
+        self._settle_deadlines: dict[tuple[str, str], float] = {}
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._invalidations = 0
+
+    def ttl_for(self, index_name: str) -> float:
+        """
+        Returns the time-to-live of the cached results of an index.
+
+        Args:
+            index_name (str): The name of the index.
+
+        Returns:
+            float: The TTL in seconds; zero means results of this index are not cached.
+        """
+        return self.index_ttl_seconds.get(index_name, self.default_ttl_seconds)
+
+    def enabled(self, index_name: str) -> bool:
+        """Whether results of the index are cached at all."""
+        return self.max_size > 0 and self.ttl_for(index_name) > 0
+
+    @staticmethod
+    def make_key(endpoint: str, index_name: str, **query_arguments: Any) -> Hashable:
+        """
+        Builds the cache key from the normalized query arguments.
+
+        The search text and the selected fields are normalized like in query_fingerprint, so that
+        queries sharing a cache entry also share the cursors of its pages.
+
+        Args:
+            endpoint (str): The search service endpoint.
+            index_name (str): The name of the index.
+            **query_arguments (Any): The arguments of the query.
+
+        Returns:
+            Hashable: The cache key.
+        """
+        normalized_arguments = []
+
+        for name, value in sorted(query_arguments.items()):
+            if name == "search_text":
+                value = normalize_search_text(value)
+            elif name == "select":
+                value = normalize_select(value)
+            elif isinstance(value, list):
+                value = tuple(value)
+            normalized_arguments.append((name, value))
+
+        return endpoint, index_name, tuple(normalized_arguments)
+
+    def generation(self, endpoint: str, index_name: str) -> int:
+        """
+        Returns the write generation of an index, to be passed back to put().
+
+        Args:
+            endpoint (str): The search service endpoint.
+            index_name (str): The name of the index.
+
+        Returns:
+            int: The number of invalidations the index has seen.
+        """
+        with self._lock:
+            return self._generations.get((endpoint, index_name), 0)
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        """
+        Returns the cached result for the key if it has not expired.
+
+        Args:
+            key (Hashable): A key built with make_key().
+
+        Returns:
+            Any | None: The cached result, or None on a miss or if the index is not cached.
+        """
+        if not self.enabled(key[1]):
+            return None
+
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    self._remove(key)
+                self._misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[1]
+
+    def put(self, key: Hashable, value: Any, generation: int) -> None:
+        """
+        Stores a result unless the index was written to since the query started or very recently.
+
+        Args:
+            key (Hashable): A key built with make_key().
+            value (Any): The result to cache. It is shared between callers and must not be mutated.
+            generation (int): The generation returned by generation() before the query was sent.
+        """
+        endpoint, index_name = key[0], key[1]
+        if not self.enabled(index_name):
+            return
+        ttl_seconds = self.ttl_for(index_name)
+
+        with self._lock:
+            if self._generations.get((endpoint, index_name), 0) != generation:
+                return
+            if self._settle_deadlines.get((endpoint, index_name), 0.0) > time.monotonic():
+                return
+
+            self._entries[key] = (time.monotonic() + ttl_seconds, value)
+            self._entries.move_to_end(key)
+            self._index_keys.setdefault((endpoint, index_name), set()).add(key)
+
+            while len(self._entries) > self.max_size:
+                evicted_key = next(iter(self._entries))
+                self._remove(evicted_key)
+
+    def invalidate(self, endpoint: str, index_name: str) -> None:
+        """
+        Drops every cached result of an index, typically after a write to it.
+
+        Args:
+            endpoint (str): The search service endpoint.
+            index_name (str): The name of the index.
+        """
+        index_key = (endpoint, index_name)
+
+        with self._lock:
+            self._generations[index_key] = self._generations.get(index_key, 0) + 1
+            self._settle_deadlines[index_key] = time.monotonic() + WRITE_SETTLE_SECONDS
+            self._invalidations += 1
+            for key in self._index_keys.pop(index_key, set()):
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """
+        Drops every cached result and resets the counters.
+        """
+        with self._lock:
+            self._entries.clear()
+            self._index_keys.clear()
+            self._settle_deadlines.clear()
+            self._hits = self._misses = self._invalidations = 0
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Returns the hit and miss counters of the cache.
+
+        Returns:
+            dict[str, Any]: The number of entries, hits, misses, invalidations and the hit ratio.
+        """
+        with self._lock:
+            lookups = self._hits + self._misses
+            return {
+                "entries": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self._hits,
+                "misses": self._misses,
+                "invalidations": self._invalidations,
+                "hit_ratio": self._hits / lookups if lookups else 0.0,
+            }
+
+    def _remove(self, key: Hashable) -> None:
+        self._entries.pop(key, None)
+        index_keys = self._index_keys.get((key[0], key[1]))
+        if index_keys is not None:
+            index_keys.discard(key)
+
+
+query_result_cache = QueryResultCache()
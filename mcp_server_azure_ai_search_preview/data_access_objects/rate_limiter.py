@@ -0,0 +1,306 @@
+import asyncio
+import email.utils
+import os
+import threading
+import time
+from typing import Callable, Literal, MutableMapping, Optional
+from urllib.parse import urlparse
+
+from azure.core.pipeline import PipelineRequest, PipelineResponse
+from azure.core.pipeline.policies import HTTPPolicy, AsyncHTTPPolicy
+from mcp.server.fastmcp.server import logger
+
+from mcp_server_azure_ai_search_preview.shared.metrics import metrics_registry
+
+TrafficClass = Literal["query", "indexing", "management"]
+
+RATE_ENVIRONMENT_VARIABLES: dict[TrafficClass, str] = {
+    "query": "AZURE_AI_SEARCH_RATE_LIMIT_QUERY",
+    "indexing": "AZURE_AI_SEARCH_RATE_LIMIT_INDEXING",
+    "management": "AZURE_AI_SEARCH_RATE_LIMIT_MANAGEMENT",
+}
+THROTTLING_STATUS_CODES = frozenset({429, 503})
+# Multiplicative decrease on throttling, and additive increase per success as a share of the rate after the decrease
+DECREASE_FACTOR = 0.5
+INCREASE_RATIO = 0.02
+MIN_RATE = 0.5
+# Without a configured maximum, the bucket stops limiting once its rate is this multiple of the throttled rate
+UNLIMITED_RECOVERY_FACTOR = 4.0
+# Pause used when a throttling response carries no Retry-After
+DEFAULT_PAUSE_SECONDS = 1.0
+
+rate_limit_wait = metrics_registry.counter(
+    "azure_search_rate_limit_wait_seconds_total", "Time requests waited for the client-side rate limiter",
+    ("traffic",))
+rate_limit_rate = metrics_registry.gauge(
+    "azure_search_rate_limit_requests_per_second", "Current rate of the client-side rate limiter; 0 while it does not limit requests",
+    ("traffic",))
+
+
+def classify_request(method: str, url: str) -> TrafficClass:
+    """
+    Assigns a request to the budget it draws from.
+
+    Args:
+        method (str): The HTTP method.
+        url (str): The request URL.
+
+    Returns:
+        TrafficClass: "indexing" for document uploads, merges and deletions, "query" for every other
+            request on documents (search, count, lookup, suggest and autocomplete) and "management"
+            for requests on indexes, indexers, data sources, skillsets and the service.
+    """
+    path = urlparse(url).path
+    if "/docs" not in path:
+        return "management"
+    if method.upper() == "POST" and path.rstrip("/").endswith("/docs/search.index"):
+        return "indexing"
+    return "query"
+
+
+def parse_retry_after(headers: MutableMapping[str, str]) -> Optional[float]:
+    """
+    Reads the delay a throttling response asks for.
+
+    Args:
+        headers (MutableMapping[str, str]): The response headers.
+
+    Returns:
+        float | None: The delay in seconds from retry-after-ms, x-ms-retry-after-ms or Retry-After
+            (in seconds or as an HTTP date), or None if there is none.
+    """
+    for header_name in ("retry-after-ms", "x-ms-retry-after-ms"):
+        value = headers.get(header_name)
+        if value is not None:
+            try:
+                return max(float(value) / 1000, 0.0)
+            except ValueError:
+                pass
+
+    value = headers.get("Retry-After")
+    if value is None:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(retry_at.timestamp() - time.time(), 0.0)
+
+
+class AdaptiveRateLimiter:
+    """
+    A token bucket whose rate adapts to throttling, shared by every client of one budget.
+
+    Without a configured maximum, the bucket does not limit requests until the service throttles one. A
+    throttling response then halves the rate, starting from the throughput just observed, and pauses the
+    bucket for the Retry-After delay. Each request reserves a token and waits until it is due, so concurrent
+    callers are spaced out at that rate instead of all retrying at once. Every successful response
+    raises the rate again by a small step, so aggregate throughput settles just below the rate at which
+    the service starts throttling.
+    """
+
+    def __init__(self,
+                 max_rate: Optional[float] = None,
+                 name: str = "",
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Initializes a bucket that does not limit requests yet.
+
+        Args:
+            max_rate (float | None): The highest rate in requests per second, enforced from the start;
+                None to only limit requests after throttling.
+            name (str): The traffic class, used in logs and metrics.
+            clock (Callable[[], float]): The monotonic clock, replaceable in tests.
+        """
+        self.name = name
+        self.max_rate = max_rate
+        # None while requests are not limited
+        self.rate: Optional[float] = max_rate
+        self._clock = clock
+        self._tokens = self._burst()
+        # Tokens accrue from this time; it lies in the future while the bucket is paused
+        self._updated = clock()
+        self._increase_step = 0.0
+        self._unlimited_above: Optional[float] = None
+        # Requests reserved in the current and the previous one-second window, to estimate the throughput
+        self._window_start = self._updated
+        self._window_count = 0
+        self._previous_window_count = 0
+        self._lock = threading.Lock()
+
+    def _burst(self) -> float:
+        return max(self.rate, 1.0) if self.rate is not None else 1.0
+
+    def reserve(self) -> float:
+        """
+        Takes a token, borrowing against future tokens if the bucket is empty.
+
+        Returns:
+            float: The seconds to wait before sending the request.
+        """
+        with self._lock:
+            now = self._clock()
+            self._count_request(now)
+            paused_for = max(self._updated - now, 0.0)
+
+            if self.rate is None:
+                return paused_for
+
+            if now > self._updated:
+                self._tokens = min(self._burst(), self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+
+            self._tokens -= 1
+            return paused_for + (max(-self._tokens, 0.0) / self.rate)
+
+    def on_throttled(self, retry_after: Optional[float]) -> None:
+        """
+        Slows the bucket down after a throttling response.
+
+        Args:
+            retry_after (float | None): The delay the service asked for, in seconds.
+        """
+        with self._lock:
+            now = self._clock()
+            # Requests sent before the bucket paused are throttled together; they only slow it down once
+            if now >= self._updated:
+                observed_rate = max(self._previous_window_count, self._window_count, MIN_RATE)
+                current_rate = observed_rate if self.rate is None else min(self.rate, observed_rate)
+                self.rate = max(MIN_RATE, current_rate * DECREASE_FACTOR)
+                self._increase_step = self.rate * INCREASE_RATIO
+                if self.max_rate is None:
+                    self._unlimited_above = current_rate * UNLIMITED_RECOVERY_FACTOR
+            # No tokens accrue until the pause is over; requests already waiting keep their place in line
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = max(self._updated, now + (retry_after if retry_after is not None
+                                                      else DEFAULT_PAUSE_SECONDS))
+            rate = self.rate
+
+        rate_limit_rate.set(rate, traffic=self.name)
+        logger.info(f"Azure AI Search throttled {self.name} requests; limiting them to {rate:.1f} requests/s")
+
+    def on_success(self) -> None:
+        """Speeds the bucket up again after a successful response."""
+        if self.rate is None or self.rate == self.max_rate:
+            return
+
+        with self._lock:
+            if self.rate is None:
+                return
+            self.rate += self._increase_step
+            if self.max_rate is not None:
+                self.rate = min(self.rate, self.max_rate)
+            elif self.rate >= self._unlimited_above:
+                self.rate = None
+            rate = self.rate
+
+        rate_limit_rate.set(rate if rate is not None else 0.0, traffic=self.name)
+
+    def _count_request(self, now: float) -> None:
+        elapsed = now - self._window_start
+        if elapsed >= 1.0:
+            self._previous_window_count = self._window_count if elapsed < 2.0 else 0
+            self._window_start = now
+            self._window_count = 0
+        self._window_count += 1
+
+
+class RateLimiterRegistry:
+    """Holds the rate limiters of each endpoint and traffic class, shared by every client in the process."""
+
+    def __init__(self):
+        self._limiters: dict[tuple[str, TrafficClass], Optional[AdaptiveRateLimiter]] = {}
+        self._lock = threading.Lock()
+
+    def limiter(self, endpoint: str, traffic_class: TrafficClass) -> Optional[AdaptiveRateLimiter]:
+        """
+        Returns the limiter of a budget, creating it with the maximum rate configured in the environment.
+
+        Returns:
+            AdaptiveRateLimiter | None: The limiter, or None if the budget is disabled with a rate of 0.
+        """
+        key = (endpoint, traffic_class)
+        with self._lock:
+            if key not in self._limiters:
+                configured_rate = os.environ.get(RATE_ENVIRONMENT_VARIABLES[traffic_class], "").strip()
+                max_rate = float(configured_rate) if configured_rate else None
+                if max_rate is not None and max_rate <= 0:
+                    self._limiters[key] = None
+                else:
+                    self._limiters[key] = AdaptiveRateLimiter(max_rate, traffic_class)
+            return self._limiters[key]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._limiters.clear()
+
+
+rate_limiter_registry = RateLimiterRegistry()
+
+
+class _RateLimitPolicyBase:
+    def __init__(self, endpoint: str):
+        self.endpoint = endpoint
+
+    def _limiter(self, request: PipelineRequest) -> Optional[AdaptiveRateLimiter]:
+        traffic_class = classify_request(request.http_request.method, request.http_request.url)
+        return rate_limiter_registry.limiter(self.endpoint, traffic_class)
+
+    @staticmethod
+    def _record(limiter: AdaptiveRateLimiter, response: PipelineResponse) -> None:
+        if response.http_response.status_code in THROTTLING_STATUS_CODES:
+            limiter.on_throttled(parse_retry_after(response.http_response.headers))
+        else:
+            limiter.on_success()
+
+
+class RateLimitPolicy(_RateLimitPolicyBase, HTTPPolicy):
+    """
+    Waits for the shared rate limiter before each attempt of a request of the sync clients.
+
+    The policy runs after the retry policy, so retries draw from the same budget as new requests.
+    """
+
+    def __init__(self, endpoint: str):
+        _RateLimitPolicyBase.__init__(self, endpoint)
+        HTTPPolicy.__init__(self)
+
+    def send(self, request: PipelineRequest) -> PipelineResponse:
+        limiter = self._limiter(request)
+        if limiter is None:
+            return self.next.send(request)
+
+        wait_seconds = limiter.reserve()
+        if wait_seconds > 0:
+            rate_limit_wait.inc(wait_seconds, traffic=limiter.name)
+            time.sleep(wait_seconds)
+
+        response = self.next.send(request)
+        self._record(limiter, response)
+        return response
+
+
+class AsyncRateLimitPolicy(_RateLimitPolicyBase, AsyncHTTPPolicy):
+    """Waits for the shared rate limiter before each attempt of a request of the async clients."""
+
+    def __init__(self, endpoint: str):
+        _RateLimitPolicyBase.__init__(self, endpoint)
+        AsyncHTTPPolicy.__init__(self)
+
+    async def send(self, request: PipelineRequest) -> PipelineResponse:
+        limiter = self._limiter(request)
+        if limiter is None:
+            return await self.next.send(request)
+
+        wait_seconds = limiter.reserve()
+        if wait_seconds > 0:
+            rate_limit_wait.inc(wait_seconds, traffic=limiter.name)
+            await asyncio.sleep(wait_seconds)
+
+        response = await self.next.send(request)
+        self._record(limiter, response)
+        return response
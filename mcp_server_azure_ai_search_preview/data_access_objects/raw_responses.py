@@ -0,0 +1,234 @@
+from typing import Any, MutableMapping, Optional
+
+from azure.core.exceptions import ClientAuthenticationError, HttpResponseError, ResourceExistsError, \
+    ResourceNotFoundError, ResourceNotModifiedError, map_error
+from azure.core.rest import HttpRequest
+from azure.search.documents.indexes.models import SearchIndex
+
+from mcp_server_azure_ai_search_preview.data_access_objects.schema_cache import index_schema_cache
+from mcp_server_azure_ai_search_preview.shared.serialization import copy_result
+
+SEARCH_PATH = "docs/search.post.search"
+SEARCH_ACCEPT = "application/json;odata.metadata=none"
+INDEXES_PATH = "indexes"
+INDEXES_ACCEPT = "application/json;odata.metadata=minimal"
+
+# The REST names of the search result properties and the keys SearchClient.search gives them in a result
+SEARCH_RESULT_PROPERTIES = {
+    "@search.score": "@search.score",
+    "@search.rerankerScore": "@search.reranker_score",
+    "@search.highlights": "@search.highlights",
+    "@search.captions": "@search.captions",
+}
+SEARCH_RESULT_PROPERTY_NAMES = set(SEARCH_RESULT_PROPERTIES)
+
+SEARCH_ERROR_MAP = {
+    401: ClientAuthenticationError,
+    404: ResourceNotFoundError,
+    409: ResourceExistsError,
+    304: ResourceNotModifiedError,
+}
+
+
+def search_request_body(search_kwargs: dict[str, Any]) -> dict[str, Any]:
+    """
+    Builds the REST body SearchClient.search sends for the arguments of a query page.
+
+    Args:
+        search_kwargs (dict[str, Any]): The search_kwargs of a PageRequest.
+
+    Returns:
+        dict[str, Any]: The body of a POST to docs/search.post.search, without the unset parameters.
+    """
+    order_by = search_kwargs.get("order_by")
+    select = search_kwargs.get("select")
+    body = {
+        "count": search_kwargs.get("include_total_count"),
+        "filter": search_kwargs.get("filter"),
+        "orderby": ",".join(order_by) if isinstance(order_by, list) else order_by,
+        "search": search_kwargs.get("search_text"),
+        "select": ",".join(select) if isinstance(select, list) else select,
+        "skip": search_kwargs.get("skip"),
+        "top": search_kwargs.get("top"),
+    }
+    return {name: value for name, value in body.items() if value is not None}
+
+
+def convert_search_result(result: dict[str, Any]) -> dict[str, Any]:
+    """
+    Converts a search result of the REST response to the dict SearchClient.search yields for it.
+
+    The SDK collects the document fields as the set difference of the result's keys and the search
+    result properties, so they come in the iteration order of that set rather than the order the
+    service sent them. The same set is built here, which gives the fields the same order as the SDK
+    within a process and keeps the encoded results byte-for-byte identical. The score, reranker score,
+    highlights and captions follow the fields. Captions are only returned for semantic queries that
+    request them, which the DAOs never send, so they are passed through as decoded.
+
+    Args:
+        result (dict[str, Any]): An item of the "value" array of the response.
+
+    Returns:
+        dict[str, Any]: The search result.
+    """
+    document = {name: result[name] for name in set(result.keys()) - SEARCH_RESULT_PROPERTY_NAMES}
+    score = result.get("@search.score")
+    reranker_score = result.get("@search.rerankerScore")
+    document["@search.score"] = float(score) if score is not None else None
+    document["@search.reranker_score"] = float(reranker_score) if reranker_score is not None else None
+    document["@search.highlights"] = result.get("@search.highlights")
+    document["@search.captions"] = result.get("@search.captions")
+    return document
+
+
+def _search_request(api_version: str, body: dict[str, Any]) -> HttpRequest:
+    return HttpRequest("POST", SEARCH_PATH, params={"api-version": api_version}, json=body,
+                       headers={"Accept": SEARCH_ACCEPT})
+
+
+def _read_response(response: Any) -> dict[str, Any]:
+    """Returns the decoded body of a search response, raising the errors SearchClient.search raises."""
+    if response.status_code not in (200, 206):
+        map_error(status_code=response.status_code, response=response, error_map=SEARCH_ERROR_MAP)
+        raise HttpResponseError(response=response)
+    return response.json()
+
+
+def _add_results(results: list[dict], payload: dict[str, Any], limit: int) -> Optional[dict[str, Any]]:
+    """Converts the results of a response up to the limit and returns the body of the next request, if any."""
+    results.extend(convert_search_result(result) for result in payload["value"][:limit - len(results)])
+    if len(results) >= limit:
+        return None
+    return payload.get("@search.nextPageParameters")
+
+
+def search_documents(client: Any,
+                     api_version: str,
+                     search_kwargs: dict[str, Any],
+                     limit: int) -> tuple[list[dict], Optional[int]]:
+    """
+    Runs a query through the pipeline of a SearchClient and converts the REST JSON directly.
+
+    SearchClient.search deserializes each response into SDK models and then converts the models back
+    to dicts, which costs more CPU than the request itself for large pages. This sends the same
+    request and yields the same results and errors without the model round trip. Server-side pages
+    are followed until the limit is reached.
+
+    Args:
+        client (SearchClient): The client whose pipeline, credential and policies send the request.
+        api_version (str): The Search API version of the client.
+        search_kwargs (dict[str, Any]): The search_kwargs of a PageRequest.
+        limit (int): The maximum number of results to return.
+
+    Returns:
+        tuple[list[dict], int | None]: The results, as SearchClient.search yields them, and the total
+            count, if it was requested.
+    """
+    results: list[dict] = []
+    payload = _read_response(client.send_request(_search_request(api_version, search_request_body(search_kwargs))))
+    count = payload.get("@odata.count")
+
+    next_body = _add_results(results, payload, limit)
+    while next_body is not None:
+        payload = _read_response(client.send_request(_search_request(api_version, next_body)))
+        next_body = _add_results(results, payload, limit)
+
+    return results, count
+
+
+async def search_documents_async(client: Any,
+                                 api_version: str,
+                                 search_kwargs: dict[str, Any],
+                                 limit: int) -> tuple[list[dict], Optional[int]]:
+    """
+    Runs a query through the pipeline of an async SearchClient and converts the REST JSON directly.
+
+    See search_documents.
+
+    Args:
+        client (azure.search.documents.aio.SearchClient): The client that sends the request.
+        api_version (str): The Search API version of the client.
+        search_kwargs (dict[str, Any]): The search_kwargs of a PageRequest.
+        limit (int): The maximum number of results to return.
+
+    Returns:
+        tuple[list[dict], int | None]: The results and the total count, if it was requested.
+    """
+    results: list[dict] = []
+    response = await client.send_request(_search_request(api_version, search_request_body(search_kwargs)))
+    payload = _read_response(response)
+    count = payload.get("@odata.count")
+
+    next_body = _add_results(results, payload, limit)
+    while next_body is not None:
+        payload = _read_response(await client.send_request(_search_request(api_version, next_body)))
+        next_body = _add_results(results, payload, limit)
+
+    return results, count
+
+
+def _list_indexes_request(api_version: str) -> HttpRequest:
+    return HttpRequest("GET", INDEXES_PATH, params={"api-version": api_version}, headers={"Accept": INDEXES_ACCEPT})
+
+
+def serialize_index_definitions(payload: dict[str, Any], endpoint: str) -> list[MutableMapping[str, Any]]:
+    """
+    Serializes the index definitions of a list response as SearchIndex.serialize(keep_readonly=True) does.
+
+    The SDK's serialization orders, omits and converts properties according to its models, so it is
+    only reproduced by a round trip through them, which costs several milliseconds per definition.
+    Definitions whose ETag matches the one in the schema cache are unchanged since they were cached,
+    and are copied from the cache instead.
+
+    Args:
+        payload (dict[str, Any]): The decoded body of GET /indexes.
+        endpoint (str): The search service endpoint the definitions were listed from.
+
+    Returns:
+        list[MutableMapping[str, Any]]: The serialized index definitions.
+    """
+    definitions: list[MutableMapping[str, Any]] = []
+    for definition in payload["value"]:
+        etag = definition.get("@odata.etag")
+        cached_schema = index_schema_cache.get(endpoint, definition.get("name"))
+        if etag and cached_schema is not None and cached_schema.etag == etag:
+            definitions.append(copy_result(cached_schema.schema))
+        else:
+            definitions.append(SearchIndex.deserialize(definition).serialize(keep_readonly=True))
+    return definitions
+
+
+def list_index_definitions(client: Any, api_version: str, endpoint: str) -> list[MutableMapping[str, Any]]:
+    """
+    Lists the serialized index definitions of a service through the pipeline of a SearchIndexClient.
+
+    Args:
+        client (SearchIndexClient): The client whose pipeline, credential and policies send the request.
+        api_version (str): The Search API version of the client.
+        endpoint (str): The search service endpoint, which keys the schema cache.
+
+    Returns:
+        list[MutableMapping[str, Any]]: The definitions, as [index.serialize(keep_readonly=True) for index
+            in client.list_indexes()] returns them.
+    """
+    return serialize_index_definitions(_read_response(client.send_request(_list_indexes_request(api_version))),
+                                       endpoint)
+
+
+async def list_index_definitions_async(client: Any, api_version: str,
+                                       endpoint: str) -> list[MutableMapping[str, Any]]:
+    """
+    Lists the serialized index definitions of a service through the pipeline of an async SearchIndexClient.
+
+    See list_index_definitions.
+
+    Args:
+        client (azure.search.documents.indexes.aio.SearchIndexClient): The client that sends the request.
+        api_version (str): The Search API version of the client.
+        endpoint (str): The search service endpoint, which keys the schema cache.
+
+    Returns:
+        list[MutableMapping[str, Any]]: The serialized index definitions.
+    """
+    response = await client.send_request(_list_indexes_request(api_version))
+    return serialize_index_definitions(_read_response(response), endpoint)
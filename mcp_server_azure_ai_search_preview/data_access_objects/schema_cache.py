@@ -0,0 +1,146 @@
+import os
+import threading
+import time
+from typing import Any, MutableMapping, NamedTuple, Optional
+
+from mcp_server_azure_ai_search_preview.shared.serialization import copy_result
+
+DEFAULT_SCHEMA_CACHE_MAX_AGE_SECONDS = 60.0
+
+
+class CachedIndexSchema(NamedTuple):
+    """A serialized index definition, its ETag and when the service last confirmed it."""
+    etag: Optional[str]
+    schema: MutableMapping[str, Any]
+    validated_at: float
+
+
+class IndexSchemaCache:
+    """
+    Serialized index definitions shared by all index DAOs of the process.
+
+    Definitions younger than max_age_seconds are served from memory. Older ones are revalidated with a
+    conditional GET carrying their ETag, which costs a 304 response without a body while the index is
+    unchanged. The complete listing of an endpoint is tracked separately so that list calls can be
+    served from memory as well.
+    """
+
+    def __init__(self, max_age_seconds: float | None = None):
+        """
+        Initializes the cache.
+
+        Args:
+            max_age_seconds (float | None): How long a definition is used without revalidation. Defaults to the
+                AZURE_AI_SEARCH_SCHEMA_CACHE_MAX_AGE environment variable or 60 seconds.
+        """
+        if max_age_seconds is None:
+            max_age_seconds = float(os.environ.get("AZURE_AI_SEARCH_SCHEMA_CACHE_MAX_AGE",
+                                                   DEFAULT_SCHEMA_CACHE_MAX_AGE_SECONDS))
+
+        self.max_age_seconds = max_age_seconds
+        self._schemas: dict[tuple[str, str], CachedIndexSchema] = {}
+        self._listings: dict[str, tuple[float, list[str]]] = {}
+        self._lock = threading.Lock()
+
+    def get(self, endpoint: str, index_name: str) -> Optional[CachedIndexSchema]:
+        """
+        Returns the cached definition of an index, fresh or not.
+
+        Args:
+            endpoint (str): The search service endpoint.
+            index_name (str): The name of the index.
+
+        Returns:
+            CachedIndexSchema | None: The cached entry, or None if the index is not cached.
+        """
+        with self._lock:
+            return self._schemas.get((endpoint, index_name))
+
+    def is_fresh(self, cached_schema: CachedIndexSchema) -> bool:
+        """Whether the entry can be used without asking the service."""
+        return time.monotonic() - cached_schema.validated_at < self.max_age_seconds
+
+    def put(self, endpoint: str, schema: MutableMapping[str, Any], etag: Optional[str] = None) -> None:
+        """
+        Stores the serialized definition of an index as just validated.
+
+        Args:
+            endpoint (str): The search service endpoint.
+            schema (MutableMapping[str, Any]): The serialized index definition.
+            etag (str | None): The ETag of the definition, if the service returned one.
+        """
+        etag = etag or schema.get("@odata.etag")
+
+        with self._lock:
+            self._schemas[(endpoint, schema["name"])] = CachedIndexSchema(etag, schema, time.monotonic())
+
+    def revalidated(self, endpoint: str, index_name: str) -> None:
+        """
+        Marks a cached definition as confirmed unchanged by the service.
+
+        Args:
+            endpoint (str): The search service endpoint.
+            index_name (str): The name of the index.
+        """
+        with self._lock:
+            cached_schema = self._schemas.get((endpoint, index_name))
+            if cached_schema is not None:
+                self._schemas[(endpoint, index_name)] = cached_schema._replace(validated_at=time.monotonic())
+
+    def get_listing(self, endpoint: str) -> Optional[list[MutableMapping[str, Any]]]:
+        """
+        Returns every index definition of an endpoint if the complete listing is still fresh.
+
+        Args:
+            endpoint (str): The search service endpoint.
+
+        Returns:
+            list[MutableMapping[str, Any]] | None: Copies of the definitions, or None if they must be listed again.
+        """
+        with self._lock:
+            listing = self._listings.get(endpoint)
+            if listing is None or time.monotonic() - listing[0] >= self.max_age_seconds:
+                return None
+
+            cached_schemas = [self._schemas.get((endpoint, index_name)) for index_name in listing[1]]
+            if any(cached_schema is None for cached_schema in cached_schemas):
+                return None
+
+            return copy_result([cached_schema.schema for cached_schema in cached_schemas])
+
+    def put_listing(self, endpoint: str, schemas: list[MutableMapping[str, Any]]) -> None:
+        """
+        Stores the complete listing of an endpoint.
+
+        Args:
+            endpoint (str): The search service endpoint.
+            schemas (list[MutableMapping[str, Any]]): Every serialized index definition of the endpoint.
+        """
+        for schema in schemas:
+            self.put(endpoint, schema)
+
+        with self._lock:
+            self._listings[endpoint] = (time.monotonic(), [schema["name"] for schema in schemas])
+
+    def invalidate(self, endpoint: str, index_name: str) -> None:
+        """
+        Drops the definition of an index and the listing of its endpoint after the index changed.
+
+        Args:
+            endpoint (str): The search service endpoint.
+            index_name (str): The name of the index.
+        """
+        with self._lock:
+            self._schemas.pop((endpoint, index_name), None)
+            self._listings.pop(endpoint, None)
+
+    def clear(self) -> None:
+        """
+        Drops every cached definition.
+        """
+        with self._lock:
+            self._schemas.clear()
+            self._listings.clear()
+
+
+index_schema_cache = IndexSchemaCache()
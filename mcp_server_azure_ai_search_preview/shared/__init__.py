@@ -1,5 +1,32 @@
-from .mcp_service import FoundryKnowledgeMCP, LoggingLevel
+from .executor import BlockingCallExecutor, BlockingDaoAdapter
+from .mcp_service import FoundryKnowledgeMCP, LoggingLevel, ExecutionMode, Transport
+from .streamable_http import StatelessHttpTransport
+from .url_fetcher import UrlFetcher, url_fetcher
+from .metrics import MetricsRegistry, Counter, Gauge, Histogram, metrics_registry
+from .serialization import encode_tool_result, copy_result
+from .local_files import read_byte_range, read_line_range, iter_file_chunks, describe_local_file, \
+    resolve_local_file, max_read_bytes
 __all__ = (
     'FoundryKnowledgeMCP',
-    'LoggingLevel'
+    'LoggingLevel',
+    'ExecutionMode',
+    'Transport',
+    'StatelessHttpTransport',
+    'BlockingCallExecutor',
+    'BlockingDaoAdapter',
+    'UrlFetcher',
+    'url_fetcher',
+    'read_byte_range',
+    'read_line_range',
+    'iter_file_chunks',
+    'describe_local_file',
+    'resolve_local_file',
+    'max_read_bytes',
+    'MetricsRegistry',
+    'Counter',
+    'Gauge',
+    'Histogram',
+    'metrics_registry',
+    'encode_tool_result',
+    'copy_result'
 )
\ No newline at end of file
@@ -0,0 +1,178 @@
+import asyncio
+import contextvars
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, TypeVar
+
+from mcp_server_azure_ai_search_preview.shared.metrics import metrics_registry
+
+ResultT = TypeVar("ResultT")
+
+DEFAULT_THREAD_POOL_SIZE = 8
+
+thread_pool_queue_depth = metrics_registry.gauge(
+    "mcp_thread_pool_queue_depth", "Blocking calls waiting for a worker thread", ("pool",))
+thread_pool_active_calls = metrics_registry.gauge(
+    "mcp_thread_pool_active_calls", "Blocking calls running on a worker thread", ("pool",))
+thread_pool_max_workers = metrics_registry.gauge(
+    "mcp_thread_pool_max_workers", "Worker threads of the pool; the pool is saturated when active calls reach it",
+    ("pool",))
+thread_pool_wait = metrics_registry.histogram(
+    "mcp_thread_pool_wait_seconds", "Time blocking calls waited for a worker thread", ("pool",))
+
+
+class BlockingCallExecutor:
+    """
+    Bounded thread pool for blocking calls made from the MCP event loop.
+
+    Keeps track of how many calls are waiting for a worker thread and how long they waited, so a
+    saturated pool can be spotted before it starts stalling every session. The queue depth, active
+    calls and wait times are also published in the metrics registry, labeled with the pool name.
+    """
+
+    def __init__(self, name: str, max_workers: int = DEFAULT_THREAD_POOL_SIZE):
+        """
+        Initializes the executor.
+
+        Args:
+            name (str): The name of the pool, used for its threads and statistics.
+            max_workers (int): The maximum number of worker threads.
+        """
+        if max_workers < 1:
+            raise ValueError("The thread pool size must be at least 1")
+
+        self.name = name
+        self.max_workers = max_workers
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix=f"mcp-{name}")
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._active = 0
+        self._completed = 0
+        self._failed = 0
+        self._max_queue_depth = 0
+        self._total_wait_seconds = 0.0
+        self._max_wait_seconds = 0.0
+        thread_pool_max_workers.set(max_workers, pool=name)
+        self._publish()
+
+    async def run(self, fn: Callable[..., ResultT], *args: Any, **kwargs: Any) -> ResultT:
+        """
+        Runs the blocking callable on the pool and waits for its result without blocking the event loop.
+
+        Args:
+            fn (Callable[..., ResultT]): The blocking callable.
+            *args (Any): Positional arguments for the callable.
+            **kwargs (Any): Keyword arguments for the callable.
+
+        Returns:
+            ResultT: The value returned by the callable.
+        """
+        submitted_at = time.perf_counter()
+        context = contextvars.copy_context()
+
+        with self._lock:
+            self._queued += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._queued)
+            self._publish()
+
+        future = self._executor.submit(self._invoke, submitted_at, context.run, fn, args, kwargs)
+        future.add_done_callback(self._discard_if_cancelled)
+
+        return await asyncio.wrap_future(future)
+
+    def _invoke(self, submitted_at: float, run: Callable[..., ResultT], fn: Callable[..., ResultT],
+                args: tuple, kwargs: dict) -> ResultT:
+        wait_seconds = time.perf_counter() - submitted_at
+
+        with self._lock:
+            self._queued -= 1
+            self._active += 1
+            self._total_wait_seconds += wait_seconds
+            self._max_wait_seconds = max(self._max_wait_seconds, wait_seconds)
+            self._publish()
+        thread_pool_wait.observe(wait_seconds, pool=self.name)
+
+        try:
+            return run(fn, *args, **kwargs)
+        except BaseException:
+            with self._lock:
+                self._failed += 1
+            raise
+        finally:
+            with self._lock:
+                self._active -= 1
+                self._completed += 1
+                self._publish()
+
+    def _discard_if_cancelled(self, future: Future) -> None:
+        # Calls cancelled while still queued never reach _invoke
+        if future.cancelled():
+            with self._lock:
+                self._queued -= 1
+                self._publish()
+
+    def _publish(self) -> None:
+        """Publishes the queue depth and active calls; called with the lock held so updates stay in order."""
+        thread_pool_queue_depth.set(self._queued, pool=self.name)
+        thread_pool_active_calls.set(self._active, pool=self.name)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Returns a snapshot of the pool statistics.
+
+        Returns:
+            dict[str, Any]: The queue depth, active calls, completed and failed calls, and wait times.
+        """
+        with self._lock:
+            started = self._completed + self._active
+            return {
+                "name": self.name,
+                "max_workers": self.max_workers,
+                "queue_depth": self._queued,
+                "max_queue_depth": self._max_queue_depth,
+                "active": self._active,
+                "completed": self._completed,
+                "failed": self._failed,
+                "average_wait_seconds": self._total_wait_seconds / started if started else 0.0,
+                "max_wait_seconds": self._max_wait_seconds,
+            }
+
+    def shutdown(self, wait: bool = True) -> None:
+        """
+        Stops accepting new calls and releases the worker threads.
+
+        Args:
+            wait (bool): Whether to wait for the running calls to finish.
+        """
+        self._executor.shutdown(wait=wait, cancel_futures=True)
+
+
+class BlockingDaoAdapter:
+    """
+    Exposes the methods of a blocking DAO as coroutines that run on a BlockingCallExecutor.
+
+    This lets the tools await SearchIndexDao, SearchClientDao and SearchIndexerDao exactly like
+    their async counterparts when the service runs in thread pool execution mode.
+    """
+
+    def __init__(self, dao: Any, executor: BlockingCallExecutor):
+        """
+        Initializes the adapter.
+
+        Args:
+            dao (Any): The blocking Data Access Object.
+            executor (BlockingCallExecutor): The pool the DAO methods are dispatched to.
+        """
+        self.dao = dao
+        self.executor = executor
+
+    def __getattr__(self, name: str) -> Any:
+        attribute = getattr(self.dao, name)
+        if not callable(attribute):
+            return attribute
+
+        async def dispatch(*args: Any, **kwargs: Any) -> Any:
+            return await self.executor.run(attribute, *args, **kwargs)
+
+        return dispatch
@@ -0,0 +1,252 @@
+import codecs
+import mmap
+import os
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterator, Optional
+
+from mcp_server_azure_ai_search_preview.data_access_objects.models import FileChunk, FileMetadata
+
+DEFAULT_MAX_READ_BYTES = 10 * 1024 * 1024
+DEFAULT_CHUNK_BYTES = 1024 * 1024
+SNIFF_BYTES = 4096
+LINE_COUNT_BLOCK_BYTES = 1024 * 1024
+
+BYTE_ORDER_MARKS = (
+    (codecs.BOM_UTF32_LE, "utf-32"),
+    (codecs.BOM_UTF32_BE, "utf-32"),
+    (codecs.BOM_UTF8, "utf-8-sig"),
+    (codecs.BOM_UTF16_LE, "utf-16"),
+    (codecs.BOM_UTF16_BE, "utf-16"),
+)
+
+
+def max_read_bytes() -> int:
+    """Returns the largest read allowed in one call, from AZURE_AI_SEARCH_MCP_FILE_READ_MAX_BYTES or 10 MiB."""
+    return int(os.environ.get("AZURE_AI_SEARCH_MCP_FILE_READ_MAX_BYTES", DEFAULT_MAX_READ_BYTES))
+
+
+def resolve_local_file(file_path: str | Path) -> Path:
+    """
+    Checks that a path names an existing file.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    path = Path(file_path)
+    if not path.is_file():
+        raise FileNotFoundError(f"No such file: '{file_path}'")
+    return path
+
+
+@contextmanager
+def _mapped_file(path: Path) -> Iterator[mmap.mmap | bytes]:
+    """Maps a file read-only; empty files, which cannot be mapped, yield empty bytes."""
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            yield b""
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+            yield mapped_file
+
+
+def _is_utf8(encoding: str) -> bool:
+    return codecs.lookup(encoding).name in ("utf-8", "utf-8-sig")
+
+
+def _has_byte_newlines(encoding: str) -> bool:
+    """Whether the encoding stores a line feed as the single byte 0x0A, which UTF-16 and UTF-32 do not."""
+    return "\n".encode(encoding) == b"\n"
+
+
+def _next_character_start(mapped_file: mmap.mmap | bytes, position: int, size: int) -> int:
+    """Moves a position forward past UTF-8 continuation bytes so that no character is split."""
+    while position < size and mapped_file[position] & 0xC0 == 0x80:
+        position += 1
+    return position
+
+
+def read_byte_range(file_path: str | Path,
+                    offset: int = 0,
+                    length: Optional[int] = None,
+                    encoding: str = "utf-8") -> FileChunk:
+    """
+    Reads part of a file through a memory map, so only the requested bytes are loaded.
+
+    With a UTF-8 encoding the range is widened to whole characters.
+
+    Args:
+        file_path (str | Path): The path to the local file.
+        offset (int): The byte offset to start at.
+        length (int | None): The number of bytes to read. Defaults to 1 MiB and is capped at the read limit.
+        encoding (str): The character encoding of the file.
+
+    Returns:
+        FileChunk: The decoded content and the offset of the next chunk, or no next_offset at the end of the file.
+
+    Raises:
+        ValueError: If the offset is negative or the length is not positive.
+    """
+    path = resolve_local_file(file_path)
+    if offset < 0:
+        raise ValueError("offset must not be negative")
+    if length is not None and length <= 0:
+        raise ValueError("length must be positive")
+    length = min(length if length is not None else DEFAULT_CHUNK_BYTES, max_read_bytes())
+
+    with _mapped_file(path) as mapped_file:
+        size = len(mapped_file)
+        start = min(offset, size)
+        end = min(start + length, size)
+
+        if _is_utf8(encoding):
+            start = _next_character_start(mapped_file, start, size)
+            end = _next_character_start(mapped_file, max(start, end), size)
+
+        content = mapped_file[start:end].decode(encoding, errors="replace")
+
+    return FileChunk(file_path=str(path), offset=start, length=end - start, size=size, content=content,
+                     next_offset=end if end < size else None)
+
+
+def read_line_range(file_path: str | Path,
+                    start_line: int = 1,
+                    line_count: Optional[int] = None,
+                    encoding: str = "utf-8") -> FileChunk:
+    """
+    Reads a range of lines through a memory map without loading the lines before them.
+
+    Args:
+        file_path (str | Path): The path to the local file.
+        start_line (int): The first line to return, counting from 1.
+        line_count (int | None): The number of lines to return. Defaults to every line up to the read limit.
+        encoding (str): The character encoding of the file.
+
+    Returns:
+        FileChunk: The decoded lines, the byte range they span and the line that follows them.
+
+    Raises:
+        ValueError: If start_line is below 1, line_count is not positive, the encoding does not store line feeds
+            as single bytes or a line is longer than the read limit.
+    """
+    path = resolve_local_file(file_path)
+    if start_line < 1:
+        raise ValueError("start_line counts from 1")
+    if line_count is not None and line_count <= 0:
+        raise ValueError("line_count must be positive")
+    if not _has_byte_newlines(encoding):
+        raise ValueError(f"Line ranges cannot be read from {encoding} files; read them with offset and length")
+    read_limit = max_read_bytes()
+
+    with _mapped_file(path) as mapped_file:
+        size = len(mapped_file)
+
+        start = 0
+        for _ in range(start_line - 1):
+            newline = mapped_file.find(b"\n", start)
+            if newline < 0:
+                start = size
+                break
+            start = newline + 1
+
+        end = start
+        lines_read = 0
+        while end < size and (line_count is None or lines_read < line_count):
+            newline = mapped_file.find(b"\n", end)
+            line_end = size if newline < 0 else newline + 1
+            if line_end - start > read_limit:
+                if not lines_read:
+                    raise ValueError(f"Line {start_line} is longer than {read_limit} bytes; "
+                                     "read it with offset and length")
+                break
+            end = line_end
+            lines_read += 1
+
+        content = mapped_file[start:end].decode(encoding, errors="replace")
+
+    return FileChunk(file_path=str(path), offset=start, length=end - start, size=size, content=content,
+                     next_offset=end if end < size else None, start_line=start_line,
+                     next_line=start_line + lines_read if end < size else None)
+
+
+def iter_file_chunks(file_path: str | Path,
+                     chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+                     encoding: str = "utf-8") -> Iterator[FileChunk]:
+    """
+    Walks a file chunk by chunk with constant memory.
+
+    Args:
+        file_path (str | Path): The path to the local file.
+        chunk_bytes (int): The number of bytes per chunk.
+        encoding (str): The character encoding of the file.
+
+    Yields:
+        FileChunk: One chunk at a time.
+
+    Raises:
+        ValueError: If chunk_bytes is not positive.
+    """
+    if chunk_bytes <= 0:
+        raise ValueError("chunk_bytes must be positive")
+    offset: Optional[int] = 0
+
+    while offset is not None:
+        chunk = read_byte_range(file_path, offset, chunk_bytes, encoding)
+        yield chunk
+        offset = chunk.next_offset
+
+
+def guess_encoding(sample: bytes) -> str:
+    """
+    Guesses the encoding of a file from its first bytes.
+
+    Returns:
+        str: The encoding named by a byte order mark, "utf-8" if the sample decodes as UTF-8, "binary" if it
+            contains NUL bytes and "latin-1" otherwise.
+    """
+    for byte_order_mark, encoding in BYTE_ORDER_MARKS:
+        if sample.startswith(byte_order_mark):
+            return encoding
+
+    if b"\x00" in sample:
+        return "binary"
+
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+        return "utf-8"
+    except UnicodeDecodeError:
+        return "latin-1"
+
+
+def describe_local_file(file_path: str | Path, count_lines: bool = True) -> FileMetadata:
+    """
+    Describes a file without loading its content into memory.
+
+    Args:
+        file_path (str | Path): The path to the local file.
+        count_lines (bool): Whether to count the lines, which scans the file in 1 MiB blocks.
+
+    Returns:
+        FileMetadata: The size, line count, encoding guess and modification time of the file.
+    """
+    path = resolve_local_file(file_path)
+    file_stat = path.stat()
+    line_count: Optional[int] = None
+
+    with open(path, "rb") as file:
+        sample = file.read(SNIFF_BYTES)
+
+        if count_lines:
+            file.seek(0)
+            line_count = 0
+            last_byte = b""
+            while block := file.read(LINE_COUNT_BLOCK_BYTES):
+                line_count += block.count(b"\n")
+                last_byte = block[-1:]
+            if last_byte and last_byte != b"\n":
+                line_count += 1
+
+    return FileMetadata(file_path=str(path), size=file_stat.st_size, line_count=line_count,
+                        encoding=guess_encoding(sample),
+                        modified=datetime.fromtimestamp(file_stat.st_mtime, tz=timezone.utc).isoformat())
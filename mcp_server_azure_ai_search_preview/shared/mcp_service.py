@@ -1,17 +1,51 @@
+import functools
+import inspect
 import os
-from typing import Any, Literal
+import sys
+import time
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Literal, Sequence, TYPE_CHECKING
+
+import anyio
 
 from mcp.server.fastmcp.server import logger, FastMCP
-from mcp.types import Tool as MCPTool
+from mcp.types import AnyFunction, Tool as MCPTool, TextContent, ImageContent, EmbeddedResource
+
+from mcp_server_azure_ai_search_preview.data_access_objects.client_registry import search_client_registry
+from mcp_server_azure_ai_search_preview.shared.executor import BlockingCallExecutor, BlockingDaoAdapter, \
+    DEFAULT_THREAD_POOL_SIZE
+from mcp_server_azure_ai_search_preview.shared.metrics import metrics_registry, record_tool_call, \
+    tool_calls_in_flight, PROMETHEUS_CONTENT_TYPE
+from mcp_server_azure_ai_search_preview.shared.serialization import encode_tool_result
+from mcp_server_azure_ai_search_preview.shared.streamable_http import StatelessHttpTransport
+from mcp_server_azure_ai_search_preview.shared.url_fetcher import url_fetcher
+
+if TYPE_CHECKING:
+    from starlette.applications import Starlette
+    from mcp_server_azure_ai_search_preview.data_access_objects.async_dao import AsyncSearchIndexDao, \
+        AsyncSearchClientDao, AsyncSearchIndexerDao
 
 LoggingLevel = Literal["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
 
+ExecutionMode = Literal["async", "thread_pool"]
+
+Transport = Literal["stdio", "sse", "streamable-http"]
+
+METRICS_PATH = "/metrics"
+STREAMABLE_HTTP_PATH = "/mcp"
+
 
 class FoundryKnowledgeMCP(FastMCP):
 
     def __init__(self, name: str | None = None, instructions: str | None = None, **settings: Any):
         super().__init__(name=name, instructions=instructions, local_level="DEBUG", **settings)
 
+        # "async" awaits the aio DAOs on the event loop, "thread_pool" runs the blocking DAOs on a bounded pool.
+        # Blocking tool functions are dispatched to the pool in both modes.
+        self.execution_mode: ExecutionMode = self._get_execution_mode()
+        thread_pool_size = int(os.environ.get("AZURE_AI_SEARCH_MCP_THREAD_POOL_SIZE", DEFAULT_THREAD_POOL_SIZE))
+        self.blocking_executor = BlockingCallExecutor("blocking-tools", max_workers=thread_pool_size)
+
         self.all_tool_names: list[str] = [
             "list_index_names",
             "list_index_schemas",
@@ -20,9 +54,14 @@ class FoundryKnowledgeMCP(FastMCP):
             "delete_index",
             "modify_index",
             "add_document",
+            "add_documents",
+            "ingest_local_file",
             "delete_document",
+            "delete_documents",
+            "delete_documents_by_filter",
             "query_index",
             "get_document_count",
+            "get_document_counts",
             "list_indexers",
             "get_indexer",
             "create_indexer",
@@ -32,11 +71,15 @@ class FoundryKnowledgeMCP(FastMCP):
             "list_skill_sets",
             "get_skill_set",
             "fk_fetch_local_file_contents",
+            "fk_get_local_file_metadata",
+            "fk_read_local_file_chunk",
             "fk_fetch_url_contents",
         ]
 
         self.fetch_file_contents = [
             "fk_fetch_local_file_contents",
+            "fk_get_local_file_metadata",
+            "fk_read_local_file_chunk",
             "fk_fetch_url_contents",
         ]
 
@@ -57,12 +100,17 @@ class FoundryKnowledgeMCP(FastMCP):
 
         self.read_document_tool_names = [
             "query_index",
-            "get_document_count"
+            "get_document_count",
+            "get_document_counts"
         ]
 
         self.write_document_tool_names = [
             "add_document",
+            "add_documents",
+            "ingest_local_file",
             "delete_document",
+            "delete_documents",
+            "delete_documents_by_filter",
             "query_index",
         ]
 
@@ -86,15 +134,7 @@ class FoundryKnowledgeMCP(FastMCP):
             "get_skill_set"
         ]
 
-    def _get_role_tools(self) -> list[str]:
-        tool_groups_raw = os.environ.get("AZURE_AI_SEARCH_MCP_TOOL_GROUPS", "ALL")
-        tool_groups_list = tool_groups_raw.split(",")
-
-        filtered_list_of_tools: list[str] = []
-
-        # This is a dictionary of the groups
-        # @TODO: define and validate the filtering of tool names for each group accordingly
-        tool_database: dict[str, list[str]] = {
+        self.tool_groups: dict[str, list[str]] = {
             "ALL": self.all_tool_names,
             "WRITE_OPERATIONS": self.all_tool_names,
             "READ_OPERATIONS": self.read_indexer_tool_names + self.read_index_tool_names + self.read_document_tool_names + self.fetch_file_contents,
@@ -107,9 +147,255 @@ class FoundryKnowledgeMCP(FastMCP):
             "FETCH_FILE_CONTENTS": self.fetch_file_contents
         }
 
+        # Resolved once: tools outside the enabled groups are never registered, and the listing is cached
+        self.enabled_tool_names: list[str] = self._get_role_tools()
+        self._enabled_tool_name_set: frozenset[str] = frozenset(self.enabled_tool_names)
+        self._listed_tools: list[MCPTool] | None = None
+
+    @staticmethod
+    def _get_execution_mode() -> ExecutionMode:
+        execution_mode = os.environ.get("AZURE_AI_SEARCH_MCP_EXECUTION_MODE", "async")
+
+        if execution_mode not in ("async", "thread_pool"):
+            raise ValueError(f"Invalid AZURE_AI_SEARCH_MCP_EXECUTION_MODE '{execution_mode}'. "
+                             "Must be one of async or thread_pool")
+
+        return execution_mode
+
+    def add_tool(self, fn: AnyFunction, name: str | None = None, description: str | None = None) -> None:
+        """Add a tool to the server, dispatching blocking tool functions to the bounded thread pool.
+
+        Tools outside the groups enabled by AZURE_AI_SEARCH_MCP_TOOL_GROUPS are not registered. Every call
+        of a registered tool is recorded in the latency, in-flight and error metrics.
+
+        Args:
+            fn: The function to register as a tool
+            name: Optional name for the tool (defaults to function name)
+            description: Optional description of what the tool does
+        """
+        tool_name = name or fn.__name__
+        if tool_name not in self._enabled_tool_name_set:
+            logger.debug(f"Skipping tool {tool_name}, which is not in the enabled tool groups")
+            return
+
+        if not inspect.iscoroutinefunction(fn):
+            blocking_fn = fn
+
+            @functools.wraps(blocking_fn)
+            async def run_in_thread_pool(*args: Any, **kwargs: Any) -> Any:
+                return await self.blocking_executor.run(blocking_fn, *args, **kwargs)
+
+            fn = run_in_thread_pool
+
+        tool_fn = fn
+
+        @functools.wraps(tool_fn)
+        async def run_with_metrics(*args: Any, **kwargs: Any) -> Any:
+            tool_calls_in_flight.inc(tool=tool_name)
+            started = time.perf_counter()
+            try:
+                result = await tool_fn(*args, **kwargs)
+            except Exception as error:
+                record_tool_call(tool_name, time.perf_counter() - started, error)
+                raise
+            finally:
+                tool_calls_in_flight.dec(tool=tool_name)
+
+            record_tool_call(tool_name, time.perf_counter() - started)
+            return result
+
+        super().add_tool(run_with_metrics, name=name, description=description)
+        self._listed_tools = None
+
+    # The DAO modules import the Azure SDK, so they are loaded by the first tool call rather than at startup
+
+    def index_dao(self) -> "AsyncSearchIndexDao | BlockingDaoAdapter":
+        """Returns an index DAO whose methods are awaitable in the configured execution mode."""
+        from mcp_server_azure_ai_search_preview.data_access_objects.async_dao import AsyncSearchIndexDao
+        from mcp_server_azure_ai_search_preview.data_access_objects.dao import SearchIndexDao
+
+        if self.execution_mode == "thread_pool":
+            return BlockingDaoAdapter(SearchIndexDao(), self.blocking_executor)
+        return AsyncSearchIndexDao()
+
+    def search_client_dao(self, index_name: str) -> "AsyncSearchClientDao | BlockingDaoAdapter":
+        """Returns a document DAO for the index whose methods are awaitable in the configured execution mode.
+
+        Args:
+            index_name: The name of the index to connect to
+        """
+        from mcp_server_azure_ai_search_preview.data_access_objects.async_dao import AsyncSearchClientDao
+        from mcp_server_azure_ai_search_preview.data_access_objects.dao import SearchClientDao
+
+        if self.execution_mode == "thread_pool":
+            return BlockingDaoAdapter(SearchClientDao(index_name), self.blocking_executor)
+        return AsyncSearchClientDao(index_name)
+
+    def indexer_dao(self) -> "AsyncSearchIndexerDao | BlockingDaoAdapter":
+        """Returns an indexer DAO whose methods are awaitable in the configured execution mode."""
+        from mcp_server_azure_ai_search_preview.data_access_objects.async_dao import AsyncSearchIndexerDao
+        from mcp_server_azure_ai_search_preview.data_access_objects.dao import SearchIndexerDao
+
+        if self.execution_mode == "thread_pool":
+            return BlockingDaoAdapter(SearchIndexerDao(), self.blocking_executor)
+        return AsyncSearchIndexerDao()
+
+    def executor_stats(self) -> dict[str, Any]:
+        """Returns the queue depth and wait time statistics of the blocking thread pool."""
+        return self.blocking_executor.stats()
+
+    def run(self, transport: Transport = "stdio") -> None:
+        """Run the MCP service and release the pooled Azure clients once it stops.
+
+        Args:
+            transport: Transport protocol to use ("stdio", "sse" or "streamable-http")
+        """
+        metrics_registry.start_otlp_export()
+        try:
+            if transport == "streamable-http":
+                anyio.run(self.run_streamable_http_async)
+            else:
+                super().run(transport)
+        finally:
+            self.shutdown()
+
+    def run_workers(self, workers: int, app_factory: str) -> None:
+        """Serve the streamable HTTP transport from several worker processes sharing the configured port.
+
+        Each worker builds its own service with the app factory, so pooled clients, caches, rate limiters
+        and metrics are per worker. Requests carry no session, so any worker can serve any of them.
+
+        Args:
+            workers: The number of worker processes
+            app_factory: The import path of a function returning the app of a worker, e.g. "package.module:function"
+        """
+        import uvicorn
+
+        uvicorn.run(app_factory, factory=True, workers=workers, host=self.settings.host, port=self.settings.port,
+                    log_level=self.settings.log_level.lower())
+
+    async def run_stdio_async(self) -> None:
+        """Run the server using stdio transport, closing the pooled async clients before the loop exits."""
+        try:
+            await super().run_stdio_async()
+        finally:
+            await self.shutdown_async()
+
+    async def run_sse_async(self) -> None:
+        """Run the server using SSE transport, closing the pooled async clients before the loop exits."""
+        try:
+            await super().run_sse_async()
+        finally:
+            await self.shutdown_async()
+
+    def sse_app(self) -> "Starlette":
+        """Return the SSE server app, with the Prometheus metrics served on /metrics."""
+        from starlette.requests import Request
+        from starlette.responses import Response
+        from starlette.routing import Route
+
+        async def handle_metrics(request: Request) -> Response:
+            return Response(metrics_registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+        starlette_app = super().sse_app()
+        starlette_app.router.routes.append(Route(METRICS_PATH, endpoint=handle_metrics, methods=["GET"]))
+        return starlette_app
+
+    def streamable_http_app(self, manage_lifecycle: bool = False) -> "Starlette":
+        """Return the stateless streamable HTTP app, serving MCP on /mcp and the Prometheus metrics on /metrics.
+
+        The pooled async clients are closed when the app shuts down.
+
+        Args:
+            manage_lifecycle: Also start the OTLP export on startup and release every other resource on
+                shutdown, for apps served by a worker process rather than by run()
+        """
+        from starlette.applications import Starlette
+        from starlette.requests import Request
+        from starlette.responses import Response
+        from starlette.routing import Route
+
+        transport = StatelessHttpTransport(self._mcp_server)
+
+        async def handle_metrics(request: Request) -> Response:
+            return Response(metrics_registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
+
+        @asynccontextmanager
+        async def lifespan(app: Starlette) -> AsyncIterator[None]:
+            if manage_lifecycle:
+                metrics_registry.start_otlp_export()
+            try:
+                yield
+            finally:
+                await self.shutdown_async()
+                if manage_lifecycle:
+                    self.shutdown()
+
+        return Starlette(
+            debug=self.settings.debug,
+            routes=[
+                Route(STREAMABLE_HTTP_PATH, endpoint=transport.handle_request, methods=["GET", "POST", "DELETE"]),
+                Route(METRICS_PATH, endpoint=handle_metrics, methods=["GET"]),
+            ],
+            lifespan=lifespan,
+        )
+
+    async def run_streamable_http_async(self) -> None:
+        """Run the server using the stateless streamable HTTP transport in this process."""
+        import uvicorn
+
+        config = uvicorn.Config(
+            self.streamable_http_app(),
+            host=self.settings.host,
+            port=self.settings.port,
+            log_level=self.settings.log_level.lower(),
+        )
+        server = uvicorn.Server(config)
+        await server.serve()
+
+    @staticmethod
+    async def shutdown_async() -> None:
+        """Closes every pooled Azure AI Search client, including the async ones bound to the running loop,
+        and the pooled HTTP client of the URL fetcher."""
+        logger.info("Closing pooled Azure AI Search clients")
+        await search_client_registry.aclose()
+        await url_fetcher.aclose()
+
+    def shutdown(self) -> None:
+        """Stops the blocking thread pool, closes every pooled Azure AI Search client and the shared credential,
+        and flushes the OTLP metrics."""
+        logger.info("Closing pooled Azure AI Search clients")
+        self.blocking_executor.shutdown()
+        search_client_registry.close()
+        metrics_registry.shutdown()
+
+        # Only close the credential if a tool call created it; importing it here would load azure.identity
+        credentials = sys.modules.get("mcp_server_azure_ai_search_preview.data_access_objects.credentials")
+        if credentials is not None:
+            credentials.close_shared_token_credential()
+
+    def _get_role_tools(self) -> list[str]:
+        """Resolves AZURE_AI_SEARCH_MCP_TOOL_GROUPS to the names of the enabled tools.
+
+        Returns:
+            list[str]: The enabled tool names without duplicates, in registration order.
+
+        Raises:
+            ValueError: If a group name is not one of the known tool groups.
+        """
+        tool_groups_raw = os.environ.get("AZURE_AI_SEARCH_MCP_TOOL_GROUPS", "ALL")
+        tool_groups_list = [tool_group_name.strip() for tool_group_name in tool_groups_raw.split(",")
+                            if tool_group_name.strip()] or ["ALL"]
+
+        unknown_tool_groups = [tool_group_name for tool_group_name in tool_groups_list
+                               if tool_group_name not in self.tool_groups]
+        if unknown_tool_groups:
+            raise ValueError(f"Invalid AZURE_AI_SEARCH_MCP_TOOL_GROUPS {', '.join(unknown_tool_groups)}. "
+                             f"Must be one or more of {', '.join(self.tool_groups)}")
+
+        filtered_list_of_tools: list[str] = []
         for tool_group_name in tool_groups_list:
-            current_list_of_tools = tool_database[tool_group_name]
-            filtered_list_of_tools += current_list_of_tools
+            filtered_list_of_tools += self.tool_groups[tool_group_name]
 
         # Eliminate duplicates while preserving order
         unique_tool_names = list(dict.fromkeys(filtered_list_of_tools))
@@ -117,17 +403,30 @@ class FoundryKnowledgeMCP(FastMCP):
         return unique_tool_names
 
     async def list_tools(self) -> list[MCPTool]:
+        """Lists the enabled tools, building the list and its JSON schemas only once.
+
+        Returns:
+            list[MCPTool]: The tools to send back to the calling MCP client.
+        """
+        if self._listed_tools is None:
+            # Only enabled tools are registered; the filter guards against tools added to the manager directly
+            tool_list: list[MCPTool] = await super().list_tools()
+            self._listed_tools = [current_tool for current_tool in tool_list
+                                  if current_tool.name in self._enabled_tool_name_set]
 
-        # This is the filtered names of tools to send back to calling MCP client
-        filtered_tool_names = self._get_role_tools()
-        filtered_tool_list: list[MCPTool] = []
+        return self._listed_tools
 
-        # This is the list of tools registered at the service
-        tool_list: list[MCPTool] = await super().list_tools()
+    async def call_tool(self, name: str,
+                        arguments: dict[str, Any]) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
+        """Calls a tool and converts its result to content, with the same output as FastMCP but faster JSON encoding.
 
-        # Preparing the filtered list of tools
-        for current_tool in tool_list:
-            if current_tool.name in filtered_tool_names:
-                filtered_tool_list.append(current_tool)
+        Args:
+            name: The name of the tool
+            arguments: The arguments of the call
 
-        return filtered_tool_list
+        Returns:
+            Sequence[TextContent | ImageContent | EmbeddedResource]: The content to send back to the MCP client.
+        """
+        context = self.get_context()
+        result = await self._tool_manager.call_tool(name, arguments, context=context)
+        return encode_tool_result(result)
@@ -0,0 +1,319 @@
+import bisect
+import importlib.util
+import os
+import threading
+from typing import Any, Iterable, Optional
+
+from mcp.server.fastmcp.server import logger
+
+# The default buckets of the Prometheus client libraries, in seconds
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+OTLP_ENDPOINT_VARIABLES = ("OTEL_EXPORTER_OTLP_METRICS_ENDPOINT", "OTEL_EXPORTER_OTLP_ENDPOINT")
+
+LabelValues = tuple[str, ...]
+
+
+def _escape_label_value(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(label_names: tuple[str, ...], label_values: Iterable[str]) -> str:
+    pairs = [f'{name}="{_escape_label_value(value)}"' for name, value in zip(label_names, label_values)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_number(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    """A named family of time series, one per combination of label values."""
+
+    metric_type = "untyped"
+
+    def __init__(self, name: str, description: str, label_names: tuple[str, ...] = (), unit: str = ""):
+        self.name = name
+        self.description = description
+        self.label_names = label_names
+        self.unit = unit
+        self._lock = threading.Lock()
+        # Set when OTLP export is enabled; every update is mirrored to it
+        self.otel_instrument: Any = None
+
+    def _label_values(self, labels: dict[str, str]) -> LabelValues:
+        if set(labels) != set(self.label_names):
+            raise ValueError(f"Metric {self.name} expects the labels {', '.join(self.label_names)}")
+        return tuple(str(labels[name]) for name in self.label_names)
+
+    def render(self) -> list[str]:
+        """Returns the lines of the metric in the Prometheus text exposition format."""
+        return [f"# HELP {self.name} {self.description}", f"# TYPE {self.name} {self.metric_type}"] + \
+            self._render_samples()
+
+    def _render_samples(self) -> list[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    """A monotonically increasing count, such as the number of requests."""
+
+    metric_type = "counter"
+
+    def __init__(self, name: str, description: str, label_names: tuple[str, ...] = (), unit: str = ""):
+        super().__init__(name, description, label_names, unit)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        label_values = self._label_values(labels)
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+        if self.otel_instrument is not None:
+            self.otel_instrument.add(amount, attributes=labels)
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._label_values(labels), 0.0)
+
+    def _render_samples(self) -> list[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.label_names, label_values)} {_format_number(value)}"
+                for label_values, value in values]
+
+
+class Gauge(_Metric):
+    """A value that goes up and down, such as the number of calls in flight."""
+
+    metric_type = "gauge"
+
+    def __init__(self, name: str, description: str, label_names: tuple[str, ...] = (), unit: str = ""):
+        super().__init__(name, description, label_names, unit)
+        self._values: dict[LabelValues, float] = {}
+
+    def inc(self, amount: float = 1.0, **labels: str) -> None:
+        label_values = self._label_values(labels)
+        with self._lock:
+            self._values[label_values] = self._values.get(label_values, 0.0) + amount
+        if self.otel_instrument is not None:
+            self.otel_instrument.add(amount, attributes=labels)
+
+    def dec(self, amount: float = 1.0, **labels: str) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels: str) -> None:
+        label_values = self._label_values(labels)
+        with self._lock:
+            change = value - self._values.get(label_values, 0.0)
+            self._values[label_values] = value
+        if self.otel_instrument is not None:
+            self.otel_instrument.add(change, attributes=labels)
+
+    def value(self, **labels: str) -> float:
+        return self._values.get(self._label_values(labels), 0.0)
+
+    def _render_samples(self) -> list[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        return [f"{self.name}{_format_labels(self.label_names, label_values)} {_format_number(value)}"
+                for label_values, value in values]
+
+
+class Histogram(_Metric):
+    """The distribution of observed values, such as latencies, in cumulative buckets."""
+
+    metric_type = "histogram"
+
+    def __init__(self,
+                 name: str,
+                 description: str,
+                 label_names: tuple[str, ...] = (),
+                 unit: str = "s",
+                 buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        super().__init__(name, description, label_names, unit)
+        self.buckets = tuple(sorted(buckets))
+        # Per label values: the count of each bucket (not cumulative, plus +Inf), the sum and the count
+        self._series: dict[LabelValues, tuple[list[int], list[float]]] = {}
+
+    def observe(self, value: float, **labels: str) -> None:
+        label_values = self._label_values(labels)
+        bucket_index = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = ([0] * (len(self.buckets) + 1), [0.0, 0])
+                self._series[label_values] = series
+            series[0][bucket_index] += 1
+            series[1][0] += value
+            series[1][1] += 1
+        if self.otel_instrument is not None:
+            self.otel_instrument.record(value, attributes=labels)
+
+    def count(self, **labels: str) -> int:
+        series = self._series.get(self._label_values(labels))
+        return int(series[1][1]) if series is not None else 0
+
+    def _render_samples(self) -> list[str]:
+        with self._lock:
+            series = sorted((label_values, (list(counts), list(totals)))
+                            for label_values, (counts, totals) in self._series.items())
+
+        lines = []
+        bucket_label_names = self.label_names + ("le",)
+        for label_values, (counts, (total, count)) in series:
+            cumulative = 0
+            for upper_bound, bucket_count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += bucket_count
+                bucket_labels = _format_labels(bucket_label_names, label_values + (_format_number(upper_bound),))
+                lines.append(f"{self.name}_bucket{bucket_labels} {cumulative}")
+            labels = _format_labels(self.label_names, label_values)
+            lines.append(f"{self.name}_sum{labels} {_format_number(total)}")
+            lines.append(f"{self.name}_count{labels} {_format_number(count)}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    The metrics of the process, rendered for Prometheus and optionally exported over OTLP.
+
+    The metrics are kept in process without third-party dependencies, so they cost a dictionary update
+    per observation and are always available. OTLP export mirrors every update to OpenTelemetry
+    instruments when the opentelemetry-sdk and opentelemetry-exporter-otlp packages are installed.
+    """
+
+    def __init__(self):
+        self._metrics: dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+        self._meter_provider: Any = None
+        self._meter: Any = None
+
+    def _register(self, metric: _Metric) -> Any:
+        with self._lock:
+            if metric.name in self._metrics:
+                raise ValueError(f"A metric named {metric.name} is already registered")
+            self._metrics[metric.name] = metric
+            # Modules loaded on demand register their metrics after the export may have started
+            if self._meter is not None:
+                self._attach_instrument(metric)
+        return metric
+
+    def _attach_instrument(self, metric: _Metric) -> None:
+        if isinstance(metric, Counter):
+            metric.otel_instrument = self._meter.create_counter(metric.name, metric.unit, metric.description)
+        elif isinstance(metric, Gauge):
+            metric.otel_instrument = self._meter.create_up_down_counter(metric.name, metric.unit,
+                                                                        metric.description)
+        elif isinstance(metric, Histogram):
+            metric.otel_instrument = self._meter.create_histogram(metric.name, metric.unit, metric.description)
+
+    def counter(self, name: str, description: str, label_names: tuple[str, ...] = (), unit: str = "") -> Counter:
+        return self._register(Counter(name, description, label_names, unit))
+
+    def gauge(self, name: str, description: str, label_names: tuple[str, ...] = (), unit: str = "") -> Gauge:
+        return self._register(Gauge(name, description, label_names, unit))
+
+    def histogram(self,
+                  name: str,
+                  description: str,
+                  label_names: tuple[str, ...] = (),
+                  unit: str = "s",
+                  buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS) -> Histogram:
+        return self._register(Histogram(name, description, label_names, unit, buckets))
+
+    def render(self) -> str:
+        """
+        Renders every metric in the Prometheus text exposition format.
+
+        Returns:
+            str: The body of a /metrics response.
+        """
+        with self._lock:
+            metrics = list(self._metrics.values())
+        return "\n".join(line for metric in metrics for line in metric.render()) + "\n"
+
+    def start_otlp_export(self) -> bool:
+        """
+        Starts exporting the metrics over OTLP/HTTP if an OTLP endpoint is configured.
+
+        The endpoint, headers and interval are read by the exporter from the standard
+        OTEL_EXPORTER_OTLP_* and OTEL_METRIC_EXPORT_INTERVAL environment variables.
+
+        Returns:
+            bool: Whether the export was started.
+        """
+        if self._meter_provider is not None or not any(os.environ.get(name) for name in OTLP_ENDPOINT_VARIABLES):
+            return False
+
+        if importlib.util.find_spec("opentelemetry.sdk") is None or \
+                importlib.util.find_spec("opentelemetry.exporter.otlp.proto.http") is None:
+            logger.warning("An OTLP endpoint is configured but the opentelemetry-sdk and opentelemetry-exporter-otlp "
+                           "packages are not installed; metrics are only exposed for Prometheus")
+            return False
+
+        from opentelemetry.exporter.otlp.proto.http.metric_exporter import OTLPMetricExporter
+        from opentelemetry.sdk.metrics import MeterProvider
+        from opentelemetry.sdk.metrics.export import PeriodicExportingMetricReader
+        from opentelemetry.sdk.resources import Resource
+
+        reader = PeriodicExportingMetricReader(OTLPMetricExporter())
+        resource = Resource.create({"service.name": os.environ.get("OTEL_SERVICE_NAME",
+                                                                   "mcp-server-azure-ai-search")})
+        self._meter_provider = MeterProvider(resource=resource, metric_readers=[reader])
+
+        with self._lock:
+            self._meter = self._meter_provider.get_meter("mcp_server_azure_ai_search_preview")
+            for metric in self._metrics.values():
+                self._attach_instrument(metric)
+
+        logger.info("Exporting metrics over OTLP")
+        return True
+
+    def shutdown(self) -> None:
+        """Flushes and stops the OTLP export, if it was started."""
+        if self._meter_provider is None:
+            return
+
+        with self._lock:
+            self._meter = None
+            for metric in self._metrics.values():
+                metric.otel_instrument = None
+        try:
+            self._meter_provider.shutdown()
+        except Exception as error:
+            logger.warning(f"Unable to flush the OTLP metrics: {error}")
+        self._meter_provider = None
+
+
+metrics_registry = MetricsRegistry()
+
+tool_calls = metrics_registry.counter(
+    "mcp_tool_calls_total", "Completed MCP tool calls by outcome (success or error)", ("tool", "outcome"))
+tool_errors = metrics_registry.counter(
+    "mcp_tool_errors_total", "MCP tool calls that raised, by exception type", ("tool", "error_type"))
+tool_call_duration = metrics_registry.histogram(
+    "mcp_tool_call_duration_seconds", "Duration of MCP tool calls, including time queued for the thread pool",
+    ("tool",))
+tool_calls_in_flight = metrics_registry.gauge(
+    "mcp_tool_calls_in_flight", "MCP tool calls currently running", ("tool",))
+
+azure_requests = metrics_registry.counter(
+    "azure_search_requests_total", "HTTP requests sent to Azure AI Search, including retries, by status code",
+    ("operation", "status_code"))
+azure_request_duration = metrics_registry.histogram(
+    "azure_search_request_duration_seconds", "Duration of single HTTP requests to Azure AI Search",
+    ("operation",))
+azure_throttled_requests = metrics_registry.counter(
+    "azure_search_throttled_requests_total", "Azure AI Search requests answered with 429 Too Many Requests",
+    ("operation",))
+azure_request_errors = metrics_registry.counter(
+    "azure_search_request_errors_total", "Azure AI Search requests that failed without a response",
+    ("operation", "error_type"))
+
+
+def record_tool_call(tool_name: str, duration_seconds: float, error: Optional[BaseException] = None) -> None:
+    """Records the outcome and duration of a completed tool call."""
+    tool_call_duration.observe(duration_seconds, tool=tool_name)
+    tool_calls.inc(tool=tool_name, outcome="error" if error is not None else "success")
+    if error is not None:
+        tool_errors.inc(tool=tool_name, error_type=type(error).__name__)
@@ -0,0 +1,84 @@
+import copy
+import json
+import pickle
+from itertools import chain
+from typing import Any, Sequence
+
+import pydantic_core
+from mcp.server.fastmcp.server import _convert_to_content
+from mcp.server.fastmcp.utilities.types import Image
+from mcp.types import TextContent, ImageContent, EmbeddedResource
+
+# A None key is encoded as "null" by json.dumps but as "None" by pydantic_core.to_jsonable_python
+NULL_KEY = '"null": '
+
+
+def copy_result(value: Any) -> Any:
+    """
+    Deep-copies a DAO result, such as a serialized index definition.
+
+    DAO results are dicts and lists of JSON values, which a pickle round trip copies several times
+    faster than copy.deepcopy; anything that cannot be pickled is deep-copied.
+
+    Args:
+        value (Any): The value to copy.
+
+    Returns:
+        Any: An independent copy of the value.
+    """
+    try:
+        return pickle.loads(pickle.dumps(value, pickle.HIGHEST_PROTOCOL))
+    except Exception:
+        return copy.deepcopy(value)
+
+
+def _legacy_json(result: Any) -> str:
+    try:
+        return json.dumps(pydantic_core.to_jsonable_python(result))
+    except Exception:
+        return str(result)
+
+
+def encode_json(result: Any) -> str:
+    """
+    Encodes a tool result as JSON text, exactly as FastMCP does.
+
+    FastMCP first converts the whole result with pydantic_core.to_jsonable_python, which copies every
+    dict and list, and then encodes the copy with json.dumps. The C encoder of json.dumps is given the
+    result directly instead, and only values it cannot encode itself, such as models and dates, go
+    through to_jsonable_python. Results the two would encode differently fall back to FastMCP's way.
+
+    Args:
+        result (Any): A tool result other than a string, a list or MCP content.
+
+    Returns:
+        str: The JSON text of the result.
+    """
+    try:
+        text = json.dumps(result, default=pydantic_core.to_jsonable_python)
+    except Exception:
+        return _legacy_json(result)
+
+    if NULL_KEY in text:
+        return _legacy_json(result)
+    return text
+
+
+def encode_tool_result(result: Any) -> Sequence[TextContent | ImageContent | EmbeddedResource]:
+    """
+    Converts a tool result to MCP content, with the same output as FastMCP but a faster JSON encoding.
+
+    Args:
+        result (Any): The value returned by a tool.
+
+    Returns:
+        Sequence[TextContent | ImageContent | EmbeddedResource]: The content sent back to the client; a list
+            or tuple result becomes one content item per element.
+    """
+    if isinstance(result, list | tuple):
+        return list(chain.from_iterable(encode_tool_result(item) for item in result))
+
+    if result is None or isinstance(result, str | TextContent | ImageContent | EmbeddedResource | Image):
+        return _convert_to_content(result)
+
+    return [TextContent(type="text", text=encode_json(result))]
@@ -0,0 +1,148 @@
+import json
+import math
+from typing import Any
+
+import anyio
+from mcp import types
+from mcp.server.fastmcp.server import logger
+from mcp.server.lowlevel import Server
+from pydantic import ValidationError
+
+# The handshake each stateless request replays on its own session before the client's messages
+STATELESS_INITIALIZE_ID = "stateless-initialize"
+STATELESS_CLIENT_INFO = types.Implementation(name="stateless-http", version="1.0")
+
+
+def _error_message(code: int, message: str, request_id: Any = None) -> dict[str, Any]:
+    return {"jsonrpc": "2.0", "id": request_id, "error": {"code": code, "message": message}}
+
+
+def _dump(message: types.JSONRPCMessage) -> dict[str, Any]:
+    return message.model_dump(by_alias=True, mode="json", exclude_none=True)
+
+
+class StatelessHttpTransport:
+    """
+    Serves MCP over HTTP POST without server-side sessions, in the request/response form of the
+    streamable HTTP transport.
+
+    Each POST carries one JSON-RPC message or a batch of them and is answered with their responses as
+    application/json. The messages run on a short-lived session of their own that is initialized
+    in-process, so no state is kept between requests and any worker process can serve any request.
+    Notifications the server sends while handling a request, such as progress, are not forwarded.
+    """
+
+    def __init__(self, server: Server):
+        """
+        Initializes the transport.
+
+        Args:
+            server (Server): The low-level MCP server whose handlers answer the requests.
+        """
+        self.server = server
+
+    async def handle_payload(self, payload: Any) -> tuple[int, Any]:
+        """
+        Runs the JSON-RPC messages of one POST body.
+
+        Args:
+            payload (Any): The decoded JSON body: a message or a list of messages.
+
+        Returns:
+            tuple[int, Any]: The HTTP status code and the JSON body to send back, or None for 202 Accepted.
+        """
+        batch = isinstance(payload, list)
+        try:
+            messages = [types.JSONRPCMessage.model_validate(item) for item in (payload if batch else [payload])]
+        except ValidationError as error:
+            return 400, _error_message(types.INVALID_REQUEST, f"Invalid JSON-RPC message: {error.errors()[0]['msg']}")
+        if not messages:
+            return 400, _error_message(types.INVALID_REQUEST, "Empty batch")
+
+        request_ids = [message.root.id for message in messages if isinstance(message.root, types.JSONRPCRequest)]
+        if not request_ids:
+            # Notifications and responses carry no state worth keeping without a session
+            return 202, None
+
+        responses = await self._exchange(messages, request_ids)
+        if batch:
+            return 200, [responses[request_id] for request_id in request_ids]
+        return 200, responses[request_ids[0]]
+
+    async def _exchange(self, messages: list[types.JSONRPCMessage], request_ids: list[Any]) -> dict[Any, Any]:
+        """Sends the messages to a new session and collects the response to each request."""
+        to_server_writer, to_server_reader = anyio.create_memory_object_stream[types.JSONRPCMessage | Exception](
+            len(messages) + 2)
+        to_client_writer, to_client_reader = anyio.create_memory_object_stream[types.JSONRPCMessage](math.inf)
+        initializes = any(isinstance(message.root, types.JSONRPCRequest) and message.root.method == "initialize"
+                          for message in messages)
+        pending = set(request_ids)
+        responses: dict[Any, Any] = {}
+
+        async with to_server_writer, to_server_reader, to_client_writer, to_client_reader:
+            async with anyio.create_task_group() as task_group:
+                task_group.start_soon(self.server.run, to_server_reader, to_client_writer,
+                                      self.server.create_initialization_options())
+
+                if not initializes:
+                    await self._initialize(to_server_writer, to_client_reader)
+                for message in messages:
+                    await to_server_writer.send(message)
+
+                async for message in to_client_reader:
+                    if isinstance(message.root, (types.JSONRPCResponse, types.JSONRPCError)) \
+                            and message.root.id in pending:
+                        responses[message.root.id] = _dump(message)
+                        pending.discard(message.root.id)
+                        if not pending:
+                            break
+
+                task_group.cancel_scope.cancel()
+
+        return responses
+
+    @staticmethod
+    async def _initialize(to_server_writer: Any, to_client_reader: Any) -> None:
+        """Completes the initialization handshake on behalf of a client that initialized in an earlier request."""
+        params = types.InitializeRequestParams(protocolVersion=types.LATEST_PROTOCOL_VERSION,
+                                               capabilities=types.ClientCapabilities(),
+                                               clientInfo=STATELESS_CLIENT_INFO)
+        await to_server_writer.send(types.JSONRPCMessage(types.JSONRPCRequest(
+            jsonrpc="2.0", id=STATELESS_INITIALIZE_ID, method="initialize",
+            params=params.model_dump(by_alias=True, mode="json", exclude_none=True))))
+
+        async for message in to_client_reader:
+            if isinstance(message.root, (types.JSONRPCResponse, types.JSONRPCError)) \
+                    and message.root.id == STATELESS_INITIALIZE_ID:
+                break
+
+        await to_server_writer.send(types.JSONRPCMessage(types.JSONRPCNotification(
+            jsonrpc="2.0", method="notifications/initialized")))
+
+    async def handle_request(self, request: Any) -> Any:
+        """
+        The Starlette endpoint of the transport.
+
+        Args:
+            request (Request): The HTTP request.
+
+        Returns:
+            Response: The JSON-RPC responses, 202 for notifications only, or 405 for GET and DELETE,
+                since there are no sessions to stream to or to end.
+        """
+        from starlette.responses import JSONResponse, Response
+
+        if request.method != "POST":
+            return Response(status_code=405, headers={"Allow": "POST"})
+
+        try:
+            payload = json.loads(await request.body())
+        except ValueError:
+            return JSONResponse(_error_message(types.PARSE_ERROR, "Parse error"), status_code=400)
+
+        status_code, body = await self.handle_payload(payload)
+        if body is None:
+            return Response(status_code=status_code)
+        if status_code >= 400:
+            logger.warning(f"Rejected MCP request: {body['error']['message']}")
+        return JSONResponse(body, status_code=status_code)
@@ -0,0 +1,232 @@
+import asyncio
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Optional
+
+import httpx
+from mcp.server.fastmcp.server import logger
+
+DEFAULT_MAX_FETCH_BYTES = 10 * 1024 * 1024
+DEFAULT_FETCH_TIMEOUT_SECONDS = 30.0
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_CACHE_DIRECTORY = Path(tempfile.gettempdir()) / "mcp-server-azure-ai-search" / "url-cache"
+DEFAULT_CACHE_MAX_BYTES = 100 * 1024 * 1024
+
+
+class UrlFetcher:
+    """
+    Fetches URLs over a shared, pooled HTTP client with an on-disk cache.
+
+    Connections are kept alive between calls, and HTTP/2 is negotiated with servers that support it.
+    Bodies are streamed and rejected once they exceed max_bytes. Responses carrying an ETag or
+    Last-Modified header are cached on disk by URL and revalidated with a conditional GET, so an
+    unchanged resource costs a 304 response without a body. Once the cached bodies exceed
+    cache_max_bytes, the least recently used entries are evicted.
+    """
+
+    def __init__(self,
+                 max_bytes: int | None = None,
+                 cache_directory: str | Path | None = None,
+                 cache_max_bytes: int | None = None,
+                 timeout_seconds: float = DEFAULT_FETCH_TIMEOUT_SECONDS,
+                 transport: Optional[httpx.AsyncBaseTransport] = None):
+        """
+        Initializes the fetcher.
+
+        Args:
+            max_bytes (int | None): The largest body accepted. Defaults to the AZURE_AI_SEARCH_MCP_FETCH_MAX_BYTES
+                environment variable or 10 MiB.
+            cache_directory (str | Path | None): Where responses are cached. Defaults to the
+                AZURE_AI_SEARCH_MCP_FETCH_CACHE_DIR environment variable or a directory under the system temp
+                directory. An empty string disables the cache.
+            cache_max_bytes (int | None): The largest total size of the cached bodies. Defaults to the
+                AZURE_AI_SEARCH_MCP_FETCH_CACHE_MAX_BYTES environment variable or 100 MiB.
+            timeout_seconds (float): The connect and read timeout of each request.
+            transport (httpx.AsyncBaseTransport | None): Replaces the network transport, e.g. in tests.
+        """
+        if max_bytes is None:
+            max_bytes = int(os.environ.get("AZURE_AI_SEARCH_MCP_FETCH_MAX_BYTES", DEFAULT_MAX_FETCH_BYTES))
+        if cache_directory is None:
+            cache_directory = os.environ.get("AZURE_AI_SEARCH_MCP_FETCH_CACHE_DIR", str(DEFAULT_CACHE_DIRECTORY))
+        if cache_max_bytes is None:
+            cache_max_bytes = int(os.environ.get("AZURE_AI_SEARCH_MCP_FETCH_CACHE_MAX_BYTES", DEFAULT_CACHE_MAX_BYTES))
+
+        self.max_bytes = max_bytes
+        self.cache_directory: Optional[Path] = Path(cache_directory) if cache_directory else None
+        self.cache_max_bytes = cache_max_bytes
+        self.timeout_seconds = timeout_seconds
+        self.transport = transport
+
+        self._client: Optional[httpx.AsyncClient] = None
+        self._client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def client(self) -> httpx.AsyncClient:
+        """
+        Returns the pooled client of the running event loop, creating it on first use.
+
+        Returns:
+            httpx.AsyncClient: The shared client.
+        """
+        loop = asyncio.get_running_loop()
+
+        if self._client is None or self._client.is_closed or self._client_loop is not loop:
+            self._client = httpx.AsyncClient(
+                http2=True,
+                transport=self.transport,
+                follow_redirects=True,
+                timeout=self.timeout_seconds,
+                limits=httpx.Limits(max_connections=DEFAULT_MAX_CONNECTIONS,
+                                    max_keepalive_connections=DEFAULT_MAX_CONNECTIONS),
+            )
+            self._client_loop = loop
+
+        return self._client
+
+    async def fetch_text(self, url: str) -> str:
+        """
+        Fetches the body of a URL as text.
+
+        Args:
+            url (str): The URL to fetch.
+
+        Returns:
+            str: The decoded body.
+
+        Raises:
+            httpx.RequestError: If the request fails due to a network problem.
+            httpx.HTTPStatusError: If the response status code is not 2xx.
+            ValueError: If the body is larger than max_bytes.
+        """
+        body, encoding = await self.fetch(url)
+        return body.decode(encoding or "utf-8", errors="replace")
+
+    async def fetch(self, url: str) -> tuple[bytes, Optional[str]]:
+        """
+        Fetches the body of a URL, revalidating a cached copy if there is one.
+
+        Args:
+            url (str): The URL to fetch.
+
+        Returns:
+            tuple[bytes, str | None]: The body and its character encoding, if known.
+        """
+        cache_paths = self._cache_paths(url)
+        cached_metadata = await asyncio.to_thread(self._read_metadata, cache_paths) if cache_paths else None
+
+        headers: dict[str, str] = {}
+        if cached_metadata is not None:
+            if cached_metadata.get("etag"):
+                headers["If-None-Match"] = cached_metadata["etag"]
+            if cached_metadata.get("last_modified"):
+                headers["If-Modified-Since"] = cached_metadata["last_modified"]
+
+        async with self.client().stream("GET", url, headers=headers) as response:
+            if response.status_code == 304 and cached_metadata is not None:
+                logger.debug(f"Fetched {url} from the cache after revalidation")
+                body = await asyncio.to_thread(self._read_cached_body, cache_paths)
+                return body, cached_metadata.get("encoding")
+
+            response.raise_for_status()
+            body = await self._read_body(url, response)
+            encoding = response.charset_encoding
+
+            if cache_paths and (response.headers.get("ETag") or response.headers.get("Last-Modified")):
+                metadata = {
+                    "url": url,
+                    "etag": response.headers.get("ETag"),
+                    "last_modified": response.headers.get("Last-Modified"),
+                    "encoding": encoding,
+                }
+                await asyncio.to_thread(self._write_cache, cache_paths, body, metadata)
+                await asyncio.to_thread(self._evict)
+
+        return body, encoding
+
+    async def aclose(self) -> None:
+        """
+        Closes the pooled client and its keep-alive connections.
+        """
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+        self._client = None
+        self._client_loop = None
+
+    async def _read_body(self, url: str, response: httpx.Response) -> bytes:
+        content_length = response.headers.get("Content-Length")
+        if content_length is not None and content_length.isdigit() and int(content_length) > self.max_bytes:
+            raise ValueError(f"{url} is {content_length} bytes, more than the limit of {self.max_bytes} bytes")
+
+        body = bytearray()
+        async for chunk in response.aiter_bytes():
+            body += chunk
+            if len(body) > self.max_bytes:
+                raise ValueError(f"{url} is larger than the limit of {self.max_bytes} bytes")
+
+        return bytes(body)
+
+    def _cache_paths(self, url: str) -> Optional[tuple[Path, Path]]:
+        if self.cache_directory is None:
+            return None
+
+        url_hash = hashlib.sha256(url.encode("utf-8")).hexdigest()
+        return self.cache_directory / f"{url_hash}.body", self.cache_directory / f"{url_hash}.json"
+
+    @staticmethod
+    def _read_metadata(cache_paths: tuple[Path, Path]) -> Optional[dict[str, Any]]:
+        body_path, metadata_path = cache_paths
+        if not body_path.is_file() or not metadata_path.is_file():
+            return None
+
+        try:
+            return json.loads(metadata_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+    @staticmethod
+    def _read_cached_body(cache_paths: tuple[Path, Path]) -> bytes:
+        body_path, _ = cache_paths
+        body = body_path.read_bytes()
+        # The modification time of the body records when the entry was last used, for eviction
+        os.utime(body_path)
+        return body
+
+    @staticmethod
+    def _write_cache(cache_paths: tuple[Path, Path], body: bytes, metadata: dict[str, Any]) -> None:
+        body_path, metadata_path = cache_paths
+
+        try:
+            body_path.parent.mkdir(parents=True, exist_ok=True)
+            # Write to temporary files first so that readers never see a partial entry
+            for path, content in ((body_path, body), (metadata_path, json.dumps(metadata).encode("utf-8"))):
+                file_descriptor, temporary_path = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+                with os.fdopen(file_descriptor, "wb") as temporary_file:
+                    temporary_file.write(content)
+                os.replace(temporary_path, path)
+        except OSError as error:
+            logger.warning(f"Caching {metadata['url']} failed: {error}")
+
+    def _evict(self) -> None:
+        """Removes the least recently used entries until the cached bodies fit in cache_max_bytes."""
+        entries: list[tuple[float, int, Path]] = []
+        total_bytes = 0
+
+        try:
+            for body_path in self.cache_directory.glob("*.body"):
+                body_stat = body_path.stat()
+                entries.append((body_stat.st_mtime, body_stat.st_size, body_path))
+                total_bytes += body_stat.st_size
+
+            for _, body_size, body_path in sorted(entries):
+                if total_bytes <= self.cache_max_bytes:
+                    break
+                body_path.unlink(missing_ok=True)
+                body_path.with_suffix(".json").unlink(missing_ok=True)
+                total_bytes -= body_size
+        except OSError as error:
+            logger.warning(f"Evicting from the URL cache failed: {error}")
+
+
+url_fetcher = UrlFetcher()
@@ -58,3 +58,31 @@ async def test_list_tools_filters_by_role(monkeypatch):
         assert "list_index_names" in filtered_names
         assert "query_index" in filtered_names
         #assert "create_index" not in filtered_names
+
+
+def test_unknown_tool_group_is_rejected_at_startup(monkeypatch):
+    monkeypatch.setenv("AZURE_AI_SEARCH_MCP_TOOL_GROUPS", "READ_INDEX,NOT_A_GROUP")
+
+    with pytest.raises(ValueError, match="NOT_A_GROUP"):
+        FoundryKnowledgeMCP()
+
+
+@pytest.mark.asyncio
+async def test_only_enabled_tools_are_registered_and_listing_is_cached(monkeypatch):
+    monkeypatch.setenv("AZURE_AI_SEARCH_MCP_TOOL_GROUPS", "READ_INDEX")
+    mcp = FoundryKnowledgeMCP()
+
+    @mcp.tool()
+    def list_index_names() -> list[str]:
+        return []
+
+    @mcp.tool()
+    def create_index() -> str:
+        return ""
+
+    assert mcp._tool_manager.get_tool("create_index") is None
+
+    tools = await mcp.list_tools()
+    assert [tool.name for tool in tools] == ["list_index_names"]
+    assert await mcp.list_tools() is tools
+    mcp.blocking_executor.shutdown()
@@ -0,0 +1,148 @@
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from azure.core.exceptions import ResourceNotModifiedError
+
+from mcp_server_azure_ai_search_preview import AsyncSearchClientDao, AsyncSearchIndexDao, AsyncSearchIndexerDao
+from mcp_server_azure_ai_search_preview.data_access_objects import search_client_registry, index_schema_cache, \
+    QueryResultCache
+
+
+class AsyncPagedResults:
+    """Minimal stand-in for AsyncItemPaged / AsyncSearchItemPaged"""
+
+    def __init__(self, items, count=None):
+        self._items = list(items)
+        self._count = count
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for item in self._items:
+            yield item
+
+    async def get_count(self):
+        return self._count
+
+
+@pytest.fixture
+def mock_client_dao():
+    dao = AsyncSearchClientDao(index_name="test-index")
+    dao.client = MagicMock()
+    yield dao
+    search_client_registry.close()
+
+
+@pytest.fixture
+def mock_index_dao():
+    dao = AsyncSearchIndexDao()
+    dao.client = MagicMock()
+    index_schema_cache.clear()
+    yield dao
+    index_schema_cache.clear()
+    search_client_registry.close()
+
+
+@pytest.mark.asyncio
+async def test_query_index(mock_client_dao):
+    mock_client_dao.client.search = AsyncMock(return_value=AsyncPagedResults([{"id": "1"}, {"id": "2"}]))
+
+    results = await mock_client_dao.query_index(search_text="item", top=2)
+
+    assert results == [{"id": "1"}, {"id": "2"}]
+    mock_client_dao.client.search.assert_awaited_once_with(
+        search_text="item",
+        include_total_count=None,
+        filter=None,
+        order_by=None,
+        select=None,
+        skip=None,
+        top=2
+    )
+
+
+@pytest.mark.asyncio
+async def test_add_document(mock_client_dao):
+    operation_result = MagicMock()
+    operation_result.serialize.return_value = {"key": "1", "status": True}
+    mock_client_dao.client.upload_documents = AsyncMock(return_value=[operation_result])
+
+    result = await mock_client_dao.add_document({"id": "1"})
+
+    assert result == {"key": "1", "status": True}
+    mock_client_dao.client.upload_documents.assert_awaited_once_with([{"id": "1"}])
+
+
+@pytest.mark.asyncio
+async def test_retrieve_index_names(mock_index_dao):
+    mock_index_dao.client.list_index_names.return_value = AsyncPagedResults(["index1", "index2"])
+
+    assert await mock_index_dao.retrieve_index_names() == ["index1", "index2"]
+
+
+@pytest.mark.asyncio
+async def test_retrieve_index_schema(mock_index_dao):
+    mock_index = MagicMock()
+    mock_index.serialize.return_value = {"name": "index1", "fields": []}
+    mock_index_dao.client.get_index = AsyncMock(return_value=mock_index)
+
+    assert await mock_index_dao.retrieve_index_schema("index1") == {"name": "index1", "fields": []}
+    mock_index_dao.client.get_index.assert_awaited_once_with("index1")
+
+
+@pytest.mark.asyncio
+async def test_retrieve_index_schema_is_revalidated_with_etag(mock_index_dao, monkeypatch):
+    mock_index = MagicMock()
+    mock_index.serialize.return_value = {"name": "index1", "fields": [], "@odata.etag": "\"0x1\""}
+    mock_index_dao.client.get_index = AsyncMock(return_value=mock_index)
+
+    await mock_index_dao.retrieve_index_schema("index1")
+    monkeypatch.setattr(index_schema_cache, "max_age_seconds", 0)
+    mock_index_dao.client.get_index.side_effect = ResourceNotModifiedError()
+
+    result = await mock_index_dao.retrieve_index_schema("index1")
+
+    assert result == {"name": "index1", "fields": [], "@odata.etag": "\"0x1\""}
+    mock_index_dao.client.get_index.assert_awaited_with("index1", headers={"If-None-Match": "\"0x1\""})
+
+
+@pytest.mark.asyncio
+async def test_query_index_page_is_cached_until_a_write(mock_client_dao, monkeypatch):
+    query_cache = QueryResultCache(max_size=8, default_ttl_seconds=60)
+    monkeypatch.setattr("mcp_server_azure_ai_search_preview.data_access_objects.dao.query_result_cache", query_cache)
+    monkeypatch.setattr("mcp_server_azure_ai_search_preview.data_access_objects.query_cache.WRITE_SETTLE_SECONDS", 0)
+    mock_client_dao.client.search = AsyncMock(side_effect=lambda **_: AsyncPagedResults([{"id": "1"}, {"id": "2"}]))
+
+    first_page = await mock_client_dao.query_index_page(search_text="item", page_size=1)
+    second_page = await mock_client_dao.query_index_page(search_text="item", page_size=1)
+
+    assert second_page is first_page
+    assert first_page.documents == [{"id": "1"}]
+    assert first_page.next_cursor is not None
+
+    mock_client_dao.client.delete_documents = AsyncMock(return_value=[])
+    await mock_client_dao.delete_document("id", "1")
+    await mock_client_dao.query_index_page(search_text="item", page_size=1)
+
+    assert mock_client_dao.client.search.await_count == 2
+    mock_client_dao.client.delete_documents.assert_awaited_once_with([{"id": "1"}])
+
+
+@pytest.mark.asyncio
+async def test_list_indexers():
+    dao = AsyncSearchIndexerDao()
+    dao.client = MagicMock()
+    dao.client.get_indexer_names = AsyncMock(return_value=["indexer1"])
+
+    assert await dao.list_indexers() == ["indexer1"]
+
+
+@pytest.mark.asyncio
+async def test_async_clients_are_pooled_per_event_loop():
+    first_dao = AsyncSearchClientDao(index_name="pooled-index")
+    second_dao = AsyncSearchClientDao(index_name="pooled-index")
+
+    assert first_dao.client is second_dao.client
+
+    await search_client_registry.aclose()
@@ -0,0 +1,220 @@
+from unittest.mock import MagicMock
+
+import pytest
+from azure.core.exceptions import HttpResponseError
+
+from mcp_server_azure_ai_search_preview.data_access_objects import DocumentBatcher, delete_matching_documents
+
+
+def _result(key, succeeded=True, status_code=200, error_message=None):
+    return {"key": key, "status": succeeded, "statusCode": status_code, "errorMessage": error_message}
+
+
+class RecordingOperation:
+    """Records every submitted batch and answers with the scripted responses"""
+
+    def __init__(self, responder=None):
+        self.batches = []
+        self._responder = responder or (lambda batch, call: [_result(document["id"]) for document in batch])
+
+    async def __call__(self, batch):
+        self.batches.append(list(batch))
+        return self._responder(batch, len(self.batches))
+
+
+@pytest.mark.asyncio
+async def test_documents_are_split_by_count():
+    operation = RecordingOperation()
+
+    async with DocumentBatcher("idx", "id", operation, max_batch_size=2) as batcher:
+        await batcher.add_many({"id": str(i)} for i in range(5))
+
+    assert [len(batch) for batch in operation.batches] == [2, 2, 1]
+    assert batcher.summary.total_documents == 5
+    assert batcher.summary.succeeded == 5
+    assert len(batcher.summary.batches) == 3
+
+
+@pytest.mark.asyncio
+async def test_documents_are_split_by_bytes():
+    operation = RecordingOperation()
+    documents = [{"id": str(i), "payload": "x" * 100} for i in range(4)]
+
+    async with DocumentBatcher("idx", "id", operation, max_batch_bytes=250) as batcher:
+        await batcher.add_many(documents)
+
+    assert [len(batch) for batch in operation.batches] == [2, 2]
+
+
+@pytest.mark.asyncio
+async def test_transient_failures_are_resubmitted():
+    def responder(batch, call):
+        if call == 1:
+            return [_result("1"), _result("2", False, 503, "Service unavailable")]
+        return [_result(document["id"]) for document in batch]
+
+    operation = RecordingOperation(responder)
+
+    batcher = DocumentBatcher("idx", "id", operation, retry_backoff_seconds=0)
+    await batcher.add_many([{"id": "1"}, {"id": "2"}])
+    summary = await batcher.close()
+
+    assert operation.batches[1] == [{"id": "2"}]
+    assert summary.succeeded == 2
+    assert summary.failed == 0
+    assert summary.batches[0].retries == 1
+
+
+@pytest.mark.asyncio
+async def test_permanent_failures_are_reported_without_retry():
+    def responder(batch, call):
+        return [_result("1"), _result("2", False, 400, "Invalid document")]
+
+    operation = RecordingOperation(responder)
+
+    batcher = DocumentBatcher("idx", "id", operation, retry_backoff_seconds=0)
+    await batcher.add_many([{"id": "1"}, {"id": "2"}])
+    summary = await batcher.close()
+
+    assert len(operation.batches) == 1
+    assert summary.failed == 1
+    assert summary.batches[0].failed_keys == ["2"]
+    assert summary.batches[0].errors == ["Invalid document"]
+
+
+@pytest.mark.asyncio
+async def test_documents_without_a_matching_result_are_reported_as_failed():
+    def responder(batch, call):
+        # "2" comes back under a normalized key and "3" is missing from the response
+        return [_result("1"), _result("two")]
+
+    operation = RecordingOperation(responder)
+
+    batcher = DocumentBatcher("idx", "id", operation, retry_backoff_seconds=0)
+    await batcher.add_many([{"id": "1"}, {"id": "2"}, {"id": "3"}])
+    summary = await batcher.close()
+
+    assert summary.succeeded + summary.failed == summary.total_documents == 3
+    assert summary.succeeded == 1
+    assert summary.batches[0].failed_keys == ["2", "3"]
+    assert len(operation.batches) == 1
+
+
+@pytest.mark.asyncio
+async def test_throttled_batches_give_up_after_max_retries():
+    async def throttled(batch):
+        error = HttpResponseError(message="Too many requests")
+        error.status_code = 429
+        error.response = MagicMock(headers={"Retry-After": "0"})
+        raise error
+
+    batcher = DocumentBatcher("idx", "id", throttled, max_retries=2, retry_backoff_seconds=0)
+    await batcher.add({"id": "1"})
+    summary = await batcher.close()
+
+    assert summary.failed == 1
+    assert summary.batches[0].retries == 2
+
+
+class FakeDocumentDao:
+    """In-memory document DAO exposing the awaitable methods used by delete_matching_documents"""
+
+    def __init__(self, keys, hidden_deletes_rounds=0):
+        self.documents = set(keys)
+        self.deleted_calls = []
+        self._hidden_deletes_rounds = hidden_deletes_rounds
+        self._pending_deletes = set()
+
+    async def count_documents(self, query_filter=None):
+        return len(self.documents)
+
+    async def query_index(self, search_text=None, *, query_filter=None, select=None, top=None, **kwargs):
+        if self._hidden_deletes_rounds:
+            # Simulates the refresh delay before deleted documents stop matching
+            self._hidden_deletes_rounds -= 1
+        else:
+            self.documents -= self._pending_deletes
+        return [{"id": key} for key in sorted(self.documents)[:top]]
+
+    async def delete_documents(self, key_field_name, document_keys):
+        self.deleted_calls.append(list(document_keys))
+        self._pending_deletes.update(document_keys)
+        return [_result(key) for key in document_keys]
+
+
+@pytest.mark.asyncio
+async def test_delete_matching_documents_deletes_in_rounds():
+    dao = FakeDocumentDao([f"{i:03}" for i in range(25)])
+    progress = []
+
+    async def on_progress(deleted, total):
+        progress.append((deleted, total))
+
+    summary = await delete_matching_documents(dao, "idx", "id", "language eq 'fr'", batch_size=5,
+                                              max_concurrency=2, progress_callback=on_progress)
+
+    assert summary.total_documents == 25
+    assert summary.succeeded == 25
+    assert all(len(batch) <= 5 for batch in dao.deleted_calls)
+    assert progress[0] == (0, 25)
+    assert progress[-1] == (25, 25)
+
+
+@pytest.mark.asyncio
+async def test_delete_matching_documents_skips_keys_still_visible(monkeypatch):
+    monkeypatch.setattr("mcp_server_azure_ai_search_preview.data_access_objects.batching.STALLED_ROUND_DELAY_SECONDS", 0)
+    dao = FakeDocumentDao(["a", "b"], hidden_deletes_rounds=2)
+
+    summary = await delete_matching_documents(dao, "idx", "id", "language eq 'fr'")
+
+    assert summary.total_documents == 2
+    assert dao.deleted_calls == [["a", "b"]]
+
+
+class ScriptedDocumentDao:
+    """Document DAO answering each query with the next scripted list of keys"""
+
+    def __init__(self, rounds, failing_keys=()):
+        self.rounds = list(rounds)
+        self.failing_keys = set(failing_keys)
+        self.queries = 0
+        self.deleted_calls = []
+
+    async def count_documents(self, query_filter=None):
+        return len({key for keys in self.rounds for key in keys})
+
+    async def query_index(self, search_text=None, *, query_filter=None, select=None, top=None, **kwargs):
+        self.queries += 1
+        keys = self.rounds.pop(0) if self.rounds else []
+        return [{"id": key} for key in keys]
+
+    async def delete_documents(self, key_field_name, document_keys):
+        self.deleted_calls.append(list(document_keys))
+        return [_result(key) if key not in self.failing_keys else
+                _result(key, succeeded=False, status_code=400, error_message="Invalid key")
+                for key in document_keys]
+
+
+@pytest.mark.asyncio
+async def test_delete_matching_documents_never_deletes_a_key_twice(monkeypatch):
+    monkeypatch.setattr("mcp_server_azure_ai_search_preview.data_access_objects.batching.STALLED_ROUND_DELAY_SECONDS", 0)
+    # a is still visible two rounds after it was deleted
+    dao = ScriptedDocumentDao([["a", "b"], ["b", "c"], ["a", "d"], ["a"]])
+
+    summary = await delete_matching_documents(dao, "idx", "id", "language eq 'fr'")
+
+    assert dao.deleted_calls == [["a", "b"], ["c"], ["d"]]
+    assert summary.total_documents == 4
+    assert summary.succeeded == 4
+
+
+@pytest.mark.asyncio
+async def test_delete_matching_documents_stops_at_keys_that_keep_failing():
+    dao = ScriptedDocumentDao([["x", "y"]] + [["x"]] * 10, failing_keys={"x"})
+
+    summary = await delete_matching_documents(dao, "idx", "id", "language eq 'fr'")
+
+    assert dao.queries == 2
+    assert summary.total_documents == 2
+    assert summary.failed == 1
+    assert summary.batches[0].failed_keys == ["x"]
@@ -0,0 +1,168 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+
+from mcp_server_azure_ai_search_preview import SearchClientDao, SearchIndexDao
+from mcp_server_azure_ai_search_preview.data_access_objects import SearchClientRegistry, search_client_registry
+from mcp_server_azure_ai_search_preview.data_access_objects import dao as dao_module
+
+
+@pytest.fixture(autouse=True)
+def clean_registry():
+    search_client_registry.close()
+    yield
+    search_client_registry.close()
+
+
+def test_acquire_reuses_client_for_same_key():
+    registry = SearchClientRegistry(max_size=4)
+    factory = MagicMock(side_effect=lambda: MagicMock())
+
+    first = registry.acquire(("search", "endpoint", "index1"), factory)
+    second = registry.acquire(("search", "endpoint", "index1"), factory)
+
+    assert first is second
+    assert factory.call_count == 1
+    assert len(registry) == 1
+
+
+def test_acquire_evicts_and_closes_least_recently_used():
+    registry = SearchClientRegistry(max_size=2)
+    client_a, client_b, client_c = MagicMock(), MagicMock(), MagicMock()
+
+    registry.release(registry.acquire("a", lambda: client_a))
+    registry.release(registry.acquire("b", lambda: client_b))
+    registry.release(registry.acquire("a", lambda: MagicMock()))  # "a" becomes the most recently used
+    registry.acquire("c", lambda: client_c)
+
+    assert "b" not in registry
+    assert "a" in registry and "c" in registry
+    client_b.close.assert_called_once()
+    client_a.close.assert_not_called()
+
+
+def test_close_closes_all_clients():
+    registry = SearchClientRegistry(max_size=4)
+    clients = [MagicMock(), MagicMock()]
+
+    registry.acquire("a", lambda: clients[0])
+    registry.acquire("b", lambda: clients[1])
+    registry.close()
+
+    assert len(registry) == 0
+    for client in clients:
+        client.close.assert_called_once()
+
+
+def test_invalid_pool_size():
+    with pytest.raises(ValueError):
+        SearchClientRegistry(max_size=0)
+
+
+def test_daos_share_pooled_clients():
+    first_dao = SearchClientDao(index_name="test-index")
+    second_dao = SearchClientDao(index_name="test-index")
+    other_dao = SearchClientDao(index_name="other-index")
+
+    assert first_dao.client is second_dao.client
+    assert first_dao.client is not other_dao.client
+    assert SearchIndexDao().client is SearchIndexDao().client
+
+
+def test_client_evicted_during_a_call_is_closed_after_the_call():
+    registry = SearchClientRegistry(max_size=1)
+    client_a = MagicMock()
+    in_call, finish_call = threading.Event(), threading.Event()
+
+    def search():
+        in_call.set()
+        finish_call.wait(5)
+        return client_a.close.called
+
+    client_a.search.side_effect = search
+
+    def call():
+        client = registry.acquire("a", lambda: client_a)
+        try:
+            return client.search()
+        finally:
+            registry.release(client)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        closed_during_call = executor.submit(call)
+        assert in_call.wait(5)
+
+        registry.acquire("b", MagicMock)  # evicts "a" while its call is in flight
+
+        assert "a" not in registry
+        client_a.close.assert_not_called()
+        finish_call.set()
+        assert closed_during_call.result() is False
+
+    client_a.close.assert_called_once()
+
+
+def test_idle_evicted_client_is_closed_right_away():
+    registry = SearchClientRegistry(max_size=1)
+    client_a = MagicMock()
+
+    registry.release(registry.acquire("a", lambda: client_a))
+    registry.acquire("b", MagicMock)
+
+    client_a.close.assert_called_once()
+
+
+def test_client_is_built_outside_the_lock():
+    registry = SearchClientRegistry(max_size=4)
+    building, finish_building = threading.Event(), threading.Event()
+
+    def slow_factory():
+        building.set()
+        finish_building.wait(5)
+        return MagicMock()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        slow_client = executor.submit(registry.acquire, "slow", slow_factory)
+        assert building.wait(5)
+
+        fast_client = registry.acquire("fast", MagicMock)
+
+        assert "fast" in registry and not slow_client.done()
+        finish_building.set()
+        assert slow_client.result() is not fast_client
+
+
+def test_client_built_concurrently_for_the_same_key_is_discarded():
+    registry = SearchClientRegistry(max_size=4)
+    registered, discarded = MagicMock(), MagicMock()
+
+    def racing_factory():
+        registry.acquire("a", lambda: registered)
+        return discarded
+
+    assert registry.acquire("a", racing_factory) is registered
+    discarded.close.assert_called_once()
+    registered.close.assert_not_called()
+
+
+def test_dao_keeps_its_evicted_client_open_until_it_is_closed(monkeypatch):
+    registry = SearchClientRegistry(max_size=1)
+    monkeypatch.setattr(dao_module, "search_client_registry", registry)
+    first_dao = SearchClientDao(index_name="index1")
+    first_client = first_dao.client
+    first_client.close = MagicMock()
+
+    second_dao = SearchClientDao(index_name="index2")
+    second_client = second_dao.client
+    second_client.close = MagicMock()
+
+    first_client.close.assert_not_called()
+    first_dao.close()
+    first_client.close.assert_called_once()
+
+    SearchClientDao(index_name="index3")  # evicts index2 while second_dao still holds it
+    second_client.close.assert_not_called()
+    del second_dao
+    second_client.close.assert_called_once()
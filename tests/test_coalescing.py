@@ -0,0 +1,162 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import MagicMock
+
+import pytest
+from azure.core.exceptions import ResourceNotFoundError
+
+from mcp_server_azure_ai_search_preview import AsyncSearchIndexerDao, SearchIndexDao, AsyncSearchIndexDao
+from mcp_server_azure_ai_search_preview.data_access_objects import search_client_registry, index_schema_cache, \
+    request_coalescer
+from mcp_server_azure_ai_search_preview.data_access_objects.coalescing import coalesced_calls
+
+
+class SlowIndexer:
+    """Stand-in for the serialized result of SearchIndexerClient.get_indexer"""
+
+    def __init__(self, name):
+        self.name = name
+
+    def serialize(self, keep_readonly=False):
+        return {"name": self.name, "fieldMappings": []}
+
+
+@pytest.fixture
+def indexer_dao():
+    dao = AsyncSearchIndexerDao()
+    dao.client = MagicMock()
+    yield dao
+    search_client_registry.close()
+
+
+@pytest.fixture(autouse=True)
+def clear_schema_cache():
+    index_schema_cache.clear()
+    yield
+    index_schema_cache.clear()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_calls_share_one_request(indexer_dao):
+    calls = []
+
+    async def get_indexer(name):
+        calls.append(name)
+        await asyncio.sleep(0.01)
+        return SlowIndexer(name)
+
+    indexer_dao.client.get_indexer = get_indexer
+    coalesced_before = coalesced_calls.value(method="AsyncSearchIndexerDao.get_indexer")
+
+    results = await asyncio.gather(*(indexer_dao.get_indexer("blobs") for _ in range(5)),
+                                   indexer_dao.get_indexer("tables"))
+
+    assert calls == ["blobs", "tables"]
+    assert results[:5] == [{"name": "blobs", "fieldMappings": []}] * 5
+    assert results[5]["name"] == "tables"
+    # Every caller of a shared request gets its own copy
+    assert len({id(result) for result in results}) == 6
+    assert coalesced_calls.value(method="AsyncSearchIndexerDao.get_indexer") == coalesced_before + 4
+    assert request_coalescer.in_flight() == 0
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared_and_not_remembered(indexer_dao):
+    calls = []
+
+    async def get_indexer(name):
+        calls.append(name)
+        await asyncio.sleep(0.01)
+        if len(calls) == 1:
+            raise ResourceNotFoundError("missing")
+        return SlowIndexer(name)
+
+    indexer_dao.client.get_indexer = get_indexer
+
+    results = await asyncio.gather(indexer_dao.get_indexer("blobs"), indexer_dao.get_indexer("blobs"),
+                                   return_exceptions=True)
+    assert all(isinstance(result, ResourceNotFoundError) for result in results)
+
+    assert (await indexer_dao.get_indexer("blobs"))["name"] == "blobs"
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_cancelling_the_first_caller_does_not_cancel_the_request(indexer_dao):
+    async def get_indexer(name):
+        await asyncio.sleep(0.02)
+        return SlowIndexer(name)
+
+    indexer_dao.client.get_indexer = get_indexer
+
+    first = asyncio.ensure_future(indexer_dao.get_indexer("blobs"))
+    await asyncio.sleep(0)
+    second = asyncio.ensure_future(indexer_dao.get_indexer("blobs"))
+    await asyncio.sleep(0)
+    first.cancel()
+
+    assert (await second)["name"] == "blobs"
+    assert first.cancelled()
+
+
+@pytest.mark.asyncio
+async def test_reads_started_after_a_write_send_their_own_request():
+    dao = AsyncSearchIndexDao()
+    dao.client = MagicMock()
+    calls = []
+
+    class Paged:
+        def __init__(self, names):
+            self._names = names
+
+        async def __aiter__(self):
+            await asyncio.sleep(0.01)
+            for name in self._names:
+                yield name
+
+    def list_index_names():
+        calls.append(len(calls))
+        return Paged(["hotels"] if len(calls) == 1 else ["hotels", "products"])
+
+    async def delete_index(name):
+        pass
+
+    dao.client.list_index_names = list_index_names
+    dao.client.delete_index = delete_index
+
+    before_write = asyncio.ensure_future(dao.retrieve_index_names())
+    await asyncio.sleep(0)
+    await dao.delete_index("orders")
+    after_write = await dao.retrieve_index_names()
+
+    assert await before_write == ["hotels"]
+    assert after_write == ["hotels", "products"]
+    assert len(calls) == 2
+    search_client_registry.close()
+
+
+def test_sync_calls_from_several_threads_share_one_request():
+    dao = SearchIndexDao()
+    dao.client = MagicMock()
+    release = threading.Event()
+    calls = []
+
+    def list_index_names():
+        calls.append(1)
+        release.wait(5)
+        return iter(["hotels"])
+
+    dao.client.list_index_names = list_index_names
+    coalesced_before = coalesced_calls.value(method="SearchIndexDao.retrieve_index_names")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [executor.submit(dao.retrieve_index_names) for _ in range(4)]
+        while coalesced_calls.value(method="SearchIndexDao.retrieve_index_names") < coalesced_before + 3:
+            threading.Event().wait(0.001)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert results == [["hotels"]] * 4
+    assert len(calls) == 1
+    search_client_registry.close()
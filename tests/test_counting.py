@@ -0,0 +1,39 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from mcp_server_azure_ai_search_preview import SearchClientDao
+from mcp_server_azure_ai_search_preview.data_access_objects import count_documents_per_index
+
+
+class CountingDao:
+    def __init__(self, index_name, counts):
+        self.index_name = index_name
+        self._counts = counts
+
+    async def get_document_count(self):
+        count = self._counts[self.index_name]
+        if isinstance(count, Exception):
+            raise count
+        return count
+
+
+def test_get_document_count_uses_count_api():
+    dao = SearchClientDao(index_name="test-index")
+    dao.client = MagicMock()
+    dao.client.get_document_count.return_value = 42
+
+    assert dao.get_document_count() == 42
+    dao.client.search.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_counts_every_index_and_reports_failures():
+    counts = {"a": 3, "b": 4, "missing": RuntimeError("Index not found")}
+
+    result = await count_documents_per_index(lambda name: CountingDao(name, counts), ["a", "b", "missing", "a"],
+                                             max_concurrency=2)
+
+    assert result.counts == {"a": 3, "b": 4}
+    assert result.total == 7
+    assert result.errors == {"missing": "Index not found"}
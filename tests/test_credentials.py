@@ -0,0 +1,138 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from azure.core.credentials import AccessToken
+
+from mcp_server_azure_ai_search_preview.data_access_objects import RefreshingTokenCredential, \
+    credentials as credentials_module
+
+SCOPE = "https://search.azure.com/.default"
+
+
+def _credential_returning(*tokens: AccessToken) -> MagicMock:
+    inner_credential = MagicMock()
+    inner_credential.get_token.side_effect = list(tokens)
+    return inner_credential
+
+
+def test_credential_chain_is_resolved_once_and_token_cached():
+    inner_credential = _credential_returning(AccessToken("token-1", int(time.time()) + 3600))
+    factory = MagicMock(return_value=inner_credential)
+
+    with RefreshingTokenCredential(factory, refresh_margin_seconds=300) as credential:
+        first = credential.get_token(SCOPE)
+        second = credential.get_token(SCOPE)
+
+    assert first.token == second.token == "token-1"
+    factory.assert_called_once()
+    inner_credential.get_token.assert_called_once_with(SCOPE, tenant_id=None)
+
+
+def test_expired_token_is_acquired_again():
+    inner_credential = _credential_returning(
+        AccessToken("expired", int(time.time()) - 10),
+        AccessToken("fresh", int(time.time()) + 3600),
+    )
+
+    with RefreshingTokenCredential(lambda: inner_credential, refresh_margin_seconds=300) as credential:
+        assert credential.get_token(SCOPE).token == "expired"
+        assert credential.get_token(SCOPE).token == "fresh"
+
+
+def _wait_for_calls(inner_credential: MagicMock, call_count: int) -> None:
+    deadline = time.time() + 5
+    while inner_credential.get_token.call_count < call_count and time.time() < deadline:
+        time.sleep(0.01)
+
+
+def test_token_is_refreshed_in_background_before_expiry(monkeypatch):
+    monkeypatch.setattr(credentials_module, "MIN_REFRESH_DELAY_SECONDS", 0.01)
+    inner_credential = _credential_returning(
+        AccessToken("expiring-soon", int(time.time()) + 1),
+        AccessToken("refreshed", int(time.time()) + 3600),
+    )
+
+    with RefreshingTokenCredential(lambda: inner_credential, refresh_margin_seconds=300) as credential:
+        assert credential.get_token(SCOPE).token == "expiring-soon"
+
+        _wait_for_calls(inner_credential, 2)
+
+        assert credential.get_token(SCOPE).token == "refreshed"
+        assert inner_credential.get_token.call_count == 2
+
+
+def test_claims_bypass_the_cache():
+    inner_credential = MagicMock()
+    inner_credential.get_token.return_value = AccessToken("token", int(time.time()) + 3600)
+
+    with RefreshingTokenCredential(lambda: inner_credential) as credential:
+        credential.get_token(SCOPE)
+        credential.get_token(SCOPE, claims="challenge")
+
+    assert inner_credential.get_token.call_count == 2
+
+
+def test_short_lived_tokens_are_not_refreshed_in_a_loop():
+    inner_credential = MagicMock()
+    inner_credential.get_token.side_effect = lambda *scopes, **kwargs: AccessToken("short", int(time.time()) + 2)
+
+    with RefreshingTokenCredential(lambda: inner_credential, refresh_margin_seconds=300) as credential:
+        credential.get_token(SCOPE)
+        time.sleep(0.3)
+
+    assert inner_credential.get_token.call_count == 1
+
+
+def test_failed_background_refresh_is_retried(monkeypatch):
+    monkeypatch.setattr(credentials_module, "MIN_REFRESH_DELAY_SECONDS", 0.01)
+    inner_credential = _credential_returning(
+        AccessToken("expiring-soon", int(time.time()) + 1),
+        ConnectionError("transient"),
+        AccessToken("refreshed", int(time.time()) + 3600),
+    )
+
+    with RefreshingTokenCredential(lambda: inner_credential, refresh_margin_seconds=300) as credential:
+        credential.get_token(SCOPE)
+        _wait_for_calls(inner_credential, 3)
+
+        assert credential.cached_token(SCOPE).token == "refreshed"
+
+
+def test_cached_tokens_are_read_while_another_token_is_acquired():
+    acquiring, finish_acquiring = threading.Event(), threading.Event()
+
+    def get_token(*scopes, **kwargs):
+        if scopes == ("slow-scope",):
+            acquiring.set()
+            finish_acquiring.wait(5)
+        return AccessToken("token", int(time.time()) + 3600)
+
+    inner_credential = MagicMock()
+    inner_credential.get_token.side_effect = get_token
+    credential = RefreshingTokenCredential(lambda: inner_credential)
+    credential.get_token(SCOPE)
+
+    slow_call = threading.Thread(target=credential.get_token, args=("slow-scope",))
+    slow_call.start()
+    assert acquiring.wait(5)
+
+    assert credential.get_token(SCOPE).token == "token"
+    credential.close()
+    finish_acquiring.set()
+    slow_call.join(5)
+
+    assert credential.cached_token("slow-scope") is None
+
+
+def test_closed_credential_is_not_resolved_again():
+    factory = MagicMock(return_value=_credential_returning(AccessToken("token", int(time.time()) + 3600)))
+    credential = RefreshingTokenCredential(factory)
+    credential.get_token(SCOPE)
+    credential.close()
+
+    with pytest.raises(RuntimeError):
+        credential.get_token(SCOPE)
+
+    factory.assert_called_once()
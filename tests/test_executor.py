@@ -0,0 +1,142 @@
+import asyncio
+import json
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from mcp_server_azure_ai_search_preview import FoundryKnowledgeMCP
+from mcp_server_azure_ai_search_preview.shared import BlockingCallExecutor, BlockingDaoAdapter, metrics_registry
+from mcp_server_azure_ai_search_preview.shared.executor import thread_pool_queue_depth, thread_pool_active_calls, \
+    thread_pool_max_workers, thread_pool_wait
+
+
+@pytest.mark.asyncio
+async def test_run_returns_result_and_records_stats():
+    executor = BlockingCallExecutor("test", max_workers=2)
+
+    result = await executor.run(lambda a, b: a + b, 1, b=2)
+    stats = executor.stats()
+    executor.shutdown()
+
+    assert result == 3
+    assert stats["completed"] == 1
+    assert stats["queue_depth"] == 0
+    assert stats["failed"] == 0
+
+
+@pytest.mark.asyncio
+async def test_pool_is_bounded_and_tracks_queue_depth():
+    executor = BlockingCallExecutor("bounded", max_workers=1)
+    release = threading.Event()
+
+    first = asyncio.ensure_future(executor.run(release.wait, 5))
+    second = asyncio.ensure_future(executor.run(lambda: "done"))
+    await asyncio.sleep(0.05)
+
+    assert executor.stats()["active"] == 1
+    assert executor.stats()["queue_depth"] == 1
+
+    release.set()
+    assert await second == "done"
+    await first
+
+    stats = executor.stats()
+    executor.shutdown()
+    assert stats["max_queue_depth"] >= 1
+    assert stats["max_wait_seconds"] > 0
+
+
+@pytest.mark.asyncio
+async def test_queue_depth_and_saturation_are_published_as_metrics():
+    executor = BlockingCallExecutor("published", max_workers=1)
+    release = threading.Event()
+
+    first = asyncio.ensure_future(executor.run(release.wait, 5))
+    second = asyncio.ensure_future(executor.run(lambda: "done"))
+    await asyncio.sleep(0.05)
+
+    assert thread_pool_active_calls.value(pool="published") == thread_pool_max_workers.value(pool="published") == 1
+    assert thread_pool_queue_depth.value(pool="published") == 1
+    assert 'mcp_thread_pool_queue_depth{pool="published"} 1' in metrics_registry.render()
+
+    release.set()
+    await asyncio.gather(first, second)
+    executor.shutdown()
+
+    assert thread_pool_active_calls.value(pool="published") == 0
+    assert thread_pool_queue_depth.value(pool="published") == 0
+    assert thread_pool_wait.count(pool="published") == 2
+
+
+@pytest.mark.asyncio
+async def test_thread_pool_stats_resource():
+    from mcp_server_azure_ai_search_preview.__main__ import setup_mcp_service
+
+    mcp = setup_mcp_service("127.0.0.1", 8000)
+    await mcp.blocking_executor.run(lambda: None)
+
+    contents = await mcp.read_resource("stats://thread-pool")
+    mcp.blocking_executor.shutdown()
+
+    stats = json.loads(contents[0].content)
+    assert stats["name"] == "blocking-tools"
+    assert stats["completed"] == 1
+    assert stats["queue_depth"] == 0
+
+
+@pytest.mark.asyncio
+async def test_failures_are_counted():
+    executor = BlockingCallExecutor("failing", max_workers=1)
+
+    def fail():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        await executor.run(fail)
+
+    assert executor.stats()["failed"] == 1
+    executor.shutdown()
+
+
+@pytest.mark.asyncio
+async def test_blocking_dao_adapter_dispatches_to_pool():
+    executor = BlockingCallExecutor("dao", max_workers=1)
+    dao = MagicMock()
+    dao.retrieve_index_names.side_effect = lambda: threading.current_thread().name
+
+    thread_name = await BlockingDaoAdapter(dao, executor).retrieve_index_names()
+    executor.shutdown()
+
+    assert thread_name.startswith("mcp-dao")
+
+
+@pytest.mark.asyncio
+async def test_blocking_tools_run_on_thread_pool():
+    mcp = FoundryKnowledgeMCP()
+
+    # Only tools in the enabled groups are registered
+    @mcp.tool(name="list_index_names")
+    def which_thread() -> str:
+        return threading.current_thread().name
+
+    result = await mcp.call_tool("list_index_names", {})
+    mcp.blocking_executor.shutdown()
+
+    assert result[0].text.startswith("mcp-blocking-tools")
+
+
+def test_thread_pool_execution_mode(monkeypatch):
+    monkeypatch.setenv("AZURE_AI_SEARCH_MCP_EXECUTION_MODE", "thread_pool")
+
+    mcp = FoundryKnowledgeMCP()
+
+    assert isinstance(mcp.index_dao(), BlockingDaoAdapter)
+    mcp.blocking_executor.shutdown()
+
+
+def test_invalid_execution_mode(monkeypatch):
+    monkeypatch.setenv("AZURE_AI_SEARCH_MCP_EXECUTION_MODE", "green-threads")
+
+    with pytest.raises(ValueError):
+        FoundryKnowledgeMCP()
@@ -0,0 +1,105 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from mcp_server_azure_ai_search_preview.data_access_objects import JsonRecordDecoder, RecordMapper, find_json_files, \
+    ingest_json_files
+
+SAMPLE_DATASET = Path(__file__).parent.parent / "sample-dataset" / "contoso-grocery"
+
+
+def _decode_in_chunks(text, chunk_size):
+    decoder = JsonRecordDecoder()
+    records = []
+    for start in range(0, len(text), chunk_size):
+        records.extend(decoder.feed(text[start:start + chunk_size]))
+    decoder.close()
+    return records
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 4096])
+def test_arrays_and_json_lines_decode_across_chunk_boundaries(chunk_size):
+    records = [{"id": str(i), "text": "a, b ] {c}"} for i in range(5)]
+
+    assert _decode_in_chunks(json.dumps(records, indent=2), chunk_size) == records
+    assert _decode_in_chunks("\n".join(json.dumps(record) for record in records), chunk_size) == records
+    assert _decode_in_chunks(json.dumps(records[0]), chunk_size) == records[:1]
+    assert _decode_in_chunks("", chunk_size) == []
+
+
+@pytest.mark.parametrize("text", ['[{"id": "1"} {"id": "2"}]', '[{"id": "1"}', '[1, 2]', '{"id": "1"'])
+def test_malformed_input_is_rejected(text):
+    with pytest.raises(ValueError):
+        _decode_in_chunks(text, 3)
+
+
+@pytest.mark.parametrize("chunk_size", [1, 3, 64])
+def test_records_spanning_many_chunks_are_decoded_once(chunk_size, monkeypatch):
+    record = {"id": "1", "text": 'quotes \\" and {braces} [brackets] \\\\', "nested": [{"a": [1, {"b": "}"}]}] * 50}
+    text = json.dumps([record, record], indent=1)
+    decoder = JsonRecordDecoder()
+    raw_decode = decoder._decoder.raw_decode
+    decode_calls = []
+    monkeypatch.setattr(decoder._decoder, "raw_decode",
+                        lambda *args: decode_calls.append(args) or raw_decode(*args))
+
+    records = []
+    for start in range(0, len(text), chunk_size):
+        records.extend(decoder.feed(text[start:start + chunk_size]))
+    decoder.close()
+
+    assert records == [record, record]
+    assert len(decode_calls) == 2
+
+
+def test_records_are_mapped_to_the_index_fields():
+    index_schema = {"fields": [{"name": "id", "key": True}, {"name": "price"}]}
+    mapper = RecordMapper(index_schema, field_mappings={"sku_id": "id"})
+
+    assert mapper.map({"sku_id": 302, "price": 1.5, "notes": "x"}) == {"id": "302", "price": 1.5}
+    assert mapper.map({"price": 2.0}) is None
+    assert mapper.dropped_fields == {"notes"}
+    assert mapper.skipped_records == 1
+
+
+class UploadingDao:
+    def __init__(self):
+        self.documents = []
+
+    async def add_documents(self, documents):
+        self.documents.extend(documents)
+        return [{"key": document["id"], "status": True, "statusCode": 201} for document in documents]
+
+
+@pytest.mark.asyncio
+async def test_sample_directory_is_ingested_in_batches():
+    file_paths = find_json_files(SAMPLE_DATASET / "departments")
+    mapper = RecordMapper({"fields": [{"name": "id", "key": True}, {"name": "department"}]})
+    dao = UploadingDao()
+    progress = []
+
+    async def on_progress(done, total):
+        progress.append((done, total))
+
+    summary = await ingest_json_files(dao, "departments", file_paths, mapper, batch_size=3,
+                                      progress_callback=on_progress)
+
+    assert summary.files == len(file_paths) == 8
+    assert summary.records == 8
+    assert summary.upload.succeeded == 8
+    assert [batch.documents for batch in summary.upload.batches] == [3, 3, 2]
+    assert progress[-1] == (8, 8)
+
+
+@pytest.mark.asyncio
+async def test_unparseable_files_are_reported(tmp_path):
+    (tmp_path / "good.jsonl").write_text('{"id": "1"}\n{"id": "2"}\n')
+    (tmp_path / "bad.json").write_text('[{"id": "3"}, oops]')
+    mapper = RecordMapper({"fields": [{"name": "id", "key": True}]})
+
+    summary = await ingest_json_files(UploadingDao(), "idx", find_json_files(tmp_path), mapper)
+
+    assert summary.records == 3
+    assert summary.upload.succeeded == 3
+    assert len(summary.file_errors) == 1
@@ -0,0 +1,114 @@
+import pytest
+
+from mcp_server_azure_ai_search_preview.shared.local_files import read_byte_range, read_line_range, \
+    iter_file_chunks, describe_local_file
+
+
+@pytest.fixture
+def text_file(tmp_path):
+    path = tmp_path / "notes.txt"
+    path.write_text("first line\nsecond line ünïcödé\nthird line\nfourth line", encoding="utf-8")
+    return path
+
+
+def test_read_byte_range_does_not_split_characters(text_file):
+    content = text_file.read_bytes()
+    # Start in the middle of the two byte "ü"
+    offset = content.index("ü".encode("utf-8")) + 1
+
+    chunk = read_byte_range(text_file, offset, 5)
+
+    assert chunk.offset == offset + 1
+    assert "�" not in chunk.content
+    assert content[chunk.offset:chunk.offset + chunk.length].decode("utf-8") == chunk.content
+    assert chunk.next_offset == chunk.offset + chunk.length
+
+
+def test_read_byte_range_at_end_of_file_has_no_next_offset(text_file):
+    chunk = read_byte_range(text_file, 0, 10_000)
+
+    assert chunk.content == text_file.read_text(encoding="utf-8")
+    assert chunk.size == len(text_file.read_bytes())
+    assert chunk.next_offset is None
+
+
+def test_read_line_range_returns_next_line(text_file):
+    chunk = read_line_range(text_file, start_line=2, line_count=2)
+
+    assert chunk.content == "second line ünïcödé\nthird line\n"
+    assert chunk.start_line == 2
+    assert chunk.next_line == 4
+
+    last_chunk = read_line_range(text_file, start_line=chunk.next_line)
+    assert last_chunk.content == "fourth line"
+    assert last_chunk.next_line is None
+
+
+def test_read_line_range_rejects_lines_over_the_limit(text_file, monkeypatch):
+    monkeypatch.setenv("AZURE_AI_SEARCH_MCP_FILE_READ_MAX_BYTES", "5")
+
+    with pytest.raises(ValueError):
+        read_line_range(text_file, start_line=1, line_count=1)
+
+
+def test_iter_file_chunks_reassembles_the_file(text_file):
+    chunks = list(iter_file_chunks(text_file, chunk_bytes=7))
+
+    assert len(chunks) > 1
+    assert "".join(chunk.content for chunk in chunks) == text_file.read_text(encoding="utf-8")
+
+
+def test_describe_local_file(text_file):
+    metadata = describe_local_file(text_file)
+
+    assert metadata.size == len(text_file.read_bytes())
+    assert metadata.line_count == 4
+    assert metadata.encoding == "utf-8"
+
+
+def test_empty_file(tmp_path):
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+
+    assert read_byte_range(path).content == ""
+    assert read_line_range(path).next_line is None
+    assert describe_local_file(path).line_count == 0
+
+
+def test_missing_file_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        read_byte_range(tmp_path / "missing.txt")
+
+
+@pytest.mark.parametrize("read", [
+    lambda path: read_byte_range(path, 0, 0),
+    lambda path: read_line_range(path, start_line=1, line_count=0),
+    lambda path: next(iter_file_chunks(path, chunk_bytes=0)),
+])
+def test_empty_ranges_are_rejected(text_file, read):
+    with pytest.raises(ValueError):
+        read(text_file)
+
+
+@pytest.mark.asyncio
+async def test_whole_file_reads_are_limited(text_file, monkeypatch):
+    from mcp_server_azure_ai_search_preview.__main__ import setup_mcp_service
+
+    mcp = setup_mcp_service("127.0.0.1", 8000)
+
+    content = await mcp.call_tool("fk_fetch_local_file_contents", {"file_path": str(text_file)})
+    assert content[0].text == text_file.read_text(encoding="utf-8")
+
+    monkeypatch.setenv("AZURE_AI_SEARCH_MCP_FILE_READ_MAX_BYTES", "5")
+    with pytest.raises(Exception, match="fk_read_local_file_chunk"):
+        await mcp.call_tool("fk_fetch_local_file_contents", {"file_path": str(text_file)})
+    mcp.blocking_executor.shutdown()
+
+
+@pytest.mark.parametrize("encoding", ["utf-16", "utf-32"])
+def test_line_ranges_reject_encodings_without_byte_newlines(tmp_path, encoding):
+    path = tmp_path / "wide.txt"
+    path.write_text("first line\nsecond line\n", encoding=encoding)
+
+    with pytest.raises(ValueError, match=encoding):
+        read_line_range(path, start_line=2, encoding=encoding)
@@ -0,0 +1,194 @@
+import json
+from pathlib import Path
+
+import pytest
+from azure.core.exceptions import ResourceNotFoundError, ResourceNotModifiedError
+from azure.search.documents.indexes.models import SearchIndex, SimpleField, SearchableField
+
+from mcp_server_azure_ai_search_preview import SearchIndexDao, SearchClientDao, SearchIndexerDao, \
+    AsyncSearchClientDao, AsyncSearchIndexDao
+from mcp_server_azure_ai_search_preview.data_access_objects import search_client_registry, index_schema_cache, \
+    query_result_cache, memory_search_service
+from mcp_server_azure_ai_search_preview.data_access_objects.odata import compile_filter, parse_order_by
+
+SAMPLE_DATASET = Path(__file__).resolve().parent.parent / "sample-dataset"
+
+HOTELS = [
+    {"id": "1", "name": "Seaside Inn", "description": "Quiet hotel by the sea with a pool", "rating": 4,
+     "tags": ["pool", "view"], "address": {"city": "Lisbon"}},
+    {"id": "2", "name": "City Lodge", "description": "Budget hotel in the city center", "rating": 2,
+     "tags": ["budget"], "address": {"city": "Porto"}},
+    {"id": "3", "name": "Harbor Hotel", "description": "Luxury hotel on the harbor, sea view and spa", "rating": 5,
+     "tags": ["spa", "view"], "address": {"city": "Lisbon"}},
+    {"id": "4", "name": "Mountain Cabin", "description": "Cabin in the mountains", "rating": 3,
+     "tags": [], "address": {"city": "Braga"}},
+]
+
+
+@pytest.fixture
+def memory_backend(monkeypatch):
+    monkeypatch.setenv("AZURE_AI_SEARCH_BACKEND", "memory")
+    monkeypatch.delenv("AZURE_AI_SEARCH_MEMORY_SEED_DIR", raising=False)
+    memory_search_service.reset()
+    search_client_registry.close()
+    index_schema_cache.clear()
+    query_result_cache.clear()
+    yield memory_search_service
+    memory_search_service.reset()
+    search_client_registry.close()
+    index_schema_cache.clear()
+    query_result_cache.clear()
+
+
+@pytest.fixture
+def hotels(memory_backend):
+    index = SearchIndex(name="hotels", fields=[
+        SimpleField(name="id", type="Edm.String", key=True, sortable=True, filterable=True),
+        SearchableField(name="name", sortable=True),
+        SearchableField(name="description"),
+        SimpleField(name="rating", type="Edm.Int64", sortable=True, filterable=True),
+        SearchableField(name="tags", collection=True, filterable=True),
+        {"name": "address", "type": "Edm.ComplexType", "fields": [{"name": "city", "type": "Edm.String"}]},
+    ])
+    memory_backend.put_index(index.serialize(keep_readonly=True))
+    memory_backend.engine("hotels").upload(HOTELS)
+    return SearchClientDao("hotels")
+
+
+def test_unknown_backend_is_rejected(monkeypatch):
+    monkeypatch.setenv("AZURE_AI_SEARCH_BACKEND", "elastic")
+
+    with pytest.raises(ValueError, match="AZURE_AI_SEARCH_BACKEND"):
+        SearchIndexDao()
+
+
+def test_text_search_ranks_matching_documents(hotels):
+    results = hotels.query_index("sea view", top=10)
+
+    assert [result["id"] for result in results] == ["3", "1"]
+    assert results[0]["@search.score"] > results[1]["@search.score"]
+
+
+def test_text_search_operators(hotels):
+    assert {result["id"] for result in hotels.query_index("hotel -sea")} == {"2"}
+    assert {result["id"] for result in hotels.query_index("+pool hotel")} == {"1"}
+    assert {result["id"] for result in hotels.query_index('"harbor spa"')} == {"3"}
+    assert {result["id"] for result in hotels.query_index("mount*")} == {"4"}
+    assert len(hotels.query_index("*")) == 4
+
+
+def test_filter_order_select_skip_top_and_count(hotels):
+    page = hotels.query_index_page(query_filter="rating ge 3 and address/city eq 'Lisbon'",
+                                   order_by=["rating desc"], select=["id", "rating"], include_total_count=True)
+    assert page.count == 2
+    assert [(document["id"], document["rating"]) for document in page.documents] == [("3", 5), ("1", 4)]
+    assert set(page.documents[0]) == {"id", "rating", "@search.score", "@search.reranker_score",
+                                      "@search.highlights", "@search.captions"}
+
+    results = hotels.query_index(order_by=["rating asc"], skip=1, top=2)
+    assert [result["id"] for result in results] == ["4", "1"]
+
+    assert {result["id"] for result in hotels.query_index(query_filter="tags/any(t: t eq 'view')")} == {"1", "3"}
+    results = hotels.query_index(query_filter="search.in(id, '2,4') or not (rating lt 5)")
+    assert {result["id"] for result in results} == {"2", "3", "4"}
+    assert hotels.count_documents("tags/all(t: t ne 'budget') and rating gt 2") == 3
+
+
+def test_keyset_paging_walks_every_document(hotels):
+    keys, cursor = [], None
+    while True:
+        page = hotels.query_index_page(page_size=3, key_field_name="id", cursor=cursor)
+        keys.extend(document["id"] for document in page.documents)
+        cursor = page.next_cursor
+        if cursor is None:
+            break
+
+    assert keys == ["1", "2", "3", "4"]
+
+
+def test_upload_merge_and_delete_documents(hotels):
+    results = hotels.add_documents([{"id": "5", "name": "New Hostel", "rating": 1},
+                                    {"id": "6", "unknown": "value"}])
+    assert hotels.get_document_count() == 5
+    assert [(result["key"], result["statusCode"]) for result in results] == [("5", 201), ("6", 400)]
+
+    client = hotels.client
+    client.merge_or_upload_documents([{"id": "5", "rating": 2}])
+    assert hotels.query_index(query_filter="id eq '5'")[0]["name"] == "New Hostel"
+
+    hotels.delete_documents("id", ["5", "missing"])
+    assert hotels.get_document_count() == 4
+
+
+def test_index_lifecycle_and_etag_revalidation(memory_backend):
+    index_dao = SearchIndexDao()
+    index_dao.create_index(SearchIndex(name="scratch", fields=[SimpleField(name="id", type="Edm.String", key=True)]))
+
+    assert index_dao.retrieve_index_names() == ["scratch"]
+    definition = index_dao.client.get_index("scratch")
+    with pytest.raises(ResourceNotModifiedError):
+        index_dao.client.get_index("scratch", headers={"If-None-Match": definition.e_tag})
+
+    index_dao.delete_index("scratch")
+    with pytest.raises(ResourceNotFoundError):
+        index_dao.client.get_index("scratch")
+
+
+def test_unsupported_query_options_are_rejected(hotels):
+    with pytest.raises(ValueError, match="vector_queries"):
+        hotels.client.search("hotel", vector_queries=[object()])
+    with pytest.raises(ValueError, match="nope"):
+        hotels.query_index(query_filter="nope(rating)")
+
+
+def test_sample_dataset_is_loaded(memory_backend, monkeypatch):
+    monkeypatch.setenv("AZURE_AI_SEARCH_MEMORY_SEED_DIR", str(SAMPLE_DATASET))
+
+    assert "product-inventory" in SearchIndexDao().retrieve_index_names()
+    schema = SearchIndexDao().retrieve_index_schema("product-inventory")
+    assert next(field["name"] for field in schema["fields"] if field.get("key")) == "sku_id"
+    assert SearchClientDao("departments").get_document_count() > 0
+
+    indexer_dao = SearchIndexerDao()
+    assert indexer_dao.list_indexers() == ["indexer-departments"]
+    assert len(indexer_dao.list_skill_sets()) == 3
+
+
+@pytest.mark.asyncio
+async def test_async_daos(hotels):
+    client_dao = AsyncSearchClientDao("hotels")
+    page = await client_dao.query_index_page("hotel", include_total_count=True, select=["id"])
+
+    assert page.count == 3
+    assert await AsyncSearchIndexDao().retrieve_index_names() == ["hotels"]
+    await search_client_registry.aclose()
+
+
+
+@pytest.mark.asyncio
+async def test_query_index_tool_returns_columnar_pages(hotels):
+    from mcp_server_azure_ai_search_preview.__main__ import setup_mcp_service
+
+    mcp = setup_mcp_service("127.0.0.1", 8000)
+    arguments = {"index_name": "hotels", "query_filter": "rating ge 4", "order_by": ["id"], "select": ["id", "name"]}
+
+    rows = json.loads((await mcp.call_tool("query_index", arguments))[0].text)
+    columnar = json.loads((await mcp.call_tool("query_index", {**arguments, "result_format": "columnar"}))[0].text)
+
+    assert [(document["id"], document["name"]) for document in rows["documents"]] == \
+        [("1", "Seaside Inn"), ("3", "Harbor Hotel")]
+    assert columnar["fields"][:2] == ["id", "name"]
+    assert [row[:2] for row in columnar["rows"]] == [["1", "Seaside Inn"], ["3", "Harbor Hotel"]]
+    assert "documents" not in columnar
+    mcp.blocking_executor.shutdown()
+    await search_client_registry.aclose()
+
+def test_compile_filter_collects_required_ranges():
+    compiled = compile_filter("rating gt 3 and (id ge 'b' or id eq 'a') and name ne null")
+
+    assert [(constraint.field_name, constraint.operator) for constraint in compiled.ranges] == \
+        [("rating", "gt"), ("name", "ne")]
+    assert compiled.predicate({"rating": 4, "id": "a", "name": "x"})
+    assert not compiled.predicate({"rating": 4, "id": "a", "name": None})
+    assert [tuple(clause) for clause in parse_order_by(["search.score() desc, name"])] == \
+        [("@search.score", True), ("name", False)]
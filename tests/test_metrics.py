@@ -0,0 +1,115 @@
+from unittest.mock import MagicMock
+
+import pytest
+from azure.core.pipeline import PipelineRequest, PipelineResponse, PipelineContext
+from azure.core.rest import HttpRequest
+from starlette.testclient import TestClient
+
+from mcp_server_azure_ai_search_preview import FoundryKnowledgeMCP
+from mcp_server_azure_ai_search_preview.shared import MetricsRegistry
+from mcp_server_azure_ai_search_preview.data_access_objects.instrumentation import RequestMetricsPolicy, \
+    operation_name
+from mcp_server_azure_ai_search_preview.shared.metrics import tool_calls, tool_errors, tool_call_duration, \
+    tool_calls_in_flight, azure_requests, azure_throttled_requests, azure_request_errors
+
+
+def test_registry_renders_prometheus_text():
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total", "Requests", ("route",))
+    in_flight = registry.gauge("in_flight", "In flight")
+    latency = registry.histogram("latency_seconds", "Latency", ("route",), buckets=(0.1, 1.0))
+
+    requests.inc(route='say "hi"')
+    requests.inc(2, route='say "hi"')
+    in_flight.inc()
+    in_flight.inc()
+    in_flight.dec()
+    latency.observe(0.05, route="a")
+    latency.observe(0.1, route="a")
+    latency.observe(5, route="a")
+
+    lines = registry.render().splitlines()
+
+    assert "# TYPE requests_total counter" in lines
+    assert 'requests_total{route="say \\"hi\\""} 3' in lines
+    assert "in_flight 1" in lines
+    assert 'latency_seconds_bucket{route="a",le="0.1"} 2' in lines
+    assert 'latency_seconds_bucket{route="a",le="1"} 2' in lines
+    assert 'latency_seconds_bucket{route="a",le="+Inf"} 3' in lines
+    assert 'latency_seconds_sum{route="a"} 5.15' in lines
+    assert 'latency_seconds_count{route="a"} 3' in lines
+
+    with pytest.raises(ValueError):
+        requests.inc(path="/")
+    with pytest.raises(ValueError):
+        registry.counter("requests_total", "Again")
+
+
+def test_otlp_export_is_off_without_an_endpoint(monkeypatch):
+    monkeypatch.delenv("OTEL_EXPORTER_OTLP_ENDPOINT", raising=False)
+    monkeypatch.delenv("OTEL_EXPORTER_OTLP_METRICS_ENDPOINT", raising=False)
+
+    assert MetricsRegistry().start_otlp_export() is False
+
+
+@pytest.mark.asyncio
+async def test_tool_calls_are_measured(monkeypatch):
+    monkeypatch.setenv("AZURE_AI_SEARCH_MCP_TOOL_GROUPS", "READ_INDEX")
+    mcp = FoundryKnowledgeMCP("test")
+
+    @mcp.tool(name="list_index_names")
+    def list_index_names(fail: bool = False) -> list[str]:
+        if fail:
+            raise KeyError("boom")
+        return ["hotels"]
+
+    successes = tool_calls.value(tool="list_index_names", outcome="success")
+    failures = tool_errors.value(tool="list_index_names", error_type="KeyError")
+    observations = tool_call_duration.count(tool="list_index_names")
+
+    await mcp.call_tool("list_index_names", {})
+    with pytest.raises(Exception):
+        await mcp.call_tool("list_index_names", {"fail": True})
+
+    assert tool_calls.value(tool="list_index_names", outcome="success") == successes + 1
+    assert tool_errors.value(tool="list_index_names", error_type="KeyError") == failures + 1
+    assert tool_call_duration.count(tool="list_index_names") == observations + 2
+    assert tool_calls_in_flight.value(tool="list_index_names") == 0
+    mcp.shutdown()
+
+
+def test_azure_requests_are_counted_by_operation_and_status():
+    policy = RequestMetricsPolicy()
+    http_request = HttpRequest("POST", "https://x.search.windows.net/indexes('hotels')/docs/search.post.search"
+                                       "?api-version=2025-03-01-preview")
+    operation = operation_name(http_request.method, http_request.url)
+    assert operation == "POST indexes({name})/docs/search.post.search"
+
+    throttled = azure_throttled_requests.value(operation=operation)
+    for status_code in (429, 200):
+        request = PipelineRequest(http_request, PipelineContext(None))
+        policy.on_request(request)
+        policy.on_response(request, PipelineResponse(http_request, MagicMock(status_code=status_code),
+                                                     request.context))
+
+    assert azure_throttled_requests.value(operation=operation) >= throttled + 1
+    assert azure_requests.value(operation=operation, status_code="200") >= 1
+
+    request = PipelineRequest(http_request, PipelineContext(None))
+    policy.on_request(request)
+    try:
+        raise ConnectionError("reset")
+    except ConnectionError:
+        policy.on_exception(request)
+    assert azure_request_errors.value(operation=operation, error_type="ConnectionError") >= 1
+
+
+def test_metrics_are_served_by_the_sse_app():
+    mcp = FoundryKnowledgeMCP("test")
+
+    response = TestClient(mcp.sse_app()).get("/metrics")
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+    assert "# TYPE mcp_tool_call_duration_seconds histogram" in response.text
+    mcp.shutdown()
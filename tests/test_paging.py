@@ -0,0 +1,108 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from mcp_server_azure_ai_search_preview import SearchClientDao, QueryPage
+from mcp_server_azure_ai_search_preview.data_access_objects import QueryCursor, sortable_key_field_name
+from mcp_server_azure_ai_search_preview.data_access_objects.paging import prepare_page_request, build_page, \
+    query_fingerprint, to_columnar, MAX_SKIP
+
+
+@pytest.fixture
+def mock_dao():
+    dao = SearchClientDao(index_name="test-index")
+    dao.client = MagicMock()
+    yield dao
+
+
+def test_cursor_round_trip():
+    cursor = QueryCursor(query_hash="abc", mode="keyset", returned=10, key_field_name="id", last_key="o'brien")
+
+    assert QueryCursor.decode(cursor.encode(), "abc") == cursor
+
+
+def test_cursor_rejects_other_queries_and_garbage():
+    cursor = QueryCursor(query_hash="abc", mode="skip", skip=50).encode()
+
+    with pytest.raises(ValueError):
+        QueryCursor.decode(cursor, "other")
+
+    with pytest.raises(ValueError):
+        QueryCursor.decode("not-a-cursor", "abc")
+
+
+def test_skip_paging_returns_one_page_and_cursor(mock_dao):
+    mock_dao.client.search.return_value = [{"id": str(i)} for i in range(3)]
+
+    page = mock_dao.query_index_page(search_text="item", page_size=2)
+
+    assert page.documents == [{"id": "0"}, {"id": "1"}]
+    assert page.next_cursor is not None
+    assert mock_dao.client.search.call_args.kwargs["top"] == 3
+    assert mock_dao.client.search.call_args.kwargs["skip"] is None
+
+    mock_dao.client.search.return_value = [{"id": "2"}]
+    last_page = mock_dao.query_index_page(search_text="item", page_size=2, cursor=page.next_cursor)
+
+    assert last_page.documents == [{"id": "2"}]
+    assert last_page.next_cursor is None
+    assert mock_dao.client.search.call_args.kwargs["skip"] == 2
+
+
+def test_keyset_paging_filters_after_last_key(mock_dao):
+    mock_dao.client.search.return_value = [{"id": "a", "name": "A"}, {"id": "b", "name": "B"}]
+
+    page = mock_dao.query_index_page(query_filter="rating gt 3", select=["name"], page_size=1, key_field_name="id")
+
+    assert page.documents == [{"name": "A"}]
+    search_kwargs = mock_dao.client.search.call_args.kwargs
+    assert search_kwargs["order_by"] == ["id asc"]
+    assert search_kwargs["select"] == ["name", "id"]
+
+    mock_dao.client.search.return_value = [{"id": "b", "name": "B"}]
+    mock_dao.query_index_page(query_filter="rating gt 3", select=["name"], page_size=1, cursor=page.next_cursor)
+
+    assert mock_dao.client.search.call_args.kwargs["filter"] == "(rating gt 3) and id gt 'a'"
+
+
+def test_top_caps_results_across_pages(mock_dao):
+    mock_dao.client.search.return_value = [{"id": str(i)} for i in range(6)]
+
+    page = mock_dao.query_index_page(search_text="item", page_size=5, top=5)
+
+    assert len(page.documents) == 5
+    assert page.next_cursor is None
+
+
+def test_skip_limit_is_reported():
+    page_request = prepare_page_request("item", page_size=10, skip=MAX_SKIP)
+
+    page = build_page(page_request, [{"id": str(i)} for i in range(11)])
+
+    assert page.next_cursor is None
+    assert page.warnings
+
+
+def test_sortable_key_field_name():
+    assert sortable_key_field_name({"fields": [{"name": "id", "key": True, "sortable": True}]}) == "id"
+    assert sortable_key_field_name({"fields": [{"name": "id", "key": True, "sortable": False}]}) is None
+    assert query_fingerprint("a", None, None, None) != query_fingerprint("b", None, None, None)
+
+
+def test_columnar_page_lists_fields_once_and_leaves_out_nulls():
+    page = QueryPage(documents=[{"id": "1", "name": "Alpha", "color": None, "size": None, "@search.captions": None},
+                                {"id": "2", "name": None, "color": "red", "size": None},
+                                {"id": "3", "name": "Gamma", "color": "blue", "size": None, "weight": 4.5}],
+                     next_cursor="abc", count=3)
+
+    columnar = to_columnar(page)
+
+    assert columnar.fields == ["id", "name", "color", "weight"]
+    assert columnar.rows == [["1", "Alpha"], ["2", None, "red"], ["3", "Gamma", "blue", 4.5]]
+    assert (columnar.next_cursor, columnar.count) == ("abc", 3)
+
+
+def test_columnar_page_of_no_documents():
+    columnar = to_columnar(QueryPage(documents=[]))
+
+    assert columnar.model_dump(exclude_none=True) == {"fields": [], "rows": []}
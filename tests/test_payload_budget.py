@@ -0,0 +1,79 @@
+import json
+
+from mcp_server_azure_ai_search_preview.data_access_objects import PayloadBudget, default_projection, QueryCursor
+from mcp_server_azure_ai_search_preview.data_access_objects.paging import prepare_page_request, build_page, \
+    query_fingerprint
+
+
+def test_default_projection_leaves_out_vector_and_hidden_fields():
+    index_schema = {"fields": [
+        {"name": "id", "type": "Edm.String", "key": True, "retrievable": True},
+        {"name": "content", "type": "Edm.String", "retrievable": True},
+        {"name": "embedding", "type": "Collection(Edm.Single)", "dimensions": 3},
+        {"name": "secret", "type": "Edm.String", "retrievable": False},
+    ]}
+
+    assert default_projection(index_schema) == (["id", "content"], ["embedding"])
+
+
+def test_default_projection_keeps_searchable_only_string_fields():
+    index_schema = {"fields": [
+        {"name": "id", "type": "Edm.String", "key": True},
+        {"name": "description", "type": "Edm.String", "searchable": True, "filterable": False, "sortable": False,
+         "facetable": False},
+        {"name": "pages", "type": "Collection(Edm.String)", "searchable": True, "filterable": False,
+         "sortable": False, "facetable": False},
+    ]}
+
+    assert default_projection(index_schema) == (["id", "description", "pages"], [])
+
+
+def test_long_strings_are_truncated_without_modifying_the_documents():
+    document = {"id": "1", "content": "x" * 20, "tags": ["short", "y" * 20]}
+
+    documents, report = PayloadBudget(max_field_chars=10, max_bytes=0).fit([document])
+
+    assert documents[0]["content"] == "x" * 10 + "…"
+    assert documents[0]["tags"] == ["short", "y" * 10 + "…"]
+    assert document["content"] == "x" * 20
+    assert report.truncated_fields == {"content": 1, "tags": 1}
+    assert report.omitted_documents == 0
+
+
+def test_documents_and_values_that_fit_are_not_copied():
+    embedding = [0.1, 0.2, 0.3]
+    documents = [{"id": "1", "embedding": embedding}, {"id": "2", "content": "x" * 20, "embedding": embedding}]
+
+    fitted_documents, report = PayloadBudget(max_field_chars=10, max_bytes=0).fit(documents)
+
+    assert fitted_documents[0] is documents[0]
+    assert fitted_documents[1] is not documents[1]
+    assert fitted_documents[1]["embedding"] is embedding
+    assert report.bytes == sum(len(json.dumps(document, separators=(",", ":")).encode("utf-8"))
+                               for document in fitted_documents)
+
+
+def test_nothing_is_reported_when_the_page_fits():
+    documents, report = PayloadBudget().fit([{"id": "1"}])
+
+    assert documents == [{"id": "1"}]
+    assert report is None
+
+
+def test_documents_over_the_byte_budget_continue_on_the_next_page():
+    results = [{"id": str(i), "content": "x" * 40} for i in range(4)]
+    page_request = prepare_page_request("item", page_size=10)
+
+    page = build_page(page_request, results, payload_budget=PayloadBudget(max_bytes=130))
+
+    assert [document["id"] for document in page.documents] == ["0", "1"]
+    assert page.trimmed.omitted_documents == 2
+    next_cursor = QueryCursor.decode(page.next_cursor, query_fingerprint("item", None, None, None))
+    assert next_cursor.skip == 2
+
+
+def test_first_document_is_returned_even_if_over_budget():
+    documents, report = PayloadBudget(max_bytes=10).fit([{"id": "1", "content": "x" * 40}, {"id": "2"}])
+
+    assert [document["id"] for document in documents] == ["1"]
+    assert report.omitted_documents == 1
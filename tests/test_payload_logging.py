@@ -0,0 +1,90 @@
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+from azure.search.documents.indexes.models import SearchIndex, SimpleField
+
+from mcp_server_azure_ai_search_preview import SearchClientDao
+from mcp_server_azure_ai_search_preview.data_access_objects import PayloadLogPolicy, search_client_registry
+from mcp_server_azure_ai_search_preview.data_access_objects.payload_logging import PayloadSummary
+
+LOGGER_NAME = "mcp.server.fastmcp.server"
+
+
+class ExplodingPayload:
+    def serialize(self, keep_readonly=False):
+        raise AssertionError("The payload must not be serialized")
+
+
+def test_batches_are_summarized_from_a_sample_of_their_documents():
+    documents = [{"id": str(number), "title": "x" * 10} for number in range(100)]
+
+    summary = str(PayloadSummary(documents, max_bytes=64, include_payload=False))
+
+    assert summary.startswith("100 documents, fields [id, title], ~")
+    assert "payload" not in summary
+    assert str(PayloadSummary(documents[:2], 64, False)) == '2 documents, fields [id, title], 62 bytes'
+    assert str(PayloadSummary([], 64, False)) == "0 documents"
+
+
+def test_sampled_payloads_are_capped():
+    documents = [{"id": str(number)} for number in range(1000)]
+
+    summary = str(PayloadSummary(documents, max_bytes=40, include_payload=True))
+
+    payload = summary.split("; payload ", 1)[1]
+    assert payload.startswith('[{"id":"0"},{"id":"1"}')
+    assert payload.endswith("... (truncated)")
+    assert len(payload) == 40 + len("... (truncated)")
+
+
+def test_index_definitions_are_described_by_name_and_fields():
+    index = SearchIndex(name="hotels", fields=[SimpleField(name="id", type="Edm.String", key=True)])
+
+    assert str(PayloadSummary(index, 2048, False)).startswith("SearchIndex 'hotels', 1 fields, ")
+
+
+def test_nothing_is_computed_unless_debug_is_enabled(caplog):
+    policy = PayloadLogPolicy(sample_rate=1.0)
+
+    with caplog.at_level(logging.INFO, logger=LOGGER_NAME):
+        policy.log("Creating index %s", ExplodingPayload(), "hotels")
+
+    assert caplog.records == []
+
+
+def test_payloads_are_sampled():
+    draws = iter([0.05, 0.5])
+    policy = PayloadLogPolicy(sample_rate=0.1, random_source=lambda: next(draws))
+    logger = logging.getLogger(LOGGER_NAME)
+    records = []
+    handler = logging.Handler()
+    handler.emit = records.append
+    logger.addHandler(handler)
+    level = logger.level
+    logger.setLevel(logging.DEBUG)
+    try:
+        policy.log("Adding documents to index %s", [{"id": "1"}], "hotels")
+        policy.log("Adding documents to index %s", [{"id": "2"}], "hotels")
+    finally:
+        logger.removeHandler(handler)
+        logger.setLevel(level)
+
+    messages = [record.getMessage() for record in records]
+    assert messages[0] == 'Adding documents to index hotels: 1 documents, fields [id], 10 bytes; payload [{"id":"1"}]'
+    assert messages[1] == "Adding documents to index hotels: 1 documents, fields [id], 10 bytes"
+
+    with pytest.raises(ValueError):
+        PayloadLogPolicy(sample_rate=2)
+
+
+def test_dao_writes_log_a_summary(caplog):
+    dao = SearchClientDao(index_name="hotels")
+    dao.client = MagicMock()
+    dao.client.upload_documents.return_value = []
+
+    with caplog.at_level(logging.DEBUG, logger=LOGGER_NAME):
+        dao.add_documents([{"id": "1", "name": "Hotel"}])
+
+    assert "Adding documents to index hotels: 1 documents, fields [id, name], 25 bytes" in caplog.messages
+    search_client_registry.close()
@@ -0,0 +1,128 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from mcp_server_azure_ai_search_preview import SearchClientDao, SearchIndexDao
+from mcp_server_azure_ai_search_preview.data_access_objects import QueryResultCache
+
+
+@pytest.fixture
+def cache():
+    yield QueryResultCache(max_size=2, default_ttl_seconds=60, index_ttl_seconds={"uncached": 0})
+
+
+def test_keys_are_normalized(cache):
+    assert cache.make_key("e", "idx", search_text=None, select=["b", "a"]) == \
+        cache.make_key("e", "idx", search_text=" * ", select=["a", "b"])
+    assert cache.make_key("e", "idx", order_by=["a", "b"]) != cache.make_key("e", "idx", order_by=["b", "a"])
+
+
+def test_hits_misses_and_lru_eviction(cache):
+    first, second, third = (cache.make_key("e", "idx", search_text=text) for text in ("1", "2", "3"))
+
+    assert cache.get(first) is None
+    cache.put(first, "page-1", cache.generation("e", "idx"))
+    cache.put(second, "page-2", cache.generation("e", "idx"))
+    assert cache.get(first) == "page-1"
+
+    cache.put(third, "page-3", cache.generation("e", "idx"))
+
+    assert cache.get(second) is None
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 2
+    assert cache.stats()["entries"] == 2
+
+
+def test_entries_expire_and_ttl_can_be_disabled_per_index(cache):
+    key = cache.make_key("e", "idx", search_text="x")
+    uncached_key = cache.make_key("e", "uncached", search_text="x")
+
+    with patch("mcp_server_azure_ai_search_preview.data_access_objects.query_cache.time.monotonic") as monotonic:
+        monotonic.return_value = 0.0
+        cache.put(key, "page", 0)
+        monotonic.return_value = 100.0
+        assert cache.get(key) is None
+
+    cache.put(uncached_key, "page", 0)
+    assert cache.get(uncached_key) is None
+    assert cache.stats()["entries"] == 0
+
+
+def test_invalidation_drops_entries_and_in_flight_results(cache, monkeypatch):
+    monkeypatch.setattr("mcp_server_azure_ai_search_preview.data_access_objects.query_cache.WRITE_SETTLE_SECONDS", 0)
+    key = cache.make_key("e", "idx", search_text="x")
+    other_key = cache.make_key("e", "other", search_text="x")
+    cache.put(key, "page", 0)
+    cache.put(other_key, "other page", 0)
+
+    in_flight_generation = cache.generation("e", "idx")
+    cache.invalidate("e", "idx")
+    cache.put(key, "stale page", in_flight_generation)
+
+    assert cache.get(key) is None
+    assert cache.get(other_key) == "other page"
+
+    cache.put(key, "fresh page", cache.generation("e", "idx"))
+    assert cache.get(key) == "fresh page"
+
+
+def test_results_right_after_a_write_are_not_cached(cache):
+    key = cache.make_key("e", "idx", search_text="x")
+    cache.invalidate("e", "idx")
+
+    cache.put(key, "page", cache.generation("e", "idx"))
+
+    assert cache.get(key) is None
+
+
+def test_dao_serves_repeated_pages_from_cache_until_a_write(monkeypatch):
+    query_cache = QueryResultCache(max_size=8, default_ttl_seconds=60)
+    monkeypatch.setattr("mcp_server_azure_ai_search_preview.data_access_objects.dao.query_result_cache", query_cache)
+    monkeypatch.setattr("mcp_server_azure_ai_search_preview.data_access_objects.query_cache.WRITE_SETTLE_SECONDS", 0)
+
+    dao = SearchClientDao(index_name="cached-index")
+    dao.client = MagicMock()
+    dao.client.search.return_value = [{"id": "1"}]
+
+    first_page = dao.query_index_page(search_text="item", page_size=5)
+    second_page = dao.query_index_page(search_text="item ", page_size=5)
+
+    assert second_page is first_page
+    assert dao.client.search.call_count == 1
+
+    dao.client.delete_documents.return_value = []
+    dao.delete_document("id", "1")
+    dao.query_index_page(search_text="item", page_size=5)
+
+    assert dao.client.search.call_count == 2
+
+    index_dao = SearchIndexDao()
+    index_dao.client = MagicMock()
+    index_dao.delete_index("cached-index")
+
+    assert query_cache.stats()["entries"] == 0
+
+
+def test_queries_written_differently_share_cached_pages_and_cursors(monkeypatch):
+    query_cache = QueryResultCache(max_size=8, default_ttl_seconds=60)
+    monkeypatch.setattr("mcp_server_azure_ai_search_preview.data_access_objects.dao.query_result_cache", query_cache)
+    documents = [{"id": str(i), "a": i, "b": i} for i in range(10)]
+
+    dao = SearchClientDao(index_name="cached-index")
+    dao.client = MagicMock()
+    dao.client.search.side_effect = lambda **kwargs: documents[kwargs["skip"] or 0:][:kwargs["top"]]
+
+    first_query = {"search_text": None, "select": ["a", "b"], "page_size": 2}
+    second_query = {"search_text": " * ", "select": ["b", "a"], "page_size": 2}
+
+    first_page = dao.query_index_page(**first_query)
+    dao.query_index_page(**first_query, cursor=first_page.next_cursor)
+
+    page = dao.query_index_page(**second_query)
+    page_ids = [document["id"] for document in page.documents]
+    for _ in range(3):
+        page = dao.query_index_page(**second_query, cursor=page.next_cursor)
+        page_ids += [document["id"] for document in page.documents]
+
+    assert page_ids == ["0", "1", "2", "3", "4", "5", "6", "7"]
+    assert dao.client.search.call_count == 4
@@ -0,0 +1,140 @@
+import time
+from email.utils import formatdate
+from unittest.mock import MagicMock, AsyncMock
+
+import pytest
+from azure.core.pipeline import PipelineRequest, PipelineResponse, PipelineContext
+from azure.core.rest import HttpRequest
+
+from mcp_server_azure_ai_search_preview.data_access_objects import AdaptiveRateLimiter, rate_limiter_registry
+from mcp_server_azure_ai_search_preview.data_access_objects.rate_limiter import classify_request, \
+    parse_retry_after, RateLimitPolicy, AsyncRateLimitPolicy
+
+ENDPOINT = "https://x.search.windows.net"
+
+
+class FakeClock:
+
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture(autouse=True)
+def clear_limiters():
+    rate_limiter_registry.clear()
+    yield
+    rate_limiter_registry.clear()
+
+
+def test_bucket_allows_a_burst_then_spaces_requests():
+    clock = FakeClock()
+    limiter = AdaptiveRateLimiter(10, "query", clock=clock)
+
+    assert [limiter.reserve() for _ in range(10)] == [0.0] * 10
+    assert limiter.reserve() == pytest.approx(0.1)
+    assert limiter.reserve() == pytest.approx(0.2)
+
+    clock.now += 1.0
+    assert limiter.reserve() == pytest.approx(0.0)
+
+
+def test_throttling_pauses_and_slows_the_bucket_then_it_recovers():
+    clock = FakeClock()
+    limiter = AdaptiveRateLimiter(10, "query", clock=clock)
+    for _ in range(10):
+        limiter.reserve()
+
+    limiter.on_throttled(retry_after=2.0)
+
+    assert limiter.rate == 5.0
+    assert limiter.reserve() == pytest.approx(2.0 + 1 / 5.0)
+
+    for _ in range(100):
+        limiter.on_success()
+    assert limiter.rate == 10.0
+
+
+def test_unlimited_bucket_starts_limiting_at_half_the_throttled_throughput():
+    clock = FakeClock()
+    limiter = AdaptiveRateLimiter(name="query", clock=clock)
+
+    assert [limiter.reserve() for _ in range(40)] == [0.0] * 40
+
+    # Requests sent before the pause are throttled together and only halve the rate once
+    for _ in range(5):
+        limiter.on_throttled(retry_after=1.0)
+
+    assert limiter.rate == 20.0
+    assert limiter.reserve() == pytest.approx(1.0 + 1 / 20.0)
+
+    clock.now += 2.0
+    for _ in range(1000):
+        limiter.on_success()
+    assert limiter.rate is None
+    assert limiter.reserve() == 0.0
+
+
+def test_requests_are_classified_into_budgets():
+    assert classify_request("POST", f"{ENDPOINT}/indexes('hotels')/docs/search.post.search") == "query"
+    assert classify_request("GET", f"{ENDPOINT}/indexes('hotels')/docs/$count") == "query"
+    assert classify_request("POST", f"{ENDPOINT}/indexes('hotels')/docs/search.index") == "indexing"
+    assert classify_request("GET", f"{ENDPOINT}/indexes('hotels')") == "management"
+    assert classify_request("GET", f"{ENDPOINT}/indexers") == "management"
+
+
+def test_retry_after_headers_are_parsed():
+    assert parse_retry_after({"Retry-After": "3"}) == 3.0
+    assert parse_retry_after({"retry-after-ms": "250", "Retry-After": "3"}) == 0.25
+    assert parse_retry_after({"Retry-After": formatdate(time.time() + 30, usegmt=True)}) == \
+        pytest.approx(30, abs=2)
+    assert parse_retry_after({"Retry-After": "soon"}) is None
+    assert parse_retry_after({}) is None
+
+
+def test_budgets_are_shared_per_endpoint_and_can_be_disabled(monkeypatch):
+    monkeypatch.setenv("AZURE_AI_SEARCH_RATE_LIMIT_INDEXING", "0")
+    monkeypatch.setenv("AZURE_AI_SEARCH_RATE_LIMIT_MANAGEMENT", "5")
+
+    assert rate_limiter_registry.limiter(ENDPOINT, "query") is rate_limiter_registry.limiter(ENDPOINT, "query")
+    assert rate_limiter_registry.limiter(ENDPOINT, "query") is not \
+        rate_limiter_registry.limiter("https://y.search.windows.net", "query")
+    assert rate_limiter_registry.limiter(ENDPOINT, "indexing") is None
+    assert rate_limiter_registry.limiter(ENDPOINT, "management").rate == 5.0
+
+
+def _pipeline_request(url):
+    return PipelineRequest(HttpRequest("POST", url), PipelineContext(None))
+
+
+def test_policy_adapts_the_shared_budget_to_throttling():
+    policy = RateLimitPolicy(ENDPOINT)
+    policy.next = MagicMock()
+    request = _pipeline_request(f"{ENDPOINT}/indexes('hotels')/docs/search.post.search")
+    policy.next.send.return_value = PipelineResponse(
+        request.http_request, MagicMock(status_code=429, headers={"Retry-After": "0"}), request.context)
+
+    policy.send(request)
+
+    assert rate_limiter_registry.limiter(ENDPOINT, "query").rate == 0.5
+    assert rate_limiter_registry.limiter(ENDPOINT, "indexing").rate is None
+
+
+@pytest.mark.asyncio
+async def test_async_policy_waits_for_a_token(monkeypatch):
+    monkeypatch.setenv("AZURE_AI_SEARCH_RATE_LIMIT_INDEXING", "1")
+    policy = AsyncRateLimitPolicy(ENDPOINT)
+    policy.next = MagicMock()
+    request = _pipeline_request(f"{ENDPOINT}/indexes('hotels')/docs/search.index")
+    policy.next.send = AsyncMock(return_value=PipelineResponse(
+        request.http_request, MagicMock(status_code=200, headers={}), request.context))
+
+    started = time.perf_counter()
+    await policy.send(request)
+    rate_limiter_registry.limiter(ENDPOINT, "indexing")._tokens = 0.9
+    await policy.send(request)
+
+    assert time.perf_counter() - started >= 0.09
+    assert policy.next.send.await_count == 2
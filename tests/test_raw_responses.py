@@ -0,0 +1,154 @@
+import json
+
+import pytest
+from azure.core.exceptions import HttpResponseError, ResourceNotFoundError
+
+from azure.search.documents._generated.models import SearchResult
+from azure.search.documents._paging import convert_search_result as sdk_convert_search_result
+from azure.search.documents.indexes.models import SearchIndex
+
+from mcp_server_azure_ai_search_preview.data_access_objects import index_schema_cache
+from mcp_server_azure_ai_search_preview.data_access_objects.paging import prepare_page_request
+from mcp_server_azure_ai_search_preview.data_access_objects.raw_responses import search_documents, \
+    search_documents_async, convert_search_result, search_request_body, list_index_definitions
+
+ENDPOINT = "https://test.search.windows.net"
+
+
+class StubResponse:
+    """The parts of azure.core.rest.HttpResponse the raw search path and the SDK errors read"""
+
+    def __init__(self, status_code, payload):
+        self.status_code = status_code
+        self.reason = "OK" if status_code == 200 else "Error"
+        self.headers = {"Content-Type": "application/json"}
+        self.content_type = "application/json"
+        self.request = None
+        self._payload = payload
+
+    def json(self):
+        return self._payload
+
+    def text(self, encoding=None):
+        return json.dumps(self._payload)
+
+    def body(self):
+        return self.text().encode("utf-8")
+
+
+class StubClient:
+    def __init__(self, *responses):
+        self.responses = list(responses)
+        self.requests = []
+
+    def send_request(self, request):
+        self.requests.append(request)
+        return self.responses.pop(0)
+
+
+class AsyncStubClient(StubClient):
+    async def send_request(self, request):
+        return super().send_request(request)
+
+
+def test_request_body_matches_the_rest_parameters_of_the_sdk():
+    page_request = prepare_page_request("hotel", query_filter="rating gt 3", order_by=["rating desc", "id"],
+                                        select=["id", "name"], include_total_count=True, page_size=10)
+
+    assert search_request_body(page_request.search_kwargs) == {
+        "count": True, "filter": "rating gt 3", "orderby": "rating desc,id", "search": "hotel",
+        "select": "id,name", "top": 11}
+    assert search_request_body({"search_text": None, "include_total_count": False, "top": 5}) == {
+        "count": False, "top": 5}
+
+
+def test_results_are_converted_like_the_sdk_converts_its_models():
+    result = {"@search.score": 2, "id": "1", "nested": {"tags": ["a"], "empty": None},
+              "@search.highlights": {"name": ["<em>a</em>"]}}
+
+    assert convert_search_result(result) == {
+        "id": "1", "nested": {"tags": ["a"], "empty": None}, "@search.score": 2.0,
+        "@search.reranker_score": None, "@search.highlights": {"name": ["<em>a</em>"]}, "@search.captions": None}
+
+
+def test_results_are_encoded_exactly_as_the_sdk_results():
+    result = {"@search.score": 1.5, "@search.rerankerScore": 2, "id": "1",
+              **{f"field{number}": number for number in range(40)}, "@search.highlights": {"name": ["a"]}}
+
+    converted = convert_search_result(result)
+
+    assert json.dumps(converted) == json.dumps(sdk_convert_search_result(SearchResult.deserialize(result)))
+    assert list(converted)[-4:] == ["@search.score", "@search.reranker_score", "@search.highlights",
+                                    "@search.captions"]
+
+
+def test_server_side_pages_are_followed_up_to_the_limit():
+    next_page_parameters = {"search": "*", "skip": 2, "top": 3}
+    client = StubClient(
+        StubResponse(200, {"@odata.count": 9, "value": [{"id": "1"}, {"id": "2"}],
+                           "@search.nextPageParameters": next_page_parameters}),
+        StubResponse(200, {"value": [{"id": "3"}, {"id": "4"}, {"id": "5"}]}))
+
+    results, count = search_documents(client, "2024-07-01", {"search_text": "*", "top": 5}, limit=4)
+
+    assert [result["id"] for result in results] == ["1", "2", "3", "4"]
+    assert count == 9
+    assert [request.url for request in client.requests] == ["docs/search.post.search?api-version=2024-07-01"] * 2
+    assert json.loads(client.requests[1].content) == next_page_parameters
+
+
+def test_errors_are_raised_as_the_sdk_raises_them():
+    error = {"error": {"code": "NotFound", "message": "No index with the name 'missing' was found"}}
+
+    with pytest.raises(ResourceNotFoundError):
+        search_documents(StubClient(StubResponse(404, error)), "2024-07-01", {"top": 5}, limit=5)
+    with pytest.raises(HttpResponseError, match="InvalidRequestParameter"):
+        search_documents(StubClient(StubResponse(400, {"error": {"code": "InvalidRequestParameter",
+                                                                 "message": "Invalid $filter"}})),
+                         "2024-07-01", {"top": 5}, limit=5)
+
+
+@pytest.mark.asyncio
+async def test_async_search_stops_at_the_limit():
+    client = AsyncStubClient(StubResponse(200, {"value": [{"id": str(number)} for number in range(5)],
+                                                "@search.nextPageParameters": {"skip": 5}}))
+
+    results, count = await search_documents_async(client, "2024-07-01", {"top": 10}, limit=3)
+
+    assert [result["id"] for result in results] == ["0", "1", "2"]
+    assert count is None
+    assert len(client.requests) == 1
+
+
+def index_definition(name, etag, *field_names):
+    return {"@odata.etag": etag, "name": name, "defaultScoringProfile": None,
+            "fields": [{"name": field_name, "type": "Edm.String", "key": field_name == "id", "retrievable": True,
+                        "analyzer": None, "synonymMaps": []} for field_name in field_names]}
+
+
+def test_index_definitions_are_serialized_like_the_sdk_models():
+    index_schema_cache.clear()
+    definition = index_definition("hotels", '"1"', "id", "name")
+
+    definitions = list_index_definitions(StubClient(StubResponse(200, {"value": [definition]})), "2024-07-01",
+                                         ENDPOINT)
+
+    assert definitions == [SearchIndex.deserialize(definition).serialize(keep_readonly=True)]
+    assert list(definitions[0]) == list(SearchIndex.deserialize(definition).serialize(keep_readonly=True))
+
+
+def test_index_definitions_with_an_unchanged_etag_are_copied_from_the_schema_cache():
+    index_schema_cache.clear()
+    cached_schema = {"@odata.etag": '"1"', "name": "hotels", "fields": [], "cached": True}
+    index_schema_cache.put(ENDPOINT, cached_schema)
+    payload = {"value": [index_definition("hotels", '"1"', "id"), index_definition("products", '"7"', "id")]}
+
+    definitions = list_index_definitions(StubClient(StubResponse(200, payload)), "2024-07-01", ENDPOINT)
+
+    assert definitions[0] == cached_schema and definitions[0] is not cached_schema
+    assert definitions[1]["name"] == "products" and "cached" not in definitions[1]
+
+    payload["value"][0]["@odata.etag"] = '"2"'
+    definitions = list_index_definitions(StubClient(StubResponse(200, payload)), "2024-07-01", ENDPOINT)
+    assert "cached" not in definitions[0]
+    index_schema_cache.clear()
@@ -1,8 +1,10 @@
 
 from unittest.mock import patch, MagicMock
 import pytest
+from azure.core.exceptions import ResourceNotModifiedError
 
 from mcp_server_azure_ai_search_preview import SearchIndexDao
+from mcp_server_azure_ai_search_preview.data_access_objects import index_schema_cache
 
 
 @pytest.fixture
@@ -13,7 +15,9 @@ def mock_dao():
 
         dao = SearchIndexDao()
         dao.client = mock_client
+        index_schema_cache.clear()
         yield dao
+        index_schema_cache.clear()
 
 
 def test_retrieve_index_names(mock_dao):
@@ -53,3 +57,36 @@ def test_retrieve_index_schema(mock_dao):
 
     assert result == {"name": "index1", "fields": ["field1", "field2"]}
     mock_dao.client.get_index.assert_called_once_with("index1")
+
+
+def test_retrieve_index_schema_is_cached_and_revalidated_with_etag(mock_dao, monkeypatch):
+    mock_index = MagicMock()
+    mock_index.serialize.return_value = {"name": "index1", "fields": [], "@odata.etag": "\"0x1\""}
+    mock_dao.client.get_index.return_value = mock_index
+
+    assert mock_dao.retrieve_index_schema("index1")["@odata.etag"] == "\"0x1\""
+    mock_dao.retrieve_index_schema("index1")
+    mock_dao.client.get_index.assert_called_once_with("index1")
+
+    monkeypatch.setattr(index_schema_cache, "max_age_seconds", 0)
+    mock_dao.client.get_index.side_effect = ResourceNotModifiedError()
+
+    result = mock_dao.retrieve_index_schema("index1")
+
+    assert result == {"name": "index1", "fields": [], "@odata.etag": "\"0x1\""}
+    mock_dao.client.get_index.assert_called_with("index1", headers={"If-None-Match": "\"0x1\""})
+
+
+def test_index_writes_invalidate_cached_schemas(mock_dao):
+    mock_index = MagicMock()
+    mock_index.serialize.return_value = {"name": "index1", "fields": []}
+    mock_dao.client.list_indexes.return_value = [mock_index]
+
+    mock_dao.retrieve_index_schemas()
+    mock_dao.retrieve_index_schema("index1")
+    mock_dao.client.get_index.assert_not_called()
+
+    mock_dao.delete_index("index1")
+    mock_dao.retrieve_index_schemas()
+
+    assert mock_dao.client.list_indexes.call_count == 2
@@ -0,0 +1,49 @@
+import datetime
+
+import pytest
+from mcp.server.fastmcp.server import _convert_to_content
+from mcp.types import TextContent
+
+from mcp_server_azure_ai_search_preview.shared import copy_result, encode_tool_result
+from mcp_server_azure_ai_search_preview.data_access_objects.models import QueryPage
+
+RESULTS = [
+    {"documents": [{"id": "1", "title": "Café  ", "rating": 4.5, "embedding": [0.1, -0.0, 1e300],
+                    "@search.score": 1.0, "@search.captions": None}], "next_cursor": "abc"},
+    [{"name": "hotels", "fields": [{"name": "id", "key": True}]}, {"name": "products", "fields": []}],
+    ["hotels", "products"],
+    {"counts": {"hotels": 3}, "total": 3, "nan": float("nan"), "keys": {1: "int", True: "bool", 1.5: "float"}},
+    {"modified": datetime.datetime(2024, 5, 1, 12, 30), "tags": {"a"}, "raw": b"bytes", "tuple": (1, 2)},
+    {"page": QueryPage(documents=[{"id": "1"}], count=1)},
+    {None: "null key", "null": "null name"},
+    "plain text",
+    42,
+    None,
+]
+
+
+@pytest.mark.parametrize("result", RESULTS)
+def test_tool_results_are_encoded_exactly_as_fastmcp_encodes_them(result):
+    assert encode_tool_result(result) == _convert_to_content(result)
+
+
+def test_content_is_passed_through():
+    content = TextContent(type="text", text="done")
+
+    assert encode_tool_result(content) == [content]
+
+
+def test_copies_are_independent_of_the_original():
+    schema = {"name": "hotels", "fields": [{"name": "id", "synonymMaps": []}]}
+
+    copied = copy_result(schema)
+    copied["fields"][0]["synonymMaps"].append("hotel-synonyms")
+
+    assert copied == {"name": "hotels", "fields": [{"name": "id", "synonymMaps": ["hotel-synonyms"]}]}
+    assert schema["fields"][0]["synonymMaps"] == []
+
+
+def test_values_that_cannot_be_pickled_are_deep_copied():
+    value = {"sort": lambda document: document["id"]}
+
+    assert copy_result(value)["sort"] is value["sort"]
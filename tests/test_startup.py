@@ -0,0 +1,35 @@
+import json
+import os
+import subprocess
+import sys
+
+import mcp_server_azure_ai_search_preview
+from mcp_server_azure_ai_search_preview import data_access_objects
+
+
+STARTUP_PROBE = """
+import json, sys
+from mcp_server_azure_ai_search_preview.__main__ import setup_mcp_service
+setup_mcp_service("127.0.0.1", 8000)
+print(json.dumps(sorted(name for name in sys.modules if name.split(".")[0] == "azure")))
+"""
+
+
+def test_server_setup_does_not_import_the_azure_sdk():
+    environment = dict(os.environ,
+                       AZURE_AI_SEARCH_ENDPOINT="https://startup.search.windows.net",
+                       AZURE_AI_SEARCH_API_KEY="key")
+
+    # A fresh interpreter, since the test session has already imported the SDK
+    output = subprocess.run([sys.executable, "-c", STARTUP_PROBE], env=environment, capture_output=True, text=True,
+                            check=True).stdout
+
+    assert json.loads(output.strip().splitlines()[-1]) == []
+
+
+def test_lazy_exports_resolve():
+    for name in mcp_server_azure_ai_search_preview.__all__:
+        assert getattr(mcp_server_azure_ai_search_preview, name) is not None
+
+    assert mcp_server_azure_ai_search_preview.SearchIndexDao is data_access_objects.SearchIndexDao
+    assert "SearchIndexDao" in dir(mcp_server_azure_ai_search_preview)
@@ -0,0 +1,61 @@
+import pytest
+from starlette.testclient import TestClient
+
+from mcp_server_azure_ai_search_preview import FoundryKnowledgeMCP
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setenv("AZURE_AI_SEARCH_MCP_TOOL_GROUPS", "READ_INDEX")
+    mcp = FoundryKnowledgeMCP("test")
+
+    @mcp.tool(name="list_index_names")
+    def list_index_names() -> list[str]:
+        return ["hotels"]
+
+    with TestClient(mcp.streamable_http_app()) as test_client:
+        yield test_client
+    mcp.shutdown()
+
+
+def _request(request_id, method, params=None):
+    return {"jsonrpc": "2.0", "id": request_id, "method": method, "params": params or {}}
+
+
+def test_initialize_is_answered_without_a_session(client):
+    response = client.post("/mcp", json=_request(1, "initialize", {
+        "protocolVersion": "2024-11-05", "capabilities": {}, "clientInfo": {"name": "test", "version": "1"}}))
+
+    assert response.status_code == 200
+    assert response.json()["result"]["serverInfo"]["name"] == "test"
+    assert "mcp-session-id" not in response.headers
+
+
+def test_requests_are_served_without_a_prior_initialize(client):
+    response = client.post("/mcp", json=_request(7, "tools/call", {"name": "list_index_names", "arguments": {}}))
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["id"] == 7
+    assert body["result"]["content"][0]["text"] == "hotels"
+
+
+def test_batches_are_answered_in_order(client):
+    response = client.post("/mcp", json=[
+        _request("b", "tools/list"),
+        {"jsonrpc": "2.0", "method": "notifications/initialized"},
+        _request("a", "tools/call", {"name": "unknown", "arguments": {}}),
+    ])
+
+    body = response.json()
+    assert [message["id"] for message in body] == ["b", "a"]
+    assert [tool["name"] for tool in body[0]["result"]["tools"]] == ["list_index_names"]
+    assert body[1]["result"]["isError"] is True
+
+
+def test_notifications_invalid_messages_and_other_methods(client):
+    assert client.post("/mcp", json={"jsonrpc": "2.0", "method": "notifications/initialized"}).status_code == 202
+    assert client.post("/mcp", content=b"{").json()["error"]["code"] == -32700
+    assert client.post("/mcp", json={"jsonrpc": "1.0"}).status_code == 400
+    assert client.get("/mcp").status_code == 405
+    assert client.get("/metrics").status_code == 200
@@ -0,0 +1,73 @@
+import json
+
+import httpx
+import pytest
+
+from mcp_server_azure_ai_search_preview.shared import UrlFetcher
+
+
+class RecordingTransport(httpx.AsyncBaseTransport):
+    """Serves a fixed body with an ETag and answers conditional requests with 304"""
+
+    def __init__(self, body=b'[{"id": "1"}]', etag='"v1"'):
+        self.body = body
+        self.etag = etag
+        self.requests = []
+
+    async def handle_async_request(self, request):
+        self.requests.append(request)
+        if request.headers.get("If-None-Match") == self.etag:
+            return httpx.Response(304)
+        return httpx.Response(200, content=self.body,
+                              headers={"ETag": self.etag, "Content-Type": "application/json; charset=utf-8"})
+
+
+@pytest.mark.asyncio
+async def test_cached_responses_are_revalidated_with_etag(tmp_path):
+    transport = RecordingTransport()
+    fetcher = UrlFetcher(cache_directory=tmp_path, transport=transport)
+
+    first = await fetcher.fetch_text("https://example.com/data.json")
+    second = await fetcher.fetch_text("https://example.com/data.json")
+    await fetcher.aclose()
+
+    assert first == second == '[{"id": "1"}]'
+    assert "If-None-Match" not in transport.requests[0].headers
+    assert transport.requests[1].headers["If-None-Match"] == '"v1"'
+
+
+@pytest.mark.asyncio
+async def test_client_is_reused_between_fetches(tmp_path):
+    fetcher = UrlFetcher(cache_directory="", transport=RecordingTransport())
+
+    await fetcher.fetch_text("https://example.com/a")
+    client = fetcher.client()
+    await fetcher.fetch_text("https://example.com/b")
+
+    assert fetcher.client() is client
+    await fetcher.aclose()
+
+
+@pytest.mark.asyncio
+async def test_bodies_over_the_limit_are_rejected(tmp_path):
+    fetcher = UrlFetcher(max_bytes=5, cache_directory=tmp_path, transport=RecordingTransport(body=b"x" * 10))
+
+    with pytest.raises(ValueError):
+        await fetcher.fetch_text("https://example.com/large")
+
+    await fetcher.aclose()
+    assert not list(tmp_path.iterdir())
+
+
+@pytest.mark.asyncio
+async def test_least_recently_used_entries_are_evicted(tmp_path):
+    fetcher = UrlFetcher(cache_directory=tmp_path, cache_max_bytes=25, transport=RecordingTransport(body=b"x" * 10))
+
+    for path in ("a", "b", "a", "c"):
+        await fetcher.fetch_text(f"https://example.com/{path}")
+    await fetcher.aclose()
+
+    # Revalidating a marked it as used, so b was the least recently used entry once c was cached
+    cached_urls = {json.loads(metadata_path.read_text())["url"] for metadata_path in tmp_path.glob("*.json")}
+    assert cached_urls == {"https://example.com/a", "https://example.com/c"}
+    assert len(list(tmp_path.glob("*.body"))) == 2